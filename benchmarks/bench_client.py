@@ -0,0 +1,190 @@
+"""
+Benchmarks of the client's hot paths.
+
+Each benchmark makes one call - a Client.make_request, an issue_get or issue_post, an AssetConsumer search,
+comment read or tag operation, or a Platform status call - against a MockPlatform serving a synthetic
+catalog. The platform runs in a separate process, so that its work neither competes with the client for the
+interpreter nor shows up in the client's allocations. Save a baseline once, then compare later runs with it -
+the run exits with status 1 if a benchmark regressed by more than the threshold:
+
+    PYTHONPATH=src python -m benchmarks.bench_client --save benchmarks/baseline.json
+    PYTHONPATH=src python -m benchmarks.bench_client --baseline benchmarks/baseline.json --threshold 0.25
+
+Baselines depend on the machine they were measured on, so compare runs made on the same one.
+
+"""
+import argparse
+import itertools
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import requests
+
+from benchmarks.harness import compare, load_baseline, run_benchmark, save_baseline
+from egeria_client.platform_services import Platform
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.client import Client
+from src.egeria_client.mock_platform import asset_kind, synthetic_guid
+from src.egeria_client.util_exp import issue_get, issue_post
+
+repository_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+server_name = "cocoMDS1"
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_platform(assets: int = 100000, latency: float = 0.0, seed: int = 0):
+    """Start a MockPlatform in another process, returning the process and the platform URL once it answers"""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.egeria_client.mock_platform"]
+        + ["--port", str(port), "--assets", str(assets)]
+        + ["--latency", str(latency), "--seed", str(seed)],
+        cwd=repository_root,
+        stdout=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    origin = (
+        url + "/open-metadata/platform-services/users/garygeeke/server-platform/origin"
+    )
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            requests.get(origin, timeout=1)
+            return process, url
+        except requests.ConnectionError:
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                raise RuntimeError(f"The mock platform did not start on {url}")
+            time.sleep(0.1)
+
+
+def hot_paths(url: str, assets: int = 100000, seed: int = 0) -> dict:
+    """
+    Return the benchmarks of the client's hot paths against the platform at url, by name
+
+    Each benchmark cycles through the first 1000 assets of the synthetic catalog, so that repeated calls are
+    for different elements rather than the same one.
+    """
+    guids = [synthetic_guid(asset_kind, i, seed) for i in range(min(assets, 1000))]
+    next_guid = itertools.cycle(guids).__next__
+    client = Client(server_name, url, "garygeeke")
+    platform = Platform(server_name, url, "garygeeke")
+    consumer = AssetConsumer(server_name, url, "peterprofile")
+    tag = consumer.create_public_tag("benchmark", "Assigned by the benchmarks")
+
+    origin_url = platform.admin_command_root + "/origin"
+    asset_url = (
+        f"{url}/servers/{server_name}/open-metadata/common-services/asset-consumer"
+        f"/connected-asset/users/peterprofile/assets/"
+    )
+    search_url = (
+        consumer.asset_consumer_endpoint
+        + "peterprofile/assets/by-search-string?startFrom=0&pageSize=50"
+    )
+    search_body = {"class": "SearchStringRequestBody", "searchString": "asset-0000001"}
+
+    return {
+        "client.make_request": lambda: client.make_request("GET", origin_url),
+        "util.issue_get": lambda: issue_get(asset_url + next_guid()),
+        "util.issue_post": lambda: issue_post(search_url, search_body),
+        "consumer.find_assets": lambda: consumer.find_assets(
+            "asset-0000001", page_size=50
+        ),
+        "consumer.get_comments": lambda: consumer.get_comments(next_guid()),
+        "consumer.add_tag": lambda: consumer.add_tag(next_guid(), tag, True),
+        "consumer.find_tags": lambda: consumer.find_tags("bench.*", page_size=50),
+        "platform.get_active_server_status": lambda: platform.get_active_server_status(),
+        "platform.get_server_status": lambda: platform.get_server_status(),
+    }
+
+
+def print_results(results: list):
+    print(
+        f"{'benchmark':34} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>8}"
+        f" {'KiB/call':>9} {'errors':>7}"
+    )
+    for r in results:
+        print(
+            f"{r.name:34} {r.p50_ms:8.3f} {r.p95_ms:8.3f} {r.p99_ms:8.3f} {r.rps:8.0f}"
+            f" {r.alloc_kib_per_call:9.1f} {r.errors:7}"
+        )
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the client's hot paths against a mock OMAG platform"
+    )
+    parser.add_argument(
+        "--url", help="the URL of a running mock platform - by default one is started"
+    )
+    parser.add_argument("--assets", type=int, default=100000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--alloc-calls", type=int, default=50)
+    parser.add_argument(
+        "--only", action="append", help="run only the benchmarks with these names"
+    )
+    parser.add_argument("--save", help="write the results to this baseline file")
+    parser.add_argument("--baseline", help="compare the results with this baseline")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    options = parser.parse_args(args)
+
+    process, url = None, options.url
+    if url is None:
+        process, url = start_platform(options.assets, options.latency)
+    try:
+        benchmarks = hot_paths(url, options.assets)
+        names = options.only or list(benchmarks)
+        unknown = [name for name in names if name not in benchmarks]
+        if unknown:
+            parser.error(
+                f"unknown benchmarks {unknown}, choose from {list(benchmarks)}"
+            )
+        results = [
+            run_benchmark(
+                name,
+                benchmarks[name],
+                options.iterations,
+                options.warmup,
+                options.concurrency,
+                options.duration,
+                options.alloc_calls,
+            )
+            for name in names
+        ]
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print_results(results)
+    if options.save:
+        settings = {
+            k: getattr(options, k)
+            for k in ("assets", "latency", "iterations", "concurrency", "duration")
+        }
+        save_baseline(options.save, results, settings)
+    if options.baseline:
+        regressions = compare(
+            results, load_baseline(options.baseline), options.threshold
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
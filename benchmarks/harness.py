@@ -0,0 +1,240 @@
+"""
+Latency, throughput and allocation measurement for the client benchmarks.
+
+A benchmark is a function of no arguments making one call. run_benchmark times it call by call on one thread
+for the latency percentiles, calls it from several threads for a fixed time for the throughput, and traces a
+few calls with tracemalloc for the memory each call allocates. The results of a run are saved as a JSON
+baseline, and compare lists the results of a later run that are worse than the baseline by more than a
+threshold.
+
+"""
+import json
+import math
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, fields
+
+# the metrics compared against a baseline, and whether a higher value is worse
+compared_metrics = {
+    "p50_ms": True,
+    "p95_ms": True,
+    "rps": False,
+    "alloc_kib_per_call": True,
+}
+
+
+@dataclass
+class BenchmarkResult:
+    """The measurements of one benchmark - latencies in milliseconds, memory in KiB"""
+
+    name: str
+    calls: int
+    errors: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    rps: float
+    concurrency: int
+    alloc_kib_per_call: float
+    retained_kib: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, values: dict) -> "BenchmarkResult":
+        return cls(**{f.name: values[f.name] for f in fields(cls)})
+
+
+@dataclass
+class Regression:
+    """A metric of a benchmark that is worse than its baseline by more than the threshold"""
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1
+
+    def __str__(self):
+        return f"{self.name}: {self.metric} {self.baseline:.3f} -> {self.current:.3f} ({self.change:+.0%})"
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """Return the nearest-rank percentile of a sorted list of samples - fraction is between 0 and 1"""
+    if not samples:
+        return 0.0
+    rank = max(math.ceil(fraction * len(samples)), 1)
+    return samples[rank - 1]
+
+
+def measure_latency(call, iterations: int, warmup: int = 0):
+    """Return the sorted durations in seconds of the calls that succeeded, and the number that failed"""
+    for _ in range(warmup):
+        call()
+    samples, errors = [], 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        try:
+            call()
+        except Exception:
+            errors += 1
+            continue
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples, errors
+
+
+def measure_throughput(call, concurrency: int, duration: float):
+    """Call from concurrency threads for duration seconds, returning the calls made, failed and per second"""
+    counts = [[0, 0] for _ in range(concurrency)]
+    deadline = time.perf_counter() + duration
+
+    def worker(count: list):
+        while time.perf_counter() < deadline:
+            try:
+                call()
+            except Exception:
+                count[1] += 1
+            count[0] += 1
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(c,)) for c in counts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    calls = sum(c[0] for c in counts)
+    return calls, sum(c[1] for c in counts), calls / elapsed
+
+
+def measure_allocations(call, calls: int):
+    """
+    Return the mean KiB allocated at the peak of a call, and the KiB still allocated after all the calls
+
+    The memory allocated by any thread is traced, so the platform called should run in another process.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        first, _ = tracemalloc.get_traced_memory()
+        peaks = 0
+        for _ in range(calls):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            try:
+                call()
+            except Exception:
+                pass
+            peaks += tracemalloc.get_traced_memory()[1] - before
+        last, _ = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return peaks / max(calls, 1) / 1024, (last - first) / 1024
+
+
+def run_benchmark(
+    name: str,
+    call,
+    iterations: int = 500,
+    warmup: int = 20,
+    concurrency: int = 8,
+    duration: float = 2.0,
+    alloc_calls: int = 50,
+) -> BenchmarkResult:
+    """
+    Measure a benchmark
+
+    Parameters
+    ----------
+    name : the name the result is saved and compared under
+    call : a function of no arguments making the call measured
+    iterations : the number of calls timed one after another for the latency percentiles
+    warmup : the number of calls made, and not timed, first
+    concurrency : the number of threads calling at once for the throughput
+    duration : the number of seconds the throughput is measured for
+    alloc_calls : the number of calls traced for the allocations
+
+    Returns
+    -------
+    A BenchmarkResult
+    """
+    samples, errors = measure_latency(call, iterations, warmup)
+    calls, failed, rps = measure_throughput(call, concurrency, duration)
+    alloc_kib, retained_kib = measure_allocations(call, alloc_calls)
+    ms = [s * 1000 for s in samples]
+    return BenchmarkResult(
+        name=name,
+        calls=iterations + calls,
+        errors=errors + failed,
+        mean_ms=sum(ms) / len(ms) if ms else 0.0,
+        p50_ms=percentile(ms, 0.50),
+        p95_ms=percentile(ms, 0.95),
+        p99_ms=percentile(ms, 0.99),
+        rps=rps,
+        concurrency=concurrency,
+        alloc_kib_per_call=alloc_kib,
+        retained_kib=retained_kib,
+    )
+
+
+def save_baseline(path: str, results: list, settings: dict = None):
+    """Write the results of a run, with the settings and environment it ran with, to a JSON file"""
+    baseline = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "machine": platform.platform(),
+        "settings": settings or {},
+        "results": {r.name: r.to_dict() for r in results},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+
+
+def load_baseline(path: str) -> dict:
+    """Return the results saved in a baseline file, by benchmark name"""
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    return {
+        name: BenchmarkResult.from_dict(values)
+        for name, values in baseline["results"].items()
+    }
+
+
+def compare(results: list, baseline: dict, threshold: float = 0.25) -> list:
+    """
+    Return the Regressions of results against a baseline
+
+    Parameters
+    ----------
+    results : the BenchmarkResults of this run
+    baseline : the BenchmarkResults of the baseline run, by name - benchmarks missing from it are skipped
+    threshold : how much worse than the baseline a metric may be - 0.25 allows latencies 25% higher, and a
+                throughput 25% lower, than the baseline's
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        for metric, higher_is_worse in compared_metrics.items():
+            before, now = getattr(base, metric), getattr(result, metric)
+            if before <= 0:
+                continue
+            if higher_is_worse:
+                worse = now > before * (1 + threshold)
+            else:
+                worse = now < before * (1 - threshold)
+            if worse:
+                regressions.append(Regression(result.name, metric, before, now))
+    return regressions
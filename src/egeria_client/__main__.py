@@ -1,13 +1,93 @@
 # __main__.py
+"""
+Generate load against an OMAG server platform, to size a deployment from measurements rather than guesses:
 
+    PYTHONPATH=src python -m egeria_client --url https://localhost:9443 --server cocoMDS1 --rate 50 \
+        --duration 300 --mix find_assets=4,get_comments=3,add_tag=1 --report load.json
+
+The comment and tag calls pick assets from those found by searching for --assets-matching, unless assets are
+given with --asset-guid.
+
+"""
+import argparse
 import sys
 
-from egeria_client import *
+from egeria_client.platform_services import Platform
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.load_generator import (
+    LoadGenerator,
+    arrival_patterns,
+    catalog_operations,
+    default_mix,
+    parse_mix,
+)
+
+
+def main(args=None) -> int:
+    """Initialize Egeria Client and generate load"""
+    parser = argparse.ArgumentParser(
+        prog="python -m egeria_client",
+        description="Generate an open-loop load of catalog calls against an OMAG server platform",
+    )
+    parser.add_argument("--url", default="https://localhost:9443")
+    parser.add_argument("--server", default="active-metadata-store")
+    parser.add_argument("--user", default="peterprofile")
+    parser.add_argument("--platform-user", default="garygeeke")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=default_mix,
+        help="operation=weight pairs, from " + ", ".join(default_mix),
+    )
+    parser.add_argument("--rate", type=float, default=10.0, help="calls per second")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds")
+    parser.add_argument("--arrivals", choices=arrival_patterns, default="uniform")
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--max-outstanding", type=int)
+    parser.add_argument("--search", default=".*", help="what find_assets searches for")
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--assets-matching", default=".*")
+    parser.add_argument("--asset-count", type=int, default=100)
+    parser.add_argument("--asset-guid", action="append")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--report", help="write the summary to this JSON file")
+    options = parser.parse_args(args)
+
+    consumer = AssetConsumer(options.server, options.url, options.user)
+    platform = Platform(options.server, options.url, options.platform_user)
+    asset_guids = options.asset_guid or consumer.find_assets(
+        options.assets_matching, page_size=options.asset_count
+    )
+    if not asset_guids:
+        parser.error(f"no assets match {options.assets_matching}")
+    operations = catalog_operations(
+        consumer,
+        platform,
+        asset_guids,
+        search_string=options.search,
+        page_size=options.page_size,
+        seed=options.seed,
+    )
+    try:
+        generator = LoadGenerator(
+            operations,
+            options.mix,
+            options.rate,
+            options.duration,
+            options.workers,
+            options.max_outstanding,
+            options.arrivals,
+            options.seed,
+        )
+    except ValueError as e:
+        parser.error(str(e))
 
-def main():
-    """Initialize Egeria Client"""
+    report = generator.run()
+    print(report.format())
+    if options.report:
+        report.write(options.report)
+    return 0
 
-    pass
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,286 @@
+"""
+Streaming helpers for open-metadata archives.
+
+Content packs can be hundreds of megabytes, so nothing here reads an archive into memory. ArchiveValidator
+checks the JSON syntax of an archive fed to it a chunk at a time, keeping only the nesting stack and the
+current token, and skips runs of string content and whitespace with a regular expression rather than a
+character at a time. archive_chunks reads the file a chunk at a time for upload, reporting progress as it goes.
+
+"""
+import codecs
+import os
+import re
+
+default_chunk_size = 1024 * 1024
+required_archive_keys = ("archiveProperties",)
+
+_number = re.compile(r"-?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?")
+_literals = ("true", "false", "null")
+_scalar_chars = frozenset("0123456789+-.eEtrufalsn")
+_scalar_run = re.compile(r"[0-9+\-.eEtrufalsn]*")
+_string_run = re.compile(r'[^"\\\x00-\x1f]*')
+_whitespace = frozenset(" \t\r\n")
+_whitespace_run = re.compile(r"[ \t\r\n]*")
+_escapes = frozenset('"\\/bfnrt')
+_hex_digits = frozenset("0123456789abcdefABCDEF")
+_max_scalar = 1024
+_max_key = 256
+
+# what the validator expects next
+_value = "a value"
+_value_or_end = "a value or ']'"
+_key_or_end = "a key or '}'"
+_key = "a key"
+_colon = "':'"
+_comma_or_end = "',' or a closing bracket"
+_end = "the end of the archive"
+
+
+class ArchiveValidationError(ValueError):
+    """Raised when an archive is not well-formed JSON, or is missing a required top-level property"""
+
+    def __init__(self, message: str, offset: int = None):
+        if offset is not None:
+            message = f"{message} at character {offset}"
+        ValueError.__init__(self, message)
+        self.offset = offset
+
+
+class ArchiveValidator:
+    """
+    Incremental JSON syntax checker for open-metadata archives
+
+    Attributes:
+        characters : int
+            the number of characters checked so far
+        top_level_keys : [str]
+            the property names of the top-level object, in the order they appeared
+
+    Methods:
+        feed(text)
+            checks the next chunk of the archive, raising ArchiveValidationError at the first syntax error
+        close(required_keys = ("archiveProperties",)) -> dict
+            checks the archive is complete and returns a summary of it
+    """
+
+    def __init__(self):
+        self.characters = 0
+        self.top_level_keys = []
+        self._stack = []
+        self._expect = _value
+        self._in_string = False
+        self._escape = (
+            0  # 1 after a backslash, 2-5 while reading the digits of a \u escape
+        )
+        self._key = None
+        self._scalar = ""
+        self._values = 0
+
+    def _fail(self, message: str, offset: int):
+        raise ArchiveValidationError(message, offset)
+
+    def _after_value(self):
+        self._values += 1
+        self._expect = _comma_or_end if self._stack else _end
+
+    def _end_scalar(self, offset: int):
+        token = self._scalar
+        self._scalar = ""
+        if token not in _literals and not _number.fullmatch(token):
+            self._fail(f"Invalid value {token[:40]!r}", offset - len(token))
+        self._after_value()
+
+    def _string_char(self, c: str, offset: int):
+        # called for the characters a string run stops at, and for every character of an escape
+        if self._escape == 1:
+            if c == "u":
+                self._escape = 2
+            elif c in _escapes:
+                self._escape = 0
+            else:
+                self._fail(f"Invalid escape '\\{c}'", offset)
+        elif self._escape:
+            if c not in _hex_digits:
+                self._fail("Invalid unicode escape", offset)
+            self._escape = self._escape + 1 if self._escape < 5 else 0
+        elif c == "\\":
+            self._escape = 1
+        elif c == '"':
+            self._in_string = False
+            if self._key is not None:
+                self.top_level_keys.append(self._key)
+                self._key = None
+            if self._expect == _key:
+                self._expect = _colon
+            else:
+                self._after_value()
+            return
+        else:
+            self._fail("Unescaped control character in string", offset)
+        if self._key is not None and len(self._key) < _max_key:
+            self._key += c
+
+    def feed(self, text: str):
+        """Check the next chunk of the archive"""
+        base = self.characters
+        i = 0
+        n = len(text)
+        while i < n:
+            if self._in_string:
+                if not self._escape:
+                    end = _string_run.match(text, i).end()
+                    if self._key is not None and len(self._key) < _max_key:
+                        self._key = (self._key + text[i:end])[:_max_key]
+                    i = end
+                    if i == n:
+                        break
+                self._string_char(text[i], base + i)
+                i += 1
+                continue
+            if self._scalar:
+                end = _scalar_run.match(text, i).end()
+                self._scalar += text[i:end]
+                if len(self._scalar) > _max_scalar:
+                    self._fail("Value too long", base + end)
+                i = end
+                if i == n:
+                    break
+                self._end_scalar(base + i)
+            c = text[i]
+            if c in _whitespace:
+                i = _whitespace_run.match(text, i).end()
+                continue
+            if c == '"':
+                if self._expect in (_key_or_end, _key):
+                    self._expect = _key
+                    if len(self._stack) == 1:
+                        self._key = ""
+                elif self._expect not in (_value, _value_or_end):
+                    self._fail(f"Expected {self._expect}, found '\"'", base + i)
+                self._in_string = True
+            elif c in "{[":
+                if self._expect not in (_value, _value_or_end):
+                    self._fail(f"Expected {self._expect}, found '{c}'", base + i)
+                self._stack.append(c)
+                self._expect = _key_or_end if c == "{" else _value_or_end
+            elif c in "}]":
+                opener = "{" if c == "}" else "["
+                closes_empty = self._expect == (
+                    _key_or_end if c == "}" else _value_or_end
+                )
+                if not self._stack or self._stack[-1] != opener:
+                    self._fail(f"Unexpected '{c}'", base + i)
+                if not closes_empty and self._expect != _comma_or_end:
+                    self._fail(f"Expected {self._expect}, found '{c}'", base + i)
+                self._stack.pop()
+                self._after_value()
+            elif c == ",":
+                if self._expect != _comma_or_end:
+                    self._fail(f"Expected {self._expect}, found ','", base + i)
+                self._expect = _key if self._stack[-1] == "{" else _value
+            elif c == ":":
+                if self._expect != _colon:
+                    self._fail(f"Expected {self._expect}, found ':'", base + i)
+                self._expect = _value
+            elif c in _scalar_chars and self._expect in (_value, _value_or_end):
+                self._scalar = c
+            else:
+                self._fail(f"Expected {self._expect}, found {c!r}", base + i)
+            i += 1
+        self.characters = base + n
+
+    def close(self, required_keys=required_archive_keys) -> dict:
+        """
+        Check that the archive is complete
+
+        Parameters
+        ----------
+        required_keys : the property names the top-level object must contain
+
+        Returns
+        -------
+        A dict with the number of characters checked, the number of values seen and the top-level keys
+        """
+        if self._scalar:
+            self._end_scalar(self.characters)
+        if self._in_string:
+            self._fail("Unterminated string", self.characters)
+        if self._expect != _end:
+            self._fail(f"Archive ends while expecting {self._expect}", self.characters)
+        missing = [k for k in required_keys if k not in self.top_level_keys]
+        if missing:
+            raise ArchiveValidationError(
+                f"Archive is missing the top-level properties {missing}"
+            )
+        return {
+            "characters": self.characters,
+            "values": self._values,
+            "top_level_keys": list(self.top_level_keys),
+        }
+
+
+def validate_archive(
+    archive_path: str,
+    chunk_size: int = default_chunk_size,
+    required_keys=required_archive_keys,
+) -> dict:
+    """
+    Check that a local archive file is well-formed JSON, reading it a chunk at a time
+
+    Parameters
+    ----------
+    archive_path : the path of the archive file
+    chunk_size : the number of bytes read at a time
+    required_keys : the property names the top-level object must contain
+
+    Returns
+    -------
+    A summary dict as returned by ArchiveValidator.close, plus the size of the file in bytes.
+    Raises ArchiveValidationError if the archive is not valid.
+    """
+    validator = ArchiveValidator()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with open(archive_path, "rb") as archive:
+        while True:
+            chunk = archive.read(chunk_size)
+            try:
+                text = decoder.decode(chunk, final=not chunk)
+            except UnicodeDecodeError as e:
+                raise ArchiveValidationError(
+                    f"Archive is not valid UTF-8: {e.reason}"
+                ) from e
+            if validator.characters == 0 and text.startswith("\ufeff"):
+                text = text[1:]
+            validator.feed(text)
+            if not chunk:
+                break
+    summary = validator.close(required_keys)
+    summary["bytes"] = os.path.getsize(archive_path)
+    return summary
+
+
+def archive_chunks(
+    archive_path: str, chunk_size: int = default_chunk_size, on_progress=None
+):
+    """
+    Yield the contents of an archive file a chunk at a time
+
+    Parameters
+    ----------
+    archive_path : the path of the archive file
+    chunk_size : the number of bytes read at a time
+    on_progress : optional function called as on_progress(bytes_sent, total_bytes) after each chunk is taken
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be greater than 0, not {chunk_size}")
+    total = os.path.getsize(archive_path)
+    sent = 0
+    with open(archive_path, "rb") as archive:
+        while True:
+            chunk = archive.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+            sent += len(chunk)
+            if on_progress is not None:
+                on_progress(sent, total)
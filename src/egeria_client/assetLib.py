@@ -15,7 +15,43 @@ class Asset:
 
 
 class AssetUniverse:
-    pass
+    """This class holds the universe of information about an asset and is created by parsing
+    the JSON object returned by the connected asset services for the asset"""
+
+    def __init__(
+        self, universe_object: dict, depth: int = 0, related_asset_guids: list = None
+    ):
+        self.universe = universe_object
+        asset = universe_object.get("asset") or {}
+        element_header = asset.get("elementHeader") or {}
+        element_type = element_header.get("type") or asset.get("type") or {}
+        asset_properties = asset.get("assetProperties") or asset
+        self.guid = element_header.get("guid") or asset.get("guid")
+        self.asset_type_name = element_type.get("typeName")
+        self.qualified_name = asset_properties.get("qualifiedName")
+        self.display_name = asset_properties.get("displayName")
+        self.depth = depth
+        self.related_asset_guids = related_asset_guids or []
+
+    def __str__(self):
+        s = f"asset GUID  : {self.guid}\n"
+        s = s + f"asset Type  : {self.asset_type_name}\n"
+        s = s + f"qualified   : {self.qualified_name}\n"
+        s = s + f"display name: {self.display_name}\n"
+        s = s + f"depth       : {self.depth}\n"
+        s = s + f"related     : {len(self.related_asset_guids)} \n"
+        return s
+
+
+def get_related_asset_guid(related_asset: dict) -> str:
+    """Return the guid of the asset described by an element of a related-assets list"""
+    for holder in (related_asset.get("relatedAsset"), related_asset):
+        if holder:
+            element_header = holder.get("elementHeader") or {}
+            guid = element_header.get("guid") or holder.get("guid")
+            if guid:
+                return guid
+    return None
 
 
 class Comment:
@@ -4,8 +4,6 @@
 #
 # Asset Consumer OMAS
 #
-import requests
-
 from src.egeria_client.assetLib import (
     print_asset_comment_replies,
     print_related_assets,
@@ -22,12 +20,34 @@ from src.egeria_client.util_exp import (
     issue_post,
     issue_get,
     validate_url,
+    max_paging_size,
+)
+from src.egeria_client.session_pool import session_pool
+from src.egeria_client.cache import AssetCache
+from src.egeria_client.disk_cache import DiskCache
+from src.egeria_client.singleflight import single_flight
+from src.egeria_client.retry import RetryPolicy, default_retry_policy
+from src.egeria_client.circuit_breaker import circuit_breakers, circuit_open_exception
+from src.egeria_client.metrics import calling_method, metrics
+from src.egeria_client.tracing import traced, tracing
+from src.egeria_client.paging import Pager, list_of
+from src.egeria_client.bulk_ops import (
+    BulkCheckpoint,
+    BulkReport,
+    default_bulk_retry_policy,
+    run_bulk,
+    safe_to_resend,
 )
 
 # from src.egeria_client.utils import issue_data_post, process_error_response, print_guid_list, \
 #     get_last_guid, issue_post, issue_get, validate_url, Asset
 from src.egeria_client.utils import comment_types, star_ratings
 import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from requests import Response
 
 
 def print_comment_list(comment_list: [Comment]):
@@ -61,21 +81,45 @@ class ConnectedAssetClientBase:
             The identity used to connect to the server
         server_user_pwd : str
             The password used to authenticate the server identity
+        session : requests.Session
+            The keep-alive session shared by all clients of the same platform
+        cache : AssetCache
+            Optional cache of asset lookups keyed by server, user and asset guid - None disables caching.
+            Entries for an asset are invalidated when this client changes the asset.
+        disk_cache : DiskCache
+            Optional persistent cache of glossary term and tag lookups, for example disk_cache_for(platform_url)
+            - None disables it. Lookups by name that find nothing are not cached, and those that do are
+            dropped when this client creates, updates or deletes a tag.
+        name_lookup_ttl : float
+            The number of seconds lookups by name stay in the disk cache, as others may add matching elements
+        coalesce_gets : bool
+            If True (the default) concurrent identical GETs share a single call and its response
+        retry_policy : RetryPolicy
+            How requests failing with a connection error or a transient 5xx status are retried
+        timeout : float
+            The number of seconds to wait for the server on each attempt of a request
+        circuit_breaker : CircuitBreaker
+            The breaker shared by all clients of this platform and server - while it is open requests fail
+            at once with CircuitOpenException
 
     Methods:
-        get_asset_properties (asset_guid)
+        get_asset_properties (asset_guid, end_user_id - optional, service_marker - optional)
             returns the properties for the asset
 
+        get_asset_universe (asset_guid, end_user_id - optional, service_marker - optional)
+            returns the universe of information about the asset as an AssetUniverse
+
         get_asset_summary (asset_guid)
             returns a summary of asset information
 
         get_comments (asset_guid, extended_properties - optional, debug - optional, start_from - optional,
-                      page_size - optional, end_user_id - optional, service_marker - optional)
+                      page_size - optional, end_user_id - optional, service_marker - optional,
+                      max_elements - optional)
                 Returns all top level comments linked to the specified asset in a list of comment objects
 
         get_comment_replies (asset_guid, comment_guid, extended_properties - optional, debug - optional,
-                            start_from - optional, page_size - optional, end_user_id - optional,
-                            service_marker - optional)
+                            end_user_id - optional, service_marker - optional, start_from - optional,
+                            page_size - optional, max_elements - optional)
                 Returns all replies for the specified comment_guid in a list of comment objects
 
         get_certifications (asset_guid, extended_properties - optional, debug - optional, start_from - optional,
@@ -93,10 +137,15 @@ class ConnectedAssetClientBase:
         end_user_id: str,
         server_user_id: str = None,
         server_user_pwd: str = None,
+        cache: AssetCache = None,
+        disk_cache: DiskCache = None,
     ):
-
-        if validate_url(server_platform_url, "ConnectedAssetClientBase", "server?"):
+        if validate_url(server_platform_url):
             self.server_platform_url = server_platform_url
+            self.session = session_pool.get_session(server_platform_url)
+            self.circuit_breaker = circuit_breakers.get(
+                server_platform_url, server_name
+            )
 
         self.guids = None
         self.server_name = server_name
@@ -104,9 +153,210 @@ class ConnectedAssetClientBase:
         self.server_user_pwd = server_user_pwd
 
         self.end_user_id = end_user_id
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.coalesce_gets = True
+        self.retry_policy = default_retry_policy
+        self.timeout = 30
+        self.name_lookup_ttl = 5 * 60.0
+
+    def _send(self, request_type: str, url: str, send, retry_safe: bool = False):
+        if not self.circuit_breaker.allow():
+            raise circuit_open_exception(
+                self.circuit_breaker,
+                self.server_platform_url,
+                self.server_name,
+                url,
+                type(self).__name__,
+                sys._getframe(2).f_code.co_name,
+            )
+        try:
+            response = metrics.observe(
+                lambda: calling_method(self),
+                request_type,
+                url,
+                lambda on_retry: self.retry_policy.call(
+                    request_type,
+                    send,
+                    timeout=self.timeout,
+                    safe=retry_safe,
+                    on_retry=on_retry,
+                ),
+            )
+        except BaseException:
+            # any failure - not only a connection error - ends a half-open trial call
+            self.circuit_breaker.record_failure()
+            raise
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+        return response
 
-    def get_asset_properties(self, asset_guid: str):
-        pass
+    def _get(self, url: str) -> Response:
+        """Issue a GET, sharing the call with concurrent identical GETs unless coalesce_gets is False"""
+
+        def get():
+            return self._send(
+                "GET",
+                url,
+                lambda timeout: self.session.get(
+                    url,
+                    verify=False,
+                    headers=tracing.inject(self.json_header),
+                    timeout=timeout,
+                ),
+            )
+
+        if not self.coalesce_gets:
+            return get()
+        # keyed by the code path too, so a GET is only shared with callers sending it the same way
+        return single_flight.do(("ConnectedAssetClientBase", "GET", url), get)
+
+    def _post(self, url: str, body: dict, retry_safe: bool = False) -> Response:
+        """Issue a POST - it is only retried if retry_safe is True, for example for a query"""
+        return self._send(
+            "POST",
+            url,
+            lambda timeout: self.session.post(
+                url,
+                json=body,
+                verify=False,
+                headers=tracing.inject(self.json_header),
+                timeout=timeout,
+            ),
+            retry_safe,
+        )
+
+    def _get_json(self, url: str) -> dict:
+        response = self._get(url)
+        if response.status_code != 200:
+            raise ConnectionError(response.text)
+        return response.json()
+
+    def _post_json(self, url: str, body: dict) -> dict:
+        response = self._post(url, body, retry_safe=True)
+        if response.status_code != 200:
+            raise ConnectionError(response.text)
+        return response.json()
+
+    def _disk_cache_key(self, end_user_id: str, *parts) -> str:
+        return "/".join((self.server_name, end_user_id) + tuple(map(str, parts)))
+
+    def _disk_cached(
+        self, key: str, fetch, required: str = None, ttl: float = None
+    ) -> dict:
+        """Return the cached body for key, fetching it on a miss - only cached if its required field is set"""
+        if self.disk_cache is None:
+            return fetch()
+        body = self.disk_cache.get(key)
+        if body is None:
+            body = fetch()
+            if required is None or body.get(required):
+                self.disk_cache.put(key, body, ttl)
+        return body
+
+    def _invalidate_tag(
+        self, end_user_id: str, tag_guid: str = None, tag_name: str = None
+    ):
+        """Drop the cached tag and the by-name lookups it may appear in - all names if tag_name is None"""
+        if self.disk_cache is None:
+            return
+        if tag_guid is not None:
+            self.disk_cache.invalidate(
+                self._disk_cache_key(end_user_id, "tags", tag_guid)
+            )
+        if tag_name is None:
+            prefix = self._disk_cache_key(end_user_id, "tags/by-name")
+        else:
+            prefix = self._disk_cache_key(end_user_id, "tags/by-name", tag_name)
+        self.disk_cache.invalidate_prefix(prefix + "/")
+
+    def _invalidate_asset(self, asset_guid: str):
+        if self.cache is not None:
+            self.cache.invalidate_asset(self.server_name, asset_guid)
+
+    def _get_universe_object(
+        self, asset_guid: str, end_user_id: str, service_marker: str
+    ) -> dict:
+        if self.cache is not None:
+            universe = self.cache.get_asset(self.server_name, end_user_id, asset_guid)
+            if universe is not None:
+                return universe
+
+        url = (
+            self.server_platform_url
+            + "/servers/"
+            + self.server_name
+            + "/open-metadata/common-services/"
+            + service_marker
+            + "/connected-asset/users/"
+            + end_user_id
+            + "/assets/"
+            + asset_guid
+        )
+        response = self._get(url)
+        if response.status_code != 200:
+            raise ConnectionError(response.text)
+
+        universe = response.json()
+        if self.cache is not None and universe.get("asset"):
+            self.cache.put_asset(self.server_name, end_user_id, asset_guid, universe)
+        return universe
+
+    def get_asset_properties(
+        self,
+        asset_guid: str,
+        end_user_id: str = None,
+        service_marker: str = "asset-consumer",
+    ) -> dict:
+        """
+        Parameters
+        ----------
+        asset_guid : str
+            Unique identifier of the asset
+        end_user_id : str = None, optional
+            the identity of the end user - defaults to the end_user_id given to the constructor
+        service_marker : str = "asset-consumer", optional
+            the access service whose connected asset services are called
+
+        Returns
+        -------
+        The asset element as a dict, or None if no asset was returned. Served from the cache when
+        one is configured and holds a live entry for the asset.
+        """
+        if end_user_id is None:
+            end_user_id = self.end_user_id
+        universe = self._get_universe_object(asset_guid, end_user_id, service_marker)
+        return universe.get("asset")
+
+    def get_asset_universe(
+        self,
+        asset_guid: str,
+        end_user_id: str = None,
+        service_marker: str = "asset-consumer",
+    ) -> AssetUniverse:
+        """
+        Parameters
+        ----------
+        asset_guid : str
+            Unique identifier of the asset
+        end_user_id : str = None, optional
+            the identity of the end user - defaults to the end_user_id given to the constructor
+        service_marker : str = "asset-consumer", optional
+            the access service whose connected asset services are called
+
+        Returns
+        -------
+        An AssetUniverse, or None if no asset was returned. Shares its cache entries with
+        get_asset_properties.
+        """
+        if end_user_id is None:
+            end_user_id = self.end_user_id
+        universe = self._get_universe_object(asset_guid, end_user_id, service_marker)
+        if not universe.get("asset"):
+            return None
+        return AssetUniverse(universe)
 
     def get_asset_summary(self, asset_guid: str, method_name: str) -> Asset:
         pass
@@ -120,6 +370,7 @@ class ConnectedAssetClientBase:
         page_size: int = 0,
         end_user_id: str = None,
         service_marker: str = "asset-consumer",
+        max_elements: int = 0,
     ):
         """
         Parameters
@@ -127,13 +378,16 @@ class ConnectedAssetClientBase:
         asset_guid :
         extended_properties :
         debug :
-        start_from :
-        page_size :
+        start_from : the index of the first comment to return
+        page_size : the initial number of comments requested per call - 0 uses the paging default.
+                    All pages are retrieved; the page size adapts to the observed response times.
         end_user_id :
         service_marker :
+        max_elements : the maximum number of comments to return - 0 means all of them
 
         Returns
         -------
+        A list of Comment objects, or None if there are none
 
         """
         comment_list = []
@@ -150,35 +404,37 @@ class ConnectedAssetClientBase:
             + end_user_id
         )
 
-        comment_query_url = (
-            connected_asset_url
-            + "/assets/"
-            + asset_guid
-            + "/comments?elementStart="
-            + str(start_from)
-            + "&maxElements="
-            + str(page_size)
-        )
+        def fetch(element_start: int, max_page: int):
+            comment_query_url = (
+                connected_asset_url
+                + "/assets/"
+                + asset_guid
+                + "/comments?elementStart="
+                + str(element_start)
+                + "&maxElements="
+                + str(max_page)
+            )
+            response = self._get(comment_query_url)
+            if response.status_code != 200:
+                raise ConnectionError(response.text)
+            return response
 
-        response = requests.get(
-            comment_query_url, verify=False, headers=self.json_header
+        pager = Pager(
+            fetch, list_of("list"), start_from, page_size, max_elements=max_elements
         )
+        for response_object in pager:
+            comment_list.append(Comment(response_object))
 
-        if response.status_code != 200:
-            raise ConnectionError(response.text)
-
-        response_objects = response.json().get("list")
-
-        if response_objects:
-            for x in range(len(response_objects)):
-                comment_list.append(Comment(response_objects[x]))
+        if comment_list:
             if debug:
-                print(f"In {__name__} the comments were returned")
+                print(
+                    f"In {__name__} {len(comment_list)} comments were returned in {pager.pages_fetched} pages"
+                )
+                if pager.truncated:
+                    print(f"In {__name__} more comments from {pager.start_from}")
             return comment_list
         elif debug:
-            print(
-                "In get_comments, no comments returned, response was {response.json()}"
-            )
+            print("In get_comments, no comments returned")
             return None
 
     def get_comment_replies(
@@ -189,6 +445,9 @@ class ConnectedAssetClientBase:
         debug: bool = False,
         end_user_id: str = None,
         service_marker: str = "asset-consumer",
+        start_from: int = 0,
+        page_size: int = 0,
+        max_elements: int = 0,
     ):
         comment_list = []
         if end_user_id is None:
@@ -204,20 +463,27 @@ class ConnectedAssetClientBase:
             + end_user_id
         )
 
-        comment_query = (
-            connectedAssetURL
-            + "/assets/"
-            + asset_guid
-            + "/comments/"
-            + comment_guid
-            + "/replies?elementStart=0&maxElements=50"
+        def fetch(element_start: int, max_page: int):
+            comment_query = (
+                connectedAssetURL
+                + "/assets/"
+                + asset_guid
+                + "/comments/"
+                + comment_guid
+                + "/replies?elementStart="
+                + str(element_start)
+                + "&maxElements="
+                + str(max_page)
+            )
+            return issue_get(comment_query)
+
+        pager = Pager(
+            fetch, list_of("list"), start_from, page_size, max_elements=max_elements
         )
-        response = issue_get(comment_query)
-        response_objects = response.json().get("list")
-        if response_objects:
-            for x in response_objects:
-                if x:
-                    comment_list.append(Comment(x))
+        for x in pager:
+            if x:
+                comment_list.append(Comment(x))
+        if comment_list:
             if debug:
                 print(f"in get_comment_replies there are {len(comment_list)} replies")
                 print(f"replies found in get_comment_replies are {comment_list}")
@@ -240,6 +506,8 @@ class ConnectedAssetClientBase:
         pass
 
 
+# the iterators are not traced themselves - each page they read is a traced call
+@traced(exclude=("iter_assets", "iter_assets_by_meaning", "iter_meanings", "iter_tags"))
 class AssetConsumer(ConnectedAssetClientBase):
     """AssetConsumer provides users the ability to find, retrieve information and annotate assets
 
@@ -257,6 +525,9 @@ class AssetConsumer(ConnectedAssetClientBase):
         a list of GUIDs
     asset_consumer_endpoint: str
         constructed string representing the base endpoint URL
+    tag_index: TagIndex
+        the tag index attached to this client, if any - tags created, deleted or updated through this
+        client are applied to it straight away
 
     Methods
     -------
@@ -265,20 +536,26 @@ class AssetConsumer(ConnectedAssetClientBase):
         returns assets associated with the specified term_guid as a list of asset_guids
 
     find_meanings (term: str, end_user_id: str = None, extended_properties=None, debug: bool = False,
-                   start_from: int = 0, page_size: int = 0) -> list[str]
-        returns the assets associated with the specified glossary term as a list of guids
+                   start_from: int = 0, page_size: int = 0) -> list[dict]
+        returns the glossary terms whose names match the regular expression in term
 
     find_assets(search_string: str)
         searches for assets matching the regular expression in the search_string
 
+    iter_assets(search_string: str, page_size: int = max_paging_size, read_ahead: bool = False)
+        yields the guids of all assets matching the search_string, fetching them page by page
+
     add_comment_to_asset(asset_guid, comment_text, comment_type, is_public)
         adds the comment_text as a comment to the asset represented by asset_guid
 
     add_reply_to_asset_comment(asset_guid, comment_guid, comment_text, comment_type, is_public)
         adds a reply to the comment represented by comment_guid on asset asset_guid
+
+    bulk_comments(specs, max_workers: int = 8, checkpoint_path: str = None) -> BulkReport
+        adds, replies to and updates many comments concurrently, resuming from a checkpoint file
     remove_comment_from_asset()  <--
 
-    asset_consumer_get_asset_universe(asset_guid)
+    get_asset_universe(asset_guid)
         returns the universe of information about the asset specified by asset_guid
 
     asset_consumer_print_asset_comment_replies(asset_guid, comment_guid)
@@ -300,6 +577,8 @@ class AssetConsumer(ConnectedAssetClientBase):
         end_user_id: str,
         server_user_id: str = None,
         server_user_pwd: str = None,
+        cache: AssetCache = None,
+        disk_cache: DiskCache = None,
     ):
         """This constructor takes connection information to instantiate an AssetConsumer object"""
         ConnectedAssetClientBase.__init__(
@@ -309,10 +588,13 @@ class AssetConsumer(ConnectedAssetClientBase):
             end_user_id,
             server_user_id,
             server_user_pwd,
+            cache,
+            disk_cache,
         )
         self.asset_consumer_endpoint = "{0}/servers/{1}/open-metadata/access-services/asset-consumer/users/".format(
             server_platform_url, server_name
         )
+        self.tag_index = None
 
     def get_assets_by_meaning(
         self,
@@ -353,14 +635,58 @@ class AssetConsumer(ConnectedAssetClientBase):
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
-
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        url = (
+            self.asset_consumer_endpoint
+            + end_user_id
+            + "/assets/by-meaning/"
+            + term_guid
+            + "?startFrom="
+            + str(start_from)
+            + "&pageSize="
+            + str(page_size)
+        )
+        response = self._get(url)
         if debug:
             print(f"response is: {response}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
 
-        return response
+        return response.json().get("guids")
+
+    def iter_assets_by_meaning(
+        self,
+        term_guid: str,
+        page_size: int = max_paging_size,
+        end_user_id: str = None,
+    ):
+        """Yields the guids of the assets associated with the glossary term, calling
+        get_assets_by_meaning a page at a time
+
+        Raises
+        ------
+            ValueError if page_size is not greater than 0
+            ConnectionError
+        """
+        if page_size <= 0:
+            raise ValueError(f"page_size must be greater than 0, not {page_size}")
+
+        def fetch(start_from: int, size: int):
+            return self.get_assets_by_meaning(
+                term_guid,
+                end_user_id=end_user_id,
+                start_from=start_from,
+                page_size=size,
+            )
+
+        return iter(
+            Pager(
+                fetch,
+                extract=lambda guids: guids,
+                page_size=page_size,
+                adaptive=False,
+                max_page_size=page_size,
+            )
+        )
 
     def find_meanings(
         self,
@@ -370,16 +696,16 @@ class AssetConsumer(ConnectedAssetClientBase):
         debug: bool = False,
         start_from: int = 0,
         page_size: int = 0,
-    ) -> [str]:
-        """Returns the assets associated with the specified glossary term as a list of guids
+    ) -> [dict]:
+        """Returns the glossary terms whose names match the regular expression in term
         Parameters
         ----------
         term : str
-            the glossary term we are investigating for related assets
+            a regular expression matching the names of the glossary terms
 
         Returns
         -------
-            List of asset_guid strings
+            A list of glossary term (meaning) elements, or None if there are none
 
         Other Parameters
         ----------------
@@ -398,12 +724,53 @@ class AssetConsumer(ConnectedAssetClientBase):
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
-
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        url = (
+            self.asset_consumer_endpoint
+            + end_user_id
+            + "/meanings/by-search-string?startFrom="
+            + str(start_from)
+            + "&pageSize="
+            + str(page_size)
+        )
+        body = {"class": "SearchStringRequestBody", "searchString": term}
+        response = self._post(url, body, retry_safe=True)
         if debug:
             print(f"response is: {response}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        return response.json().get("meanings")
+
+    def iter_meanings(
+        self,
+        term: str,
+        page_size: int = max_paging_size,
+        end_user_id: str = None,
+    ):
+        """Yields the glossary term elements whose names match the regular expression in term,
+        calling find_meanings a page at a time
+
+        Raises
+        ------
+            ValueError if page_size is not greater than 0
+            ConnectionError
+        """
+        if page_size <= 0:
+            raise ValueError(f"page_size must be greater than 0, not {page_size}")
+
+        def fetch(start_from: int, size: int):
+            return self.find_meanings(
+                term, end_user_id, start_from=start_from, page_size=size
+            )
+
+        return iter(
+            Pager(
+                fetch,
+                extract=lambda meanings: meanings,
+                page_size=page_size,
+                adaptive=False,
+                max_page_size=page_size,
+            )
+        )
 
     def find_assets(
         self,
@@ -464,7 +831,7 @@ class AssetConsumer(ConnectedAssetClientBase):
             + "&pageSize="
             + str(page_size)
         )
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        response = self._post(url, body, retry_safe=True)
 
         if debug:
             print(f"In find_assets response is {response.json()}")
@@ -475,49 +842,65 @@ class AssetConsumer(ConnectedAssetClientBase):
         guids = response.json().get("guids")
         return guids
 
-    def get_asset_properties(
-        self, asset_guid: str, end_user_id: str = None, extended_properties=None
+    def iter_assets(
+        self,
+        search_string: str,
+        page_size: int = max_paging_size,
+        read_ahead: bool = False,
+        extended_properties=None,
+        end_user_id: str = None,
     ):
-        """Returns the properties for the asset
+        """Yields the guids of all assets matching the regular expression in the search_string.
+        Pages are requested from the server only as the caller consumes the guids, so memory use is
+        bounded by the page size however many assets match.
+
         Parameters
         ----------
-        asset_guid :
-        end_user_id :
-        extended_properties :
+        search_string : a regular expression string defining the search criteria
 
         Returns
         -------
+        A generator of asset guid strings
 
-        """
-        if end_user_id is None:
-            end_user_id = self.end_user_id
+        Other Parameters
+        ----------------
+        page_size : int = max_paging_size, optional
+            Specifies the number of guids requested per call to find_assets. Must be greater than 0.
+        read_ahead : bool = False, optional
+            If True, the next page is fetched on a background thread while the caller
+            processes the current one.
+        end_user_id : str = none, optional
+            the identity of the end user. Default is none. If not specified (or none) end_user_id is set to
+            the default defined in the constructor
+        extended_properties : optional
 
-        asset_consumer_url = (
-            self.server_platform_url
-            + "/servers/"
-            + self.server_name
-            + "/open-metadata/access-services/asset-consumer/users/"
-            + end_user_id
-        )
-        body = {"class": "SearchStringRequestBody", "searchString": search_string}
+        Raises
+        ------
+            ValueError if page_size is not greater than 0
+            ConnectionError
+        """
+        if page_size <= 0:
+            raise ValueError(f"page_size must be greater than 0, not {page_size}")
+
+        def fetch(start_from: int, size: int):
+            return self.find_assets(
+                search_string,
+                extended_properties,
+                start_from=start_from,
+                page_size=size,
+                end_user_id=end_user_id,
+            )
 
-        url = (
-            asset_consumer_url
-            + "/assets/by-search-string?startFrom="
-            + str(start_from)
-            + "&pageSize="
-            + str(page_size)
+        return iter(
+            Pager(
+                fetch,
+                extract=lambda guids: guids,
+                page_size=page_size,
+                adaptive=False,
+                max_page_size=page_size,
+                read_ahead=read_ahead,
+            )
         )
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
-
-        if debug:
-            print(f"In find_assets response is {response.json()}")
-
-        if response.status_code != 200:
-            raise ConnectionError(response.text)
-
-        guids = response.json().get("guids")
-        return guids
 
     # returns list of Meaning Elements
     def get_meaning_by_name(
@@ -532,7 +915,8 @@ class AssetConsumer(ConnectedAssetClientBase):
         """
         Parameters
         ----------
-        term :
+        term : str
+            the name of the glossary term
         end_user_id :
         extended_properties :
         debug :
@@ -541,77 +925,102 @@ class AssetConsumer(ConnectedAssetClientBase):
 
         Returns
         -------
-
+        A list of glossary term elements, or None if there are none. Served from the disk cache
+        when one is configured.
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
-        asset_consumer_url = (
-            self.server_platform_url
-            + "/servers/"
-            + self.server_name
-            + "/open-metadata/access-services/asset-consumer/users/"
-            + end_user_id
-        )
-
-        body = {"class": "NameRequestBody", "name": term}
-
         url = (
-            asset_consumer_url
-            + "/meanings/by-name?startFrom"
+            self.asset_consumer_endpoint
+            + end_user_id
+            + "/meanings/by-name?startFrom="
             + str(start_from)
             + "&pageSize="
             + str(page_size)
         )
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        body = {"class": "NameRequestBody", "name": term}
+        key = self._disk_cache_key(
+            end_user_id, "meanings/by-name", term, start_from, page_size
+        )
+        response_body = self._disk_cached(
+            key, lambda: self._post_json(url, body), "meanings", self.name_lookup_ttl
+        )
 
         if debug:
-            print(f"In find_assets response is {response.json()}")
-
-        if response.status_code != 200:
-            raise ConnectionError(response.text)
-
-    # Look at this more closely
-    # guids = response.json().get('guids')
-
-    # return (guids)
+            print(f"In get_meaning_by_name response is {response_body}")
+        return response_body.get("meanings")
 
     # returns meaning Element
     def get_meaning(
-        self, term_guid: str, end_user_id: str = None, extended_properties=None
+        self,
+        term_guid: str,
+        end_user_id: str = None,
+        extended_properties=None,
+        debug: bool = False,
     ):
         """
         Parameters
         ----------
-        term_guid :
+        term_guid : str
+            Unique identifier of the glossary term
         end_user_id :
         extended_properties :
+        debug :
 
         Returns
         -------
-
+        The glossary term element, or None. Served from the disk cache when one is configured.
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
-        asset_consumer_url = (
-            self.server_platform_url
-            + "/servers/"
-            + self.server_name
-            + "/open-metadata/access-services/asset-consumer/users/"
-            + end_user_id
-        )
-
-        url = asset_consumer_url + "/meanings/" + term_guid
-        response = requests.get(url, verify=False, headers=self.json_header)
+        url = self.asset_consumer_endpoint + end_user_id + "/meanings/" + term_guid
+        key = self._disk_cache_key(end_user_id, "meanings", term_guid)
+        response_body = self._disk_cached(key, lambda: self._get_json(url))
 
         if debug:
-            print(f"In find_assets response is {response.json()}")
+            print(f"In get_meaning response is {response_body}")
+        return response_body.get("meaning")
 
-        if response.status_code != 200:
-            raise ConnectionError(response.text)
+    def warm_disk_cache(
+        self,
+        term_guids=(),
+        tag_guids=(),
+        end_user_id: str = None,
+        max_workers: int = 8,
+    ) -> int:
+        """
+        Load the glossary terms and tags that are not yet in the disk cache
 
-        # guids = response.json().get('guids')
-        # create a meaning object to return
-        return
+        Parameters
+        ----------
+        term_guids : an iterable of glossary term guids, as passed to get_meaning
+        tag_guids : an iterable of tag guids, as passed to get_tag
+        end_user_id :
+        max_workers : the number of lookups issued at the same time
+
+        Returns
+        -------
+        The number of entries fetched from the server
+        """
+        if self.disk_cache is None:
+            raise ValueError("warm_disk_cache needs a disk_cache")
+        if end_user_id is None:
+            end_user_id = self.end_user_id
+        urls = {}
+        for kind, guids in (("meanings", term_guids), ("tags", tag_guids)):
+            for guid in guids:
+                key = self._disk_cache_key(end_user_id, kind, guid)
+                urls[key] = (
+                    self.asset_consumer_endpoint + end_user_id + "/" + kind + "/" + guid
+                )
+
+        missing = [key for key in urls if key not in self.disk_cache.get_many(urls)]
+        if not missing:
+            return 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            bodies = executor.map(lambda key: self._get_json(urls[key]), missing)
+            self.disk_cache.put_many(dict(zip(missing, bodies)))
+        return len(missing)
 
     #
     # Comments
@@ -678,12 +1087,11 @@ class AssetConsumer(ConnectedAssetClientBase):
             "commentText": comment_text,
             "isPublic": json_public,
         }
-        response = requests.post(
-            add_comment_url, json=comment_body, verify=False, headers=self.json_header
-        )
+        response = self._post(add_comment_url, comment_body)
 
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        self._invalidate_asset(asset_guid)
 
         comment_guid = response.json().get("guid")
         if comment_guid:
@@ -756,16 +1164,12 @@ class AssetConsumer(ConnectedAssetClientBase):
             "commentText": comment_text,
             "isPublic": json_public,
         }
-        response = requests.post(
-            update_comment_url,
-            json=comment_body,
-            verify=False,
-            headers=self.json_header,
-        )
+        response = self._post(update_comment_url, comment_body)
 
         if response.status_code != 200:
             raise ConnectionError(response.text)
-        elif debug:
+        self._invalidate_asset(asset_guid)
+        if debug:
             print(f"update_comment worked: {response.text}")
         return
 
@@ -810,11 +1214,12 @@ class AssetConsumer(ConnectedAssetClientBase):
         if debug:
             print(f" Comment to delete is: {comment_guid}")
 
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        response = self._post(url, body)
 
         if response.status_code != 200:
             raise ConnectionError(response.text)
-        elif debug:
+        self._invalidate_asset(asset_guid)
+        if debug:
             print(f"in remove_comment, response is: {response.json()}")
         return
 
@@ -869,10 +1274,11 @@ class AssetConsumer(ConnectedAssetClientBase):
             "commentText": comment_text,
             "isPublic": json_public,
         }
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        response = self._post(url, body)
 
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        self._invalidate_asset(asset_guid)
 
         comment_guid = response.json().get("guid")
         if comment_guid:
@@ -883,6 +1289,122 @@ class AssetConsumer(ConnectedAssetClientBase):
             )
             return None
 
+    def _apply_comment_spec(self, spec: dict, comment_guid: str = None) -> str:
+        action = spec.get("action", "reply" if "reply_to" in spec else "add")
+        args = (
+            spec["comment_text"],
+            spec.get("comment_type", "STANDARD_COMMENT"),
+            spec.get("is_public", True),
+        )
+        end_user_id = spec.get("end_user_id")
+        comment_guid = comment_guid or spec.get("comment_guid")
+        if action == "add":
+            return self.add_comment_to_asset(
+                spec["asset_guid"], *args, end_user_id=end_user_id
+            )
+        if action == "reply":
+            return self.add_comment_reply(
+                spec["asset_guid"], comment_guid, *args, end_user_id=end_user_id
+            )
+        if action == "update":
+            self.update_comment(
+                spec["asset_guid"], comment_guid, *args, end_user_id=end_user_id
+            )
+            return comment_guid
+        raise ValueError(f"{action} is not a valid comment action")
+
+    def bulk_comments(
+        self,
+        specs,
+        max_workers: int = 8,
+        checkpoint_path: str = None,
+        retry_policy: RetryPolicy = default_bulk_retry_policy,
+        on_result=None,
+    ) -> BulkReport:
+        """
+        Add, reply to and update many comments, several at a time
+
+        Parameters
+        ----------
+        specs : an iterable of dicts, one per comment, with the keys
+                asset_guid, comment_text - required
+                action - "add" (the default), "reply" or "update"
+                comment_type - from comment_types, default STANDARD_COMMENT
+                is_public - default True
+                comment_guid - the comment replied to or updated
+                key - a stable identifier of the spec, such as the id of the comment in the system it is
+                      migrated from, used by the checkpoint. Defaults to the position of the spec.
+                reply_to - the key of another spec in specs whose comment this one replies to. The reply
+                      is made once that comment exists, and fails if it could not be added.
+                end_user_id - defaults to the end_user_id of the client
+        max_workers : the maximum number of comments being sent at the same time
+        checkpoint_path : optional path of a checkpoint file - specs that it records as done are not sent
+                again when the same specs are re-run after an interruption
+        retry_policy : how often and how soon a comment that failed with a transient error is retried - only
+                errors showing the comment was not added are, so that a retry cannot post it twice: the
+                connection failing or timing out, or a 503 or 429 status. A comment whose response timed out,
+                or that failed with another 5xx status, fails - a comment has no name to look it up by, to
+                tell whether it was added.
+        on_result : optional function called with each BulkResult as it completes
+
+        Returns
+        -------
+        A BulkReport with one BulkResult per spec in input order - its value is the guid of the comment
+        added, replied or updated, and its error the reason the spec failed
+        """
+        specs = list(specs)
+        keys = [str(spec.get("key", i)) for i, spec in enumerate(specs)]
+        position = {key: i for i, key in enumerate(keys)}
+        results = [None] * len(specs)
+        pending = list(range(len(specs)))
+        start = time.perf_counter()
+        checkpoint = (
+            None if checkpoint_path is None else BulkCheckpoint(checkpoint_path)
+        )
+        try:
+            while pending:
+                # a reply waits for the comment it replies to when that is in the same bulk request
+                ready, blocked = [], []
+                for i in pending:
+                    parent = position.get(str(specs[i].get("reply_to")))
+                    if parent is None or results[parent] is not None:
+                        ready.append(i)
+                    else:
+                        blocked.append(i)
+                if not ready:
+                    raise ValueError(
+                        f"reply_to cycle among specs {[keys[i] for i in blocked]}"
+                    )
+
+                def operation(i):
+                    parent = position.get(str(specs[i].get("reply_to")))
+                    if parent is None:
+                        return self._apply_comment_spec(specs[i])
+                    if not results[parent].ok:
+                        raise ValueError(
+                            f"the comment replied to, {keys[parent]}, failed"
+                        )
+                    return self._apply_comment_spec(specs[i], results[parent].value)
+
+                wave = run_bulk(
+                    ready,
+                    operation,
+                    key=lambda i: keys[i],
+                    max_workers=max_workers,
+                    retry_policy=retry_policy,
+                    checkpoint=checkpoint,
+                    retry_on=safe_to_resend,
+                    on_result=on_result,
+                )
+                for i, result in zip(ready, wave.results):
+                    result.index = i
+                    results[i] = result
+                pending = blocked
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+        return BulkReport(results, time.perf_counter() - start)
+
     #
     # Likes & Ratings
     #
@@ -923,11 +1445,12 @@ class AssetConsumer(ConnectedAssetClientBase):
             + "/likes"
         )
         body = {"isPublic": json_public}
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        response = self._post(url, body)
         if debug:
             print(f"response is: {response.text}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        self._invalidate_asset(asset_guid)
         return True
 
     def remove_like(
@@ -959,12 +1482,13 @@ class AssetConsumer(ConnectedAssetClientBase):
             + asset_guid
             + "/likes/delete"
         )
-        body = {"isPublic": json_public}
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        body = {"class": "NullRequestBody"}
+        response = self._post(url, body)
         if debug:
             print(f"response is: {response}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        self._invalidate_asset(asset_guid)
         return True
 
     def add_rating(
@@ -1013,11 +1537,12 @@ class AssetConsumer(ConnectedAssetClientBase):
             "user": end_user_id,
             "isPublic": json_public,
         }
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        response = self._post(url, body)
         if debug:
             print(f"response is: {response.text}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        self._invalidate_asset(asset_guid)
         return True
 
     def remove_rating(
@@ -1049,11 +1574,12 @@ class AssetConsumer(ConnectedAssetClientBase):
             + "/ratings/delete"
         )
         body = {}
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        response = self._post(url, body)
         if debug:
             print(f"response is: {response.text}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        self._invalidate_asset(asset_guid)
         return True
 
     #
@@ -1098,11 +1624,12 @@ class AssetConsumer(ConnectedAssetClientBase):
         )
         body = {"isPublic": json_public}
 
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        response = self._post(url, body)
         if debug:
             print(f"response is: {response.text}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        self._invalidate_asset(asset_guid)
         return
 
     def add_tag_to_element(
@@ -1138,8 +1665,6 @@ class AssetConsumer(ConnectedAssetClientBase):
         url = (
             self.asset_consumer_endpoint
             + end_user_id
-            + "/assets/"
-            + asset_guid
             + "/elements/"
             + element_guid
             + "/tags/"
@@ -1147,11 +1672,12 @@ class AssetConsumer(ConnectedAssetClientBase):
         )
         body = {"isPublic": json_public}
 
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        response = self._post(url, body)
         if debug:
             print(f"response is: {response}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        self._invalidate_asset(element_guid)
         return True
 
     def create_private_tag(
@@ -1186,14 +1712,20 @@ class AssetConsumer(ConnectedAssetClientBase):
             "description": tag_description,
             "user": end_user_id,
         }
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        response = self._post(url, body)
         if debug:
             print(f"response is: {response.text}")
 
         if response.status_code != 200:
             raise ConnectionError(response.text)
 
-        return response.json().get("guid")
+        guid = response.json().get("guid")
+        self._invalidate_tag(end_user_id, tag_name=tag_name)
+        if self.tag_index is not None and guid:
+            self.tag_index.tag_created(
+                guid, tag_name, tag_description, end_user_id, is_private=True
+            )
+        return guid
 
     def create_public_tag(
         self,
@@ -1227,12 +1759,18 @@ class AssetConsumer(ConnectedAssetClientBase):
             "description": tag_description,
             "user": end_user_id,
         }
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        response = self._post(url, body)
         if debug:
             print(f"response is: {response}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
-        return response.json().get("guid")
+        guid = response.json().get("guid")
+        self._invalidate_tag(end_user_id, tag_name=tag_name)
+        if self.tag_index is not None and guid:
+            self.tag_index.tag_created(
+                guid, tag_name, tag_description, end_user_id, is_private=False
+            )
+        return guid
 
     def delete_tag(
         self,
@@ -1256,18 +1794,20 @@ class AssetConsumer(ConnectedAssetClientBase):
         if end_user_id is None:
             end_user_id = self.end_user_id
         url = (
-            self.asset_consumer_endpoint + end_user_id + "/tags" + tag_guid + "/delete"
+            self.asset_consumer_endpoint + end_user_id + "/tags/" + tag_guid + "/delete"
         )
         body = {
             "class": "NullRequestBody",
         }
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        response = self._post(url, body)
         if debug:
             print(f"response is: {response.text}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
-        else:
-            return True
+        self._invalidate_tag(end_user_id, tag_guid)
+        if self.tag_index is not None:
+            self.tag_index.tag_deleted(tag_guid)
+        return True
 
     def find_my_tags(
         self,
@@ -1290,24 +1830,26 @@ class AssetConsumer(ConnectedAssetClientBase):
 
         Returns
         -------
-
+        A list of the end user's private informal tag elements whose names match the regular
+        expression in tag, or None if there are none
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
         url = (
             self.asset_consumer_endpoint
             + end_user_id
-            + "/tags/private/by-search-string/?startFrom"
+            + "/tags/private/by-search-string?startFrom="
             + str(start_from)
             + "&pageSize="
             + str(page_size)
         )
-
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        body = {"class": "SearchStringRequestBody", "searchString": tag}
+        response = self._post(url, body, retry_safe=True)
         if debug:
             print(f"response is: {response.text}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        return response.json().get("tags")
 
     def find_tags(
         self,
@@ -1330,18 +1872,61 @@ class AssetConsumer(ConnectedAssetClientBase):
 
         Returns
         -------
-
+        A list of the informal tag elements whose names match the regular expression in tag, or None
+        if there are none
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
-        url = self.asset_consumer_endpoint + end_user_id + "/tags/by-search-string"
-        body = {"tag": tag}
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        url = (
+            self.asset_consumer_endpoint
+            + end_user_id
+            + "/tags/by-search-string?startFrom="
+            + str(start_from)
+            + "&pageSize="
+            + str(page_size)
+        )
+        body = {"class": "SearchStringRequestBody", "searchString": tag}
+        response = self._post(url, body, retry_safe=True)
         if debug:
             print(f"response is: {response}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
-        return response.content
+        return response.json().get("tags")
+
+    def iter_tags(
+        self,
+        search_string: str,
+        page_size: int = max_paging_size,
+        end_user_id: str = None,
+    ):
+        """Yields the informal tag elements whose names match the regular expression in search_string,
+        calling find_tags a page at a time
+
+        Raises
+        ------
+            ValueError if page_size is not greater than 0
+            ConnectionError
+        """
+        if page_size <= 0:
+            raise ValueError(f"page_size must be greater than 0, not {page_size}")
+
+        def fetch(start_from: int, size: int):
+            return self.find_tags(
+                search_string,
+                end_user_id,
+                start_from=start_from,
+                page_size=size,
+            )
+
+        return iter(
+            Pager(
+                fetch,
+                extract=lambda tags: tags,
+                page_size=page_size,
+                adaptive=False,
+                max_page_size=page_size,
+            )
+        )
 
     # returns informalTagElement
     def get_tag(
@@ -1354,24 +1939,26 @@ class AssetConsumer(ConnectedAssetClientBase):
         """
         Parameters
         ----------
-        tag_guid :
+        tag_guid : str
+            Unique identifier of the informal tag
         end_user_id :
         debug :
         extended_properties :
 
         Returns
         -------
-
+        The informal tag element, or None. Served from the disk cache when one is configured.
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        url = self.asset_consumer_endpoint + end_user_id + "/tags/" + tag_guid
+        key = self._disk_cache_key(end_user_id, "tags", tag_guid)
+        response_body = self._disk_cached(key, lambda: self._get_json(url))
         if debug:
-            print(f"response is: {response}")
-        if response.status_code != 200:
-            raise ConnectionError(response.text)
+            print(f"response is: {response_body}")
+        return response_body.get("tag")
 
-    # returns list of informatlTagElement
+    # returns list of informalTagElement
     def get_tags_by_name(
         self,
         tag: str,
@@ -1384,7 +1971,8 @@ class AssetConsumer(ConnectedAssetClientBase):
         """
         Parameters
         ----------
-        tag :
+        tag : str
+            the name of the informal tag
         end_user_id :
         debug :
         extended_properties :
@@ -1393,16 +1981,29 @@ class AssetConsumer(ConnectedAssetClientBase):
 
         Returns
         -------
-
+        A list of informal tag elements, or None if there are none. Served from the disk cache
+        when one is configured.
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
-
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        url = (
+            self.asset_consumer_endpoint
+            + end_user_id
+            + "/tags/by-name?startFrom="
+            + str(start_from)
+            + "&pageSize="
+            + str(page_size)
+        )
+        body = {"class": "NameRequestBody", "name": tag}
+        key = self._disk_cache_key(
+            end_user_id, "tags/by-name", tag, start_from, page_size
+        )
+        response_body = self._disk_cached(
+            key, lambda: self._post_json(url, body), "tags", self.name_lookup_ttl
+        )
         if debug:
-            print(f"response is: {response}")
-        if response.status_code != 200:
-            raise ConnectionError(response.text)
+            print(f"response is: {response_body}")
+        return response_body.get("tags")
 
     def get_assets_by_tag(
         self,
@@ -1425,15 +2026,24 @@ class AssetConsumer(ConnectedAssetClientBase):
 
         Returns
         -------
-
+        The guids of the assets the tag is attached to, or None if there are none
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        url = (
+            self.asset_consumer_endpoint
+            + end_user_id
+            + "/assets/by-tag/"
+            + tag_guid
+            + "?startFrom="
+            + str(start_from)
+            + "&pageSize="
+            + str(page_size)
+        )
+        response_body = self._get_json(url)
         if debug:
-            print(f"response is: {response}")
-        if response.status_code != 200:
-            raise ConnectionError(response.text)
+            print(f"response is: {response_body}")
+        return response_body.get("guids")
 
     # returns list of informatlTagElement
     def get_my_tags_by_name(
@@ -1457,15 +2067,23 @@ class AssetConsumer(ConnectedAssetClientBase):
 
         Returns
         -------
-
+        A list of the end user's private tags with the name, or None if there are none
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        url = (
+            self.asset_consumer_endpoint
+            + end_user_id
+            + "/tags/private/by-name?startFrom="
+            + str(start_from)
+            + "&pageSize="
+            + str(page_size)
+        )
+        body = {"class": "NameRequestBody", "name": tag}
+        response_body = self._post_json(url, body)
         if debug:
-            print(f"response is: {response}")
-        if response.status_code != 200:
-            raise ConnectionError(response.text)
+            print(f"response is: {response_body}")
+        return response_body.get("tags")
 
     def remove_tag(
         self,
@@ -1490,11 +2108,22 @@ class AssetConsumer(ConnectedAssetClientBase):
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        url = (
+            self.asset_consumer_endpoint
+            + end_user_id
+            + "/assets/"
+            + asset_guid
+            + "/tags/"
+            + tag_guid
+            + "/delete"
+        )
+        body = {"class": "NullRequestBody"}
+        response = self._post(url, body)
         if debug:
             print(f"response is: {response}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        self._invalidate_asset(asset_guid)
 
     def remove_tag_from_element(
         self,
@@ -1508,7 +2137,7 @@ class AssetConsumer(ConnectedAssetClientBase):
         """
         Parameters
         ----------
-        asset_guid :
+        asset_guid : the asset the element belongs to
         element_guid :
         tag_guid :
         end_user_id :
@@ -1521,11 +2150,23 @@ class AssetConsumer(ConnectedAssetClientBase):
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        url = (
+            self.asset_consumer_endpoint
+            + end_user_id
+            + "/elements/"
+            + element_guid
+            + "/tags/"
+            + tag_guid
+            + "/delete"
+        )
+        body = {"class": "NullRequestBody"}
+        response = self._post(url, body)
         if debug:
             print(f"response is: {response}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        self._invalidate_asset(element_guid)
+        self._invalidate_asset(asset_guid)
 
     def update_tag_description(
         self,
@@ -1550,11 +2191,21 @@ class AssetConsumer(ConnectedAssetClientBase):
         """
         if end_user_id is None:
             end_user_id = self.end_user_id
-        response = requests.post(url, json=body, verify=False, headers=self.json_header)
+        url = (
+            self.asset_consumer_endpoint + end_user_id + "/tags/" + tag_guid + "/update"
+        )
+        body = {
+            "class": "InformalTagUpdateRequestBody",
+            "description": tag_description,
+        }
+        response = self._post(url, body)
         if debug:
             print(f"response is: {response}")
         if response.status_code != 200:
             raise ConnectionError(response.text)
+        self._invalidate_tag(end_user_id, tag_guid)
+        if self.tag_index is not None:
+            self.tag_index.tag_updated(tag_guid, tag_description)
 
     def print_asset_guids(self, search_string):
         """
@@ -1608,76 +2259,3 @@ class AssetConsumer(ConnectedAssetClientBase):
             self.end_user_id,
             asset_guid,
         )
-
-
-class AssetUniverse:
-    """This class holds the asset universe for a consumer"""
-
-    def __init__(self, asset_prop: str):
-        connectedAssetURL = (
-            ac.platform_url
-            + "/servers/"
-            + ac.server_name
-            + "/open-metadata/common-services/"
-            + service_url_marker
-            + "/connected-asset/users/"
-            + ac.user_id
-        )
-        getAsset = connectedAssetURL + "/assets/" + asset_guid
-
-        response = issue_get(getAsset)
-        asset = response.json().get("asset")
-        if not asset:
-            process_error_response(serverName, "fixme", serverPlatformURL, response)
-            return asset
-
-        print(json.dumps(response.json(), indent=4))
-        #   elementHeader = asset.get('elementHeader')
-        self.elementType = asset.get("type")
-        self.assetTypeName = self.elementType.get("typeName")
-        self.assetSuperTypes = self.elementType.get("superTypeNames")
-        self.guid = asset.get("guid")
-        #    self.assetProperties = asset.get('assetProperties')
-        self.assetQualifiedName = self.asset.get("qualifiedName")
-        self.assetDisplayName = self.asset.get("displayName")
-        #    self.assetCatalogBean = self.assetProperties.get('description')
-        #    self.assetOwner = self.assetProperties.get('owner')
-        self.assetOrigin = self.assetProperties.get("otherOriginValues")
-        self.assetOwnerType = self.assetProperties.get("ownerTypeName")
-        self.assetZones = self.assetProperties.get("zoneMembership")
-        self.assetLatestChange = self.assetProperties.get("latestChange")
-        if not self.guid:
-            self.guid = "<null>"
-        if not self.assetDisplayName:
-            self.assetDisplayName = "<none>"
-        print(self.assetDisplayName + " [" + self.guid + "]")
-        if not self.assetQualifiedName:
-            self.assetQualifiedName = "<null>"
-        print("  qualifiedName: " + self.assetQualifiedName)
-        if self.assetCatalogBean:
-            print("  description:   " + self.assetCatalogBean)
-        print(
-            "  type:          "
-            + self.assetTypeName
-            + " [%s]" % ", ".join(map(str, assetSuperTypes))
-        )
-        if self.assetOwner:
-            print(
-                "  owner:         " + self.assetOwner + " [" + self.assetOwnerType + "]"
-            )
-        if self.assetOrigin:
-            self.contact = self.assetOrigin.get("contact")
-            self.dept = self.assetOrigin.get("originatingDept")
-            self.org = self.assetOrigin.get("originatingOrganization")
-            print(
-                "  origin:        contact="
-                + self.contact
-                + ", dept="
-                + self.dept
-                + ", org="
-                + self.org
-            )
-        if self.assetZones:
-            print("  zones:         " + "%s" % ", ".join(map(str, self.assetZones)))
-        if self.assetLatestChange:
-            print("  latest change: " + self.assetLatestChange)
@@ -0,0 +1,147 @@
+"""
+Concurrent, breadth-first crawling of the asset universe.
+
+Starting from a set of asset GUIDs, an AssetUniverseCrawler retrieves each asset's universe and its related
+assets, then walks outwards through the related assets level by level using a bounded pool of worker
+threads. Each asset is retrieved once, however many paths lead to it, and AssetUniverse objects are
+yielded to the caller as soon as they arrive.
+
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from src.egeria_client.assetLib import AssetUniverse, get_related_asset_guid
+from src.egeria_client.utils import get_asset_universe, get_related_assets
+
+
+class AssetUniverseCrawler:
+    """
+    Walks related assets breadth-first from a set of starting assets
+
+    Attributes:
+        server_name : str
+            Name of the OMAG server to use
+        server_platform_url : str
+            URL of the server platform to connect to
+        user_id : str
+            The identity of the user calling the connected asset services
+        service_marker : str
+            The access service whose connected asset services are called
+        max_workers : int
+            The maximum number of assets retrieved at the same time
+        max_depth : int
+            How many related-asset hops to follow from the starting assets - 0 retrieves only the starting assets
+        max_assets : int
+            The maximum number of assets to retrieve - 0 means no limit
+        visited : set
+            The guids of all assets scheduled for retrieval so far
+        errors : dict
+            Exceptions raised while retrieving an asset, keyed by asset guid
+
+    Methods:
+        crawl(asset_guids) -> generator of AssetUniverse
+            yields the universe of each asset reached, in breadth-first order of discovery
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        server_platform_url: str,
+        user_id: str,
+        service_marker: str = "asset-consumer",
+        max_workers: int = 8,
+        max_depth: int = 1,
+        max_assets: int = 0,
+    ):
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be greater than 0, not {max_workers}")
+        if max_depth < 0:
+            raise ValueError(f"max_depth must not be negative, not {max_depth}")
+        self.server_name = server_name
+        self.server_platform_url = server_platform_url
+        self.user_id = user_id
+        self.service_marker = service_marker
+        self.max_workers = max_workers
+        self.max_depth = max_depth
+        self.max_assets = max_assets
+        self.visited = set()
+        self.errors = {}
+
+    def _retrieve(self, asset_guid: str, depth: int):
+        universe = get_asset_universe(
+            self.server_name,
+            "fixme",
+            self.server_platform_url,
+            self.service_marker,
+            self.user_id,
+            asset_guid,
+        )
+        if not universe:
+            return None
+        related_guids = []
+        if depth < self.max_depth:
+            related_assets = get_related_assets(
+                self.server_name,
+                "fixme",
+                self.server_platform_url,
+                self.service_marker,
+                self.user_id,
+                asset_guid,
+            )
+            for related_asset in related_assets or []:
+                related_guid = get_related_asset_guid(related_asset)
+                if related_guid:
+                    related_guids.append(related_guid)
+        return AssetUniverse(universe, depth, related_guids)
+
+    def _schedule(self, queue: deque, asset_guid: str, depth: int):
+        if asset_guid in self.visited:
+            return
+        if self.max_assets and len(self.visited) >= self.max_assets:
+            return
+        self.visited.add(asset_guid)
+        queue.append((asset_guid, depth))
+
+    def crawl(self, asset_guids):
+        """
+        Yield the AssetUniverse of every asset reachable from asset_guids within max_depth hops
+
+        Parameters
+        ----------
+        asset_guids : an iterable of the guids of the starting assets
+
+        Returns
+        -------
+        A generator of AssetUniverse objects. Assets that could not be retrieved are skipped and
+        the exception, if any, recorded in errors.
+        """
+        queue = deque()
+        for asset_guid in asset_guids:
+            self._schedule(queue, asset_guid, 0)
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="egeria-crawler"
+        )
+        in_flight = {}
+        try:
+            while queue or in_flight:
+                while queue and len(in_flight) < self.max_workers:
+                    asset_guid, depth = queue.popleft()
+                    future = executor.submit(self._retrieve, asset_guid, depth)
+                    in_flight[future] = asset_guid
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    asset_guid = in_flight.pop(future)
+                    try:
+                        universe = future.result()
+                    except Exception as e:
+                        self.errors[asset_guid] = e
+                        continue
+                    if universe is None:
+                        continue
+                    for related_guid in universe.related_asset_guids:
+                        self._schedule(queue, related_guid, universe.depth + 1)
+                    yield universe
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,243 @@
+"""
+Asset Owner OMAS client.
+
+The functions in assetOwner.py predate the client classes and call the asset owner services one file at a
+time. AssetOwner is the client class for the same services, sharing the keep-alive session, retries and
+circuit breaker of the other connected asset clients.
+
+"""
+from src.egeria_client.asset_consumer import ConnectedAssetClientBase
+from src.egeria_client.cache import AssetCache
+from src.egeria_client.disk_cache import DiskCache
+from src.egeria_client.paging import Pager
+from src.egeria_client.tracing import tracing
+from src.egeria_client.util_exp import max_paging_size
+
+data_file_types = ("csv", "avro")
+
+
+class AssetOwner(ConnectedAssetClientBase):
+    """
+    Client for the Asset Owner OMAS, which authors assets
+
+    Methods:
+        create_data_file_asset(file_type, display_name, description, full_path, column_headers, end_user_id)
+            catalogs a data file of file_type csv or avro, returning the guids of the elements created
+        create_csv_asset(display_name, description, full_path, column_headers - optional, end_user_id - optional)
+        create_avro_asset(display_name, description, full_path, end_user_id - optional)
+        find_assets(search_string, start_from = 0, page_size = 0, end_user_id - optional) -> [dict]
+            returns one page of the asset elements matching the regular expression search_string
+        iter_assets(search_string, page_size = max_paging_size, end_user_id - optional)
+            yields the asset elements matching search_string, fetching them page by page
+        delete_asset(asset_guid, end_user_id - optional)
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        server_platform_url: str,
+        end_user_id: str,
+        server_user_id: str = None,
+        server_user_pwd: str = None,
+        cache: AssetCache = None,
+        disk_cache: DiskCache = None,
+    ):
+        ConnectedAssetClientBase.__init__(
+            self,
+            server_name,
+            server_platform_url,
+            end_user_id,
+            server_user_id,
+            server_user_pwd,
+            cache,
+            disk_cache,
+        )
+        self.asset_owner_endpoint = (
+            "{0}/servers/{1}/open-metadata/access-services/asset-owner/users/".format(
+                server_platform_url, server_name
+            )
+        )
+
+    def create_data_file_asset(
+        self,
+        file_type: str,
+        display_name: str,
+        description: str,
+        full_path: str,
+        column_headers: [str] = None,
+        end_user_id: str = None,
+    ) -> [str]:
+        """
+        Catalog a data file
+
+        Parameters
+        ----------
+        file_type : str
+            csv or avro
+        display_name : str
+            the name the asset is shown with
+        description : str
+        full_path : str
+            the path of the file, which the server also uses as the qualified name of the asset
+        column_headers : [str], optional
+            the column names of a csv file - without them the server does not describe its columns
+        end_user_id : str, optional
+            defaults to the end user set in the constructor
+
+        Returns
+        -------
+        The guids of the elements created, the asset first
+
+        Raises
+        ------
+            ValueError if file_type is not csv or avro
+            ConnectionError if the server rejects the request
+        """
+        if file_type not in data_file_types:
+            raise ValueError(f"{file_type} is not one of {', '.join(data_file_types)}")
+        if end_user_id is None:
+            end_user_id = self.end_user_id
+
+        url = (
+            self.asset_owner_endpoint + end_user_id + "/assets/data-files/" + file_type
+        )
+        body = {
+            "class": "NewCSVFileAssetRequestBody",
+            "displayName": display_name,
+            "description": description,
+            "fullPath": full_path,
+        }
+        if column_headers:
+            body["columnHeaders"] = list(column_headers)
+        response = self._post(url, body)
+
+        if response.status_code != 200:
+            raise ConnectionError(response.text)
+        return response.json().get("guids")
+
+    def create_csv_asset(
+        self,
+        display_name: str,
+        description: str,
+        full_path: str,
+        column_headers: [str] = None,
+        end_user_id: str = None,
+    ) -> [str]:
+        return self.create_data_file_asset(
+            "csv", display_name, description, full_path, column_headers, end_user_id
+        )
+
+    def create_avro_asset(
+        self,
+        display_name: str,
+        description: str,
+        full_path: str,
+        end_user_id: str = None,
+    ) -> [str]:
+        return self.create_data_file_asset(
+            "avro", display_name, description, full_path, None, end_user_id
+        )
+
+    def find_assets(
+        self,
+        search_string: str,
+        start_from: int = 0,
+        page_size: int = 0,
+        end_user_id: str = None,
+    ) -> [dict]:
+        """
+        Search for assets
+
+        Parameters
+        ----------
+        search_string : str
+            a regular expression matched against the asset properties
+        start_from : int, optional
+            the index of the first asset to return
+        page_size : int, optional
+            the maximum number of assets to return - 0 uses the server default
+        end_user_id : str, optional
+            defaults to the end user set in the constructor
+
+        Returns
+        -------
+        The asset elements found - None if there are none
+
+        Raises
+        ------
+            ConnectionError if the server rejects the request
+        """
+        if end_user_id is None:
+            end_user_id = self.end_user_id
+
+        url = (
+            self.asset_owner_endpoint
+            + end_user_id
+            + "/assets/by-search-string?startFrom="
+            + str(start_from)
+            + "&pageSize="
+            + str(page_size)
+        )
+        # this service takes the search string itself as the request body
+        response = self._send(
+            "POST",
+            url,
+            lambda timeout: self.session.post(
+                url,
+                data=search_string,
+                verify=False,
+                headers=tracing.inject(self.json_header),
+                timeout=timeout,
+            ),
+            retry_safe=True,
+        )
+
+        if response.status_code != 200:
+            raise ConnectionError(response.text)
+        return response.json().get("assets")
+
+    def iter_assets(
+        self,
+        search_string: str,
+        page_size: int = max_paging_size,
+        end_user_id: str = None,
+    ):
+        if page_size <= 0:
+            raise ValueError(f"page_size must be greater than 0, not {page_size}")
+
+        def fetch(start_from: int, size: int):
+            return self.find_assets(search_string, start_from, size, end_user_id)
+
+        return iter(
+            Pager(
+                fetch,
+                extract=lambda assets: assets,
+                page_size=page_size,
+                adaptive=False,
+                max_page_size=page_size,
+            )
+        )
+
+    def delete_asset(self, asset_guid: str, end_user_id: str = None):
+        """
+        Delete an asset
+
+        Raises
+        ------
+            ConnectionError if the server rejects the request
+        """
+        if end_user_id is None:
+            end_user_id = self.end_user_id
+
+        url = (
+            self.asset_owner_endpoint
+            + end_user_id
+            + "/assets/"
+            + asset_guid
+            + "/delete"
+        )
+        response = self._post(url, {"class": "NullRequestBody"})
+
+        if response.status_code != 200:
+            raise ConnectionError(response.text)
+        self._invalidate_asset(asset_guid)
@@ -0,0 +1,241 @@
+"""
+Bulk registration of data files as assets.
+
+AssetOwner.create_csv_asset and create_avro_asset catalog one file per call. An AssetRegistrar takes the files
+of a directory tree or of a manifest listing their paths, reads the column headers of each CSV file from its
+first line only, and registers the files through run_bulk with bounded concurrency. Each file registered is
+recorded in a local manifest keyed by its qualified name, so files registered by an earlier run - or an
+interrupted one - are skipped without a call to the server.
+
+Creating an asset is not idempotent, so before a registration is retried the server is searched for the
+qualified name, in case the failed attempt created the asset after all. That makes any 5xx status safe to
+retry (see resend_after_lookup), but not a read timeout, after which the server may still be creating it.
+
+"""
+import csv
+import os
+import re
+import threading
+
+from src.egeria_client.asset_owner import AssetOwner
+from src.egeria_client.bulk_ops import (
+    BulkCheckpoint,
+    BulkReport,
+    default_bulk_retry_policy,
+    resend_after_lookup,
+    run_bulk,
+)
+from src.egeria_client.retry import RetryPolicy
+
+file_types = {".csv": "csv", ".avro": "avro"}
+max_header_chars = 64 * 1024
+
+
+def file_type_of(path: str) -> str:
+    """Return csv or avro for a data file path, None for other files"""
+    return file_types.get(os.path.splitext(path)[1].lower())
+
+
+def sniff_csv_header(path: str, max_chars: int = max_header_chars) -> [str]:
+    """
+    Return the column names in the first line of a CSV file
+
+    Only the first line is read - and no more than max_chars of it - however large the file is.
+    """
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+        line = f.readline(max_chars)
+    if not line.strip():
+        return []
+    return [name.strip() for name in next(csv.reader([line], skipinitialspace=True))]
+
+
+def walk_files(root: str, extensions=tuple(file_types)):
+    """Yield the paths of the files under root with one of the extensions, directory by directory"""
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+            elif os.path.splitext(entry.name)[1].lower() in extensions:
+                yield entry.path
+        pending.extend(reversed(subdirectories))
+
+
+def read_manifest(path: str):
+    """
+    Yield the file paths listed in a manifest - one per line, ignoring blank lines and lines starting with #.
+    Relative paths are taken relative to the directory of the manifest.
+    """
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield os.path.join(base, line)
+
+
+class AssetRegistrar:
+    """
+    Registers many data files as CSV or Avro file assets, skipping the ones already registered
+
+    Attributes:
+        owner : AssetOwner
+            the client the assets are created with
+        manifest : BulkCheckpoint
+            the local manifest of the files registered, keyed by qualified name, with the guid of each asset
+        max_workers : int
+            the maximum number of files being registered at the same time
+        description : str
+            the description given to each asset
+        sniff_headers : bool
+            if True the column headers of CSV files are read from their first line and registered with them
+
+    Methods:
+        qualified_name(path) -> str
+            the qualified name the asset of a file is registered under - its full path
+        registered(path) -> str
+            the guid of the asset of a file in the manifest, or None
+        find_registered(path) -> str
+            the guid of the asset the server has for a file, or None
+        register(paths, on_result = None, keep_results = False) -> BulkReport
+        register_tree(root, on_result = None, keep_results = False) -> BulkReport
+            registers the CSV and Avro files under root
+        register_manifest(manifest_file, on_result = None, keep_results = False) -> BulkReport
+            registers the files listed in manifest_file
+        close()
+    """
+
+    def __init__(
+        self,
+        owner: AssetOwner,
+        manifest_path: str,
+        max_workers: int = 16,
+        description: str = "Data file registered by a bulk registration run",
+        sniff_headers: bool = True,
+        full_path=None,
+        retry_policy: RetryPolicy = default_bulk_retry_policy,
+    ):
+        """
+        Parameters
+        ----------
+        owner : the client to create the assets with
+        manifest_path : the path of the local manifest of registered files - it is created if it does not exist
+        max_workers : the maximum number of files being registered at the same time
+        description : the description given to each asset
+        sniff_headers : if True CSV files are registered with the column names in their first line
+        full_path : optional function mapping a local path to the full path the server should know the file
+                    by, for example where the landing zone is mounted differently - by default the absolute path
+        retry_policy : how often and how soon a registration that failed before reaching the server, or with
+                       a 5xx status, is retried
+        """
+        self.owner = owner
+        self.manifest = BulkCheckpoint(manifest_path)
+        self.max_workers = max_workers
+        self.description = description
+        self.sniff_headers = sniff_headers
+        self.full_path = full_path if full_path is not None else os.path.abspath
+        self.retry_policy = retry_policy
+
+    def __len__(self):
+        return len(self.manifest)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def qualified_name(self, path: str) -> str:
+        return self.full_path(path)
+
+    def registered(self, path: str) -> str:
+        return self.manifest.get(self.qualified_name(path))[1]
+
+    def find_registered(self, path: str) -> str:
+        qualified_name = self.qualified_name(path)
+        for asset in self.owner.find_assets(re.escape(qualified_name)) or []:
+            properties = asset.get("assetProperties") or {}
+            if properties.get("qualifiedName") == qualified_name:
+                return asset["elementHeader"]["guid"]
+        return None
+
+    def _register(self, path: str, retry: bool = False) -> str:
+        if retry:
+            # the attempt that failed may have created the asset before its response was lost
+            guid = self.find_registered(path)
+            if guid is not None:
+                return guid
+        file_type = file_type_of(path)
+        if file_type is None:
+            raise ValueError(f"{path} is not a CSV or Avro file")
+        headers = None
+        if file_type == "csv" and self.sniff_headers:
+            headers = sniff_csv_header(path)
+        guids = self.owner.create_data_file_asset(
+            file_type,
+            os.path.basename(path),
+            self.description,
+            self.qualified_name(path),
+            headers,
+        )
+        if not guids:
+            raise ConnectionError(f"No asset was created for {path}")
+        return guids[0]
+
+    def register(self, paths, on_result=None, keep_results: bool = False) -> BulkReport:
+        """
+        Register data files
+
+        Parameters
+        ----------
+        paths : an iterable of file paths - it is consumed as the work proceeds, so it may be a generator
+        on_result : optional function called with the BulkResult of each file as it completes - its key is the
+                    qualified name and its value the guid of the asset
+        keep_results : if True the report holds a BulkResult for every file, otherwise only for the files
+                       that failed
+
+        Returns
+        -------
+        A BulkReport - files already in the manifest are counted as resumed
+        """
+        attempted = set()
+        lock = threading.Lock()
+
+        def register(path: str) -> str:
+            qualified_name = self.qualified_name(path)
+            with lock:
+                retry = qualified_name in attempted
+                attempted.add(qualified_name)
+            guid = self._register(path, retry)
+            with lock:
+                attempted.discard(qualified_name)
+            return guid
+
+        return run_bulk(
+            paths,
+            register,
+            key=self.qualified_name,
+            max_workers=self.max_workers,
+            retry_policy=self.retry_policy,
+            checkpoint=self.manifest,
+            retry_on=resend_after_lookup,
+            on_result=on_result,
+            keep_results=keep_results,
+        )
+
+    def register_tree(
+        self, root: str, on_result=None, keep_results: bool = False
+    ) -> BulkReport:
+        return self.register(walk_files(root), on_result, keep_results)
+
+    def register_manifest(
+        self, manifest_file: str, on_result=None, keep_results: bool = False
+    ) -> BulkReport:
+        return self.register(read_manifest(manifest_file), on_result, keep_results)
+
+    def close(self):
+        self.manifest.close()
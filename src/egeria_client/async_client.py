@@ -0,0 +1,285 @@
+"""
+Asyncio clients for Egeria.
+
+AsyncClient, AsyncPlatform and AsyncAssetConsumer expose coroutine versions of the Client, Platform and
+AssetConsumer methods so that many calls can be awaited together, for example with asyncio.gather.
+
+The coroutines run the blocking client methods on a thread pool shared by all async clients of the same
+platform, and sized to that platform's keep-alive connection pool. URL construction, error mapping to
+InvalidParameterException / PropertyServerException and connection re-use are therefore exactly those of
+the synchronous clients. Each call runs in a copy of the context of the awaiting task, so a
+tracing span open in the task is the parent of the call's span.
+
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from requests import Response
+
+from egeria_client.client import Client
+from egeria_client.platform_services import Platform
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.cache import AssetCache
+from src.egeria_client.disk_cache import DiskCache
+from src.egeria_client.session_pool import session_pool
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(platform_url: str, max_workers: int) -> ThreadPoolExecutor:
+    """Return the thread pool shared by the async clients of a platform, creating it on first use"""
+    key = session_pool.platform_key(platform_url)
+    with _executors_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="egeria-async"
+            )
+            _executors[key] = executor
+        return executor
+
+
+def shutdown_executors(wait: bool = True):
+    """Shut down the thread pools used by all async clients"""
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=wait)
+        _executors.clear()
+
+
+def _coroutine(method):
+    """Build a coroutine that runs the same-named method of the wrapped synchronous client"""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await self._run(
+            getattr(self._delegate, method.__name__), *args, **kwargs
+        )
+
+    return wrapper
+
+
+class AsyncClient(Client):
+    """
+    An abstract class used to issue Egeria requests from asyncio code
+    for a particular server, platform and user.
+
+    Attributes:
+        executor : ThreadPoolExecutor
+            The thread pool, shared per platform, that the blocking requests run on
+
+    Methods:
+        make_request(self, request_type: str, endpoint: str, payload: str = None) -> Response
+         Coroutine version of Client.make_request
+
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        platform_url: str,
+        user_id: str = None,
+        user_pwd: str = None,
+        verify_flag: bool = False,
+        pool_size: int = None,
+        max_connections: int = None,
+        pool_block: bool = None,
+    ):
+        Client.__init__(
+            self,
+            server_name,
+            platform_url,
+            user_id,
+            user_pwd,
+            verify_flag,
+            pool_size,
+            max_connections,
+            pool_block,
+        )
+        self._delegate = self
+        self.executor = get_executor(
+            self.platform_url, self.pool_stats()["max_connections"]
+        )
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        # run in a copy of the task's context, so the call joins the span open in the task
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.executor, context.run, functools.partial(func, *args, **kwargs)
+        )
+
+    async def make_request(
+        self,
+        request_type: str,
+        endpoint: str,
+        payload: str = None,
+        retry_safe: bool = False,
+    ) -> Response:
+        """
+        Coroutine version of Client.make_request - raises the same exceptions.
+
+        :param request_type: Type of Request.
+               Supported Values - GET, POST, DELETE.
+               Type - String
+        :param endpoint: API Endpoint. Type - String
+        :param payload: API Request Parameters or Query String.
+               Type - String or Dict
+        :param retry_safe: True if a POST can be replayed without side effects.
+               Type - Boolean
+        :return: Response. Type - JSON Formatted String
+        """
+        return await self._run(
+            Client.make_request, self, request_type, endpoint, payload, retry_safe
+        )
+
+
+class AsyncPlatform(AsyncClient):
+    """
+    Asyncio client to operate Egeria Platforms - every method is a coroutine version of
+    the same-named Platform method.
+
+    Attributes:
+
+        platform_url : str
+            URL of the server platform to connect to
+        user_id : str
+            The identity of the user calling the method - this sets a default optionally used by the methods
+            when the user doesn't pass the user_id on a method call.
+
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        platform_url: str,
+        user_id: str,
+        user_pwd: str = None,
+        verify_flag: bool = False,
+        pool_size: int = None,
+        max_connections: int = None,
+        pool_block: bool = None,
+    ):
+        AsyncClient.__init__(
+            self,
+            server_name,
+            platform_url,
+            user_id,
+            user_pwd,
+            verify_flag,
+            pool_size,
+            max_connections,
+            pool_block,
+        )
+        self._delegate = Platform(
+            server_name,
+            platform_url,
+            user_id,
+            user_pwd,
+            verify_flag,
+            pool_size,
+            max_connections,
+            pool_block,
+        )
+        self.admin_command_root = self._delegate.admin_command_root
+
+    shutdown_platform = _coroutine(Platform.shutdown_platform)
+    get_platform_origin = _coroutine(Platform.get_platform_origin)
+    activate_server_stored_config = _coroutine(Platform.activate_server_stored_config)
+    de_activate_server = _coroutine(Platform.de_activate_server)
+    list_servers = _coroutine(Platform.list_servers)
+    delete_servers = _coroutine(Platform.delete_servers)
+    get_active_configuration = _coroutine(Platform.get_active_configuration)
+    activate_server_supplied_config = _coroutine(
+        Platform.activate_server_supplied_config
+    )
+    load_archive_file = _coroutine(Platform.load_archive_file)
+    load_archive_content = _coroutine(Platform.load_archive_content)
+    get_active_server_status = _coroutine(Platform.get_active_server_status)
+    is_server_known = _coroutine(Platform.is_server_known)
+    get_active_service_list_for_server = _coroutine(
+        Platform.get_active_service_list_for_server
+    )
+    get_server_status = _coroutine(Platform.get_server_status)
+    get_active_server_list = _coroutine(Platform.get_active_server_list)
+    shutdown_all_servers = _coroutine(Platform.shutdown_all_servers)
+
+
+class AsyncAssetConsumer(AsyncClient):
+    """
+    Asyncio version of AssetConsumer - every method is a coroutine version of the same-named
+    AssetConsumer method.
+
+    Attributes
+    ----------
+    server_name: str
+        the name of the server we want to connect to
+    server_platform_url: str
+        the url of the server platform
+    end_user_id: str
+        the user id of the individual we are making the request on behalf of
+
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        server_platform_url: str,
+        end_user_id: str,
+        server_user_id: str = None,
+        server_user_pwd: str = None,
+        cache: AssetCache = None,
+        disk_cache: DiskCache = None,
+    ):
+        AsyncClient.__init__(
+            self, server_name, server_platform_url, server_user_id, server_user_pwd
+        )
+        self._delegate = AssetConsumer(
+            server_name,
+            server_platform_url,
+            end_user_id,
+            server_user_id,
+            server_user_pwd,
+            cache,
+            disk_cache,
+        )
+        self.server_platform_url = server_platform_url
+        self.end_user_id = end_user_id
+
+    get_comments = _coroutine(AssetConsumer.get_comments)
+    get_comment_replies = _coroutine(AssetConsumer.get_comment_replies)
+    get_assets_by_meaning = _coroutine(AssetConsumer.get_assets_by_meaning)
+    find_meanings = _coroutine(AssetConsumer.find_meanings)
+    find_assets = _coroutine(AssetConsumer.find_assets)
+    get_asset_properties = _coroutine(AssetConsumer.get_asset_properties)
+    get_asset_universe = _coroutine(AssetConsumer.get_asset_universe)
+    get_meaning_by_name = _coroutine(AssetConsumer.get_meaning_by_name)
+    get_meaning = _coroutine(AssetConsumer.get_meaning)
+    warm_disk_cache = _coroutine(AssetConsumer.warm_disk_cache)
+    add_comment_to_asset = _coroutine(AssetConsumer.add_comment_to_asset)
+    update_comment = _coroutine(AssetConsumer.update_comment)
+    remove_comment = _coroutine(AssetConsumer.remove_comment)
+    add_comment_reply = _coroutine(AssetConsumer.add_comment_reply)
+    bulk_comments = _coroutine(AssetConsumer.bulk_comments)
+    add_like = _coroutine(AssetConsumer.add_like)
+    remove_like = _coroutine(AssetConsumer.remove_like)
+    add_rating = _coroutine(AssetConsumer.add_rating)
+    remove_rating = _coroutine(AssetConsumer.remove_rating)
+    add_tag = _coroutine(AssetConsumer.add_tag)
+    add_tag_to_element = _coroutine(AssetConsumer.add_tag_to_element)
+    create_private_tag = _coroutine(AssetConsumer.create_private_tag)
+    create_public_tag = _coroutine(AssetConsumer.create_public_tag)
+    delete_tag = _coroutine(AssetConsumer.delete_tag)
+    find_my_tags = _coroutine(AssetConsumer.find_my_tags)
+    find_tags = _coroutine(AssetConsumer.find_tags)
+    get_tag = _coroutine(AssetConsumer.get_tag)
+    get_tags_by_name = _coroutine(AssetConsumer.get_tags_by_name)
+    get_assets_by_tag = _coroutine(AssetConsumer.get_assets_by_tag)
+    get_my_tags_by_name = _coroutine(AssetConsumer.get_my_tags_by_name)
+    remove_tag = _coroutine(AssetConsumer.remove_tag)
+    remove_tag_from_element = _coroutine(AssetConsumer.remove_tag_from_element)
+    update_tag_description = _coroutine(AssetConsumer.update_tag_description)
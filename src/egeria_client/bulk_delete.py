@@ -0,0 +1,259 @@
+"""
+Bulk deletion of the assets matching a search.
+
+Cleaning up an environment means searching for assets and deleting each one found. A BulkDeleter streams the
+search results a page at a time and deletes the assets through run_bulk, with a bounded number of deletes in
+flight and an optional cap on the deletes started per second. Deleting assets shifts the later search results
+towards the front, so rather than paging on through them the search is read again from the start once the
+deletes of each page are done, only moving past the assets already tried, until it finds none left. Every
+asset deleted, or that could not be, is written to a JSON lines audit log, and a dry run writes the assets
+that would be deleted without deleting them.
+
+"""
+import json
+import threading
+import time
+
+from src.egeria_client.asset_owner import AssetOwner
+from src.egeria_client.bulk_ops import (
+    BulkReport,
+    BulkResult,
+    RateLimiter,
+    default_bulk_retry_policy,
+    related_http_code,
+    run_bulk,
+    transient_errors,
+)
+from src.egeria_client.retry import RetryPolicy
+from src.egeria_client.util_exp import max_paging_size
+
+
+def asset_guid(asset: dict) -> str:
+    """Return the guid of an asset element"""
+    return (asset.get("elementHeader") or {}).get("guid")
+
+
+def asset_qualified_name(asset: dict) -> str:
+    """Return the qualified name of an asset element"""
+    return (asset.get("assetProperties") or asset.get("properties") or {}).get(
+        "qualifiedName"
+    )
+
+
+def _retryable(error: BaseException) -> bool:
+    """Return True if a delete that failed with error is tried again - a 4xx status will not change"""
+    return (
+        isinstance(error, transient_errors)
+        and not 400 <= related_http_code(error) < 500
+    )
+
+
+class AuditLog:
+    """
+    A JSON lines file with one line per asset a bulk delete acted on
+
+    Each line holds the time, action (deleted, failed or dry-run), guid and qualified name of the asset, and
+    the error of a failed delete.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, action: str, guid: str, qualified_name: str, error: str = None):
+        entry = {
+            "time": time.time(),
+            "action": action,
+            "guid": guid,
+            "qualifiedName": qualified_name,
+        }
+        if error is not None:
+            entry["error"] = error
+        line = json.dumps(entry)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class BulkDeleter:
+    """
+    Deletes every asset matching a search, concurrently and at a bounded rate
+
+    Attributes:
+        owner : AssetOwner
+            the client used to search for and delete the assets
+        max_workers : int
+            the maximum number of deletes in flight
+        rate_limit : float
+            the maximum number of deletes started per second - None for no limit
+        page_size : int
+            the number of assets read per search request, and deleted before the search is read again
+
+    Methods:
+        count(search_string) -> int
+            returns the number of assets matching search_string
+        delete(search_string, dry_run = False, audit_log_path = None, on_result = None) -> BulkReport
+            deletes the assets matching search_string - or, in a dry run, only counts and logs them
+    """
+
+    def __init__(
+        self,
+        owner: AssetOwner,
+        max_workers: int = 16,
+        rate_limit: float = None,
+        page_size: int = max_paging_size,
+        retry_policy: RetryPolicy = default_bulk_retry_policy,
+    ):
+        """
+        Parameters
+        ----------
+        owner : the client to search and delete with
+        max_workers : the maximum number of deletes in flight
+        rate_limit : the maximum number of deletes started per second - None for no limit
+        page_size : the number of assets read per search request, and deleted before the search is read again
+        retry_policy : how often and how soon a delete that failed with a transient error is retried - an
+                       asset a retried delete finds missing was deleted by the attempt that failed
+        """
+        self.owner = owner
+        self.max_workers = max_workers
+        self.rate_limit = rate_limit
+        self.page_size = page_size
+        self.retry_policy = retry_policy
+
+    def count(self, search_string: str) -> int:
+        return sum(1 for _ in self.owner.iter_assets(search_string, self.page_size))
+
+    def _pages(self, search_string: str, counts: dict):
+        """Yield the assets not yet tried a page at a time, reading the search from the start after each page"""
+        tried = set()
+        start_from = 0
+        counts["remaining"] = 0
+        while True:
+            counts["searches"] += 1
+            page = self.owner.find_assets(search_string, start_from, self.page_size)
+            if not page:
+                return
+            new = []
+            for asset in page:
+                guid = asset_guid(asset)
+                if guid is not None and guid not in tried:
+                    tried.add(guid)
+                    new.append(asset)
+            if new:
+                # the caller deletes the page before the next one is read
+                yield new
+                start_from = 0
+                counts["remaining"] = 0
+            else:
+                # only assets that could not be deleted - step over them
+                start_from += len(page)
+                counts["remaining"] += len(page)
+
+    def delete(
+        self,
+        search_string: str,
+        dry_run: bool = False,
+        audit_log_path: str = None,
+        on_result=None,
+    ) -> BulkReport:
+        """
+        Delete the assets matching a search
+
+        Parameters
+        ----------
+        search_string : a regular expression selecting the assets to delete
+        dry_run : if True nothing is deleted - the assets that would be are counted and written to the audit log
+        audit_log_path : optional path of the JSON lines audit log, which is appended to
+        on_result : optional function called with the BulkResult of each asset - its key is the asset guid and
+                    its value the qualified name
+
+        Returns
+        -------
+        A BulkReport holding the assets that could not be deleted. Its counts include matched, the number of
+        assets found, searches, the number of search requests made, and remaining, the number of assets still
+        matching the search when it ended - 0 unless some could not be deleted.
+        """
+        start = time.perf_counter()
+        audit = AuditLog(audit_log_path) if audit_log_path is not None else None
+        try:
+            if dry_run:
+                report = BulkReport(counts={"matched": 0})
+                for index, asset in enumerate(
+                    self.owner.iter_assets(search_string, self.page_size)
+                ):
+                    guid, name = asset_guid(asset), asset_qualified_name(asset)
+                    report.counts["matched"] += 1
+                    if audit is not None:
+                        audit.write("dry-run", guid, name)
+                    if on_result is not None:
+                        on_result(BulkResult(index, guid, True, name))
+                report.elapsed = time.perf_counter() - start
+                return report
+
+            names = {}  # guid -> qualified name, of the assets in flight
+            retried = set()  # guids of the deletes that have failed, while in flight
+
+            def operation(asset: dict) -> str:
+                guid = asset_guid(asset)
+                try:
+                    self.owner.delete_asset(guid)
+                except ConnectionError as e:
+                    if guid not in retried or related_http_code(e) != 404:
+                        retried.add(guid)
+                        raise
+                    # the attempt that failed deleted the asset before its response was lost
+                retried.discard(guid)
+                return asset_qualified_name(asset)
+
+            def audited(result: BulkResult):
+                name = names.pop(result.key, None)
+                if audit is not None:
+                    if result.ok:
+                        audit.write("deleted", result.key, name)
+                    else:
+                        audit.write("failed", result.key, name, result.error)
+                if on_result is not None:
+                    on_result(result)
+
+            rate_limit = self.rate_limit
+            if rate_limit is not None:
+                rate_limit = RateLimiter(rate_limit)  # shared by the pages
+            report = BulkReport(counts={"searches": 0})
+            for page in self._pages(search_string, report.counts):
+                for asset in page:
+                    names[asset_guid(asset)] = asset_qualified_name(asset)
+                page_report = run_bulk(
+                    page,
+                    operation,
+                    key=asset_guid,
+                    max_workers=self.max_workers,
+                    retry_policy=self.retry_policy,
+                    retry_on=_retryable,
+                    on_result=audited,
+                    keep_results=False,
+                    rate_limit=rate_limit,
+                )
+                items = report.counts.get("items", 0)
+                for result in page_report.results:
+                    result.index += items
+                    report.results.append(result)
+                for name, count in page_report.counts.items():
+                    report.counts[name] = report.counts.get(name, 0) + count
+            report.counts["matched"] = report.counts.get("items", 0)
+            report.elapsed = time.perf_counter() - start
+            return report
+        finally:
+            if audit is not None:
+                audit.close()
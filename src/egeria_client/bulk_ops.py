@@ -0,0 +1,403 @@
+"""
+Bulk execution of per-item catalog operations.
+
+run_bulk applies one operation to every item of an iterable on a bounded thread pool, retrying items that fail
+with a transient error, and returns one BulkResult per item in input order. With a checkpoint file, the result of
+every item that succeeds is appended to the file as it completes, so a run that is interrupted can be started
+again with the same items and will skip the ones that were already done rather than repeating them. A
+RateLimiter caps the number of attempts started per second, however many workers there are.
+
+An operation that is not idempotent, such as adding a comment, must only be retried when the failed attempt
+cannot have been carried out - run_bulk is given retry_on=safe_to_resend for those. When the operation looks
+up whether an earlier attempt was carried out before sending it again, retry_on=resend_after_lookup also
+retries the other 5xx statuses, which a server may return after doing the work.
+
+"""
+import contextvars
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from src.egeria_client.retry import RetryPolicy
+from src.egeria_client.util_exp import (
+    CircuitOpenException,
+    EgeriaException,
+    PropertyServerException,
+)
+
+# builtin ConnectionError is what the AssetConsumer methods raise when the server rejects a call
+transient_errors = (ConnectionError, requests.RequestException, PropertyServerException)
+default_bulk_retry_policy = RetryPolicy(max_attempts=3, backoff_base=0.5)
+# the statuses with which a server turns a request away without carrying it out
+resend_statuses = frozenset((429, 503))
+
+
+def related_http_code(error: BaseException) -> int:
+    """
+    Return the HTTP status of the response an error was raised for - the relatedHTTPCode of the response
+    body an AssetConsumer method raised, or the status a Client raised an EgeriaException for - or 0
+    """
+    try:
+        if isinstance(error, EgeriaException):
+            return int(error.http_error_code)
+        return int(json.loads(str(error)).get("relatedHTTPCode") or 0)
+    except (ValueError, TypeError, AttributeError):
+        return 0
+
+
+def safe_to_resend(error: BaseException) -> bool:
+    """
+    Return True if a non-idempotent request that failed with error may be sent again
+
+    That is when the request never reached the server - the connection was refused or timed out, or the
+    circuit breaker rejected it - or the server turned it away with a 503 or 429 status. A read timeout, a
+    dropped connection or another 5xx status may follow a request the server carried out, and a 4xx status
+    will not change, so those are not retried.
+    """
+    if isinstance(error, CircuitOpenException):
+        return True
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if isinstance(error, requests.Timeout):
+        return False
+    if isinstance(error, requests.ConnectionError):
+        reason = error.args[0] if error.args else None
+        return isinstance(getattr(reason, "reason", reason), NewConnectionError)
+    if isinstance(error, (PropertyServerException, ConnectionError)):
+        return related_http_code(error) in resend_statuses
+    return False
+
+
+def resend_after_lookup(error: BaseException) -> bool:
+    """
+    Return True if a non-idempotent request that failed with error may be sent again once a lookup has shown
+    that it was not carried out
+
+    That is when it is safe_to_resend, or the server answered with any other 5xx status. The server has
+    finished with the request by then, so the lookup finds what it did. After a read timeout the server may
+    still be working on the request, so those are not retried.
+    """
+    return safe_to_resend(error) or 500 <= related_http_code(error) < 600
+
+
+@dataclass
+class BulkResult:
+    """The outcome of one item of a bulk operation"""
+
+    index: int
+    key: str
+    ok: bool = False
+    value: object = None
+    error: str = None
+    attempts: int = 0
+    resumed: bool = False
+
+
+@dataclass
+class BulkReport:
+    """
+    The results of a bulk operation
+
+    Attributes:
+        results : [BulkResult]
+            one entry per item, in input order - or only the items that failed, when run_bulk was told
+            not to keep results
+        elapsed : float
+            the wall-clock duration in seconds
+        counts : dict
+            the number of items, succeeded, failed, resumed and retries, kept as items complete
+
+    Methods:
+        succeeded() -> [BulkResult]
+        failed() -> [BulkResult]
+        values() -> list
+            the value of each item in input order, None for items that failed
+        summary() -> dict
+            the item counts and throughput of the run
+    """
+
+    results: list = field(default_factory=list)
+    elapsed: float = 0.0
+    counts: dict = field(default_factory=dict)
+
+    def count(self, result: BulkResult):
+        counts = self.counts
+        counts["items"] = counts.get("items", 0) + 1
+        outcome = "succeeded" if result.ok else "failed"
+        counts[outcome] = counts.get(outcome, 0) + 1
+        if result.resumed:
+            counts["resumed"] = counts.get("resumed", 0) + 1
+        else:
+            counts["retries"] = counts.get("retries", 0) + max(result.attempts - 1, 0)
+
+    def succeeded(self) -> list:
+        return [r for r in self.results if r.ok]
+
+    def failed(self) -> list:
+        return [r for r in self.results if not r.ok]
+
+    def values(self) -> list:
+        return [r.value if r.ok else None for r in self.results]
+
+    def summary(self) -> dict:
+        if not self.counts:
+            for result in self.results:
+                self.count(result)
+        summary = {
+            c: self.counts.get(c, 0)
+            for c in ("items", "succeeded", "failed", "resumed", "retries")
+        }
+        executed = summary["items"] - summary["resumed"]
+        summary["elapsed"] = round(self.elapsed, 3)
+        summary["items_per_second"] = (
+            round(executed / self.elapsed, 1) if self.elapsed > 0 else 0.0
+        )
+        summary.update({k: v for k, v in self.counts.items() if k not in summary})
+        return summary
+
+
+class BulkCheckpoint:
+    """
+    A JSON lines file recording the items of a bulk operation that have succeeded
+
+    Each line holds the key and value of one item. The file is flushed and synced after every line, and a
+    partly written last line - left by a crash - is ignored when the file is read back.
+
+    Attributes:
+        path : str
+            the path of the checkpoint file
+
+    Methods:
+        get(key) -> (bool, object)
+            returns (True, value) if the item was recorded, otherwise (False, None)
+        record(key, value)
+        close()
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._done = {}
+        line = "\n"
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._done[entry["key"]] = entry.get("value")
+        self._file = open(path, "a", encoding="utf-8")
+        if not line.endswith("\n"):
+            self._file.write("\n")  # start after the partly written line
+
+    def __len__(self):
+        return len(self._done)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, key: str):
+        with self._lock:
+            if key in self._done:
+                return True, self._done[key]
+        return False, None
+
+    def record(self, key: str, value):
+        line = json.dumps({"key": key, "value": value}, default=str)
+        with self._lock:
+            self._done[key] = value
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class RateLimiter:
+    """
+    A token bucket spacing calls out to at most rate per second, after an initial burst
+
+    Attributes:
+        rate : float
+            the number of calls allowed per second
+        burst : int
+            the number of calls that may start at once after the limiter has been idle
+
+    Methods:
+        acquire()
+            blocks until the next call may start
+    """
+
+    def __init__(
+        self, rate: float, burst: int = 1, sleep=time.sleep, clock=time.monotonic
+    ):
+        if rate <= 0:
+            raise ValueError(f"rate must be greater than 0, not {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, not {burst}")
+        self.rate = rate
+        self.burst = burst
+        self.sleep = sleep
+        self.clock = clock
+        self._tokens = float(burst)
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            # the token is taken now, so waiting callers are served in the order they arrived
+            self._tokens -= 1
+            delay = -self._tokens / self.rate
+        if delay > 0:
+            self.sleep(delay)
+
+
+def _attempt(
+    item,
+    operation,
+    retry_policy: RetryPolicy,
+    retry_on,
+    result: BulkResult,
+    checkpoint,
+    rate_limiter: RateLimiter,
+):
+    while True:
+        result.attempts += 1
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            result.value = operation(item)
+            result.ok = True
+            if checkpoint is not None:
+                # recorded straight away, to keep the window in which a crash would repeat the item small
+                checkpoint.record(result.key, result.value)
+            return result
+        except Exception as e:
+            if isinstance(retry_on, (tuple, type)):
+                retry = isinstance(e, retry_on)
+            else:
+                retry = retry_on(e)
+            if not retry or result.attempts >= retry_policy.max_attempts:
+                result.error = f"{type(e).__name__}: {e}"
+                return result
+            retry_policy.sleep(retry_policy.backoff(result.attempts))
+
+
+def run_bulk(
+    items,
+    operation,
+    key=None,
+    max_workers: int = 8,
+    retry_policy: RetryPolicy = default_bulk_retry_policy,
+    checkpoint=None,
+    retry_on=transient_errors,
+    on_result=None,
+    keep_results: bool = True,
+    rate_limit=None,
+) -> BulkReport:
+    """
+    Apply operation to every item with bounded concurrency
+
+    Parameters
+    ----------
+    items : an iterable of items - it is consumed as the work proceeds, so it may be a generator
+    operation : a function taking one item and returning its value, which must be JSON serializable when a
+                checkpoint is used
+    key : a function returning the key of an item, which must be stable across runs - by default the
+          position of the item in items
+    max_workers : the maximum number of items in progress at the same time
+    retry_policy : max_attempts and backoff decide how often and how soon a failed item is tried again
+    checkpoint : a BulkCheckpoint or the path of a checkpoint file - items it records are not run again
+    retry_on : the exception types that are retried, or a function taking the exception and returning True
+               if it is - others fail the item at once. The default retries any connection error, which
+               may repeat an operation that is not idempotent - use safe_to_resend for those.
+    on_result : optional function called with each BulkResult as it completes
+    keep_results : if False only the results of failed items are kept, so that memory use does not grow
+                   with the number of items - the report counts still cover every item
+    rate_limit : optional RateLimiter, or a number of attempts per second, bounding how fast attempts start
+
+    Returns
+    -------
+    A BulkReport with one BulkResult per item, in input order
+    """
+    if max_workers <= 0:
+        raise ValueError(f"max_workers must be greater than 0, not {max_workers}")
+    own_checkpoint = isinstance(checkpoint, (str, os.PathLike))
+    if own_checkpoint:
+        checkpoint = BulkCheckpoint(checkpoint)
+    if rate_limit is not None and not isinstance(rate_limit, RateLimiter):
+        rate_limit = RateLimiter(rate_limit)
+    start = time.perf_counter()
+    report = BulkReport()
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="egeria-bulk"
+    )
+    in_flight = {}
+
+    def complete(result: BulkResult):
+        report.count(result)
+        if not keep_results and not result.ok:
+            report.results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    def drain(limit: int):
+        while len(in_flight) > limit:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.pop(future)
+                complete(future.result())
+
+    try:
+        for index, item in enumerate(items):
+            item_key = str(index) if key is None else str(key(item))
+            result = BulkResult(index, item_key)
+            if keep_results:
+                report.results.append(result)
+            if checkpoint is not None:
+                done, value = checkpoint.get(item_key)
+                if done:
+                    result.ok, result.value, result.resumed = True, value, True
+                    complete(result)
+                    continue
+            # each item runs in a copy of the caller's context, so its calls join the caller's span
+            future = executor.submit(
+                contextvars.copy_context().run,
+                _attempt,
+                item,
+                operation,
+                retry_policy,
+                retry_on,
+                result,
+                checkpoint,
+                rate_limit,
+            )
+            in_flight[future] = result
+            drain(2 * max_workers)
+        drain(0)
+    finally:
+        executor.shutdown(wait=True)
+        if own_checkpoint:
+            checkpoint.close()
+    if not keep_results:
+        report.results.sort(key=lambda r: r.index)
+    report.elapsed = time.perf_counter() - start
+    return report
@@ -0,0 +1,140 @@
+"""
+In-process caching of Egeria lookups.
+
+LRUCache is a size-bounded, least-recently-used cache whose entries also expire after a time-to-live.
+AssetCache keys it by server, user and asset GUID for the connected asset clients, which invalidate an
+asset's entries whenever they change that asset.
+
+"""
+import threading
+import time
+from collections import OrderedDict
+
+default_max_entries = 1024
+default_ttl = 300.0  # seconds
+
+
+class LRUCache:
+    """
+    A thread-safe LRU cache with a per-entry time-to-live
+
+    Attributes:
+        max_entries : int
+            the number of entries kept - the least recently used entry is evicted to make room
+        ttl : float
+            the default number of seconds an entry stays valid
+        hits, misses, evictions, expirations : int
+            counters, also returned by stats()
+
+    Methods:
+        get(key, default = None)
+            returns the cached value, or default if the key is absent or expired
+        put(key, value, ttl = None)
+            caches value under key for ttl seconds (the cache default if None)
+        invalidate(key)
+            removes the entry for key
+        invalidate_where(predicate) -> int
+            removes every entry whose key satisfies predicate, returning the number removed
+        clear()
+            removes all entries
+        stats() -> dict
+            returns the counters and current size
+    """
+
+    def __init__(
+        self,
+        max_entries: int = default_max_entries,
+        ttl: float = default_ttl,
+        clock=time.monotonic,
+    ):
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be greater than 0, not {max_entries}")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires = entry
+            if expires <= self.clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, ttl: float = None):
+        expires = self.clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class AssetCache(LRUCache):
+    """
+    An LRUCache of asset lookups keyed by (server name, user id, asset guid)
+
+    Any object with the same get_asset, put_asset and invalidate_asset methods can be passed to the
+    connected asset clients in its place.
+
+    Methods:
+        get_asset(server_name, user_id, asset_guid)
+        put_asset(server_name, user_id, asset_guid, value)
+        invalidate_asset(server_name, asset_guid) -> int
+            removes the asset's entries for every user
+    """
+
+    def get_asset(self, server_name: str, user_id: str, asset_guid: str):
+        return self.get((server_name, user_id, asset_guid))
+
+    def put_asset(self, server_name: str, user_id: str, asset_guid: str, value):
+        self.put((server_name, user_id, asset_guid), value)
+
+    def invalidate_asset(self, server_name: str, asset_guid: str) -> int:
+        return self.invalidate_where(
+            lambda key: key[0] == server_name and key[2] == asset_guid
+        )
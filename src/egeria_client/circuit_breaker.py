@@ -0,0 +1,242 @@
+"""
+Circuit breakers for OMAG servers.
+
+Each (platform, server) pair has a CircuitBreaker that watches the outcome of the calls made to it. While
+calls succeed the circuit is closed. When the share of failed calls in the recent window passes a threshold
+the circuit opens, and further calls are rejected at once with CircuitOpenException rather than waiting on
+the server. After reset_timeout the circuit is half-open: a few trial calls go through, and their outcome
+closes the circuit again or re-opens it.
+
+"""
+import threading
+import time
+from collections import deque
+from enum import Enum
+
+from src.egeria_client.session_pool import SessionPool
+from src.egeria_client.util_exp import OMAGCommonErrorCode, CircuitOpenException
+
+
+class CircuitState(Enum):
+    """
+    Enum class for the states of a circuit breaker - CLOSED, OPEN, HALF_OPEN
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """
+    Tracks the failures of calls to one server and decides whether new calls may be made
+
+    Attributes:
+        failure_threshold : float
+            the share of failed calls in the window, between 0 and 1, that opens the circuit
+        minimum_calls : int
+            the number of calls the window must hold before the failure rate is acted on
+        window : float
+            the number of seconds of recent calls considered
+        reset_timeout : float
+            the number of seconds the circuit stays open before trial calls are allowed
+        half_open_max_calls : int
+            the number of trial calls allowed at the same time while half-open
+
+    Methods:
+        allow() -> bool
+            returns True if a call may be made now - the caller must then report its outcome
+        record_success()
+        record_failure()
+        state -> CircuitState
+        retry_in() -> float
+            returns the number of seconds until an open circuit allows a trial call
+        stats() -> dict
+            returns the state, the calls and failures in the window, the failure rate and retry_in
+        reset()
+            closes the circuit and forgets the calls seen so far
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        minimum_calls: int = 5,
+        window: float = 60.0,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock=time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.minimum_calls = minimum_calls
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.clock = clock
+        self.times_opened = 0
+        self.rejected = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._calls = deque()
+        self._failures = 0
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float):
+        while self._calls and self._calls[0][0] <= now - self.window:
+            _, failed = self._calls.popleft()
+            self._failures -= failed
+
+    def _update_state(self, now: float):
+        if (
+            self._state is CircuitState.OPEN
+            and now - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_calls = 0
+
+    def _open(self, now: float):
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self.times_opened += 1
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._update_state(self.clock())
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            self._update_state(self.clock())
+            if self._state is CircuitState.CLOSED:
+                return True
+            if (
+                self._state is CircuitState.HALF_OPEN
+                and self._trial_calls < self.half_open_max_calls
+            ):
+                self._trial_calls += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            now = self.clock()
+            if self._state is CircuitState.HALF_OPEN:
+                self._state = CircuitState.CLOSED
+                self._calls.clear()
+                self._failures = 0
+            self._calls.append((now, False))
+            self._prune(now)
+
+    def record_failure(self):
+        with self._lock:
+            now = self.clock()
+            if self._state is CircuitState.HALF_OPEN:
+                self._open(now)
+                return
+            self._calls.append((now, True))
+            self._failures += 1
+            self._prune(now)
+            if (
+                self._state is CircuitState.CLOSED
+                and len(self._calls) >= self.minimum_calls
+                and self._failures / len(self._calls) >= self.failure_threshold
+            ):
+                self._open(now)
+
+    def retry_in(self) -> float:
+        with self._lock:
+            if self._state is not CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - self.clock())
+
+    def reset(self):
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._calls.clear()
+            self._failures = 0
+
+    def stats(self) -> dict:
+        state = self.state
+        retry_in = self.retry_in()
+        with self._lock:
+            self._prune(self.clock())
+            calls = len(self._calls)
+            return {
+                "state": state.value,
+                "calls": calls,
+                "failures": self._failures,
+                "failure_rate": self._failures / calls if calls else 0.0,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+                "retry_in": retry_in,
+            }
+
+
+class CircuitBreakerRegistry:
+    """
+    The circuit breakers of all servers, keyed by platform and server name
+
+    Attributes:
+        settings : dict
+            the keyword arguments used to create new circuit breakers
+
+    Methods:
+        get(platform_url, server_name) -> CircuitBreaker
+            returns the breaker for the server, creating it on first use
+        states() -> dict
+            returns the stats of every breaker, keyed by "platform key/server name"
+        reset()
+            forgets all breakers
+    """
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, platform_url: str, server_name: str) -> CircuitBreaker:
+        key = (SessionPool.platform_key(platform_url), server_name)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(**self.settings)
+                self._breakers[key] = breaker
+            return breaker
+
+    def states(self) -> dict:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {
+            f"{platform}/{server}": breaker.stats()
+            for (platform, server), breaker in breakers.items()
+        }
+
+    def reset(self):
+        with self._lock:
+            self._breakers.clear()
+
+
+def circuit_open_exception(
+    breaker: CircuitBreaker,
+    platform_url: str,
+    server_name: str,
+    endpoint: str,
+    class_name: str,
+    method_name: str,
+) -> CircuitOpenException:
+    """Build the exception raised when breaker rejects a call to endpoint"""
+    msg = OMAGCommonErrorCode.CIRCUIT_OPEN.value["message_template"].format(
+        endpoint, server_name, platform_url, breaker.retry_in()
+    )
+    return CircuitOpenException(
+        msg,
+        OMAGCommonErrorCode.CIRCUIT_OPEN,
+        class_name,
+        method_name,
+        [endpoint, "503"],
+    )
+
+
+circuit_breakers = CircuitBreakerRegistry()
@@ -2,6 +2,7 @@
 This is a simple class to create and manage a connection to an Egeria backend
 
 """
+import json
 import os
 import sys
 
@@ -29,6 +30,12 @@ from src.egeria_client.util_exp import (
     RESTConnectionException,
     PropertyServerException,
 )
+from src.egeria_client.session_pool import session_pool
+from src.egeria_client.singleflight import single_flight
+from src.egeria_client.retry import default_retry_policy
+from src.egeria_client.circuit_breaker import circuit_breakers, circuit_open_exception
+from src.egeria_client.metrics import metrics
+from src.egeria_client.tracing import tracing
 
 
 class RequestType(Enum):
@@ -63,6 +70,17 @@ class Client:
             The identity used to connect to the server
         user_pwd : str
             The password used to authenticate the server identity
+        session : requests.Session
+            The keep-alive session shared by all clients of the same platform
+        coalesce_gets : bool
+            If True (the default) concurrent identical GETs share a single call and its response
+        retry_policy : RetryPolicy
+            How requests failing with a connection error or a transient 5xx status are retried
+        timeout : float
+            The number of seconds to wait for the server on each attempt of a request
+        circuit_breaker : CircuitBreaker
+            The breaker shared by all clients of this platform and server - while it is open requests fail
+            at once with CircuitOpenException
 
     Methods:
         __init__(self, server_name: str,
@@ -73,6 +91,12 @@ class Client:
                  )
          Initializes the connection - throwing an exception if there is a problem
 
+        pool_stats(self) -> dict
+         Returns the connection pool statistics for this client's platform
+
+        circuit_state(self) -> dict
+         Returns the state and recent failure rate of the circuit breaker for this client's server
+
 
 
     """
@@ -86,12 +110,18 @@ class Client:
         user_id: str = None,
         user_pwd: str = None,
         verify_flag: bool = False,
+        pool_size: int = None,
+        max_connections: int = None,
+        pool_block: bool = None,
     ):
         self.server_name = None
         self.platform_url = None
         self.user_id = user_id
         self.user_pwd = user_pwd
         self.ssl_verify = verify_flag
+        self.coalesce_gets = True
+        self.retry_policy = default_retry_policy
+        self.timeout = 30
         api_key = os.environ.get("API_KEY")
         self.headers = {"Content-Type": "application/json", "x-api-key": api_key}
 
@@ -109,7 +139,10 @@ class Client:
                 self.platform_url = platform_url
                 self.server_name = server_name
                 self.user_id = user_id
-                self.session = requests.Session()
+                self.session = session_pool.get_session(
+                    platform_url, pool_size, max_connections, pool_block
+                )
+                self.circuit_breaker = circuit_breakers.get(platform_url, server_name)
             else:
                 raise Exception("Unexpected Exception")
         except InvalidParameterException as e:
@@ -234,11 +267,18 @@ class Client:
     #     )
 
     def make_request(
-        self, request_type: str, endpoint: str, payload: str = None
+        self,
+        request_type: str,
+        endpoint: str,
+        payload: str = None,
+        retry_safe: bool = False,
+        data=None,
     ) -> Response:
         """
         Function to make an API call via the Requests Library. Raise an exception if the HTTP response code
         is not 200/201. IF there is a REST communication exception, raise InvalidParameterException.
+        Connection errors and transient 5xx responses are retried according to retry_policy - POSTs only
+        when retry_safe is True.
 
         :param request_type: Type of Request.
                Supported Values - GET, POST, (not PUT, PATCH, DELETE).
@@ -246,26 +286,58 @@ class Client:
         :param endpoint: API Endpoint. Type - String
         :param payload: API Request Parameters or Query String.
                Type - String or Dict
+        :param retry_safe: True if a POST can be replayed without side effects, for example a query.
+               Type - Boolean
+        :param data: A POST body sent as-is instead of payload - bytes, a file or an iterator of chunks,
+               which is streamed to the server. Since an iterator can only be read once, a data body is never retried.
         :return: Response. Type - JSON Formatted String
         """
         class_name = sys._getframe(2).f_code.co_name
         caller_method = sys._getframe(1).f_code.co_name
-        try:
-            response = ""
-            if request_type == "GET":
-                response = requests.get(
-                    endpoint, timeout=30, params=payload, verify=self.ssl_verify
+
+        def call() -> Response:
+            # run once per request sent - callers sharing a coalesced GET share its outcome, so the
+            # breaker counts it once
+            if not self.circuit_breaker.allow():
+                raise circuit_open_exception(
+                    self.circuit_breaker,
+                    self.platform_url,
+                    self.server_name,
+                    endpoint,
+                    class_name,
+                    caller_method,
                 )
-            elif request_type == "POST":
-                response = requests.post(
+            try:
+                response = metrics.observe(
+                    caller_method,
+                    request_type,
                     endpoint,
-                    headers=self.headers,
-                    timeout=30,
-                    json=payload,
-                    verify=self.ssl_verify,
+                    lambda on_retry: self._send(
+                        request_type, endpoint, payload, retry_safe, data, on_retry
+                    ),
                 )
-            elif request_type == "DELETE":
-                response = requests.delete(endpoint, timeout=30, verify=self.ssl_verify)
+            except BaseException:
+                # any failure - not only a connection error - ends a half-open trial call
+                self.circuit_breaker.record_failure()
+                raise
+            if response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            return response
+
+        try:
+            if request_type == "GET" and self.coalesce_gets:
+                key = (
+                    "Client",
+                    "GET",
+                    endpoint,
+                    json.dumps(payload, sort_keys=True, default=str),
+                    self.ssl_verify,
+                )
+                response = single_flight.do(key, call)
+            else:
+                response = call()
 
             if response.status_code in (200, 201):
                 return response
@@ -329,6 +401,82 @@ class Client:
                 [endpoint],
             )
 
+    def _send(
+        self,
+        request_type: str,
+        endpoint: str,
+        payload,
+        retry_safe: bool,
+        data,
+        on_retry=None,
+    ) -> Response:
+        response = ""
+        if request_type == "GET":
+            response = self._get(endpoint, payload, on_retry)
+        elif request_type == "POST":
+            response = self.retry_policy.call(
+                request_type,
+                lambda timeout: self.session.post(
+                    endpoint,
+                    headers=tracing.inject(self.headers),
+                    timeout=timeout,
+                    json=payload if data is None else None,
+                    data=data,
+                    verify=self.ssl_verify,
+                ),
+                timeout=self.timeout,
+                safe=retry_safe and data is None,
+                on_retry=on_retry,
+            )
+        elif request_type == "DELETE":
+            response = self.retry_policy.call(
+                request_type,
+                lambda timeout: self.session.delete(
+                    endpoint,
+                    headers=tracing.inject(),
+                    timeout=timeout,
+                    verify=self.ssl_verify,
+                ),
+                timeout=self.timeout,
+                on_retry=on_retry,
+            )
+        return response
+
+    def _get(self, endpoint: str, payload, on_retry=None) -> Response:
+        return self.retry_policy.call(
+            "GET",
+            lambda timeout: self.session.get(
+                endpoint,
+                headers=tracing.inject(),
+                timeout=timeout,
+                params=payload,
+                verify=self.ssl_verify,
+            ),
+            timeout=self.timeout,
+            on_retry=on_retry,
+        )
+
+    def pool_stats(self) -> dict:
+        """
+        Return the statistics of the connection pool shared by clients of this platform
+
+        Returns
+        -------
+        dict with the pool settings and the connections opened, requests issued and idle connections
+        """
+        return session_pool.pool_stats(self.platform_url)
+
+    def circuit_state(self) -> dict:
+        """
+        Return the state of the circuit breaker for this client's platform and server
+
+        Returns
+        -------
+        dict with the state, the calls and failures in the current window, the failure rate, the number of
+        times the circuit opened, the calls rejected and the seconds until an open circuit allows a trial call
+        """
+        return self.circuit_breaker.stats()
+
 
 if __name__ == "__main__":
     try:
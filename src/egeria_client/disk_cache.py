@@ -0,0 +1,277 @@
+"""
+Persistent caching of Egeria response bodies in SQLite.
+
+A DiskCache stores JSON response bodies in a SQLite file with a time-to-live per entry, so that lookups
+survive process restarts. When the file grows past max_bytes, expired entries and then the least recently
+used entries are removed. The total size of the entries is kept by triggers in a one-row table, so a write
+does not add up the whole cache, and a read only records when an entry was used if the time recorded is more
+than touch_interval seconds old. disk_cache_for returns the shared DiskCache for a platform - there is one
+file per platform, in EGERIA_CACHE_DIR or ~/.cache/egeria_client by default.
+
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from src.egeria_client.session_pool import SessionPool
+
+default_ttl = 24 * 60 * 60.0  # seconds
+default_max_bytes = 64 * 1024 * 1024
+default_touch_interval = 60.0  # seconds
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def default_cache_directory() -> str:
+    """Return the directory holding the per-platform cache files"""
+    return os.environ.get(
+        "EGERIA_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "egeria_client"),
+    )
+
+
+def disk_cache_for(
+    platform_url: str,
+    directory: str = None,
+    ttl: float = default_ttl,
+    max_bytes: int = default_max_bytes,
+):
+    """Return the DiskCache for a platform, opening its file on first use"""
+    if directory is None:
+        directory = default_cache_directory()
+    file_name = re.sub(r"[^A-Za-z0-9.-]+", "_", SessionPool.platform_key(platform_url))
+    path = os.path.join(directory, file_name + ".sqlite")
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            os.makedirs(directory, exist_ok=True)
+            cache = DiskCache(path, ttl, max_bytes)
+            _caches[path] = cache
+        return cache
+
+
+def close_disk_caches():
+    """Close the files of all platform caches opened by disk_cache_for"""
+    with _caches_lock:
+        for cache in _caches.values():
+            cache.close()
+        _caches.clear()
+
+
+class DiskCache:
+    """
+    A SQLite-backed cache of JSON response bodies
+
+    Attributes:
+        path : str
+            the SQLite file - ":memory:" keeps the cache in memory
+        ttl : float
+            the default number of seconds an entry stays valid
+        max_bytes : int
+            the total size of the stored bodies above which entries are evicted
+        touch_interval : float
+            the number of seconds the last use of an entry may be out of date by - the least recently used
+            entries are found to within this
+
+    Methods:
+        get(key) -> object
+            returns the decoded body, or None if the key is absent or expired
+        get_many(keys) -> dict
+            returns the live entries among keys, in a single query
+        put(key, value, ttl = None)
+            stores value, which must be JSON serializable, for ttl seconds (the cache default if None)
+        put_many(items, ttl = None)
+            stores every key, value pair of the dict items in a single transaction
+        invalidate(key)
+        invalidate_prefix(prefix) -> int
+            removes every entry whose key starts with prefix, returning the number removed
+        purge_expired() -> int
+        clear()
+        stats() -> dict
+            returns the hit, miss, eviction and expiration counters, the number of entries and their size
+        close()
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = default_ttl,
+        max_bytes: int = default_max_bytes,
+        clock=time.time,
+        touch_interval: float = default_touch_interval,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, body TEXT NOT NULL, size INTEGER NOT NULL,"
+                " expires REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+            # the total size of the entries, kept by triggers - filled in once for files written without it
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS usage ("
+                " id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "INSERT OR IGNORE INTO usage (id, bytes)"
+                " SELECT 0, COALESCE(SUM(size), 0) FROM responses"
+            )
+            for name, event, change in (
+                ("responses_inserted", "INSERT", "NEW.size"),
+                ("responses_deleted", "DELETE", "-OLD.size"),
+                ("responses_updated", "UPDATE OF size", "NEW.size - OLD.size"),
+            ):
+                self._connection.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON responses"
+                    f" BEGIN UPDATE usage SET bytes = bytes + {change} WHERE id = 0; END"
+                )
+
+    def get(self, key: str):
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys) -> dict:
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        touched = []
+        if not keys:
+            return found
+        now = self.clock()
+        with self._lock, self._connection:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    "SELECT key, body, expires, accessed FROM responses"
+                    f" WHERE key IN ({marks})",
+                    chunk,
+                ).fetchall()
+                expired = [key for key, _, expires, _ in rows if expires <= now]
+                if expired:
+                    self._connection.executemany(
+                        "DELETE FROM responses WHERE key = ?", [(k,) for k in expired]
+                    )
+                    self.expirations += len(expired)
+                for key, body, expires, accessed in rows:
+                    if expires > now:
+                        found[key] = json.loads(body)
+                        if now - accessed >= self.touch_interval:
+                            touched.append((now, key))
+            if touched:
+                self._connection.executemany(
+                    "UPDATE responses SET accessed = ? WHERE key = ?", touched
+                )
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put(self, key: str, value, ttl: float = None):
+        self.put_many({key: value}, ttl)
+
+    def put_many(self, items: dict, ttl: float = None):
+        if not items:
+            return
+        now = self.clock()
+        expires = now + (self.ttl if ttl is None else ttl)
+        rows = []
+        for key, value in items.items():
+            body = json.dumps(value)
+            rows.append((key, body, len(body), expires, now))
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO responses (key, body, size, expires, accessed)"
+                " VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET"
+                " body = excluded.body, size = excluded.size,"
+                " expires = excluded.expires, accessed = excluded.accessed",
+                rows,
+            )
+            self._evict(now)
+
+    def _evict(self, now: float):
+        total = self._size()
+        if total <= self.max_bytes:
+            return
+        self.expirations += self._connection.execute(
+            "DELETE FROM responses WHERE expires <= ?", (now,)
+        ).rowcount
+        total = self._size()
+        while total > self.max_bytes:
+            rows = self._connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            victims = []
+            for key, size in rows:
+                victims.append((key,))
+                total -= size
+                if total <= self.max_bytes:
+                    break
+            self._connection.executemany("DELETE FROM responses WHERE key = ?", victims)
+            self.evictions += len(victims)
+
+    def _size(self) -> int:
+        return self._connection.execute(
+            "SELECT bytes FROM usage WHERE id = 0"
+        ).fetchone()[0]
+
+    def invalidate(self, key: str):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        with self._lock, self._connection:
+            return self._connection.execute(
+                "DELETE FROM responses WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            ).rowcount
+
+    def purge_expired(self) -> int:
+        with self._lock, self._connection:
+            removed = self._connection.execute(
+                "DELETE FROM responses WHERE expires <= ?", (self.clock(),)
+            ).rowcount
+            self.expirations += removed
+            return removed
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+            size = self._size()
+            return {
+                "entries": entries,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,272 @@
+"""
+Concurrent status sweeps across many platforms.
+
+A PlatformFleet holds one Platform client per platform URL and fans the platform status calls out over a
+bounded thread pool. Each call is timed, and a sweep returns whatever has completed by its deadline - calls
+that failed or did not finish in time are reported as such rather than failing the whole sweep.
+
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+
+from requests import Response
+
+from egeria_client.platform_services import Platform
+from src.egeria_client.retry import no_retries
+
+
+@dataclass
+class FleetCallResult:
+    """The outcome of one call made during a fleet sweep"""
+
+    platform_url: str
+    operation: str
+    server: str = None
+    ok: bool = False
+    latency: float = 0.0
+    result: dict = None
+    error: str = None
+
+
+@dataclass
+class FleetStatus:
+    """
+    The results of a fleet sweep
+
+    Attributes:
+        results : [FleetCallResult]
+            one entry per call, in the order the calls completed
+        elapsed : float
+            the wall-clock duration of the sweep in seconds
+        complete : bool
+            False if the sweep deadline passed before every call finished
+
+    Methods:
+        failed() -> [FleetCallResult]
+        servers(platform_url, operation = "list_servers") -> [str]
+            returns the server names reported by a successful call
+        rows() -> [dict]
+            returns one dict per call, ready for tabulating
+        table() -> str
+            returns the results as a fixed-width text table, sorted by platform, operation and server
+    """
+
+    results: list = field(default_factory=list)
+    elapsed: float = 0.0
+    complete: bool = True
+
+    def failed(self) -> list:
+        return [r for r in self.results if not r.ok]
+
+    def servers(self, platform_url: str, operation: str = "list_servers") -> list:
+        for r in self.results:
+            if r.platform_url == platform_url and r.operation == operation and r.ok:
+                return server_names(r.result)
+        return []
+
+    def rows(self) -> list:
+        return [
+            {
+                "platform": r.platform_url,
+                "operation": r.operation,
+                "server": r.server or "",
+                "status": "ok" if r.ok else "failed",
+                "latency_ms": round(r.latency * 1000, 1),
+                "detail": r.error
+                or (", ".join(server_names(r.result)) if r.result else ""),
+            }
+            for r in self.results
+        ]
+
+    def table(self) -> str:
+        columns = ("platform", "operation", "server", "status", "latency_ms", "detail")
+        rows = sorted(
+            self.rows(), key=lambda r: (r["platform"], r["operation"], r["server"])
+        )
+        widths = {
+            c: max([len(c)] + [len(str(r[c])) for r in rows]) for c in columns[:-1]
+        }
+        lines = ["  ".join(c.ljust(widths.get(c, 0)) for c in columns).rstrip()]
+        for r in rows:
+            lines.append(
+                "  ".join(str(r[c]).ljust(widths.get(c, 0)) for c in columns).rstrip()
+            )
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.table()
+
+
+def server_names(result: dict) -> list:
+    """Return the server names in a server list response body"""
+    if not isinstance(result, dict):
+        return []
+    return result.get("serverList") or []
+
+
+class PlatformFleet:
+    """
+    Runs platform status calls against many platforms at once
+
+    Attributes:
+        platform_urls : [str]
+            the URLs of the platforms in the fleet
+        user_id : str
+            the identity used to call the platform services
+        max_workers : int
+            the maximum number of calls in progress at the same time
+        timeout : float
+            the number of seconds each call waits for its platform
+        platforms : dict
+            the Platform client for each platform URL
+
+    Methods:
+        sweep(operations = ("list_servers", "get_active_server_list"), servers = None, deadline = None)
+            -> FleetStatus
+            calls each operation on every platform, and get_server_status for each server in servers
+        list_servers(deadline = None) -> FleetStatus
+        get_active_server_list(deadline = None) -> FleetStatus
+        get_server_status(servers = None, deadline = None) -> FleetStatus
+            returns the status of the named servers, or of every server each platform knows about
+    """
+
+    platform_operations = ("list_servers", "get_active_server_list")
+
+    def __init__(
+        self,
+        platform_urls,
+        user_id: str,
+        user_pwd: str = None,
+        server_name: str = None,
+        max_workers: int = 16,
+        timeout: float = 10.0,
+        retry_policy=no_retries,
+    ):
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be greater than 0, not {max_workers}")
+        self.platform_urls = list(dict.fromkeys(platform_urls))
+        self.user_id = user_id
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.platforms = {}
+        for url in self.platform_urls:
+            platform = Platform(server_name, url, user_id, user_pwd)
+            platform.timeout = timeout
+            platform.retry_policy = retry_policy
+            self.platforms[url] = platform
+
+    def _call(self, platform_url: str, operation: str, server: str = None):
+        platform = self.platforms[platform_url]
+        start = time.perf_counter()
+        result = FleetCallResult(platform_url, operation, server)
+        try:
+            if server is None:
+                response = getattr(platform, operation)()
+            else:
+                response = getattr(platform, operation)(server)
+            result.result = (
+                response.json() if isinstance(response, Response) else response
+            )
+            result.ok = True
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        result.latency = time.perf_counter() - start
+        return result
+
+    def sweep(
+        self,
+        operations=platform_operations,
+        servers=None,
+        deadline: float = None,
+        status_of_listed_servers: bool = False,
+    ) -> FleetStatus:
+        """
+        Call the operations on every platform concurrently
+
+        Parameters
+        ----------
+        operations : the names of Platform methods taking no arguments, such as list_servers
+        servers : a dict of platform URL to server names, or a list of server names used for every
+                  platform - get_server_status is called for each of them
+        deadline : the maximum number of seconds the sweep may take - calls still in progress are then
+                   reported as timed out. None waits for every call.
+        status_of_listed_servers : if True, get_server_status is also called for every server that
+                   list_servers reports
+
+        Returns
+        -------
+        A FleetStatus with one FleetCallResult per call
+        """
+        status = FleetStatus()
+        start = time.perf_counter()
+        expires = None if deadline is None else start + deadline
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="egeria-fleet"
+        )
+        in_flight = {}
+
+        def submit(platform_url, operation, server=None):
+            future = executor.submit(self._call, platform_url, operation, server)
+            in_flight[future] = (platform_url, operation, server)
+
+        try:
+            for url in self.platform_urls:
+                for operation in operations:
+                    submit(url, operation)
+                if isinstance(servers, dict):
+                    names = servers.get(url, [])
+                else:
+                    names = servers or []
+                for server in names:
+                    submit(url, "get_server_status", server)
+
+            while in_flight:
+                remaining = None
+                if expires is not None:
+                    remaining = expires - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                done, _ = wait(
+                    in_flight, timeout=remaining, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    in_flight.pop(future)
+                    result = future.result()
+                    status.results.append(result)
+                    if (
+                        status_of_listed_servers
+                        and result.ok
+                        and result.operation == "list_servers"
+                    ):
+                        for server in server_names(result.result):
+                            submit(result.platform_url, "get_server_status", server)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for platform_url, operation, server in in_flight.values():
+            status.results.append(
+                FleetCallResult(
+                    platform_url,
+                    operation,
+                    server,
+                    latency=time.perf_counter() - start,
+                    error="timed out",
+                )
+            )
+        status.complete = not in_flight
+        status.elapsed = time.perf_counter() - start
+        return status
+
+    def list_servers(self, deadline: float = None) -> FleetStatus:
+        return self.sweep(("list_servers",), deadline=deadline)
+
+    def get_active_server_list(self, deadline: float = None) -> FleetStatus:
+        return self.sweep(("get_active_server_list",), deadline=deadline)
+
+    def get_server_status(self, servers=None, deadline: float = None) -> FleetStatus:
+        if servers is None:
+            return self.sweep(
+                ("list_servers",), deadline=deadline, status_of_listed_servers=True
+            )
+        return self.sweep((), servers, deadline)
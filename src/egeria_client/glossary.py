@@ -0,0 +1,260 @@
+"""
+Local resolution of glossary terms.
+
+Semantic tagging resolves the same few thousand glossary terms over and over, and find_meanings,
+get_meaning_by_name and get_meaning each call the server. A GlossaryResolver loads the terms once into a
+sorted index - exact names in a dict, case-folded names in a sorted list searched with bisect for prefixes -
+and answers exact, case-insensitive and prefix lookups from memory. A lookup that misses falls back to the
+server; terms found there are added to the index, and names that are not found are remembered for a while
+so that repeating them does not repeat the call.
+
+"""
+import bisect
+import re
+import threading
+from dataclasses import dataclass
+
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.cache import LRUCache
+from src.egeria_client.util_exp import max_paging_size
+
+
+@dataclass(frozen=True)
+class MeaningEntry:
+    """One glossary term held by a GlossaryResolver"""
+
+    guid: str
+    name: str
+    qualified_name: str = None
+    description: str = None
+
+
+def meaning_entry(meaning: dict) -> MeaningEntry:
+    """Return the MeaningEntry of a glossary term element, or None if it has no guid or name"""
+    guid = (meaning.get("elementHeader") or {}).get("guid")
+    properties = (
+        meaning.get("meaningProperties") or meaning.get("properties") or meaning
+    )
+    name = properties.get("displayName") or properties.get("name")
+    if guid is None or name is None:
+        return None
+    return MeaningEntry(
+        guid, name, properties.get("qualifiedName"), properties.get("description")
+    )
+
+
+class GlossaryResolver:
+    """
+    Resolves glossary term names and guids from an in-memory index, falling back to the server
+
+    Attributes:
+        consumer : AssetConsumer
+            the client used to load the terms and to look up the ones the index does not hold
+        end_user_id : str
+            the user the terms are read as
+        fallback : bool
+            if False, lookups are answered from the index alone
+
+    Methods:
+        load(term = ".*", page_size = max_paging_size) -> int
+            adds the terms matching the regular expression term to the index, returning the number read
+        lookup(name, ignore_case = False) -> [MeaningEntry]
+            returns the terms with this name
+        resolve(name, ignore_case = False) -> str
+            returns the guid of the first term with this name, or None
+        prefix(prefix, limit = 0, ignore_case = False) -> [MeaningEntry]
+            returns the terms whose names start with prefix, in name order
+        get(guid) -> MeaningEntry
+            returns the term with this guid
+        stats() -> dict
+            returns the size of the index, and the lookups, hits and server calls of each kind of lookup
+            with its hit rate
+    """
+
+    kinds = ("exact", "casefold", "prefix", "guid")
+
+    def __init__(
+        self,
+        consumer: AssetConsumer,
+        end_user_id: str = None,
+        fallback: bool = True,
+        negative_ttl: float = 300.0,
+        max_negative_entries: int = 10000,
+        load: bool = True,
+    ):
+        """
+        Parameters
+        ----------
+        consumer : the client used to read the glossary terms
+        end_user_id : the user the terms are read as - defaults to the consumer's end user
+        fallback : if True, a lookup the index cannot answer is sent to the server
+        negative_ttl : the number of seconds a lookup that the server could not answer is remembered for
+        max_negative_entries : the number of such lookups remembered
+        load : if True every glossary term is loaded before the constructor returns
+        """
+        self.consumer = consumer
+        self.end_user_id = end_user_id or consumer.end_user_id
+        self.fallback = fallback
+        self._lock = threading.RLock()
+        self._by_guid = {}
+        self._by_name = {}
+        self._by_folded = {}
+        self._folded = []  # sorted case-folded names, for prefix searches
+        self._not_found = LRUCache(max_negative_entries, negative_ttl)
+        self._counts = {k: {"lookups": 0, "hits": 0, "server": 0} for k in self.kinds}
+        if load:
+            self.load()
+
+    def __len__(self):
+        return len(self._by_guid)
+
+    def _remove(self, entry: MeaningEntry) -> bool:
+        """Remove an entry, returning True if that left a case-folded name without terms"""
+        del self._by_guid[entry.guid]
+        folded = entry.name.casefold()
+        for index, key in ((self._by_name, entry.name), (self._by_folded, folded)):
+            del index[key][entry.guid]
+            if not index[key]:
+                del index[key]
+        return folded not in self._by_folded
+
+    def _add(self, entries) -> int:
+        added = 0
+        with self._lock:
+            new_names = False
+            for entry in entries:
+                if entry is None:
+                    continue
+                current = self._by_guid.get(entry.guid)
+                if current == entry:
+                    continue
+                if current is not None:
+                    new_names |= self._remove(current)
+                self._by_guid[entry.guid] = entry
+                self._by_name.setdefault(entry.name, {})[entry.guid] = entry
+                folded = entry.name.casefold()
+                if folded not in self._by_folded:
+                    self._by_folded[folded] = {}
+                    new_names = True
+                self._by_folded[folded][entry.guid] = entry
+                added += 1
+            if new_names:
+                self._folded = sorted(self._by_folded)
+        return added
+
+    def load(self, term: str = ".*", page_size: int = max_paging_size) -> int:
+        # added in one go, so the sorted names are rebuilt once rather than once per page
+        entries = [
+            meaning_entry(meaning)
+            for meaning in self.consumer.iter_meanings(
+                term, page_size, self.end_user_id
+            )
+        ]
+        self._add(entries)
+        self._not_found.clear()
+        return len(entries)
+
+    def _count(self, kind: str, hit: bool, server: bool = False):
+        with self._lock:
+            counts = self._counts[kind]
+            counts["lookups"] += 1
+            counts["hits"] += hit
+            counts["server"] += server
+
+    def _from_server(self, kind: str, key: str, fetch, select) -> list:
+        """Look up a miss on the server, remembering lookups that find nothing"""
+        if not self.fallback or self._not_found.get((kind, key)):
+            self._count(kind, False)
+            return []
+        self._add(meaning_entry(m) for m in fetch() or [])
+        found = select()
+        if not found:
+            self._not_found.put((kind, key), True)
+        self._count(kind, False, server=True)
+        return found
+
+    @staticmethod
+    def _ordered(entries) -> list:
+        return sorted(entries, key=lambda e: (e.name, e.guid))
+
+    def _select_name(self, name: str, ignore_case: bool) -> list:
+        with self._lock:
+            if ignore_case:
+                found = self._by_folded.get(name.casefold())
+            else:
+                found = self._by_name.get(name)
+            return self._ordered(found.values()) if found else []
+
+    def lookup(self, name: str, ignore_case: bool = False) -> list:
+        kind = "casefold" if ignore_case else "exact"
+        found = self._select_name(name, ignore_case)
+        if found:
+            self._count(kind, True)
+            return found
+        return self._from_server(
+            kind,
+            name.casefold() if ignore_case else name,
+            lambda: self.consumer.get_meaning_by_name(name, self.end_user_id),
+            lambda: self._select_name(name, ignore_case),
+        )
+
+    def resolve(self, name: str, ignore_case: bool = False) -> str:
+        found = self.lookup(name, ignore_case)
+        return found[0].guid if found else None
+
+    def _select_prefix(self, prefix: str, limit: int, ignore_case: bool) -> list:
+        folded = prefix.casefold()
+        found = []
+        with self._lock:
+            start = bisect.bisect_left(self._folded, folded)
+            for name in self._folded[start:]:
+                if not name.startswith(folded):
+                    break
+                for entry in self._ordered(self._by_folded[name].values()):
+                    if ignore_case or entry.name.startswith(prefix):
+                        found.append(entry)
+                if limit and len(found) >= limit:
+                    return found[:limit]
+        return found
+
+    def prefix(self, prefix: str, limit: int = 0, ignore_case: bool = False) -> list:
+        found = self._select_prefix(prefix, limit, ignore_case)
+        if found:
+            self._count("prefix", True)
+            return found
+        pattern = ("(?i)" if ignore_case else "") + re.escape(prefix) + ".*"
+        return self._from_server(
+            "prefix",
+            ("i:" if ignore_case else "") + prefix,
+            lambda: self.consumer.find_meanings(pattern, self.end_user_id),
+            lambda: self._select_prefix(prefix, limit, ignore_case),
+        )
+
+    def get(self, guid: str) -> MeaningEntry:
+        entry = self._by_guid.get(guid)
+        if entry is not None:
+            self._count("guid", True)
+            return entry
+        found = self._from_server(
+            "guid",
+            guid,
+            lambda: [self.consumer.get_meaning(guid, self.end_user_id) or {}],
+            lambda: [self._by_guid[guid]] if guid in self._by_guid else [],
+        )
+        return found[0] if found else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {"terms": len(self._by_guid), "names": len(self._by_name)}
+            lookups = hits = 0
+            for kind, counts in self._counts.items():
+                stats[kind] = dict(counts)
+                stats[kind]["hit_rate"] = (
+                    counts["hits"] / counts["lookups"] if counts["lookups"] else 0.0
+                )
+                lookups += counts["lookups"]
+                hits += counts["hits"]
+            stats["lookups"] = lookups
+            stats["hits"] = hits
+            stats["hit_rate"] = hits / lookups if lookups else 0.0
+            return stats
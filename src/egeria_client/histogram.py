@@ -0,0 +1,152 @@
+"""
+Latency histograms with a bounded relative error.
+
+LatencyHistogram buckets values the way HdrHistogram does: each power of two is split into the same number of
+linear sub-buckets, enough for the requested number of significant figures, so a value is held to within
+that precision whether it is a microsecond or a minute, in a few kilobytes however many values are recorded.
+Only the buckets that have values are stored. Histograms can be merged, which lets each thread or operation
+keep its own and a report combine them.
+
+"""
+import math
+import threading
+
+
+class LatencyHistogram:
+    """
+    A histogram of durations, recorded in seconds and held in integer units of unit seconds
+
+    Attributes:
+        significant_figures : int
+            the number of significant decimal figures each value is held to, from 1 to 5
+        unit : float
+            the resolution of the histogram in seconds - a microsecond by default
+        count : int
+            the number of values recorded
+        total : float
+            the sum of the values recorded, in seconds
+
+    Methods:
+        record(seconds, count = 1)
+        value_at_percentile(percentile) -> float
+            the value in seconds that percentile percent of the recorded values are at or below
+        percentiles(percentiles) -> dict
+        count_at_or_below(seconds) -> int
+        merge(other)
+        reset()
+        summary() -> dict
+            the count, min, mean, max and common percentiles, in milliseconds
+    """
+
+    def __init__(self, significant_figures: int = 3, unit: float = 1e-6):
+        if not 1 <= significant_figures <= 5:
+            raise ValueError(
+                f"significant_figures must be from 1 to 5, not {significant_figures}"
+            )
+        self.significant_figures = significant_figures
+        self.unit = unit
+        sub_bucket_magnitude = math.ceil(math.log2(2 * 10**significant_figures))
+        self._half_magnitude = sub_bucket_magnitude - 1
+        self._half_count = 1 << self._half_magnitude
+        self._mask = (1 << sub_bucket_magnitude) - 1
+        self._counts = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self._min = None
+        self._max = 0
+
+    def _index(self, value: int) -> int:
+        bucket = (value | self._mask).bit_length() - self._half_magnitude - 1
+        sub_bucket = value >> bucket
+        return (bucket << self._half_magnitude) + sub_bucket
+
+    def _highest_equivalent(self, index: int) -> int:
+        bucket, sub_bucket = divmod(index, self._half_count)
+        if bucket == 0:
+            return sub_bucket
+        sub_bucket += self._half_count
+        return ((sub_bucket + 1) << (bucket - 1)) - 1
+
+    def record(self, seconds: float, count: int = 1):
+        value = max(int(seconds / self.unit), 0)
+        index = self._index(value)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + count
+            self.count += count
+            self.total += seconds * count
+            if self._min is None or value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+
+    @property
+    def min(self) -> float:
+        return (self._min or 0) * self.unit
+
+    @property
+    def max(self) -> float:
+        return self._max * self.unit
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def value_at_percentile(self, percentile: float) -> float:
+        with self._lock:
+            if not self.count:
+                return 0.0
+            wanted = max(math.ceil(self.count * min(percentile, 100.0) / 100), 1)
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= wanted:
+                    value = min(self._highest_equivalent(index), self._max)
+                    return max(value, self._min) * self.unit
+            return self._max * self.unit
+
+    def percentiles(self, percentiles=(50, 90, 95, 99, 99.9)) -> dict:
+        return {p: self.value_at_percentile(p) for p in percentiles}
+
+    def count_at_or_below(self, seconds: float) -> int:
+        """Return the number of values recorded in the buckets at or below seconds"""
+        limit = self._index(max(int(seconds / self.unit), 0))
+        with self._lock:
+            return sum(n for index, n in self._counts.items() if index <= limit)
+
+    def merge(self, other: "LatencyHistogram"):
+        if (other.significant_figures, other.unit) != (
+            self.significant_figures,
+            self.unit,
+        ):
+            raise ValueError("Only histograms with the same precision can be merged")
+        with other._lock:
+            counts = dict(other._counts)
+            count, total, low, high = other.count, other.total, other._min, other._max
+        with self._lock:
+            for index, n in counts.items():
+                self._counts[index] = self._counts.get(index, 0) + n
+            self.count += count
+            self.total += total
+            if low is not None and (self._min is None or low < self._min):
+                self._min = low
+            self._max = max(self._max, high)
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+            self.count = 0
+            self.total = 0.0
+            self._min = None
+            self._max = 0
+
+    def summary(self) -> dict:
+        summary = {
+            "count": self.count,
+            "min_ms": round(self.min * 1000, 3),
+            "mean_ms": round(self.mean * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+        for p, value in self.percentiles().items():
+            summary[f"p{p:g}_ms"] = round(value * 1000, 3)
+        return summary
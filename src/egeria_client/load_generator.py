@@ -0,0 +1,366 @@
+"""
+Open-loop load generation against an OMAG server platform.
+
+A LoadGenerator starts calls at a target rate for a fixed time, choosing each call from a weighted mix of
+operations. The scheduling is open loop: a call is due at its planned time whether or not the calls before it
+have finished, as it would be with many independent users, so a slow server makes calls queue rather than
+slowing the load down. The latency of a call is measured from its planned start, so time spent queued
+behind slow calls is counted, and the service time from when it actually started. Both are kept in a
+LatencyHistogram per operation, along with the calls that failed and the calls dropped because too many were
+already outstanding. The LoadReport of a run can be printed or written as JSON to size a deployment from.
+
+"""
+import itertools
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.histogram import LatencyHistogram
+
+arrival_patterns = ("uniform", "poisson")
+default_mix = {
+    "find_assets": 4,
+    "get_comments": 3,
+    "add_comment_to_asset": 1,
+    "add_tag": 1,
+    "platform_status": 1,
+}
+
+
+def parse_mix(text: str) -> dict:
+    """Parse a mix like find_assets=4,get_comments=3 into a dict of operation name -> weight"""
+    mix = {}
+    for part in text.split(","):
+        name, sep, weight = part.strip().partition("=")
+        if not name:
+            continue
+        try:
+            mix[name] = float(weight) if sep else 1.0
+        except ValueError:
+            raise ValueError(f"The weight of {name} must be a number, not {weight}")
+        if mix[name] < 0:
+            raise ValueError(f"The weight of {name} must not be negative")
+    return mix
+
+
+def catalog_operations(
+    consumer: AssetConsumer,
+    platform,
+    asset_guids: list,
+    tag_guid: str = None,
+    search_string: str = ".*",
+    page_size: int = 50,
+    seed: int = None,
+) -> dict:
+    """
+    Return the operations a load mix can choose from, by name
+
+    Parameters
+    ----------
+    consumer : the AssetConsumer the catalog calls are made with
+    platform : the Platform the status calls are made with
+    asset_guids : the assets the comment and tag calls pick from at random
+    tag_guid : the tag add_tag assigns - None creates a public tag on the first call
+    search_string : the regular expression find_assets searches for
+    page_size : the number of assets find_assets asks for
+    seed : the seed of the random choice of assets, for repeatable runs
+
+    Returns
+    -------
+    dict of operation name -> function of no arguments making one call
+    """
+    if not asset_guids:
+        raise ValueError("The load needs at least one asset to comment on and tag")
+    rng = random.Random(seed)
+    lock = threading.Lock()
+
+    def any_asset() -> str:
+        with lock:
+            return rng.choice(asset_guids)
+
+    tag = [tag_guid]
+
+    def add_tag():
+        with lock:
+            if tag[0] is None:
+                tag[0] = consumer.create_public_tag(
+                    "load-test", "Assigned by load tests"
+                )
+        consumer.add_tag(any_asset(), tag[0], True)
+
+    return {
+        "find_assets": lambda: consumer.find_assets(search_string, page_size=page_size),
+        "get_comments": lambda: consumer.get_comments(any_asset()),
+        "add_comment_to_asset": lambda: consumer.add_comment_to_asset(
+            any_asset(), "Added by a load test", "STANDARD_COMMENT", True
+        ),
+        "add_tag": add_tag,
+        "platform_status": lambda: platform.get_active_server_status(),
+    }
+
+
+@dataclass
+class OperationStats:
+    """
+    The calls made for one operation of a load
+
+    Attributes:
+        name : str
+        latency : LatencyHistogram
+            the time from when each call was due to when it finished
+        service_time : LatencyHistogram
+            the time from when each call started to when it finished
+        calls : int
+            the number of calls started
+        errors : int
+            the number of calls that raised an exception
+        dropped : int
+            the number of calls not started because too many were outstanding
+        error_types : dict
+            exception class name -> number of calls that raised it
+    """
+
+    name: str
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    service_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+    calls: int = 0
+    errors: int = 0
+    dropped: int = 0
+    error_types: dict = field(default_factory=dict)
+
+    @property
+    def error_rate(self) -> float:
+        due = self.calls + self.dropped
+        return (self.errors + self.dropped) / due if due else 0.0
+
+    def summary(self) -> dict:
+        latency = self.latency.summary()
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "error_rate": round(self.error_rate, 4),
+            "error_types": dict(self.error_types),
+            "latency_ms": {k[:-3]: v for k, v in latency.items() if k != "count"},
+            "service_time_ms": {
+                k[:-3]: v
+                for k, v in self.service_time.summary().items()
+                if k != "count"
+            },
+        }
+
+
+@dataclass
+class LoadReport:
+    """
+    The outcome of a load run
+
+    Attributes:
+        operations : dict
+            operation name -> OperationStats
+        target_rate : float
+            the calls per second the run was asked for
+        elapsed : float
+            the seconds from the first call being due to the last one finishing
+
+    Methods:
+        total() -> OperationStats
+            the statistics of all the operations combined
+        summary() -> dict
+        format() -> str
+            the summary as a table
+        write(path)
+            writes the summary as JSON
+    """
+
+    operations: dict = field(default_factory=dict)
+    target_rate: float = 0.0
+    elapsed: float = 0.0
+
+    def total(self) -> OperationStats:
+        total = OperationStats("total")
+        for stats in self.operations.values():
+            total.latency.merge(stats.latency)
+            total.service_time.merge(stats.service_time)
+            total.calls += stats.calls
+            total.errors += stats.errors
+            total.dropped += stats.dropped
+            for name, n in stats.error_types.items():
+                total.error_types[name] = total.error_types.get(name, 0) + n
+        return total
+
+    def summary(self) -> dict:
+        total = self.total()
+        return {
+            "target_rate": self.target_rate,
+            "achieved_rate": round(total.calls / self.elapsed, 2)
+            if self.elapsed
+            else 0.0,
+            "elapsed": round(self.elapsed, 3),
+            "total": total.summary(),
+            "operations": {
+                name: stats.summary() for name, stats in self.operations.items()
+            },
+        }
+
+    def format(self) -> str:
+        summary = self.summary()
+        lines = [
+            f"target {summary['target_rate']:g}/s, achieved {summary['achieved_rate']:g}/s"
+            f" over {summary['elapsed']:g}s",
+            f"{'operation':22} {'calls':>7} {'errors':>7} {'dropped':>7}"
+            f" {'p50 ms':>9} {'p99 ms':>9} {'p99.9 ms':>9} {'max ms':>9}",
+        ]
+        rows = list(summary["operations"].items()) + [("total", summary["total"])]
+        for name, stats in rows:
+            latency = stats["latency_ms"]
+            lines.append(
+                f"{name:22} {stats['calls']:7} {stats['errors']:7} {stats['dropped']:7}"
+                f" {latency['p50']:9.2f} {latency['p99']:9.2f} {latency['p99.9']:9.2f}"
+                f" {latency['max']:9.2f}"
+            )
+        return "\n".join(lines)
+
+    def write(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+
+
+class LoadGenerator:
+    """
+    Starts calls from a weighted mix of operations at a target rate
+
+    Attributes:
+        operations : dict
+            operation name -> function of no arguments making one call
+        mix : dict
+            operation name -> relative weight of the operation in the load
+        rate : float
+            the number of calls started per second
+        duration : float
+            the number of seconds calls are started for
+        max_workers : int
+            the maximum number of calls in progress
+        max_outstanding : int
+            the maximum number of calls in progress or queued - a call due when there are this many is dropped
+        arrivals : str
+            uniform for calls evenly spaced, or poisson for calls at random intervals averaging the rate
+
+    Methods:
+        run() -> LoadReport
+    """
+
+    def __init__(
+        self,
+        operations: dict,
+        mix: dict = None,
+        rate: float = 10.0,
+        duration: float = 60.0,
+        max_workers: int = 32,
+        max_outstanding: int = None,
+        arrivals: str = "uniform",
+        seed: int = None,
+    ):
+        """
+        Parameters
+        ----------
+        operations : operation name -> function of no arguments making one call
+        mix : operation name -> relative weight - if None, the default mix restricted to operations, or equal
+              weights if the default mix has none of them
+        rate : the number of calls started per second
+        duration : the number of seconds calls are started for
+        max_workers : the maximum number of calls in progress
+        max_outstanding : the maximum number of calls in progress or queued - ten times max_workers if None
+        arrivals : uniform or poisson
+        seed : the seed of the random choice of operations and poisson intervals
+        """
+        if mix is None:
+            mix = {k: v for k, v in default_mix.items() if k in operations} or {
+                name: 1 for name in operations
+            }
+        unknown = sorted(set(mix) - set(operations))
+        if unknown:
+            raise ValueError(
+                f"Unknown operations {unknown}, choose from {sorted(operations)}"
+            )
+        mix = {name: weight for name, weight in mix.items() if weight > 0}
+        if not mix:
+            raise ValueError("The mix must give at least one operation a weight")
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, not {rate}")
+        if arrivals not in arrival_patterns:
+            raise ValueError(
+                f"arrivals must be one of {arrival_patterns}, not {arrivals}"
+            )
+        self.operations = operations
+        self.mix = mix
+        self.rate = rate
+        self.duration = duration
+        self.max_workers = max_workers
+        self.max_outstanding = max_outstanding or 10 * max_workers
+        self.arrivals = arrivals
+        self._random = random.Random(seed)
+
+    def _schedule(self):
+        """Yield the operation name and the offset in seconds from the start of every call due"""
+        names = list(self.mix)
+        cumulative, running = [], 0.0
+        for name in names:
+            running += self.mix[name]
+            cumulative.append(running)
+        offset = 0.0
+        for n in itertools.count(1):
+            yield self._random.choices(names, cum_weights=cumulative)[0], offset
+            if self.arrivals == "poisson":
+                offset += self._random.expovariate(self.rate)
+            else:
+                offset = n / self.rate
+            if offset >= self.duration:
+                return
+
+    def run(self) -> LoadReport:
+        report = LoadReport(
+            {name: OperationStats(name) for name in self.mix}, self.rate
+        )
+        outstanding = [0]
+        lock = threading.Lock()
+
+        def call(stats: OperationStats, due: float):
+            started = time.perf_counter()
+            error = None
+            try:
+                self.operations[stats.name]()
+            except Exception as e:
+                error = type(e).__name__
+            finished = time.perf_counter()
+            stats.latency.record(finished - due)
+            stats.service_time.record(finished - started)
+            with lock:
+                outstanding[0] -= 1
+                if error is not None:
+                    stats.errors += 1
+                    stats.error_types[error] = stats.error_types.get(error, 0) + 1
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            self.max_workers, thread_name_prefix="egeria-load"
+        ) as pool:
+            for name, offset in self._schedule():
+                due = start + offset
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                stats = report.operations[name]
+                with lock:
+                    if outstanding[0] >= self.max_outstanding:
+                        stats.dropped += 1
+                        continue
+                    outstanding[0] += 1
+                    stats.calls += 1
+                pool.submit(call, stats, due)
+        report.elapsed = time.perf_counter() - start
+        return report
@@ -0,0 +1,435 @@
+"""
+Timing of the REST calls made by the clients.
+
+Every call made through Client.make_request, the AssetConsumer and AssetOwner clients, or the issue_get,
+issue_post, issue_put and issue_data_post functions is reported to the hooks registered with the metrics
+registry, as a CallRecord of the operation, the URL template, the status, the response size, the duration
+and the number of retries. URL templates replace the server name, user and guids in a URL with placeholders,
+so that the calls to one endpoint are counted together. Nothing is measured while no hook is registered.
+
+A HistogramCollector keeps a LatencyHistogram per operation and endpoint, to see which endpoints dominate the
+time of a job, and a PrometheusTextfile writes a collector in the Prometheus text format to a file - for the
+node exporter textfile collector, for example.
+
+"""
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+from src.egeria_client.histogram import LatencyHistogram
+
+guid_pattern = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+# the path segment following one of these is a name, unless it ends the path
+named_segments = {"servers": "{server}", "users": "{user}"}
+default_duration_buckets = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def url_template(url: str) -> str:
+    """Return the path of a URL with the server name, user and guids replaced by placeholders"""
+    parts = urlsplit(url).path.split("/")
+    last = len(parts) - 1
+    for i in range(1, last + 1):
+        placeholder = named_segments.get(parts[i - 1])
+        if placeholder is not None and i < last:
+            parts[i] = placeholder
+        elif guid_pattern.fullmatch(parts[i]):
+            parts[i] = "{guid}"
+    return "/".join(parts)
+
+
+def calling_method(client) -> str:
+    """Return the name of the public method of client that the current call was made from"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        name = frame.f_code.co_name
+        if (
+            not name.startswith("_")
+            and frame.f_locals.get("self") is client
+            and callable(getattr(type(client), name, None))
+        ):
+            return name
+        frame = frame.f_back
+    return "unknown"
+
+
+@dataclass(frozen=True)
+class CallRecord:
+    """
+    One REST call
+
+    Attributes:
+        operation : str
+            the client method or function that made the call
+        url_template : str
+            the path called, with the server name, user and guids replaced by placeholders
+        method : str
+            the HTTP method
+        status : int
+            the HTTP status of the response - None if the call failed without one
+        bytes : int
+            the size of the response body
+        duration : float
+            the seconds the call took, including its retries
+        retries : int
+            the number of times the request was retried
+        error : str
+            the class name of the exception the call failed with, if it did
+    """
+
+    operation: str
+    url_template: str
+    method: str
+    status: int
+    bytes: int
+    duration: float
+    retries: int = 0
+    error: str = None
+
+
+class MetricsRegistry:
+    """
+    The hooks that are given a CallRecord for every REST call
+
+    A hook is a function taking a CallRecord. It is called on the thread that made the call, after the call,
+    and an exception it raises is ignored so that a broken hook cannot fail the client.
+
+    Methods:
+        add_hook(hook) -> hook
+        remove_hook(hook)
+        clear()
+        enabled -> bool
+            True if any hook is registered
+        emit(record)
+            passes a CallRecord to every hook
+        observe(operation, method, url, call) -> object
+            makes a call and emits its CallRecord
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hooks = ()
+
+    def add_hook(self, hook):
+        with self._lock:
+            self._hooks = self._hooks + (hook,)
+        return hook
+
+    def remove_hook(self, hook):
+        with self._lock:
+            self._hooks = tuple(h for h in self._hooks if h is not hook)
+
+    def clear(self):
+        with self._lock:
+            self._hooks = ()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._hooks)
+
+    def emit(self, record: CallRecord):
+        for hook in self._hooks:
+            try:
+                hook(record)
+            except Exception:
+                pass
+
+    def observe(self, operation, method: str, url: str, call):
+        """
+        Make a call, emitting a CallRecord for it if a hook is registered
+
+        Parameters
+        ----------
+        operation : the name of the operation, or a function of no arguments returning it - only called when
+                    a hook is registered
+        method : the HTTP method
+        url : the URL called
+        call : a function taking an on_retry function to pass to RetryPolicy.call - None when no hook is
+               registered - and returning the requests.Response
+
+        Returns
+        -------
+        The response returned by call. An exception raised by call is reported and raised again.
+        """
+        if not self._hooks:
+            return call(None)
+        retries = [0]
+
+        def on_retry(retry, delay, reason):
+            retries[0] = retry
+
+        start = time.perf_counter()
+        response = error = None
+        try:
+            response = call(on_retry)
+            return response
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            self.emit(
+                CallRecord(
+                    operation() if callable(operation) else operation,
+                    url_template(url),
+                    method,
+                    getattr(response, "status_code", None),
+                    _body_size(response),
+                    duration,
+                    retries[0],
+                    error,
+                )
+            )
+
+
+def _body_size(response) -> int:
+    if response is None:
+        return 0
+    length = response.headers.get("Content-Length")
+    if length is not None and length.isdigit():
+        return int(length)
+    return len(response.content or b"")
+
+
+metrics = MetricsRegistry()
+
+
+@dataclass
+class EndpointStats:
+    """The calls made by one operation to one endpoint"""
+
+    operation: str
+    method: str
+    url_template: str
+    duration: LatencyHistogram = field(default_factory=LatencyHistogram)
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes: int = 0
+    statuses: dict = field(default_factory=dict)
+
+    def summary(self) -> dict:
+        return {
+            "operation": self.operation,
+            "method": self.method,
+            "url_template": self.url_template,
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "statuses": dict(self.statuses),
+            "total_seconds": round(self.duration.total, 6),
+            **self.duration.summary(),
+        }
+
+
+class HistogramCollector:
+    """
+    A metrics hook keeping the duration histogram, call, error and retry counts and response bytes of each
+    operation and endpoint
+
+    Register it with metrics.add_hook(collector). A call is counted as an error if it raised an exception
+    or its status is 400 or more.
+
+    Methods:
+        stats() -> [EndpointStats]
+            the statistics of each operation and endpoint, those taking the most time in total first
+        summary() -> [dict]
+        format() -> str
+            the statistics as a table
+        reset()
+    """
+
+    def __init__(self, significant_figures: int = 3):
+        self.significant_figures = significant_figures
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def __call__(self, record: CallRecord):
+        key = (record.operation, record.method, record.url_template)
+        failed = record.error is not None or (record.status or 0) >= 400
+        status = str(record.status) if record.status is not None else record.error
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = EndpointStats(*key, LatencyHistogram(self.significant_figures))
+                self._stats[key] = stats
+            stats.calls += 1
+            stats.errors += failed
+            stats.retries += record.retries
+            stats.bytes += record.bytes
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        stats.duration.record(record.duration)
+
+    def stats(self) -> list:
+        with self._lock:
+            stats = list(self._stats.values())
+        return sorted(stats, key=lambda s: s.duration.total, reverse=True)
+
+    def summary(self) -> list:
+        return [s.summary() for s in self.stats()]
+
+    def format(self) -> str:
+        lines = [
+            f"{'operation':32} {'calls':>7} {'errors':>6} {'retries':>7} {'total s':>9}"
+            f" {'p50 ms':>9} {'p99 ms':>9}  endpoint"
+        ]
+        for s in self.stats():
+            lines.append(
+                f"{s.operation:32} {s.calls:7} {s.errors:6} {s.retries:7}"
+                f" {s.duration.total:9.3f} {s.duration.value_at_percentile(50) * 1000:9.2f}"
+                f" {s.duration.value_at_percentile(99) * 1000:9.2f}  {s.method} {s.url_template}"
+            )
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+def _label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{k}="{_label_value(v)}"' for k, v in labels.items())
+
+
+class PrometheusTextfile:
+    """
+    Writes the statistics of a HistogramCollector to a file in the Prometheus text exposition format
+
+    The file is written to a temporary file that then replaces it, so a scraper never reads half of it. The
+    metrics are egeria_client_request_duration_seconds, a histogram, and the counters
+    egeria_client_requests_total (by status), egeria_client_request_errors_total,
+    egeria_client_request_retries_total and egeria_client_response_bytes_total, all labelled with the
+    operation, method and endpoint.
+
+    Attributes:
+        collector : HistogramCollector
+        path : str
+        buckets : tuple
+            the upper bounds in seconds of the duration histogram buckets
+
+    Methods:
+        render() -> str
+        write()
+        start(interval)
+            writes the file every interval seconds on a background thread, until stop is called
+        stop()
+            stops the background thread and writes the file a last time
+    """
+
+    def __init__(
+        self,
+        collector: HistogramCollector,
+        path: str,
+        buckets=default_duration_buckets,
+        prefix: str = "egeria_client",
+    ):
+        self.collector = collector
+        self.path = path
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._stop = threading.Event()
+        self._thread = None
+
+    def render(self) -> str:
+        p = self.prefix
+        stats = self.collector.stats()
+        lines = [
+            f"# HELP {p}_request_duration_seconds Duration of the REST calls made by the client",
+            f"# TYPE {p}_request_duration_seconds histogram",
+        ]
+        for s in stats:
+            labels = _labels(
+                operation=s.operation, method=s.method, endpoint=s.url_template
+            )
+            for bound in self.buckets:
+                count = s.duration.count_at_or_below(bound)
+                lines.append(
+                    f'{p}_request_duration_seconds_bucket{{{labels},le="{bound:g}"}} {count}'
+                )
+            lines.append(
+                f'{p}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {s.duration.count}'
+            )
+            lines.append(
+                f"{p}_request_duration_seconds_sum{{{labels}}} {s.duration.total:.6f}"
+            )
+            lines.append(
+                f"{p}_request_duration_seconds_count{{{labels}}} {s.duration.count}"
+            )
+
+        lines += [
+            f"# HELP {p}_requests_total REST calls made by the client, by response status",
+            f"# TYPE {p}_requests_total counter",
+        ]
+        for s in stats:
+            for status, count in sorted(s.statuses.items(), key=lambda i: str(i[0])):
+                labels = _labels(
+                    operation=s.operation,
+                    method=s.method,
+                    endpoint=s.url_template,
+                    status=status,
+                )
+                lines.append(f"{p}_requests_total{{{labels}}} {count}")
+
+        for name, attribute, help_text in (
+            ("request_errors_total", "errors", "REST calls that failed"),
+            ("request_retries_total", "retries", "Retries of REST calls"),
+            ("response_bytes_total", "bytes", "Bytes received in REST responses"),
+        ):
+            lines += [
+                f"# HELP {p}_{name} {help_text}",
+                f"# TYPE {p}_{name} counter",
+            ]
+            for s in stats:
+                labels = _labels(
+                    operation=s.operation, method=s.method, endpoint=s.url_template
+                )
+                lines.append(f"{p}_{name}{{{labels}}} {getattr(s, attribute)}")
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(temporary, self.path)
+
+    def start(self, interval: float = 15.0):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(interval):
+                self.write()
+
+        self._thread = threading.Thread(
+            target=run, name="egeria-prometheus-textfile", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+        self.write()
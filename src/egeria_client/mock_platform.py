@@ -0,0 +1,1309 @@
+"""
+A local stand-in for an OMAG server platform.
+
+MockPlatform serves the platform services, asset consumer, asset owner and connected asset endpoints that
+this client calls, from a SyntheticCatalog held in memory, so that tests and benchmarks run without an Egeria
+install. The catalog is generated from its sizes and a seed: an asset, glossary term, tag or comment is
+computed from its index when it is asked for, so a catalog of millions of assets costs no more memory than an
+empty one, and two runs with the same seed see the same catalog. Only the changes made through the
+endpoints - comments, tags, likes, registered and deleted assets - are stored. Each request can be delayed by
+a fixed latency plus random jitter, and a share of requests can be failed, to see how the client behaves
+against a slow or unreliable platform.
+
+Run it with python -m src.egeria_client.mock_platform --port 9443 --assets 1000000.
+
+"""
+import argparse
+import bisect
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from src.egeria_client.utils import comment_types
+
+asset_kind, term_kind, tag_kind, comment_kind, registered_kind = range(1, 6)
+match_all = ("", ".*")
+default_servers = ("active-metadata-store", "cocoMDS1", "cocoMDS2", "cocoMDS3")
+platform_origin = "Egeria OMAG Server Platform (mock)"
+
+
+def synthetic_guid(kind: int, index: int, seed: int = 0) -> str:
+    """Return the guid of the element of a kind with an index - the kind, seed and index can be read back"""
+    return f"{kind:08x}-{seed & 0xffff:04x}-4000-8000-{index:012x}"
+
+
+def parse_guid(guid: str):
+    """Return (kind, seed, index) of a guid made by synthetic_guid, or None for any other string"""
+    parts = guid.split("-")
+    if len(parts) != 5 or parts[2] != "4000" or parts[3] != "8000":
+        return None
+    try:
+        return int(parts[0], 16), int(parts[1], 16), int(parts[4], 16)
+    except ValueError:
+        return None
+
+
+class MockError(Exception):
+    """An error response - the HTTP status and relatedHTTPCode are both status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _page(items, start: int, size: int) -> list:
+    return list(itertools.islice(items, start, start + size if size > 0 else None))
+
+
+def _compile(pattern: str):
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        raise MockError(400, f"Invalid search string {pattern}: {e}")
+
+
+class SyntheticCatalog:
+    """
+    A deterministic in-memory catalog of assets, glossary terms, tags and comments
+
+    Asset i has the type asset_types[i % len(asset_types)], is linked to glossary term i % term_count, is
+    related to assets i + 1 and 7i + 3 (modulo asset_count), and has comments_per_asset comments. Everything
+    else starts empty.
+
+    Attributes:
+        asset_count : int
+        term_count : int
+        tag_count : int
+            the number of public tags generated
+        comments_per_asset : int
+        seed : int
+            the seed the guids are made from
+
+    Methods:
+        asset(guid) -> dict
+        search_assets(pattern, start_from, page_size) -> [dict]
+        related_assets(guid, start_from, page_size) -> [dict]
+        register_asset(type_name, display_name, description, full_path) -> str
+        delete_asset(guid)
+        meaning(guid) -> dict
+        search_meanings(pattern, start_from, page_size) -> [dict]
+        meanings_by_name(name, start_from, page_size) -> [dict]
+        assets_by_meaning(guid, start_from, page_size) -> [str]
+        comments(asset_guid, start_from, page_size) -> [dict]
+        replies(comment_guid, start_from, page_size) -> [dict]
+        add_comment(asset_guid, user, comment_type, text, is_public, reply_to = None) -> str
+        update_comment(comment_guid, comment_type, text, is_public)
+        remove_comment(comment_guid)
+        tag(guid, user) -> dict
+        search_tags(pattern, user, private_only, start_from, page_size) -> [dict]
+        tags_by_name(name, user, private_only, start_from, page_size) -> [dict]
+        create_tag(name, description, user, is_private) -> str
+        update_tag(guid, description)
+        delete_tag(guid)
+        assign_tag(element_guid, tag_guid) / unassign_tag(element_guid, tag_guid)
+        like(asset_guid, user) / unlike(asset_guid, user)
+        rate(asset_guid, user, star_rating, review) / unrate(asset_guid, user)
+        stats() -> dict
+    """
+
+    asset_types = ("CSVFile", "AvroFile", "Database", "DataFile", "DeployedReport")
+
+    def __init__(
+        self,
+        asset_count: int = 10000,
+        term_count: int = 1000,
+        tag_count: int = 100,
+        comments_per_asset: int = 2,
+        seed: int = 0,
+    ):
+        if min(asset_count, term_count, tag_count, comments_per_asset) < 0:
+            raise ValueError("the catalog sizes must not be negative")
+        self.asset_count = asset_count
+        self.term_count = term_count
+        self.tag_count = tag_count
+        self.comments_per_asset = comments_per_asset
+        self.seed = seed & 0xFFFF
+        self._lock = threading.RLock()
+        self._deleted = set()  # indices of the deleted synthetic assets
+        self._deleted_sorted = []  # the same, sorted - rebuilt when a search needs it
+        self._registered = {}  # guid -> asset element
+        self._comments = (
+            {}
+        )  # comment guid -> comment properties, for comments added or changed
+        self._added_comments = (
+            {}
+        )  # asset or comment guid -> [guids of comments added to it]
+        self._removed_comments = set()
+        self._tags = {}  # tag guid -> tag properties, for tags created or changed
+        self._deleted_tags = set()
+        self._assignments = {}  # element guid -> set of tag guids
+        self._likes = {}  # asset guid -> set of users
+        self._ratings = {}  # asset guid -> {user: (star rating, review)}
+        self._counter = itertools.count()
+
+    # assets
+
+    def _index(self, guid: str, kind: int, count: int) -> int:
+        parsed = parse_guid(guid)
+        if parsed is None or parsed[0] != kind or parsed[1] != self.seed:
+            return None
+        return parsed[2] if parsed[2] < count else None
+
+    def _is_deleted(self, index: int) -> bool:
+        return index in self._deleted
+
+    def _synthetic_asset(self, index: int) -> dict:
+        return {
+            "elementHeader": {
+                "class": "ElementHeader",
+                "guid": synthetic_guid(asset_kind, index, self.seed),
+                "type": {
+                    "typeName": self.asset_types[index % len(self.asset_types)],
+                    "superTypeNames": ["Asset", "Referenceable"],
+                },
+            },
+            "assetProperties": {
+                "qualifiedName": f"synthetic-asset-{index:09d}",
+                "displayName": f"Synthetic asset {index}",
+                "description": f"Synthetic asset number {index}",
+                "owner": "erinoverview",
+                "zoneMembership": ["data-lake"],
+            },
+        }
+
+    def asset(self, guid: str) -> dict:
+        index = self._index(guid, asset_kind, self.asset_count)
+        with self._lock:
+            if index is not None and not self._is_deleted(index):
+                return self._synthetic_asset(index)
+            return self._registered.get(guid)
+
+    def _live_from(self, rank: int) -> int:
+        """Return the index of the rank-th synthetic asset that has not been deleted"""
+        with self._lock:
+            if len(self._deleted_sorted) != len(self._deleted):
+                # sorted once per search after deletes, rather than kept sorted by each delete
+                self._deleted_sorted = sorted(self._deleted)
+            deleted = self._deleted_sorted
+        index = rank
+        while True:
+            moved = rank + bisect.bisect_right(deleted, index)
+            if moved == index:
+                return index
+            index = moved
+
+    def _all_assets(self, start_from: int):
+        with self._lock:
+            live = self.asset_count - len(self._deleted)
+            registered = list(self._registered.values())
+        if start_from < live:
+            index = self._live_from(start_from)
+            while index < self.asset_count:
+                if not self._is_deleted(index):
+                    yield self._synthetic_asset(index)
+                index += 1
+        yield from registered[max(start_from - live, 0) :]
+
+    @staticmethod
+    def _asset_matches(regex, asset: dict) -> bool:
+        properties = asset["assetProperties"]
+        return bool(
+            regex.search(properties["qualifiedName"])
+            or regex.search(properties["displayName"])
+        )
+
+    def search_assets(self, pattern: str, start_from: int, page_size: int) -> list:
+        if pattern in match_all:
+            return _page(self._all_assets(start_from), 0, page_size)
+        regex = _compile(pattern)
+        matches = (a for a in self._all_assets(0) if self._asset_matches(regex, a))
+        return _page(matches, start_from, page_size)
+
+    def related_assets(self, guid: str, start_from: int, page_size: int) -> list:
+        index = self._index(guid, asset_kind, self.asset_count)
+        if index is None:
+            if self.asset(guid) is None:
+                raise MockError(404, f"Unknown asset {guid}")
+            return []
+        related = []
+        for other in dict.fromkeys(
+            ((index + 1) % self.asset_count, (7 * index + 3) % self.asset_count)
+        ):
+            if other != index and not self._is_deleted(other):
+                related.append({"relatedAsset": self._synthetic_asset(other)})
+        return _page(related, start_from, page_size)
+
+    def register_asset(
+        self, type_name: str, display_name: str, description: str, full_path: str
+    ) -> str:
+        with self._lock:
+            guid = synthetic_guid(registered_kind, next(self._counter), self.seed)
+            self._registered[guid] = {
+                "elementHeader": {
+                    "class": "ElementHeader",
+                    "guid": guid,
+                    "type": {
+                        "typeName": type_name,
+                        "superTypeNames": ["DataFile", "Asset", "Referenceable"],
+                    },
+                },
+                "assetProperties": {
+                    "qualifiedName": full_path,
+                    "displayName": display_name,
+                    "description": description,
+                },
+            }
+        return guid
+
+    def delete_asset(self, guid: str):
+        index = self._index(guid, asset_kind, self.asset_count)
+        with self._lock:
+            if index is not None and not self._is_deleted(index):
+                self._deleted.add(index)
+            elif self._registered.pop(guid, None) is None:
+                raise MockError(404, f"Unknown asset {guid}")
+
+    def _require_asset(self, guid: str):
+        if self.asset(guid) is None:
+            raise MockError(404, f"Unknown asset {guid}")
+
+    # glossary terms
+
+    def _meaning(self, index: int) -> dict:
+        return {
+            "elementHeader": {
+                "class": "ElementHeader",
+                "guid": synthetic_guid(term_kind, index, self.seed),
+                "type": {"typeName": "GlossaryTerm"},
+            },
+            "meaningProperties": {
+                "qualifiedName": f"Glossary::SyntheticTerm::{index:07d}",
+                "name": f"Synthetic Term {index:07d}",
+                "description": f"Synthetic glossary term number {index}",
+            },
+        }
+
+    def meaning(self, guid: str) -> dict:
+        index = self._index(guid, term_kind, self.term_count)
+        if index is None:
+            raise MockError(404, f"Unknown glossary term {guid}")
+        return self._meaning(index)
+
+    def search_meanings(self, pattern: str, start_from: int, page_size: int) -> list:
+        if pattern in match_all:
+            indices = range(start_from, self.term_count)
+            return _page(map(self._meaning, indices), 0, page_size)
+        regex = _compile(pattern)
+        meanings = (
+            m
+            for m in map(self._meaning, range(self.term_count))
+            if regex.search(m["meaningProperties"]["name"])
+        )
+        return _page(meanings, start_from, page_size)
+
+    def meanings_by_name(self, name: str, start_from: int, page_size: int) -> list:
+        found = re.fullmatch(r"Synthetic Term (\d{7})", name)
+        if found is None or int(found.group(1)) >= self.term_count:
+            return []
+        return _page([self._meaning(int(found.group(1)))], start_from, page_size)
+
+    def assets_by_meaning(self, guid: str, start_from: int, page_size: int) -> list:
+        index = self._index(guid, term_kind, self.term_count)
+        if index is None:
+            raise MockError(404, f"Unknown glossary term {guid}")
+        guids = (
+            synthetic_guid(asset_kind, i, self.seed)
+            for i in range(index, self.asset_count, self.term_count)
+            if not self._is_deleted(i)
+        )
+        return _page(guids, start_from, page_size)
+
+    # comments
+
+    def _synthetic_comment(self, index: int) -> dict:
+        asset_index, number = divmod(index, self.comments_per_asset)
+        return {
+            "guid": synthetic_guid(comment_kind, index, self.seed),
+            "commentType": comment_types[number % len(comment_types)],
+            "commentText": f"Synthetic comment {number} on asset {asset_index}",
+            "user": "peterprofile",
+            "isPublic": True,
+        }
+
+    def _comment(self, guid: str) -> dict:
+        with self._lock:
+            if guid in self._removed_comments:
+                return None
+            if guid in self._comments:
+                return dict(self._comments[guid])
+        index = self._index(
+            guid, comment_kind, self.asset_count * self.comments_per_asset
+        )
+        return None if index is None else self._synthetic_comment(index)
+
+    def _comment_list(self, guids) -> list:
+        listed = []
+        for guid in guids:
+            comment = self._comment(guid)
+            if comment is not None:
+                with self._lock:
+                    replies = self._added_comments.get(guid, ())
+                    count = sum(r not in self._removed_comments for r in replies)
+                listed.append({"comment": comment, "replyCount": count})
+        return listed
+
+    def comments(self, asset_guid: str, start_from: int, page_size: int) -> list:
+        self._require_asset(asset_guid)
+        index = self._index(asset_guid, asset_kind, self.asset_count)
+        guids = []
+        if index is not None:
+            first = index * self.comments_per_asset
+            guids = [
+                synthetic_guid(comment_kind, i, self.seed)
+                for i in range(first, first + self.comments_per_asset)
+            ]
+        with self._lock:
+            guids += self._added_comments.get(asset_guid, [])
+        return _page(self._comment_list(guids), start_from, page_size)
+
+    def replies(self, comment_guid: str, start_from: int, page_size: int) -> list:
+        if self._comment(comment_guid) is None:
+            raise MockError(404, f"Unknown comment {comment_guid}")
+        with self._lock:
+            guids = list(self._added_comments.get(comment_guid, []))
+        return _page(self._comment_list(guids), start_from, page_size)
+
+    def add_comment(
+        self,
+        asset_guid: str,
+        user: str,
+        comment_type: str,
+        text: str,
+        is_public: bool,
+        reply_to: str = None,
+    ) -> str:
+        self._require_asset(asset_guid)
+        if reply_to is not None and self._comment(reply_to) is None:
+            raise MockError(404, f"Unknown comment {reply_to}")
+        if comment_type not in comment_types:
+            raise MockError(400, f"Invalid comment type {comment_type}")
+        with self._lock:
+            guid = synthetic_guid(
+                comment_kind,
+                self.asset_count * self.comments_per_asset + next(self._counter),
+                self.seed,
+            )
+            self._comments[guid] = {
+                "guid": guid,
+                "commentType": comment_type,
+                "commentText": text,
+                "user": user,
+                "isPublic": is_public,
+            }
+            self._added_comments.setdefault(reply_to or asset_guid, []).append(guid)
+        return guid
+
+    def update_comment(
+        self, comment_guid: str, comment_type: str, text: str, is_public: bool
+    ):
+        comment = self._comment(comment_guid)
+        if comment is None:
+            raise MockError(404, f"Unknown comment {comment_guid}")
+        comment.update(commentType=comment_type, commentText=text, isPublic=is_public)
+        with self._lock:
+            self._comments[comment_guid] = comment
+
+    def remove_comment(self, comment_guid: str):
+        if self._comment(comment_guid) is None:
+            raise MockError(404, f"Unknown comment {comment_guid}")
+        with self._lock:
+            self._removed_comments.add(comment_guid)
+
+    # informal tags
+
+    def _tag_properties(self, guid: str) -> dict:
+        with self._lock:
+            if guid in self._deleted_tags:
+                return None
+            if guid in self._tags:
+                return self._tags[guid]
+        index = self._index(guid, tag_kind, self.tag_count)
+        if index is None:
+            return None
+        return {
+            "name": f"synthetic-tag-{index}",
+            "description": f"Synthetic tag number {index}",
+            "isPrivateTag": False,
+            "user": "erinoverview",
+        }
+
+    @staticmethod
+    def _tag_element(guid: str, properties: dict) -> dict:
+        return {
+            "elementHeader": {
+                "class": "ElementHeader",
+                "guid": guid,
+                "type": {"typeName": "InformalTag"},
+            },
+            "informalTagProperties": dict(properties),
+        }
+
+    def tag(self, guid: str, user: str) -> dict:
+        properties = self._tag_properties(guid)
+        if properties is None or (
+            properties["isPrivateTag"] and properties["user"] != user
+        ):
+            raise MockError(404, f"Unknown tag {guid}")
+        return self._tag_element(guid, properties)
+
+    def _visible_tags(self, user: str, private_only: bool):
+        with self._lock:
+            created = list(self._tags)
+        guids = itertools.chain(
+            (synthetic_guid(tag_kind, i, self.seed) for i in range(self.tag_count)),
+            # synthetic tags that were changed are in _tags too, but already listed
+            (g for g in created if self._index(g, tag_kind, self.tag_count) is None),
+        )
+        for guid in guids:
+            properties = self._tag_properties(guid)
+            if properties is None:
+                continue
+            if properties["isPrivateTag"]:
+                if properties["user"] != user:
+                    continue
+            elif private_only:
+                continue
+            yield guid, properties
+
+    def search_tags(
+        self,
+        pattern: str,
+        user: str,
+        private_only: bool,
+        start_from: int,
+        page_size: int,
+    ) -> list:
+        regex = _compile(pattern)
+        tags = (
+            self._tag_element(guid, properties)
+            for guid, properties in self._visible_tags(user, private_only)
+            if regex.search(properties["name"])
+        )
+        return _page(tags, start_from, page_size)
+
+    def tags_by_name(
+        self, name: str, user: str, private_only: bool, start_from: int, page_size: int
+    ) -> list:
+        tags = (
+            self._tag_element(guid, properties)
+            for guid, properties in self._visible_tags(user, private_only)
+            if properties["name"] == name
+        )
+        return _page(tags, start_from, page_size)
+
+    def create_tag(
+        self, name: str, description: str, user: str, is_private: bool
+    ) -> str:
+        with self._lock:
+            guid = synthetic_guid(
+                tag_kind, self.tag_count + next(self._counter), self.seed
+            )
+            self._tags[guid] = {
+                "name": name,
+                "description": description,
+                "isPrivateTag": is_private,
+                "user": user,
+            }
+        return guid
+
+    def update_tag(self, guid: str, description: str):
+        properties = self._tag_properties(guid)
+        if properties is None:
+            raise MockError(404, f"Unknown tag {guid}")
+        with self._lock:
+            self._tags[guid] = dict(properties, description=description)
+
+    def delete_tag(self, guid: str):
+        if self._tag_properties(guid) is None:
+            raise MockError(404, f"Unknown tag {guid}")
+        with self._lock:
+            self._deleted_tags.add(guid)
+
+    def assign_tag(self, element_guid: str, tag_guid: str):
+        if self._tag_properties(tag_guid) is None:
+            raise MockError(404, f"Unknown tag {tag_guid}")
+        with self._lock:
+            self._assignments.setdefault(element_guid, set()).add(tag_guid)
+
+    def unassign_tag(self, element_guid: str, tag_guid: str):
+        with self._lock:
+            self._assignments.get(element_guid, set()).discard(tag_guid)
+
+    def tagged_elements(self, tag_guid: str, start_from: int, page_size: int) -> list:
+        with self._lock:
+            guids = sorted(
+                e for e, tags in self._assignments.items() if tag_guid in tags
+            )
+        return _page(guids, start_from, page_size)
+
+    # likes and ratings
+
+    def like(self, asset_guid: str, user: str):
+        self._require_asset(asset_guid)
+        with self._lock:
+            self._likes.setdefault(asset_guid, set()).add(user)
+
+    def unlike(self, asset_guid: str, user: str):
+        with self._lock:
+            self._likes.get(asset_guid, set()).discard(user)
+
+    def rate(self, asset_guid: str, user: str, star_rating: str, review: str):
+        self._require_asset(asset_guid)
+        with self._lock:
+            self._ratings.setdefault(asset_guid, {})[user] = (star_rating, review)
+
+    def unrate(self, asset_guid: str, user: str):
+        with self._lock:
+            self._ratings.get(asset_guid, {}).pop(user, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "assets": self.asset_count - len(self._deleted) + len(self._registered),
+                "deleted_assets": len(self._deleted),
+                "registered_assets": len(self._registered),
+                "terms": self.term_count,
+                "tags": self.tag_count + len(self._tags) - len(self._deleted_tags),
+                "comments_added": len(self._comments),
+                "tag_assignments": sum(len(t) for t in self._assignments.values()),
+                "likes": sum(len(u) for u in self._likes.values()),
+                "ratings": sum(len(u) for u in self._ratings.values()),
+            }
+
+
+def _flag(value) -> bool:
+    return value is True or str(value).lower() == "true"
+
+
+def _query_int(query: dict, name: str) -> int:
+    try:
+        return int(query.get(name, ["0"])[0])
+    except ValueError:
+        raise MockError(400, f"{name} must be a number")
+
+
+platform_root = (
+    r"/open-metadata/platform-services/users/(?P<user>[^/]+)/server-platform"
+)
+server_root = r"/servers/(?P<server>[^/]+)/open-metadata"
+consumer_root = server_root + r"/access-services/asset-consumer/users/(?P<user>[^/]+)"
+owner_root = server_root + r"/access-services/asset-owner/users/(?P<user>[^/]+)"
+connected_root = (
+    server_root
+    + r"/common-services/(?P<service>[^/]+)/connected-asset/users/(?P<user>[^/]+)"
+)
+guid = r"(?P<guid>[^/]+)"
+
+# (method, path pattern, route name) - the route name selects the MockPlatform method that answers
+routes = [
+    ("GET", platform_root + r"/origin", "platform_origin"),
+    ("DELETE", platform_root + r"/instance", "shutdown_platform"),
+    ("GET", platform_root + r"/servers", "list_servers"),
+    ("DELETE", platform_root + r"/servers", "delete_servers"),
+    ("GET", platform_root + r"/servers/active", "list_active_servers"),
+    ("DELETE", platform_root + r"/servers/instance", "shutdown_all_servers"),
+    ("POST", platform_root + r"/servers/(?P<name>[^/]+)/instance", "activate_server"),
+    (
+        "DELETE",
+        platform_root + r"/servers/(?P<name>[^/]+)/instance",
+        "deactivate_server",
+    ),
+    (
+        "GET",
+        platform_root + r"/servers/(?P<name>[^/]+)/instance/configuration",
+        "get_configuration",
+    ),
+    (
+        "POST",
+        platform_root + r"/servers/(?P<name>[^/]+)/instance/configuration",
+        "activate_with_configuration",
+    ),
+    (
+        "POST",
+        platform_root
+        + r"/servers/(?P<name>[^/]+)/instance/open-metadata-archives/(file|archive-content)",
+        "load_archive",
+    ),
+    (
+        "GET",
+        platform_root + r"/servers/(?P<name>[^/]+)/instance/status",
+        "server_instance_status",
+    ),
+    ("GET", platform_root + r"/servers/(?P<name>[^/]+)/is-known", "is_server_known"),
+    ("GET", platform_root + r"/servers/(?P<name>[^/]+)/services", "server_services"),
+    ("GET", platform_root + r"/servers/(?P<name>[^/]+)/status", "server_status"),
+    ("GET", connected_root + r"/assets/" + guid, "get_asset"),
+    ("GET", connected_root + r"/assets/" + guid + r"/comments", "get_comments"),
+    (
+        "GET",
+        connected_root + r"/assets/" + guid + r"/comments/(?P<comment>[^/]+)/replies",
+        "get_comment_replies",
+    ),
+    (
+        "GET",
+        connected_root + r"/assets/" + guid + r"/related-assets",
+        "get_related_assets",
+    ),
+    ("POST", consumer_root + r"/assets/by-search-string", "find_assets"),
+    ("GET", consumer_root + r"/assets/by-meaning/" + guid, "get_assets_by_meaning"),
+    ("GET", consumer_root + r"/assets/by-tag/" + guid, "get_assets_by_tag"),
+    ("POST", consumer_root + r"/meanings/by-search-string", "find_meanings"),
+    ("POST", consumer_root + r"/meanings/by-name", "get_meanings_by_name"),
+    ("GET", consumer_root + r"/meanings/" + guid, "get_meaning"),
+    ("POST", consumer_root + r"/assets/" + guid + r"/comments", "add_comment"),
+    (
+        "POST",
+        consumer_root + r"/assets/" + guid + r"/comments/(?P<comment>[^/]+)/replies",
+        "add_comment_reply",
+    ),
+    (
+        "POST",
+        consumer_root + r"/assets/" + guid + r"/comments/(?P<comment>[^/]+)/update",
+        "update_comment",
+    ),
+    (
+        "POST",
+        consumer_root + r"/assets/" + guid + r"/comments/(?P<comment>[^/]+)/delete",
+        "remove_comment",
+    ),
+    ("POST", consumer_root + r"/assets/" + guid + r"/likes", "add_like"),
+    ("POST", consumer_root + r"/assets/" + guid + r"/likes/delete", "remove_like"),
+    ("POST", consumer_root + r"/assets/" + guid + r"/ratings", "add_rating"),
+    ("POST", consumer_root + r"/assets/" + guid + r"/ratings/delete", "remove_rating"),
+    (
+        "POST",
+        consumer_root + r"/(assets|elements)/" + guid + r"/tags/(?P<tag>[^/]+)",
+        "add_tag",
+    ),
+    (
+        "POST",
+        consumer_root + r"/(assets|elements)/" + guid + r"/tags/(?P<tag>[^/]+)/delete",
+        "remove_tag",
+    ),
+    ("POST", consumer_root + r"/tags", "create_tag"),
+    ("POST", consumer_root + r"/tags/by-search-string", "find_tags"),
+    ("POST", consumer_root + r"/tags/private/by-search-string", "find_my_tags"),
+    ("POST", consumer_root + r"/tags/by-name", "get_tags_by_name"),
+    ("POST", consumer_root + r"/tags/private/by-name", "get_my_tags_by_name"),
+    ("GET", consumer_root + r"/tags/" + guid, "get_tag"),
+    ("POST", consumer_root + r"/tags/" + guid + r"/update", "update_tag"),
+    ("POST", consumer_root + r"/tags/" + guid + r"/delete", "delete_tag"),
+    (
+        "POST",
+        owner_root + r"/assets/data-files/(?P<file_type>csv|avro)",
+        "create_data_file_asset",
+    ),
+    ("POST", owner_root + r"/assets/by-search-string", "owner_find_assets"),
+    ("POST", owner_root + r"/assets/" + guid + r"/delete", "delete_asset"),
+]
+compiled_routes = [(m, re.compile(p + "$"), name) for m, p, name in routes]
+
+
+class _MockPlatformHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # the headers and body are written separately - without this a keep-alive client waits for the
+    # delayed acknowledgement of the headers before the body is sent
+    disable_nagle_algorithm = True
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if size == 0:
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _reply(self, status: int, body):
+        if isinstance(body, str):
+            data, content_type = body.encode(), "text/plain"
+        else:
+            data = json.dumps({"relatedHTTPCode": status, **body}).encode()
+            content_type = "application/json"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self, method: str):
+        body = self._read_body()
+        status, reply = self.server.platform.handle(method, self.path, body)
+        self._reply(status, reply)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class MockPlatform:
+    """
+    A local HTTP server answering like an OMAG server platform, backed by a SyntheticCatalog
+
+    Attributes:
+        catalog : SyntheticCatalog
+            the catalog the access services answer from
+        url : str
+            the platform URL to give to the clients, once started
+        latency : float
+            the number of seconds each request is delayed by
+        jitter : float
+            an extra random delay of up to jitter seconds added to each request
+        route_latency : dict
+            route name -> number of seconds, replacing latency for the routes listed
+        error_rate : float
+            the share of requests, from 0 to 1, that fail with error_status
+        error_status : int
+            the status of the injected failures
+        activation_time : float
+            the number of seconds an activated server reports STARTING before it is RUNNING
+
+    Methods:
+        start() -> str
+            starts serving on a background thread and returns the platform URL
+        stop()
+        handle(method, path, body) -> (int, dict or str)
+            answers one request - used by the HTTP handler, and directly by tests
+        stats() -> dict
+            the requests and injected errors of each route, and the catalog statistics
+    """
+
+    def __init__(
+        self,
+        catalog: SyntheticCatalog = None,
+        servers=default_servers,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        route_latency: dict = None,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        activation_time: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Parameters
+        ----------
+        catalog : the catalog to serve - by default a SyntheticCatalog of 10000 assets
+        servers : the names of the servers the platform knows, which are all active to begin with
+        host : the address to listen on
+        port : the port to listen on - 0 picks a free port
+        latency, jitter, route_latency : the delay added to each request, see Attributes
+        error_rate : the share of requests that fail with error_status
+        error_status : the status of the injected failures
+        activation_time : the number of seconds an activated server takes to start
+        seed : the seed of the jitter and of the choice of failed requests
+        """
+        self.catalog = catalog if catalog is not None else SyntheticCatalog()
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.route_latency = dict(route_latency or {})
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.activation_time = activation_time
+        self.url = None
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._servers = {name: {"started": 0.0, "config": None} for name in servers}
+        self._known = set(servers)
+        self._requests = {}
+        self._errors = {}
+        self._httpd = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self) -> str:
+        if self._httpd is None:
+            self._httpd = _Server((self.host, self.port), _MockPlatformHandler)
+            self._httpd.platform = self
+            self.port = self._httpd.server_address[1]
+            self.url = f"http://{self.host}:{self.port}"
+            threading.Thread(
+                target=self._httpd.serve_forever,
+                name="egeria-mock-platform",
+                daemon=True,
+            ).start()
+        return self.url
+
+    def stop(self):
+        httpd, self._httpd = self._httpd, None
+        if httpd is not None:
+            httpd.shutdown()
+            httpd.server_close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": sum(self._requests.values()),
+                "errors": sum(self._errors.values()),
+                "routes": {
+                    name: {"requests": count, "errors": self._errors.get(name, 0)}
+                    for name, count in sorted(self._requests.items())
+                },
+                "catalog": self.catalog.stats(),
+            }
+
+    def _route(self, method: str, path: str):
+        for route_method, pattern, name in compiled_routes:
+            if route_method == method:
+                found = pattern.match(path)
+                if found is not None:
+                    return name, {k: unquote(v) for k, v in found.groupdict().items()}
+        return None, None
+
+    def handle(self, method: str, path: str, body: bytes = b""):
+        """Answer a request, returning the status and a body - a dict for JSON, a str for plain text"""
+        split = urlsplit(path)
+        name, params = self._route(method, split.path)
+        if name is None:
+            return 404, {"exceptionErrorMessage": f"No mock for {method} {split.path}"}
+        with self._lock:
+            self._requests[name] = self._requests.get(name, 0) + 1
+            delay = self.route_latency.get(name, self.latency)
+            if self.jitter:
+                delay += self._random.uniform(0, self.jitter)
+            failed = self.error_rate and self._random.random() < self.error_rate
+            if failed:
+                self._errors[name] = self._errors.get(name, 0) + 1
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            return self.error_status, {
+                "exceptionClassName": "PropertyServerException",
+                "exceptionErrorMessage": "Injected failure",
+            }
+        try:
+            if "server" in params and self._server_state(params["server"]) is None:
+                raise MockError(404, f"The server {params['server']} is not active")
+            query = parse_qs(split.query)
+            reply = getattr(self, "_" + name)(params, query, body)
+        except MockError as e:
+            return e.status, {
+                "exceptionClassName": "InvalidParameterException",
+                "exceptionErrorMessage": str(e),
+            }
+        if isinstance(reply, str):
+            return 200, reply
+        return 200, reply or {}
+
+    @staticmethod
+    def _json(body: bytes) -> dict:
+        if not body:
+            return {}
+        try:
+            value = json.loads(body)
+        except ValueError:
+            raise MockError(400, "The request body is not JSON")
+        return value if isinstance(value, dict) else {}
+
+    @staticmethod
+    def _paging(query: dict, start: str = "startFrom", size: str = "pageSize"):
+        return _query_int(query, start), _query_int(query, size)
+
+    # platform services
+
+    def _server_state(self, name: str) -> str:
+        server = self._servers.get(name)
+        if server is None:
+            return None
+        if time.monotonic() < server["started"] + self.activation_time:
+            return "STARTING"
+        return "RUNNING"
+
+    def _active(self) -> list:
+        with self._lock:
+            return sorted(self._servers)
+
+    def _platform_origin(self, params, query, body):
+        return platform_origin
+
+    def _shutdown_platform(self, params, query, body):
+        return {"class": "VoidResponse"}
+
+    def _list_servers(self, params, query, body):
+        with self._lock:
+            return {"class": "ServerListResponse", "serverList": sorted(self._known)}
+
+    def _delete_servers(self, params, query, body):
+        with self._lock:
+            self._known = set(self._servers)
+        return {"class": "VoidResponse"}
+
+    def _list_active_servers(self, params, query, body):
+        return {"class": "ServerListResponse", "serverList": self._active()}
+
+    def _shutdown_all_servers(self, params, query, body):
+        with self._lock:
+            self._servers.clear()
+        return {"class": "VoidResponse"}
+
+    def _activate(self, name: str, config: dict) -> dict:
+        with self._lock:
+            self._known.add(name)
+            if name not in self._servers:
+                self._servers[name] = {"started": time.monotonic(), "config": None}
+            if config is not None:
+                self._servers[name]["config"] = config
+        return {
+            "class": "SuccessMessageResponse",
+            "successMessage": f"The OMAG server {name} is activating",
+        }
+
+    def _activate_server(self, params, query, body):
+        if params["name"] not in self._known:
+            raise MockError(404, f"Unknown server {params['name']}")
+        return self._activate(params["name"], None)
+
+    def _activate_with_configuration(self, params, query, body):
+        return self._activate(params["name"], self._json(body))
+
+    def _deactivate_server(self, params, query, body):
+        with self._lock:
+            self._servers.pop(params["name"], None)
+        return {"class": "VoidResponse"}
+
+    def _get_configuration(self, params, query, body):
+        with self._lock:
+            server = self._servers.get(params["name"])
+            if server is None:
+                raise MockError(400, f"The server {params['name']} is not active")
+            config = server["config"] or {"localServerName": params["name"]}
+        return {"class": "OMAGServerConfigResponse", "omagserverConfig": config}
+
+    def _load_archive(self, params, query, body):
+        if self._server_state(params["name"]) is None:
+            raise MockError(400, f"The server {params['name']} is not active")
+        if body and not body.lstrip().startswith((b"{", b'"', b"\xef\xbb\xbf{")):
+            raise MockError(400, "The archive is not JSON")
+        return {"class": "VoidResponse"}
+
+    def _server_instance_status(self, params, query, body):
+        state = self._server_state(params["name"])
+        if state is None:
+            raise MockError(400, f"The server {params['name']} is not active")
+        return {
+            "class": "OMAGServerStatusResponse",
+            "serverName": params["name"],
+            "serverStatus": state,
+        }
+
+    def _is_server_known(self, params, query, body):
+        with self._lock:
+            return {"class": "BooleanResponse", "flag": params["name"] in self._known}
+
+    def _server_services(self, params, query, body):
+        if self._server_state(params["name"]) is None:
+            raise MockError(400, f"The server {params['name']} is not active")
+        return {
+            "class": "ServerServicesListResponse",
+            "serverName": params["name"],
+            "serverServicesList": [
+                "Open Metadata Repository Services (OMRS)",
+                "Connected Asset Services",
+                "Asset Consumer OMAS",
+                "Asset Owner OMAS",
+            ],
+        }
+
+    def _server_status(self, params, query, body):
+        with self._lock:
+            known = params["name"] in self._known
+            started = (self._servers.get(params["name"]) or {}).get("started")
+        if not known:
+            raise MockError(404, f"Unknown server {params['name']}")
+        return {
+            "class": "ServerStatusResponse",
+            "serverName": params["name"],
+            "serverType": "Metadata Access Store",
+            "active": started is not None,
+        }
+
+    # connected asset services
+
+    def _get_asset(self, params, query, body):
+        asset = self.catalog.asset(params["guid"])
+        if asset is None:
+            raise MockError(404, f"Unknown asset {params['guid']}")
+        return {"class": "AssetResponse", "asset": asset}
+
+    def _get_comments(self, params, query, body):
+        start, size = self._paging(query, "elementStart", "maxElements")
+        found = self.catalog.comments(params["guid"], start, size)
+        return {"class": "CommentsResponse", "list": found or None}
+
+    def _get_comment_replies(self, params, query, body):
+        start, size = self._paging(query, "elementStart", "maxElements")
+        found = self.catalog.replies(params["comment"], start, size)
+        return {"class": "CommentsResponse", "list": found or None}
+
+    def _get_related_assets(self, params, query, body):
+        start, size = self._paging(query, "elementStart", "maxElements")
+        found = self.catalog.related_assets(params["guid"], start, size)
+        return {"class": "RelatedAssetsResponse", "list": found or None}
+
+    # asset consumer services
+
+    def _search_string(self, body: bytes) -> str:
+        return self._json(body).get("searchString") or ""
+
+    def _find_assets(self, params, query, body):
+        start, size = self._paging(query)
+        found = self.catalog.search_assets(self._search_string(body), start, size)
+        guids = [a["elementHeader"]["guid"] for a in found]
+        return {"class": "GUIDListResponse", "guids": guids or None}
+
+    def _get_assets_by_meaning(self, params, query, body):
+        start, size = self._paging(query)
+        guids = self.catalog.assets_by_meaning(params["guid"], start, size)
+        return {"class": "GUIDListResponse", "guids": guids or None}
+
+    def _get_assets_by_tag(self, params, query, body):
+        start, size = self._paging(query)
+        guids = self.catalog.tagged_elements(params["guid"], start, size)
+        return {"class": "GUIDListResponse", "guids": guids or None}
+
+    def _find_meanings(self, params, query, body):
+        start, size = self._paging(query)
+        found = self.catalog.search_meanings(self._search_string(body), start, size)
+        return {"class": "MeaningElementsResponse", "meanings": found or None}
+
+    def _get_meanings_by_name(self, params, query, body):
+        start, size = self._paging(query)
+        name = self._json(body).get("name") or ""
+        found = self.catalog.meanings_by_name(name, start, size)
+        return {"class": "MeaningElementsResponse", "meanings": found or None}
+
+    def _get_meaning(self, params, query, body):
+        return {
+            "class": "MeaningElementResponse",
+            "meaning": self.catalog.meaning(params["guid"]),
+        }
+
+    def _new_comment(self, params, body, reply_to):
+        request = self._json(body)
+        guid = self.catalog.add_comment(
+            params["guid"],
+            params["user"],
+            request.get("commentType"),
+            request.get("commentText"),
+            _flag(request.get("isPublic")),
+            reply_to,
+        )
+        return {"class": "GUIDResponse", "guid": guid}
+
+    def _add_comment(self, params, query, body):
+        return self._new_comment(params, body, None)
+
+    def _add_comment_reply(self, params, query, body):
+        return self._new_comment(params, body, params["comment"])
+
+    def _update_comment(self, params, query, body):
+        request = self._json(body)
+        self.catalog.update_comment(
+            params["comment"],
+            request.get("commentType"),
+            request.get("commentText"),
+            _flag(request.get("isPublic")),
+        )
+        return {"class": "VoidResponse"}
+
+    def _remove_comment(self, params, query, body):
+        self.catalog.remove_comment(params["comment"])
+        return {"class": "VoidResponse"}
+
+    def _add_like(self, params, query, body):
+        self.catalog.like(params["guid"], params["user"])
+        return {"class": "VoidResponse"}
+
+    def _remove_like(self, params, query, body):
+        self.catalog.unlike(params["guid"], params["user"])
+        return {"class": "VoidResponse"}
+
+    def _add_rating(self, params, query, body):
+        request = self._json(body)
+        self.catalog.rate(
+            params["guid"],
+            params["user"],
+            request.get("starRating"),
+            request.get("review"),
+        )
+        return {"class": "VoidResponse"}
+
+    def _remove_rating(self, params, query, body):
+        self.catalog.unrate(params["guid"], params["user"])
+        return {"class": "VoidResponse"}
+
+    def _add_tag(self, params, query, body):
+        self.catalog.assign_tag(params["guid"], params["tag"])
+        return {"class": "VoidResponse"}
+
+    def _remove_tag(self, params, query, body):
+        self.catalog.unassign_tag(params["guid"], params["tag"])
+        return {"class": "VoidResponse"}
+
+    def _create_tag(self, params, query, body):
+        request = self._json(body)
+        if not request.get("name"):
+            raise MockError(400, "A tag needs a name")
+        guid = self.catalog.create_tag(
+            request["name"],
+            request.get("description"),
+            params["user"],
+            _flag(request.get("isPrivateTag")),
+        )
+        return {"class": "GUIDResponse", "guid": guid}
+
+    def _tags(self, params, query, body, private_only: bool, by_name: bool):
+        start, size = self._paging(query)
+        if by_name:
+            found = self.catalog.tags_by_name(
+                self._json(body).get("name") or "",
+                params["user"],
+                private_only,
+                start,
+                size,
+            )
+        else:
+            found = self.catalog.search_tags(
+                self._search_string(body), params["user"], private_only, start, size
+            )
+        return {"class": "InformalTagsResponse", "tags": found or None}
+
+    def _find_tags(self, params, query, body):
+        return self._tags(params, query, body, False, False)
+
+    def _find_my_tags(self, params, query, body):
+        return self._tags(params, query, body, True, False)
+
+    def _get_tags_by_name(self, params, query, body):
+        return self._tags(params, query, body, False, True)
+
+    def _get_my_tags_by_name(self, params, query, body):
+        return self._tags(params, query, body, True, True)
+
+    def _get_tag(self, params, query, body):
+        return {
+            "class": "InformalTagResponse",
+            "tag": self.catalog.tag(params["guid"], params["user"]),
+        }
+
+    def _update_tag(self, params, query, body):
+        self.catalog.update_tag(params["guid"], self._json(body).get("description"))
+        return {"class": "VoidResponse"}
+
+    def _delete_tag(self, params, query, body):
+        self.catalog.delete_tag(params["guid"])
+        return {"class": "VoidResponse"}
+
+    # asset owner services
+
+    def _create_data_file_asset(self, params, query, body):
+        request = self._json(body)
+        if not request.get("fullPath"):
+            raise MockError(400, "A data file needs a fullPath")
+        type_name = "CSVFile" if params["file_type"] == "csv" else "AvroFile"
+        guid = self.catalog.register_asset(
+            type_name,
+            request.get("displayName"),
+            request.get("description"),
+            request["fullPath"],
+        )
+        return {"class": "GUIDListResponse", "guids": [guid]}
+
+    def _owner_find_assets(self, params, query, body):
+        # the asset owner search takes the search string itself as the body
+        start, size = self._paging(query)
+        found = self.catalog.search_assets(body.decode("utf-8"), start, size)
+        return {"class": "AssetElementsResponse", "assets": found or None}
+
+    def _delete_asset(self, params, query, body):
+        self.catalog.delete_asset(params["guid"])
+        return {"class": "VoidResponse"}
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Serve a synthetic catalog as a local OMAG server platform"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9443)
+    parser.add_argument("--assets", type=int, default=10000)
+    parser.add_argument("--terms", type=int, default=1000)
+    parser.add_argument("--tags", type=int, default=100)
+    parser.add_argument("--comments-per-asset", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    options = parser.parse_args(args)
+
+    catalog = SyntheticCatalog(
+        options.assets,
+        options.terms,
+        options.tags,
+        options.comments_per_asset,
+        options.seed,
+    )
+    platform = MockPlatform(
+        catalog,
+        host=options.host,
+        port=options.port,
+        latency=options.latency,
+        jitter=options.jitter,
+        error_rate=options.error_rate,
+        error_status=options.error_status,
+        seed=options.seed,
+    )
+    print(f"Serving {options.assets} synthetic assets at {platform.start()}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        platform.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Paging over Egeria list endpoints.
+
+Egeria returns lists a page at a time, selected by a starting element and a page size (elementStart and
+maxElements on the connected asset services, startFrom and pageSize on the access services). A Pager
+walks such an endpoint page by page, adapting the page size to the observed latency and payload size,
+and stops at the end of the list or at a caller supplied cap - recording whether the result was truncated
+and the cursor to resume from. A server may return fewer elements than asked for when it caps the page size,
+so only an empty page ends the list. A page may also be short because the server filtered it, so
+max_page_size is only lowered when two pages in a row come back short by the same number of elements.
+
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from requests import Response
+
+from src.egeria_client.util_exp import max_paging_size
+
+default_page_size = 50
+min_page_size = 10
+target_page_latency = 0.5  # seconds
+max_page_bytes = 1024 * 1024
+
+
+def list_of(key: str):
+    """Return an extractor that takes the named list out of an Egeria response body"""
+
+    def extract(response: Response) -> list:
+        return response.json().get(key)
+
+    return extract
+
+
+class Pager:
+    """
+    Iterates over the elements returned by a paged Egeria endpoint
+
+    Attributes:
+        start_from : int
+            the cursor - the index of the next element to request
+        page_size : int
+            the number of elements the next request will ask for
+        max_page_size : int
+            the largest page size requested - lowered to the size of a short page when the next page comes
+            back the same size, as the server caps it
+        elements_returned : int
+            the number of elements yielded so far
+        pages_fetched : int
+            the number of requests issued so far
+        exhausted : bool
+            True once the server has returned an empty page
+        truncated : bool
+            True if iteration stopped at max_elements before the end of the list was seen - resume
+            from start_from to retrieve any remaining elements
+
+    Methods:
+        __iter__()
+            yields the elements one at a time
+
+        pages()
+            yields the elements a page (list) at a time
+    """
+
+    def __init__(
+        self,
+        fetch_page,
+        extract=list_of("list"),
+        start_from: int = 0,
+        page_size: int = 0,
+        max_elements: int = 0,
+        adaptive: bool = True,
+        max_page_size: int = max_paging_size,
+        read_ahead: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        fetch_page : callable(start_from: int, page_size: int) -> Response
+            issues the request for one page
+        extract : callable(Response) -> list
+            takes the elements out of what fetch_page returned - None or an empty list ends the iteration
+        start_from : the index of the first element to request
+        page_size : the initial page size - 0 uses default_page_size
+        max_elements : the maximum number of elements to return - 0 means no limit
+        adaptive : if True the page size is adjusted between min_page_size and max_page_size, growing while
+                   pages are fast and small and shrinking when they are slow or large
+        max_page_size : the largest page size to request
+        read_ahead : if True the next page is requested on a background thread while the
+                     current page is being consumed
+        """
+        if start_from < 0:
+            raise ValueError(f"start_from must not be negative, not {start_from}")
+        if page_size < 0:
+            raise ValueError(f"page_size must not be negative, not {page_size}")
+        self.fetch_page = fetch_page
+        self.extract = extract
+        self.start_from = start_from
+        self.max_page_size = max_page_size
+        self.page_size = min(page_size or default_page_size, max_page_size)
+        self.max_elements = max_elements
+        self.adaptive = adaptive
+        self.read_ahead = read_ahead
+        self.elements_returned = 0
+        self.pages_fetched = 0
+        self.exhausted = False
+        self.truncated = False
+        self._short_page = 0
+
+    def _request_size(self) -> int:
+        if self.max_elements:
+            return min(self.page_size, self.max_elements - self.elements_returned)
+        return self.page_size
+
+    def _fetch(self, start_from: int, page_size: int):
+        started = time.perf_counter()
+        response = self.fetch_page(start_from, page_size)
+        latency = time.perf_counter() - started
+        elements = self.extract(response) or []
+        payload = len(response.content) if isinstance(response, Response) else 0
+        return elements, page_size, latency, payload
+
+    def _adapt(self, latency: float, payload: int, returned: int):
+        if not self.adaptive or returned == 0:
+            return
+        if latency > target_page_latency or payload > max_page_bytes:
+            self.page_size = min(
+                self.max_page_size, max(min_page_size, self.page_size // 2)
+            )
+        elif latency < target_page_latency / 2 and payload < max_page_bytes / 2:
+            self.page_size = min(self.max_page_size, self.page_size * 2)
+
+    def pages(self):
+        """Yield the elements a page at a time"""
+        executor = ThreadPoolExecutor(max_workers=1) if self.read_ahead else None
+        try:
+            pending = None
+            while not self.exhausted and not self.truncated:
+                size = self._request_size()
+                if size <= 0:
+                    self.truncated = True
+                    return
+                if pending is not None:
+                    elements, size, latency, payload = pending.result()
+                    pending = None
+                else:
+                    elements, size, latency, payload = self._fetch(
+                        self.start_from, size
+                    )
+                self.pages_fetched += 1
+                self.start_from += len(elements)
+                self.elements_returned += len(elements)
+                if not elements:
+                    self.exhausted = True
+                elif len(elements) < size:
+                    # the end of the list, a filtered page, or the most the server returns in a page -
+                    # only the last of these repeats
+                    if len(elements) == self._short_page:
+                        self.max_page_size = len(elements)
+                        self.page_size = min(self.page_size, self.max_page_size)
+                    self._short_page = len(elements)
+                else:
+                    self._short_page = 0
+                self._adapt(latency, payload, len(elements))
+
+                if executor is not None and not self.exhausted:
+                    next_size = self._request_size()
+                    if next_size > 0:
+                        pending = executor.submit(
+                            self._fetch, self.start_from, next_size
+                        )
+                if elements:
+                    yield elements
+                if (
+                    not self.exhausted
+                    and self.max_elements
+                    and self.elements_returned >= self.max_elements
+                ):
+                    self.truncated = True
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def __iter__(self):
+        for page in self.pages():
+            yield from page
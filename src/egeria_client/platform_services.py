@@ -6,13 +6,17 @@ from dataclasses import dataclass
 from egeria_client.client import Client
 from requests import Response
 
+from egeria_client.archive import archive_chunks, default_chunk_size, validate_archive
+
 from egeria_client.util_exp import (
     OMAGCommonErrorCode,
     EgeriaException,
     InvalidParameterException,
 )
+from src.egeria_client.tracing import traced
 
 
+@traced(exclude=("make_request", "pool_stats", "circuit_state"))
 class Platform(Client):
 
     """
@@ -44,8 +48,21 @@ class Platform(Client):
         user_id: str,
         user_pwd: str = None,
         verify_flag: bool = False,
+        pool_size: int = None,
+        max_connections: int = None,
+        pool_block: bool = None,
     ):
-        Client.__init__(self, server_name, platform_url, user_id, user_pwd, verify_flag)
+        Client.__init__(
+            self,
+            server_name,
+            platform_url,
+            user_id,
+            user_pwd,
+            verify_flag,
+            pool_size,
+            max_connections,
+            pool_block,
+        )
         self.admin_command_root = (
             self.platform_url
             + "/open-metadata/platform-services/users/"
@@ -316,8 +333,8 @@ class Platform(Client):
         try:
             response = self.make_request(
                 "POST",
-                config_body,
                 url,
+                config_body,
             )
             return response
         except Exception as e:
@@ -332,6 +349,7 @@ class Platform(Client):
         ----------
         archive_file: the name of the archive file to load
                 - note that the path is relative to the working directory of the platform.
+                  Use load_archive_content to send a local archive file instead.
         server : Use the server if specified. If None, use the default server associated with the Platform object.
 
         Returns
@@ -351,13 +369,54 @@ class Platform(Client):
         try:
             response = self.make_request(
                 "POST",
-                archive_file,
                 url,
+                archive_file,
             )
             return response
         except Exception as e:
             raise (e)
 
+    def load_archive_content(
+        self,
+        archive_path: str,
+        server: str = None,
+        chunk_size: int = default_chunk_size,
+        on_progress=None,
+        validate: bool = True,
+    ) -> Response:
+        """
+        Load the server with the contents of a local archive file, streaming it to the platform in chunks.
+        /open-metadata/platform-services/users/{userId}/server-platform/servers/{serverName}/instance/open-metadata-archives/archive-content
+
+        Parameters
+        ----------
+        archive_path: the path of the archive file on this machine - it is never read into memory as a whole
+        server : Use the server if specified. If None, use the default server associated with the Platform object.
+        chunk_size : the number of bytes read and sent at a time
+        on_progress : optional function called as on_progress(bytes_sent, total_bytes) as the upload proceeds
+        validate : if True, the archive is checked to be well-formed JSON before anything is sent, and
+                ArchiveValidationError is raised if it is not
+
+        Returns
+        -------
+        Response object.  Also throws exceptions if no viable server or endpoint errors
+
+        """
+        if server is None:
+            server = self.server_name
+        if validate:
+            validate_archive(archive_path, chunk_size)
+
+        url = (
+            self.admin_command_root
+            + "/servers/"
+            + server
+            + "/instance/open-metadata-archives/archive-content"
+        )
+        return self.make_request(
+            "POST", url, data=archive_chunks(archive_path, chunk_size, on_progress)
+        )
+
     def get_active_server_status(self, server: str = None) -> Response:
         """
         Get the status for the specified server.
@@ -373,7 +432,10 @@ class Platform(Client):
 
         """
 
-        url = self.admin_command_root + "/servers" + server + "/instance/status"
+        if server is None:
+            server = self.server_name
+
+        url = self.admin_command_root + "/servers/" + server + "/instance/status"
         try:
             response = self.make_request("GET", url)
             return response
@@ -395,7 +457,10 @@ class Platform(Client):
 
         """
 
-        url = self.admin_command_root + "/servers" + server + "/is-known"
+        if server is None:
+            server = self.server_name
+
+        url = self.admin_command_root + "/servers/" + server + "/is-known"
         try:
             response = self.make_request("GET", url)
             return response
@@ -417,7 +482,10 @@ class Platform(Client):
 
         """
 
-        url = self.admin_command_root + "/servers" + server + "/services"
+        if server is None:
+            server = self.server_name
+
+        url = self.admin_command_root + "/servers/" + server + "/services"
         try:
             response = self.make_request("GET", url)
             return response
@@ -439,7 +507,10 @@ class Platform(Client):
 
         """
 
-        url = self.admin_command_root + "/servers" + server + "/status"
+        if server is None:
+            server = self.server_name
+
+        url = self.admin_command_root + "/servers/" + server + "/status"
         try:
             response = self.make_request("GET", url)
             return response
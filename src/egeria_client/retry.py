@@ -0,0 +1,149 @@
+"""
+Retrying of transient request failures.
+
+A RetryPolicy re-issues a request that failed with a connection error, a timeout or one of a set of HTTP
+status codes (by default the 5xx codes an OMAG platform returns while a server restarts), sleeping for an
+exponentially growing, jittered delay between attempts. Only idempotent methods are retried unless the
+caller marks the request as safe to replay, and an optional deadline bounds the total time spent on one
+call, including the timeouts of the individual attempts.
+
+"""
+import random
+import time
+
+import requests
+
+default_retry_statuses = frozenset((500, 502, 503, 504))
+idempotent_methods = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+
+class RetryPolicy:
+    """
+    How failed requests are retried
+
+    Attributes:
+        max_attempts : int
+            the total number of attempts, including the first - 1 disables retries
+        backoff_base : float
+            the delay in seconds before the first retry - the delay doubles on each further retry
+        backoff_cap : float
+            the largest delay in seconds between two attempts
+        jitter : bool
+            if True each delay is drawn uniformly from [0, delay] so that clients retrying together spread out
+        retry_statuses : frozenset
+            the HTTP status codes that are retried
+        deadline : float
+            the maximum number of seconds one call may take, over all its attempts - None means no deadline
+
+    Methods:
+        should_retry_method(request_type, safe = False) -> bool
+            returns True if requests of this type may be replayed
+        backoff(retry) -> float
+            returns the delay before the given retry (1 for the first)
+        call(request_type, send, timeout = None, safe = False, on_retry = None) -> requests.Response
+            calls send(timeout) until it succeeds, fails permanently, or the attempts or deadline run out
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 10.0,
+        jitter: bool = True,
+        retry_statuses=default_retry_statuses,
+        deadline: float = None,
+        sleep=time.sleep,
+        clock=time.monotonic,
+    ):
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, not {max_attempts}")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.deadline = deadline
+        self.sleep = sleep
+        self.clock = clock
+
+    def should_retry_method(self, request_type: str, safe: bool = False) -> bool:
+        return safe or request_type.upper() in idempotent_methods
+
+    def backoff(self, retry: int) -> float:
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (retry - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def _retry_after(self, response) -> float:
+        value = response.headers.get("Retry-After") if response is not None else None
+        try:
+            return min(self.backoff_cap, float(value))
+        except (TypeError, ValueError):
+            return 0.0
+
+    def call(
+        self,
+        request_type: str,
+        send,
+        timeout: float = None,
+        safe: bool = False,
+        on_retry=None,
+    ):
+        """
+        Issue a request, retrying transient failures
+
+        Parameters
+        ----------
+        request_type : the HTTP method, used to decide whether the request may be replayed
+        send : a function taking the timeout for one attempt and returning a requests.Response
+        timeout : the timeout of a single attempt - None means none. It is reduced to fit the deadline.
+        safe : True if the request may be replayed even though its method is not idempotent
+        on_retry : optional function called as on_retry(retry, delay, reason) before each retry
+
+        Returns
+        -------
+        The response of the last attempt. The exception of the last attempt is raised if it failed
+        with a connection error or timeout.
+        """
+        retryable = self.max_attempts > 1 and self.should_retry_method(
+            request_type, safe
+        )
+        expires = None if self.deadline is None else self.clock() + self.deadline
+        attempt = 0
+        while True:
+            attempt += 1
+            attempt_timeout = timeout
+            if expires is not None:
+                remaining = max(expires - self.clock(), 0.001)
+                attempt_timeout = (
+                    remaining if timeout is None else min(timeout, remaining)
+                )
+            response = None
+            try:
+                response = send(attempt_timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not retryable or attempt >= self.max_attempts:
+                    raise
+                reason = e
+            else:
+                if (
+                    not retryable
+                    or attempt >= self.max_attempts
+                    or response.status_code not in self.retry_statuses
+                ):
+                    return response
+                reason = response.status_code
+
+            delay = max(self.backoff(attempt), self._retry_after(response))
+            if expires is not None and self.clock() + delay >= expires:
+                if response is None:
+                    raise reason
+                return response
+            if on_retry is not None:
+                on_retry(attempt, delay, reason)
+            self.sleep(delay)
+
+
+no_retries = RetryPolicy(max_attempts=1)
+default_retry_policy = RetryPolicy()
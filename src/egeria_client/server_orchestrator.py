@@ -0,0 +1,304 @@
+"""
+Parallel activation and deactivation of OMAG servers.
+
+A ServerOrchestrator starts or stops a set of servers on a platform, several at a time, while respecting the
+dependencies between them - a server is only activated once the servers it depends on are running, and is
+deactivated before them. After each request the orchestrator polls the platform until the server has reached
+its target state, and reports the progress of every server as it goes.
+
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+
+from egeria_client.platform_services import Platform
+
+running_states = ("RUNNING", "ACTIVE")
+
+
+@dataclass
+class ServerProgress:
+    """The progress of one server through an orchestration"""
+
+    server: str
+    action: str
+    state: str = "pending"  # pending, requested, ready, failed or skipped
+    started: float = None
+    finished: float = None
+    polls: int = 0
+    error: str = None
+
+    @property
+    def duration(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+@dataclass
+class OrchestrationReport:
+    """
+    The outcome of an orchestration
+
+    Attributes:
+        progress : dict
+            the ServerProgress of each server, in the order the servers were given
+        elapsed : float
+            the wall-clock duration in seconds
+
+    Methods:
+        succeeded() -> [str]
+        failed() -> [str]
+            the servers that failed or were skipped because a dependency failed
+        table() -> str
+    """
+
+    progress: dict
+    elapsed: float = 0.0
+
+    def succeeded(self) -> list:
+        return [s for s, p in self.progress.items() if p.state == "ready"]
+
+    def failed(self) -> list:
+        return [s for s, p in self.progress.items() if p.state != "ready"]
+
+    def table(self) -> str:
+        width = max([len("server")] + [len(s) for s in self.progress])
+        lines = [
+            f"{'server'.ljust(width)}  action      state     polls  seconds  error"
+        ]
+        for p in self.progress.values():
+            lines.append(
+                f"{p.server.ljust(width)}  {p.action.ljust(10)}  {p.state.ljust(8)}  "
+                f"{p.polls:5d}  {p.duration:7.1f}  {p.error or ''}".rstrip()
+            )
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.table()
+
+
+def dependency_order(servers, dependencies: dict = None) -> list:
+    """
+    Return the servers grouped into waves - each server appears after every server it depends on
+
+    Dependencies on servers that are not in servers are ignored. Raises ValueError if the
+    dependencies contain a cycle.
+    """
+    servers = list(dict.fromkeys(servers))
+    dependencies = dependencies or {}
+    remaining = {
+        s: {d for d in dependencies.get(s, ()) if d in servers and d != s}
+        for s in servers
+    }
+    waves = []
+    while remaining:
+        wave = [s for s, deps in remaining.items() if not deps]
+        if not wave:
+            raise ValueError(
+                f"Server dependencies contain a cycle among {sorted(remaining)}"
+            )
+        waves.append(wave)
+        for s in wave:
+            del remaining[s]
+        for deps in remaining.values():
+            deps.difference_update(wave)
+    return waves
+
+
+class ServerOrchestrator:
+    """
+    Activates and deactivates servers on a platform in parallel
+
+    Attributes:
+        platform : Platform
+            the platform the servers run on
+        max_parallel : int
+            the maximum number of servers being activated or deactivated at the same time
+        poll_interval : float
+            the number of seconds between two status checks of a server
+        ready_timeout : float
+            the number of seconds a server may take to reach its target state before it is marked failed
+
+    Methods:
+        activate(servers, dependencies = None, on_progress = None) -> OrchestrationReport
+            activates the servers with their stored configuration, dependencies first
+        deactivate(servers, dependencies = None, on_progress = None) -> OrchestrationReport
+            deactivates the servers, dependent servers first
+        restart(servers, dependencies = None, on_progress = None) -> (OrchestrationReport, OrchestrationReport)
+            deactivates then re-activates the servers
+    """
+
+    def __init__(
+        self,
+        platform: Platform,
+        max_parallel: int = 4,
+        poll_interval: float = 2.0,
+        ready_timeout: float = 300.0,
+    ):
+        if max_parallel <= 0:
+            raise ValueError(f"max_parallel must be greater than 0, not {max_parallel}")
+        self.platform = platform
+        self.max_parallel = max_parallel
+        self.poll_interval = poll_interval
+        self.ready_timeout = ready_timeout
+        self._lock = threading.Lock()
+
+    def _is_running(self, server: str) -> bool:
+        response = self.platform.get_active_server_status(server)
+        return response.json().get("serverStatus") in running_states
+
+    def _is_stopped(self, server: str) -> bool:
+        response = self.platform.get_active_server_list()
+        return server not in (response.json().get("serverList") or [])
+
+    def _update(self, progress: ServerProgress, on_progress, **changes):
+        with self._lock:
+            for name, value in changes.items():
+                setattr(progress, name, value)
+            if on_progress is not None:
+                on_progress(progress)
+
+    def _run_one(self, progress: ServerProgress, request, is_done, on_progress):
+        self._update(progress, on_progress, state="requested", started=time.monotonic())
+        try:
+            request(progress.server)
+            expires = time.monotonic() + self.ready_timeout
+            last_error = None
+            while True:
+                progress.polls += 1
+                try:
+                    if is_done(progress.server):
+                        break
+                except Exception as e:
+                    # the platform may fail a status request while the server changes state - keep polling
+                    last_error = e
+                if time.monotonic() >= expires:
+                    message = f"{progress.server} did not {progress.action} within {self.ready_timeout} seconds"
+                    if last_error is not None:
+                        message += f" - last poll failed with {type(last_error).__name__}: {last_error}"
+                    raise TimeoutError(message)
+                time.sleep(self.poll_interval)
+        except Exception as e:
+            self._update(
+                progress,
+                on_progress,
+                state="failed",
+                finished=time.monotonic(),
+                error=f"{type(e).__name__}: {e}",
+            )
+            return
+        self._update(progress, on_progress, state="ready", finished=time.monotonic())
+
+    def _orchestrate(
+        self, action, servers, prerequisites: dict, request, is_done, on_progress
+    ):
+        start = time.monotonic()
+        servers = list(dict.fromkeys(servers))
+        dependency_order(servers, prerequisites)  # reject cycles before starting
+        progress = {s: ServerProgress(s, action) for s in servers}
+        waiting_on = {
+            s: {d for d in prerequisites.get(s, ()) if d in progress and d != s}
+            for s in servers
+        }
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_parallel, thread_name_prefix="egeria-orchestrator"
+        )
+        in_flight = {}
+        try:
+            while waiting_on or in_flight:
+                for server in [s for s, deps in waiting_on.items() if not deps]:
+                    del waiting_on[server]
+                    future = executor.submit(
+                        self._run_one, progress[server], request, is_done, on_progress
+                    )
+                    in_flight[future] = server
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    server = in_flight.pop(future)
+                    if progress[server].state == "ready":
+                        for deps in waiting_on.values():
+                            deps.discard(server)
+                    else:
+                        self._skip_dependents(server, waiting_on, progress, on_progress)
+        finally:
+            executor.shutdown(wait=True)
+        return OrchestrationReport(progress, time.monotonic() - start)
+
+    def _skip_dependents(self, failed: str, waiting_on, progress, on_progress):
+        blocked = [failed]
+        while blocked:
+            server = blocked.pop()
+            for dependent in [s for s, deps in waiting_on.items() if server in deps]:
+                del waiting_on[dependent]
+                self._update(
+                    progress[dependent],
+                    on_progress,
+                    state="skipped",
+                    error=f"{server} did not {progress[dependent].action}",
+                )
+                blocked.append(dependent)
+
+    def activate(
+        self, servers, dependencies: dict = None, on_progress=None
+    ) -> OrchestrationReport:
+        """
+        Activate the servers with their stored configuration
+
+        Parameters
+        ----------
+        servers : the names of the servers to activate
+        dependencies : a dict of server name to the names of the servers it depends on, for example
+                       {"cocoView1": ["cocoMDS1", "cocoMDS2"]} - those are activated first
+        on_progress : optional function called with the ServerProgress of a server whenever it changes
+
+        Returns
+        -------
+        An OrchestrationReport. Servers whose dependencies failed are skipped.
+        """
+        return self._orchestrate(
+            "activate",
+            servers,
+            dependencies or {},
+            self.platform.activate_server_stored_config,
+            self._is_running,
+            on_progress,
+        )
+
+    def deactivate(
+        self, servers, dependencies: dict = None, on_progress=None
+    ) -> OrchestrationReport:
+        """
+        Deactivate the servers - a server is deactivated only after the servers that depend on it
+
+        Parameters
+        ----------
+        servers : the names of the servers to deactivate
+        dependencies : a dict of server name to the names of the servers it depends on, as for activate
+        on_progress : optional function called with the ServerProgress of a server whenever it changes
+
+        Returns
+        -------
+        An OrchestrationReport
+        """
+        dependents = {}
+        for server, needs in (dependencies or {}).items():
+            for need in needs:
+                dependents.setdefault(need, []).append(server)
+        return self._orchestrate(
+            "deactivate",
+            servers,
+            dependents,
+            self.platform.de_activate_server,
+            self._is_stopped,
+            on_progress,
+        )
+
+    def restart(self, servers, dependencies: dict = None, on_progress=None):
+        """Deactivate and then re-activate the servers, returning both reports"""
+        stopped = self.deactivate(servers, dependencies, on_progress)
+        started = self.activate(stopped.succeeded(), dependencies, on_progress)
+        return stopped, started
@@ -0,0 +1,158 @@
+"""
+Shared, keep-alive HTTP sessions for Egeria clients.
+
+Every client talking to the same platform (scheme, host and port) shares one requests.Session, and so one
+urllib3 connection pool, rather than paying a fresh TCP+TLS handshake on each call.
+
+"""
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+default_pool_size = 10
+default_max_connections = 10
+default_pool_block = False
+
+
+class SessionPool:
+    """
+    A registry of pooled requests.Session objects, one per platform URL
+
+    Attributes:
+        pool_size : int
+            number of urllib3 host pools to cache in each session's adapter
+        max_connections : int
+            maximum number of connections kept alive to a single platform
+        pool_block : bool
+            if True, callers wait for a free connection when the pool is exhausted rather than
+            opening (and then discarding) an extra one
+
+    Methods:
+        get_session(platform_url) -> requests.Session
+            returns the session for the platform, creating it on first use
+
+        pool_stats(platform_url = None) -> dict
+            returns connection statistics for one platform, or for all platforms keyed by platform key
+
+        close(platform_url = None)
+            closes the session for one platform, or all sessions
+    """
+
+    def __init__(
+        self,
+        pool_size: int = default_pool_size,
+        max_connections: int = default_max_connections,
+        pool_block: bool = default_pool_block,
+    ):
+        self.pool_size = pool_size
+        self.max_connections = max_connections
+        self.pool_block = pool_block
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def platform_key(platform_url: str) -> str:
+        """Return the scheme://host:port key that identifies a platform's connection pool"""
+        parts = urlsplit(platform_url)
+        port = parts.port
+        if port is None:
+            port = 443 if parts.scheme == "https" else 80
+        return f"{parts.scheme}://{parts.hostname}:{port}"
+
+    def get_session(
+        self,
+        platform_url: str,
+        pool_size: int = None,
+        max_connections: int = None,
+        pool_block: bool = None,
+    ) -> requests.Session:
+        """
+        Return the shared session for platform_url, creating and mounting its adapter on first use.
+
+        Parameters
+        ----------
+        platform_url : the URL of the platform - only the scheme, host and port are significant
+        pool_size : overrides the registry default when the session is first created
+        max_connections : overrides the registry default when the session is first created
+        pool_block : overrides the registry default when the session is first created
+
+        Returns
+        -------
+        requests.Session
+        """
+        key = self.platform_key(platform_url)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=pool_size or self.pool_size,
+                    pool_maxsize=max_connections or self.max_connections,
+                    pool_block=self.pool_block if pool_block is None else pool_block,
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[key] = session
+            return session
+
+    def pool_stats(self, platform_url: str = None) -> dict:
+        """
+        Return connection pool statistics.
+
+        For each platform the statistics are: the adapter settings, the number of connections opened,
+        the number of requests issued and the number of idle connections currently available for re-use.
+        If platform_url is None, a dict of statistics keyed by platform key is returned.
+        """
+        with self._lock:
+            if platform_url is not None:
+                key = self.platform_key(platform_url)
+                session = self._sessions.get(key)
+                if session is None:
+                    return {}
+                return self._session_stats(session)
+            return {
+                key: self._session_stats(session)
+                for key, session in self._sessions.items()
+            }
+
+    @staticmethod
+    def _session_stats(session: requests.Session) -> dict:
+        adapter = session.get_adapter("https://")
+        stats = {
+            "pool_size": adapter._pool_connections,
+            "max_connections": adapter._pool_maxsize,
+            "pool_block": adapter._pool_block,
+            "connections_opened": 0,
+            "requests": 0,
+            "idle_connections": 0,
+        }
+        pools = adapter.poolmanager.pools
+        for pool_key in pools.keys():
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+            stats["connections_opened"] += pool.num_connections
+            stats["requests"] += pool.num_requests
+            if pool.pool is not None:
+                stats["idle_connections"] += sum(
+                    1 for conn in list(pool.pool.queue) if conn is not None
+                )
+        return stats
+
+    def close(self, platform_url: str = None):
+        """Close the session for platform_url, or every session if platform_url is None"""
+        with self._lock:
+            if platform_url is not None:
+                session = self._sessions.pop(self.platform_key(platform_url), None)
+                if session is not None:
+                    session.close()
+                return
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+# The registry shared by all clients in the process
+session_pool = SessionPool()
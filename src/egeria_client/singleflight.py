@@ -0,0 +1,89 @@
+"""
+Coalescing of identical concurrent requests.
+
+When several threads issue the same idempotent request at the same moment, SingleFlight lets the first one
+make the call while the others wait for it, and then hands every waiter the same result - or the same
+exception. Only calls that overlap in time are shared; a request issued after the call completes makes a
+new call, so results are never served stale.
+
+"""
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call between concurrent callers using the same key
+
+    Attributes:
+        calls : int
+            the number of calls actually made
+        shared : int
+            the number of callers that received the result of another caller's call
+
+    Methods:
+        do(key, fn) -> object
+            returns fn(), sharing the call with any concurrent caller using the same key
+        in_flight() -> int
+            returns the number of calls currently in progress
+        stats() -> dict
+            returns the calls, shared and in_flight counts
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.calls += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "shared": self.shared,
+                "in_flight": len(self._calls),
+            }
+
+
+single_flight = SingleFlight()
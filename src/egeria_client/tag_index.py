@@ -0,0 +1,322 @@
+"""
+A client-side index of informal tags.
+
+find_tags, find_my_tags and get_tags_by_name each search the whole repository on the server. A TagIndex
+reads all the public tags and the end user's private tags once, a page at a time, and then answers name and
+prefix lookups from memory - prefixes with a binary search over the sorted tag names. The index is brought
+up to date by re-reading every tag and applying only the differences, optionally on a background thread - the
+server has no way to list only the tags changed since a given time, so a refresh costs as many requests as the
+first load. Tags created, deleted or updated through the AssetConsumer it is attached to are applied straight
+away.
+
+"""
+import bisect
+import threading
+import time
+from dataclasses import dataclass
+
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.paging import Pager
+from src.egeria_client.tagging import tag_guid, tag_properties
+from src.egeria_client.util_exp import max_paging_size
+
+
+@dataclass(frozen=True)
+class TagEntry:
+    """One informal tag held by a TagIndex"""
+
+    guid: str
+    name: str
+    description: str = None
+    is_private: bool = False
+
+
+class TagIndex:
+    """
+    In-memory index of the informal tags visible to one end user
+
+    Attributes:
+        consumer : AssetConsumer
+            the client the tags are read with - creating the index attaches it to the client
+        end_user_id : str
+            the user whose private tags are included
+        page_size : int
+            the number of tags read per request
+        refresh_interval : float
+            the number of seconds between background refreshes - None disables them
+        last_refresh : float
+            the time.time() at which the index was last read from the server
+        last_error : str
+            the error of the last background refresh that failed, None if it succeeded
+
+    Methods:
+        refresh() -> dict
+            re-reads all the tags and applies the differences, returning the numbers added, removed and updated
+        lookup(name) -> [TagEntry]
+            returns the tags with exactly this name, public tags first
+        guid_for(name) -> str
+            returns the guid of the first tag with this name, or None
+        get(guid) -> TagEntry
+        prefix(prefix, limit = 0) -> [TagEntry]
+            returns the tags whose names start with prefix, in name order
+        start() / stop()
+            start or stop refreshing in the background every refresh_interval seconds
+        tag_created(guid, name, description, end_user_id, is_private)
+        tag_deleted(guid)
+        tag_updated(guid, description)
+            apply a change made through the consumer - called by the consumer itself
+        stats() -> dict
+    """
+
+    def __init__(
+        self,
+        consumer: AssetConsumer,
+        end_user_id: str = None,
+        page_size: int = max_paging_size,
+        refresh_interval: float = None,
+        load: bool = True,
+    ):
+        """
+        Parameters
+        ----------
+        consumer : the client to read the tags with
+        end_user_id : the user whose private tags are included - defaults to the consumer's end user
+        page_size : the number of tags read per request
+        refresh_interval : if set, a background thread refreshes the index every refresh_interval seconds
+        load : if True the tags are read before the constructor returns
+        """
+        self.consumer = consumer
+        self.end_user_id = end_user_id or consumer.end_user_id
+        self.page_size = page_size
+        self.refresh_interval = refresh_interval
+        self.last_refresh = None
+        self.last_error = None
+        self._lock = threading.RLock()
+        self._by_guid = {}
+        self._by_name = {}
+        self._names = []
+        # guid -> time.monotonic() of the last change made through the consumer
+        self._changed = {}
+        self._refreshes = 0
+        self._lookups = 0
+        self._hits = 0
+        self._stop = threading.Event()
+        self._thread = None
+        consumer.tag_index = self
+        if load:
+            self.refresh()
+        if refresh_interval is not None:
+            self.start()
+
+    def __len__(self):
+        return len(self._by_guid)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _read_all(self) -> dict:
+        entries = {}
+        for find, is_private in (
+            (self.consumer.find_tags, False),
+            (self.consumer.find_my_tags, True),
+        ):
+
+            def fetch(start_from: int, size: int, find=find):
+                return find(
+                    ".*", self.end_user_id, start_from=start_from, page_size=size
+                )
+
+            # a Pager reads on until an empty page, as the server may return fewer tags than asked for
+            pager = Pager(
+                fetch,
+                extract=lambda tags: tags,
+                page_size=self.page_size,
+                adaptive=False,
+                max_page_size=self.page_size,
+            )
+            for tag in pager:
+                entry = self._entry(tag, is_private)
+                if entry is not None:
+                    entries[entry.guid] = entry
+        return entries
+
+    @staticmethod
+    def _entry(tag: dict, is_private: bool) -> TagEntry:
+        guid = tag_guid(tag)
+        properties = tag_properties(tag)
+        if guid is None or properties.get("name") is None:
+            return None
+        return TagEntry(
+            guid,
+            properties["name"],
+            properties.get("description"),
+            bool(properties.get("isPrivateTag", is_private)),
+        )
+
+    def _add(self, entry: TagEntry, keep_sorted: bool = True):
+        tags = self._by_name.get(entry.name)
+        if tags is None:
+            tags = self._by_name[entry.name] = {}
+            if keep_sorted:
+                bisect.insort(self._names, entry.name)
+        tags[entry.guid] = entry
+        self._by_guid[entry.guid] = entry
+
+    def _remove(self, guid: str, keep_sorted: bool = True) -> TagEntry:
+        entry = self._by_guid.pop(guid, None)
+        if entry is None:
+            return None
+        tags = self._by_name[entry.name]
+        del tags[guid]
+        if not tags:
+            del self._by_name[entry.name]
+            if keep_sorted:
+                del self._names[bisect.bisect_left(self._names, entry.name)]
+        return entry
+
+    def refresh(self) -> dict:
+        """
+        Re-read all the tags from the server and apply the differences to the index
+
+        The whole list is read again - only the changes to the index are incremental.
+
+        Returns
+        -------
+        A dict with the numbers of tags added, removed and updated
+        """
+        started = time.monotonic()
+        entries = self._read_all()
+        changes = {"added": 0, "removed": 0, "updated": 0}
+        with self._lock:
+            # changes made through the consumer while the tags were being read are newer than what was read
+            recent = {g for g, t in self._changed.items() if t >= started}
+            self._changed = {g: self._changed[g] for g in recent}
+            for guid in [g for g in self._by_guid if g not in entries]:
+                if guid in recent:
+                    continue
+                self._remove(guid, keep_sorted=False)
+                changes["removed"] += 1
+            for guid, entry in entries.items():
+                if guid in recent:
+                    continue
+                current = self._by_guid.get(guid)
+                if current == entry:
+                    continue
+                if current is not None:
+                    self._remove(guid, keep_sorted=False)
+                    changes["updated"] += 1
+                else:
+                    changes["added"] += 1
+                self._add(entry, keep_sorted=False)
+            if any(changes.values()):
+                # one sort instead of an insertion per tag, which is quadratic on the first load
+                self._names = sorted(self._by_name)
+            self._refreshes += 1
+            self.last_refresh = time.time()
+        return changes
+
+    def lookup(self, name: str) -> list:
+        with self._lock:
+            self._lookups += 1
+            tags = self._by_name.get(name)
+            if not tags:
+                return []
+            self._hits += 1
+            return sorted(tags.values(), key=lambda e: (e.is_private, e.guid))
+
+    def guid_for(self, name: str) -> str:
+        tags = self.lookup(name)
+        return tags[0].guid if tags else None
+
+    def get(self, guid: str) -> TagEntry:
+        with self._lock:
+            return self._by_guid.get(guid)
+
+    def prefix(self, prefix: str, limit: int = 0) -> list:
+        with self._lock:
+            self._lookups += 1
+            start = bisect.bisect_left(self._names, prefix)
+            found = []
+            for name in self._names[start:]:
+                if not name.startswith(prefix):
+                    break
+                found.extend(
+                    sorted(self._by_name[name].values(), key=lambda e: e.is_private)
+                )
+                if limit and len(found) >= limit:
+                    found = found[:limit]
+                    break
+            if found:
+                self._hits += 1
+            return found
+
+    def tag_created(
+        self,
+        guid: str,
+        name: str,
+        description: str = None,
+        end_user_id: str = None,
+        is_private: bool = False,
+    ):
+        if is_private and end_user_id not in (None, self.end_user_id):
+            return  # another user's private tag is not visible to this index
+        with self._lock:
+            self._changed[guid] = time.monotonic()
+            self._remove(guid)
+            self._add(TagEntry(guid, name, description, is_private))
+
+    def tag_deleted(self, guid: str):
+        with self._lock:
+            self._changed[guid] = time.monotonic()
+            self._remove(guid)
+
+    def tag_updated(self, guid: str, description: str):
+        with self._lock:
+            entry = self._by_guid.get(guid)
+            if entry is not None:
+                self._changed[guid] = time.monotonic()
+                self._remove(guid)
+                self._add(TagEntry(guid, entry.name, description, entry.is_private))
+
+    def _run(self):
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+
+    def start(self):
+        if self.refresh_interval is None or self.refresh_interval <= 0:
+            raise ValueError(
+                f"refresh_interval must be greater than 0, not {self.refresh_interval}"
+            )
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="egeria-tag-index", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "tags": len(self._by_guid),
+                "names": len(self._names),
+                "refreshes": self._refreshes,
+                "lookups": self._lookups,
+                "hits": self._hits,
+                "last_refresh": self.last_refresh,
+                "last_error": self.last_error,
+            }
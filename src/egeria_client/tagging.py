@@ -0,0 +1,253 @@
+"""
+Bulk tagging of assets and elements.
+
+Classification jobs produce (guid, tag name) pairs, while the asset consumer OMAS tags by tag guid. A
+TagNameMap resolves tag names to guids - from a map loaded up front with find_tags, then with
+get_tags_by_name, and finally by creating the tag - so that each name costs at most one lookup however many
+pairs use it. A BulkTagger streams the pairs through run_bulk, resolving names as it goes and applying the
+assignments concurrently.
+
+"""
+import threading
+
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.bulk_ops import (
+    BulkReport,
+    default_bulk_retry_policy,
+    run_bulk,
+)
+from src.egeria_client.retry import RetryPolicy
+from src.egeria_client.singleflight import SingleFlight
+from src.egeria_client.util_exp import max_paging_size
+
+
+def tag_guid(tag: dict) -> str:
+    """Return the guid of an informal tag element"""
+    return (tag.get("elementHeader") or {}).get("guid")
+
+
+def tag_properties(tag: dict) -> dict:
+    """Return the properties - name, description, isPrivateTag - of an informal tag element"""
+    return tag.get("informalTagProperties") or tag.get("properties") or tag
+
+
+def tag_name(tag: dict) -> str:
+    """Return the name of an informal tag element"""
+    return tag_properties(tag).get("name")
+
+
+class TagNameMap:
+    """
+    A local map of tag names to tag guids, filled in as names are resolved
+
+    Attributes:
+        consumer : AssetConsumer
+            the client used to look up and create tags
+        is_public : bool
+            True to create missing tags as public tags, False for private tags
+        create_missing : bool
+            if False, resolving a name that has no tag raises KeyError rather than creating the tag
+
+    Methods:
+        load(search_string = ".*", page_size = max_paging_size) -> int
+            adds every tag matching search_string to the map, returning the number of tags read
+        resolve(name) -> str
+            returns the guid of the tag, looking it up or creating it the first time the name is seen
+        stats() -> dict
+            returns the size of the map and the numbers of names loaded, looked up and created
+    """
+
+    def __init__(
+        self,
+        consumer: AssetConsumer,
+        is_public: bool = True,
+        create_missing: bool = True,
+        tag_description: str = "Created by a bulk tagging run",
+        end_user_id: str = None,
+    ):
+        self.consumer = consumer
+        self.is_public = is_public
+        self.create_missing = create_missing
+        self.tag_description = tag_description
+        self.end_user_id = end_user_id
+        self._guids = {}
+        self._lock = threading.Lock()
+        self._lookups = SingleFlight()
+        self.loaded = 0
+        self.looked_up = 0
+        self.created = 0
+
+    def __len__(self):
+        return len(self._guids)
+
+    def __contains__(self, name: str):
+        return name in self._guids
+
+    def load(self, search_string: str = ".*", page_size: int = max_paging_size) -> int:
+        count = 0
+        for tag in self.consumer.iter_tags(search_string, page_size, self.end_user_id):
+            name, guid = tag_name(tag), tag_guid(tag)
+            if name is not None and guid is not None:
+                with self._lock:
+                    self._guids.setdefault(name, guid)
+            count += 1
+        self.loaded += count
+        return count
+
+    def _find_or_create(self, name: str) -> str:
+        with self._lock:
+            if name in self._guids:
+                return self._guids[name]
+            self.looked_up += 1
+        guid = None
+        for tag in self.consumer.get_tags_by_name(name, self.end_user_id) or []:
+            if tag_name(tag) == name:
+                guid = tag_guid(tag)
+                break
+        if guid is None:
+            if not self.create_missing:
+                raise KeyError(f"There is no tag called {name}")
+            create = (
+                self.consumer.create_public_tag
+                if self.is_public
+                else self.consumer.create_private_tag
+            )
+            guid = create(name, self.tag_description, self.end_user_id)
+            with self._lock:
+                self.created += 1
+        with self._lock:
+            self._guids[name] = guid
+        return guid
+
+    def resolve(self, name: str) -> str:
+        guid = self._guids.get(name)
+        if guid is not None:
+            return guid
+        # concurrent callers resolving the same new name share one lookup, so a tag is created only once
+        return self._lookups.do(name, lambda: self._find_or_create(name))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "names": len(self._guids),
+                "loaded": self.loaded,
+                "looked_up": self.looked_up,
+                "created": self.created,
+            }
+
+
+class BulkTagger:
+    """
+    Applies tags to many assets or elements concurrently
+
+    Attributes:
+        consumer : AssetConsumer
+            the client used to tag
+        tags : TagNameMap
+            the tag names resolved so far
+        max_workers : int
+            the maximum number of assignments in progress at the same time
+        is_public : bool
+            True if the assignments are public
+
+    Methods:
+        tag_assets(pairs, checkpoint_path = None, on_result = None, keep_results = False) -> BulkReport
+            tags each asset with the named tag, using add_tag
+        tag_elements(pairs, checkpoint_path = None, on_result = None, keep_results = False) -> BulkReport
+            tags each element with the named tag, using add_tag_to_element
+    """
+
+    def __init__(
+        self,
+        consumer: AssetConsumer,
+        max_workers: int = 16,
+        is_public: bool = True,
+        tags: TagNameMap = None,
+        preload: bool = True,
+        retry_policy: RetryPolicy = default_bulk_retry_policy,
+    ):
+        """
+        Parameters
+        ----------
+        consumer : the client used to look up, create and assign tags
+        max_workers : the maximum number of assignments in progress at the same time
+        is_public : True for public assignments and tags, False for private ones
+        tags : the TagNameMap to resolve names with - by default a new map that creates missing tags
+        preload : if True, the map is loaded with every tag the server knows before the first assignment
+        retry_policy : how often and how soon an assignment that failed with a transient error is retried
+        """
+        self.consumer = consumer
+        self.max_workers = max_workers
+        self.is_public = is_public
+        self.tags = tags if tags is not None else TagNameMap(consumer, is_public)
+        self.preload = preload
+        self.retry_policy = retry_policy
+        self._preloaded = False
+
+    def _run(self, pairs, assign, checkpoint_path, on_result, keep_results):
+        if self.preload and not self._preloaded:
+            self.tags.load()
+            self._preloaded = True
+
+        def operation(pair):
+            guid, name = pair
+            tag = self.tags.resolve(name)
+            assign(guid, tag, self.is_public)
+            return tag
+
+        report = run_bulk(
+            pairs,
+            operation,
+            key=lambda pair: f"{pair[0]}/{pair[1]}",
+            max_workers=self.max_workers,
+            retry_policy=self.retry_policy,
+            checkpoint=checkpoint_path,
+            on_result=on_result,
+            keep_results=keep_results,
+        )
+        report.counts.update(
+            {"tag_" + name: count for name, count in self.tags.stats().items()}
+        )
+        return report
+
+    def tag_assets(
+        self,
+        pairs,
+        checkpoint_path: str = None,
+        on_result=None,
+        keep_results: bool = False,
+    ) -> BulkReport:
+        """
+        Tag assets
+
+        Parameters
+        ----------
+        pairs : an iterable of (asset guid, tag name) - it is consumed as the work proceeds
+        checkpoint_path : optional path of a checkpoint file recording the pairs already applied
+        on_result : optional function called with each BulkResult as it completes
+        keep_results : if True the report holds a BulkResult for every pair, otherwise only for the
+                       pairs that failed
+
+        Returns
+        -------
+        A BulkReport - summary() gives the throughput, and counts includes the tag name map statistics
+        """
+        return self._run(
+            pairs, self.consumer.add_tag, checkpoint_path, on_result, keep_results
+        )
+
+    def tag_elements(
+        self,
+        pairs,
+        checkpoint_path: str = None,
+        on_result=None,
+        keep_results: bool = False,
+    ) -> BulkReport:
+        """Tag elements, as tag_assets does for assets - pairs are (element guid, tag name)"""
+        return self._run(
+            pairs,
+            self.consumer.add_tag_to_element,
+            checkpoint_path,
+            on_result,
+            keep_results,
+        )
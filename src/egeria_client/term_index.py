@@ -0,0 +1,171 @@
+"""
+A local inverted index from glossary terms to the assets that carry them.
+
+Impact analysis asks which assets carry some set of glossary terms, and get_assets_by_meaning answers for one
+term per round trip. TermAssetIndex.build fetches the assets of every term of a glossary concurrently and
+keeps them as an inverted index: each asset guid is interned to a small integer once, and each term holds
+a sorted array('I') of those integers. Queries across many terms are then unions and intersections of
+integer sets, done locally.
+
+"""
+import threading
+from array import array
+
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.bulk_ops import default_bulk_retry_policy, run_bulk
+from src.egeria_client.retry import RetryPolicy
+from src.egeria_client.util_exp import max_paging_size
+
+
+class TermAssetIndex:
+    """
+    Inverted index of glossary term guids to asset guids
+
+    Attributes:
+        report : BulkReport
+            the report of the build that filled the index, if it was built with build()
+
+    Methods:
+        build(consumer, term_guids = None, max_workers = 16, ...) -> TermAssetIndex
+            class method - fetches the assets of every term, by default of every glossary term
+        add_term(term_guid, asset_guids)
+            sets the assets of a term, replacing any it had
+        assets_of(term_guid) -> [str]
+        assets_with_any(term_guids) -> set
+            the assets carrying at least one of the terms
+        assets_with_all(term_guids) -> set
+            the assets carrying every one of the terms
+        count_with_any(term_guids) -> int
+        terms() -> [str]
+        stats() -> dict
+            the numbers of terms, assets and postings, and the bytes used by the posting lists
+    """
+
+    def __init__(self):
+        self._ids = {}  # asset guid -> interned id
+        self._guids = []  # interned id -> asset guid
+        self._postings = {}  # term guid -> sorted array('I') of interned ids
+        self._lock = threading.Lock()
+        self.report = None
+
+    def __len__(self):
+        return len(self._postings)
+
+    def __contains__(self, term_guid: str):
+        return term_guid in self._postings
+
+    def _intern(self, guid: str) -> int:
+        asset_id = self._ids.get(guid)
+        if asset_id is None:
+            asset_id = self._ids[guid] = len(self._guids)
+            self._guids.append(guid)
+        return asset_id
+
+    def add_term(self, term_guid: str, asset_guids):
+        with self._lock:
+            ids = sorted({self._intern(g) for g in asset_guids or ()})
+            self._postings[term_guid] = array("I", ids)
+
+    def _posting(self, term_guid: str) -> array:
+        return self._postings.get(term_guid, array("I"))
+
+    def assets_of(self, term_guid: str) -> list:
+        return [self._guids[i] for i in self._posting(term_guid)]
+
+    def _any(self, term_guids) -> set:
+        ids = set()
+        for term_guid in term_guids:
+            ids.update(self._posting(term_guid))
+        return ids
+
+    def _all(self, term_guids) -> set:
+        postings = sorted((self._posting(t) for t in set(term_guids)), key=len)
+        if not postings:
+            return set()
+        # start from the shortest list, so each intersection is bounded by the smallest result so far
+        ids = set(postings[0])
+        for posting in postings[1:]:
+            if not ids:
+                break
+            ids.intersection_update(posting)
+        return ids
+
+    def assets_with_any(self, term_guids) -> set:
+        return {self._guids[i] for i in self._any(term_guids)}
+
+    def assets_with_all(self, term_guids) -> set:
+        return {self._guids[i] for i in self._all(term_guids)}
+
+    def count_with_any(self, term_guids) -> int:
+        return len(self._any(term_guids))
+
+    def terms(self) -> list:
+        return list(self._postings)
+
+    def stats(self) -> dict:
+        with self._lock:
+            postings = sum(len(p) for p in self._postings.values())
+            return {
+                "terms": len(self._postings),
+                "assets": len(self._guids),
+                "postings": postings,
+                "posting_bytes": postings * array("I").itemsize,
+            }
+
+    @classmethod
+    def build(
+        cls,
+        consumer: AssetConsumer,
+        term_guids=None,
+        max_workers: int = 16,
+        page_size: int = max_paging_size,
+        retry_policy: RetryPolicy = default_bulk_retry_policy,
+        end_user_id: str = None,
+        on_result=None,
+    ) -> "TermAssetIndex":
+        """
+        Build an index by fetching the assets of many terms concurrently
+
+        Parameters
+        ----------
+        consumer : the client to call get_assets_by_meaning with
+        term_guids : the guids of the terms to index - by default every glossary term found by find_meanings
+        max_workers : the maximum number of terms being fetched at the same time
+        page_size : the number of asset guids requested per call
+        retry_policy : how often and how soon a term that failed with a transient error is retried
+        end_user_id : the user the terms and assets are read as
+        on_result : optional function called with the BulkResult of each term as it completes
+
+        Returns
+        -------
+        The TermAssetIndex. Its report lists the terms that could not be fetched - they are not in the index.
+        """
+        if term_guids is None:
+            term_guids = (
+                (m.get("elementHeader") or {}).get("guid")
+                for m in consumer.iter_meanings(".*", page_size, end_user_id)
+            )
+        index = cls()
+
+        def fetch(term_guid: str) -> list:
+            return list(
+                consumer.iter_assets_by_meaning(term_guid, page_size, end_user_id)
+            )
+
+        def indexed(result):
+            if result.ok:
+                index.add_term(result.key, result.value)
+                result.value = len(result.value)  # the guids are in the index now
+            if on_result is not None:
+                on_result(result)
+
+        index.report = run_bulk(
+            (t for t in term_guids if t),
+            fetch,
+            key=lambda term_guid: term_guid,
+            max_workers=max_workers,
+            retry_policy=retry_policy,
+            on_result=indexed,
+            keep_results=False,
+        )
+        return index
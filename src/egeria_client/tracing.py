@@ -0,0 +1,387 @@
+"""
+Optional tracing of the calls made through the clients.
+
+Classes marked with @traced - AssetConsumer and Platform - have each public method wrapped in a span once a
+tracer is set with tracing.set_tracer. The span is named after the class and method and has the operation,
+the server name and platform URL, and the guids the method was given, as attributes. Requests sent while a
+span is open carry a W3C traceparent header, so the server side of the call joins the same trace. The
+methods are only wrapped while a tracer is set, and the classes are restored when it is removed, so tracing
+costs nothing when it is not used.
+
+The tracer is pluggable: anything with a start_span(name, attributes, parent) method returning a span with a
+traceparent, set_attribute, record_exception and end will do. SimpleTracer keeps finished spans in memory and
+can pass them to a function, and OpenTelemetryTracer creates the spans with OpenTelemetry, when it is
+installed, as children of the span current in the calling service.
+
+"""
+import contextlib
+import contextvars
+import functools
+import inspect
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+traceparent_pattern = re.compile(
+    r"([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})"
+)
+_current_span = contextvars.ContextVar("egeria_client_span", default=None)
+
+
+def format_traceparent(trace_id: str, span_id: str, sampled: bool = True) -> str:
+    return f"00-{trace_id}-{span_id}-{'01' if sampled else '00'}"
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """The identity of a span in another process, read from a traceparent header"""
+
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+    @property
+    def traceparent(self) -> str:
+        return format_traceparent(self.trace_id, self.span_id, self.sampled)
+
+
+def parse_traceparent(traceparent: str) -> SpanContext:
+    """Return the SpanContext of a traceparent header, or None if it is not a valid one"""
+    found = traceparent_pattern.fullmatch((traceparent or "").strip().lower())
+    if found is None:
+        return None
+    version, trace_id, span_id, flags = found.groups()
+    if version == "ff" or trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return SpanContext(trace_id, span_id, bool(int(flags, 16) & 1))
+
+
+@dataclass
+class Span:
+    """
+    A span recorded by SimpleTracer
+
+    Attributes:
+        name : str
+        trace_id : str
+        span_id : str
+        parent_id : str
+            the span id of the parent span - None for the root of a trace
+        sampled : bool
+            False if the span is propagated but not recorded
+        attributes : dict
+        start : float
+            the wall clock time the span started
+        duration : float
+            the seconds the span lasted, once it has ended
+        error : str
+            the exception the span ended with, if any
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str = None
+    sampled: bool = True
+    attributes: dict = field(default_factory=dict)
+    start: float = 0.0
+    duration: float = None
+    error: str = None
+    _tracer: object = field(default=None, repr=False, compare=False)
+    _started: float = field(default=0.0, repr=False, compare=False)
+
+    @property
+    def traceparent(self) -> str:
+        return format_traceparent(self.trace_id, self.span_id, self.sampled)
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException):
+        self.error = f"{type(exception).__name__}: {exception}"
+
+    def end(self):
+        if self.duration is None:
+            self.duration = time.perf_counter() - self._started
+            if self.sampled and self._tracer is not None:
+                self._tracer._finished(self)
+
+
+class SimpleTracer:
+    """
+    A tracer that keeps the spans it records in memory
+
+    A span opened with no parent starts a new trace, which is sampled with probability sample_rate. A span
+    opened inside another, or under a remote parent set with tracing.remote_parent, joins its trace and
+    follows its sampling decision.
+
+    Attributes:
+        spans : deque
+            the most recent finished spans, oldest first
+        on_end : function
+            optional function called with each finished span
+        sample_rate : float
+            the share of new traces recorded, from 0 to 1
+
+    Methods:
+        start_span(name, attributes, parent) -> Span
+        clear()
+    """
+
+    def __init__(self, on_end=None, max_spans: int = 10000, sample_rate: float = 1.0):
+        self.on_end = on_end
+        self.sample_rate = sample_rate
+        self.spans = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, attributes: dict, parent=None) -> Span:
+        if parent is None:
+            trace_id = os.urandom(16).hex()
+            sampled = self.sample_rate >= 1 or random.random() < self.sample_rate
+            parent_id = None
+        else:
+            trace_id, sampled, parent_id = (
+                parent.trace_id,
+                parent.sampled,
+                parent.span_id,
+            )
+        return Span(
+            name,
+            trace_id,
+            os.urandom(8).hex(),
+            parent_id,
+            sampled,
+            dict(attributes),
+            time.time(),
+            _tracer=self,
+            _started=time.perf_counter(),
+        )
+
+    def _finished(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+        if self.on_end is not None:
+            self.on_end(span)
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+
+
+class _OpenTelemetrySpan:
+    def __init__(self, span, scope):
+        self.span = span
+        self._scope = scope
+        self._scope.__enter__()
+
+    @property
+    def traceparent(self) -> str:
+        context = self.span.get_span_context()
+        return format_traceparent(
+            f"{context.trace_id:032x}",
+            f"{context.span_id:016x}",
+            context.trace_flags.sampled,
+        )
+
+    def set_attribute(self, key: str, value):
+        self.span.set_attribute(key, value)
+
+    def record_exception(self, exception: BaseException):
+        from opentelemetry.trace import Status, StatusCode
+
+        self.span.record_exception(exception)
+        self.span.set_status(Status(StatusCode.ERROR, str(exception)))
+
+    def end(self):
+        self._scope.__exit__(None, None, None)
+        self.span.end()
+
+
+class OpenTelemetryTracer:
+    """
+    A tracer creating its spans with OpenTelemetry, which must be installed
+
+    The spans are children of the OpenTelemetry span current when the client method is called - the span of
+    the request handler calling the catalog, for example - and are exported by the tracer provider the
+    service has configured.
+
+    Attributes:
+        tracer : opentelemetry.trace.Tracer
+    """
+
+    def __init__(self, tracer=None):
+        """
+        Parameters
+        ----------
+        tracer : the OpenTelemetry tracer to create spans with - by default one named egeria_client from the
+                 global tracer provider
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetryTracer needs the opentelemetry-api package"
+            ) from None
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("egeria_client")
+
+    def start_span(self, name: str, attributes: dict, parent=None):
+        context = None
+        if isinstance(parent, _OpenTelemetrySpan):
+            context = self._trace.set_span_in_context(parent.span)
+        span = self.tracer.start_span(
+            name,
+            context=context,
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=attributes,
+        )
+        return _OpenTelemetrySpan(span, self._trace.use_span(span, end_on_exit=False))
+
+
+def _span_attributes(method, signature, self, args, kwargs) -> dict:
+    attributes = {
+        "egeria.operation": method.__name__,
+        "egeria.server": getattr(self, "server_name", None),
+        "egeria.platform_url": getattr(self, "platform_url", None)
+        or getattr(self, "server_platform_url", None),
+    }
+    try:
+        bound = signature.bind_partial(self, *args, **kwargs).arguments
+    except TypeError:
+        bound = {}
+    if bound.get("server"):
+        attributes["egeria.server"] = bound["server"]
+    for name, value in bound.items():
+        if name.endswith("guid") and isinstance(value, str):
+            attributes["egeria." + name] = value
+    return {k: v for k, v in attributes.items() if v is not None}
+
+
+def _traced_method(tracer, class_name: str, method):
+    signature = inspect.signature(method)
+    span_name = f"{class_name}.{method.__name__}"
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        span = tracer.start_span(
+            span_name,
+            _span_attributes(method, signature, self, args, kwargs),
+            _current_span.get(),
+        )
+        token = _current_span.set(span)
+        try:
+            return method(self, *args, **kwargs)
+        except Exception as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    return wrapper
+
+
+class TracingRegistry:
+    """
+    The tracer used by the clients, and the classes whose methods are traced
+
+    Methods:
+        set_tracer(tracer)
+            starts tracing with tracer - None stops tracing
+        tracer
+            the tracer in use, None when tracing is off
+        current_span()
+            the span open on this thread or task, if any
+        inject(headers) -> dict
+            returns headers with the traceparent of the current span added
+        remote_parent(traceparent)
+            a context manager making the spans opened inside it children of a span in another process
+        register(cls, exclude)
+            marks the public methods of cls to be traced
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._classes = {}  # class -> names of the methods not traced
+        self._originals = {}  # class -> {name: method defined on the class, or None}
+        self.tracer = None
+
+    def register(self, cls, exclude=()):
+        with self._lock:
+            self._classes[cls] = frozenset(exclude)
+            if self.tracer is not None:
+                self._wrap(cls)
+        return cls
+
+    def _methods(self, cls):
+        excluded = self._classes[cls]
+        for name in dir(cls):
+            if name.startswith("_") or name in excluded:
+                continue
+            raw = inspect.getattr_static(cls, name)
+            if inspect.isfunction(raw) and not inspect.isgeneratorfunction(raw):
+                yield name, raw
+
+    def _wrap(self, cls):
+        originals = {}
+        for name, method in self._methods(cls):
+            originals[name] = cls.__dict__.get(name)
+            setattr(cls, name, _traced_method(self.tracer, cls.__name__, method))
+        self._originals[cls] = originals
+
+    def _unwrap(self, cls):
+        for name, original in self._originals.pop(cls, {}).items():
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+
+    def set_tracer(self, tracer):
+        """Trace the registered classes with tracer, or stop tracing them if tracer is None"""
+        with self._lock:
+            for cls in self._classes:
+                self._unwrap(cls)
+            self.tracer = tracer
+            if tracer is not None:
+                for cls in self._classes:
+                    self._wrap(cls)
+
+    @staticmethod
+    def current_span():
+        return _current_span.get()
+
+    @staticmethod
+    def inject(headers: dict = None) -> dict:
+        """Return headers, or a copy of them with a traceparent header if a span is open"""
+        span = _current_span.get()
+        if span is None:
+            return headers
+        return {**(headers or {}), "traceparent": span.traceparent}
+
+    @staticmethod
+    @contextlib.contextmanager
+    def remote_parent(traceparent: str):
+        """Make the spans opened inside the block children of the span a traceparent header identifies"""
+        context = parse_traceparent(traceparent)
+        if context is None:
+            yield None
+            return
+        token = _current_span.set(context)
+        try:
+            yield context
+        finally:
+            _current_span.reset(token)
+
+
+tracing = TracingRegistry()
+
+
+def traced(cls=None, *, exclude=()):
+    """Class decorator marking the public methods of a client class to be traced while a tracer is set"""
+    if cls is None:
+        return lambda c: tracing.register(c, exclude)
+    return tracing.register(cls, exclude)
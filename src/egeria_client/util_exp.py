@@ -9,6 +9,10 @@ from requests import HTTPError
 
 ...
 from src.egeria_client.config import isDebug
+from src.egeria_client.singleflight import single_flight
+from src.egeria_client.retry import default_retry_policy, no_retries
+from src.egeria_client.metrics import metrics
+from src.egeria_client.tracing import tracing
 from enum import Enum
 import json
 import requests
@@ -194,6 +198,14 @@ class OMAGCommonErrorCode(EgeriaErrorCode):
                                      and correct the source of the error.",
     )
 
+    CIRCUIT_OPEN = dict(
+        http_error_code="503",
+        message_id="CLIENT-SIDE-CIRCUIT-BREAKER-503-004",
+        message_template="The call {0} to server {1} on platform {2} was rejected because recent calls to the server failed. Calls resume in {3:.1f} seconds",
+        system_action="The client has stopped sending requests to the server for a while so that callers are not left waiting on a server that is not responding.",
+        user_action="Check that the server is running and reachable. Calls are tried again automatically once the wait has passed",
+    )
+
     SERVER_URL_NOT_SPECIFIED = dict(
         http_error_code="400",
         message_id="OMAG-COMMON-400-001",
@@ -408,6 +420,27 @@ class UserNotAuthorizedException(EgeriaException):
         )
 
 
+class CircuitOpenException(PropertyServerException):
+    """Exception raised without calling the server because recent calls to the server have failed"""
+
+    def __init__(
+        self,
+        error_msg: str,
+        error_code: OMAGCommonErrorCode,
+        class_name: str,
+        action_description: str,
+        params: [str],
+    ):
+        PropertyServerException.__init__(
+            self,
+            error_msg,
+            error_code,
+            class_name,
+            action_description,
+            params,
+        )
+
+
 class RESTConnectionException(EgeriaException):
     """Exception that wraps exceptions coming from the Request package
 
@@ -592,7 +625,24 @@ def issue_get(url: str) -> object:
 
     try:
         validate_url(url)
-        response = requests.get(url, headers=jsonHeader, verify=False)
+        response = metrics.observe(
+            caller_method,
+            "GET",
+            url,
+            lambda on_retry: single_flight.do(
+                ("issue_get", "GET", url),
+                lambda: default_retry_policy.call(
+                    "GET",
+                    lambda timeout: requests.get(
+                        url,
+                        headers=tracing.inject(jsonHeader),
+                        verify=False,
+                        timeout=timeout,
+                    ),
+                    on_retry=on_retry,
+                ),
+            ),
+        )
 
     except InvalidParameterException as e:
         raise
@@ -666,12 +716,15 @@ def issue_post(
     url,
     body: json = {"class": "NullRequestBody"},
     headers: json = {"Content-Type": "application/json"},
+    safe: bool = False,
 ) -> object:
     """
 
     Args:
         url: URL string to post to
         body: json body
+        safe: True if the POST can be replayed without side effects, for example a query - it is then
+              retried according to default_retry_policy
 
     Returns:
         object: response
@@ -683,7 +736,23 @@ def issue_post(
 
     try:
         validate_url(url)
-        response = requests.post(url, json=body, headers=headers, verify=False)
+        response = metrics.observe(
+            caller_method,
+            "POST",
+            url,
+            lambda on_retry: default_retry_policy.call(
+                "POST",
+                lambda timeout: requests.post(
+                    url,
+                    json=body,
+                    headers=tracing.inject(headers),
+                    verify=False,
+                    timeout=timeout,
+                ),
+                safe=safe,
+                on_retry=on_retry,
+            ),
+        )
 
     except (ConnectionError, TimeoutError) as e:
         msg = OMAGCommonErrorCode.CLIENT_SIDE_REST_API_ERROR.value[
@@ -712,12 +781,14 @@ def issue_post(
     return response
 
 
-def issue_data_post(url, body):
+def issue_data_post(url, body, safe: bool = False):
     """
 
     Args:
         url:
         body:
+        safe: True if the POST can be replayed without side effects - it is then retried according to
+              default_retry_policy. A body that can only be read once, such as a file, is never safe.
 
     Returns:
         response:
@@ -726,16 +797,34 @@ def issue_data_post(url, body):
 
     # jsonHeader = {'content-type': 'text/plain'}
     jsonHeader = {"content-type": "application/json"}
-    response = requests.post(url, data=body, verify=False, headers=jsonHeader)
+    response = metrics.observe(
+        sys._getframe(1).f_code.co_name,
+        "POST",
+        url,
+        lambda on_retry: default_retry_policy.call(
+            "POST",
+            lambda timeout: requests.post(
+                url,
+                data=body,
+                verify=False,
+                headers=tracing.inject(jsonHeader),
+                timeout=timeout,
+            ),
+            safe=safe,
+            on_retry=on_retry,
+        ),
+    )
     return response
 
 
-def issue_put(url, body):
+def issue_put(url, body, safe: bool = True):
     """
 
     Args:
         url:
         body:
+        safe: False if the PUT must not be replayed - otherwise, as a PUT is idempotent, it is retried
+              according to default_retry_policy
 
     Returns:
         object:
@@ -745,7 +834,22 @@ def issue_put(url, body):
         print_rest_request("PUT " + url)
         print_rest_request_body(body)
     jsonHeader = {"content-type": "application/json"}
-    response = requests.put(url, json=body, headers=jsonHeader, verify=False)
+    response = metrics.observe(
+        sys._getframe(1).f_code.co_name,
+        "PUT",
+        url,
+        lambda on_retry: (default_retry_policy if safe else no_retries).call(
+            "PUT",
+            lambda timeout: requests.put(
+                url,
+                json=body,
+                headers=tracing.inject(jsonHeader),
+                verify=False,
+                timeout=timeout,
+            ),
+            on_retry=on_retry,
+        ),
+    )
     if isDebug:
         print_rest_response(response)
     return response
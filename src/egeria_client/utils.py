@@ -5,6 +5,7 @@
 #
 ...
 from src.egeria_client.config import isDebug
+from src.egeria_client.paging import Pager
 from enum import Enum
 import json
 import requests
@@ -354,7 +355,7 @@ def get_asset_universe(
         + userId
     )
     getAsset = connectedAssetURL + "/assets/" + assetGUID
-    response = issueGet(getAsset)
+    response = issue_get(getAsset)
     asset = response.json().get("asset")
     if asset:
         return response.json()
@@ -363,6 +364,55 @@ def get_asset_universe(
         process_error_response(serverName, "fixme", serverPlatformURL, response)
 
 
+def connected_asset_pager(
+    serverName,
+    serverPlatformName,
+    serverPlatformURL,
+    requestURL,
+    start_from: int = 0,
+    page_size: int = 0,
+    max_elements: int = 0,
+) -> Pager:
+    """
+    Return a Pager over a connected asset list endpoint
+
+    Parameters
+    ----------
+    serverName :
+    serverPlatformName :
+    serverPlatformURL :
+    requestURL : the URL of the list endpoint, without the elementStart and maxElements parameters
+    start_from : the index of the first element to return
+    page_size : the initial page size - 0 uses the paging default
+    max_elements : the maximum number of elements to return - 0 means all of them
+
+    Returns
+    -------
+    Pager - iteration raises ConnectionError, after printing the response, if the server returns an error
+    """
+
+    def fetch(element_start: int, max_page: int):
+        return issue_get(
+            requestURL
+            + "?elementStart="
+            + str(element_start)
+            + "&maxElements="
+            + str(max_page)
+        )
+
+    def extract(response):
+        if response.status_code == 200:
+            relatedHTTPCode = response.json().get("relatedHTTPCode")
+            if relatedHTTPCode == 200:
+                return response.json().get("list")
+        print_unexpected_response(
+            serverName, serverPlatformName, serverPlatformURL, response
+        )
+        raise ConnectionError(response.text)
+
+    return Pager(fetch, extract, start_from, page_size, max_elements=max_elements)
+
+
 def get_related_assets(
     serverName,
     serverPlatformName,
@@ -370,6 +420,7 @@ def get_related_assets(
     serviceURLMarker,
     userId,
     assetGUID,
+    max_elements: int = 0,
 ):
     """
     Parameters
@@ -380,9 +431,11 @@ def get_related_assets(
     serviceURLMarker :
     userId :
     assetGUID :
+    max_elements : the maximum number of related assets to return - 0 means all of them
 
     Returns
     -------
+    list of related assets, or None if there are none
 
     """
     connectedAssetURL = (
@@ -394,25 +447,15 @@ def get_related_assets(
         + "/connected-asset/users/"
         + userId
     )
-    getRelatedAsset = (
-        connectedAssetURL
-        + "/assets/"
-        + assetGUID
-        + "/related-assets?elementStart=0&maxElements=50"
+    getRelatedAsset = connectedAssetURL + "/assets/" + assetGUID + "/related-assets"
+    pager = connected_asset_pager(
+        serverName,
+        serverPlatformName,
+        serverPlatformURL,
+        getRelatedAsset,
+        max_elements=max_elements,
     )
-    response = issue_get(getRelatedAsset)
-    if response.status_code == 200:
-        relatedHTTPCode = response.json().get("relatedHTTPCode")
-        if relatedHTTPCode == 200:
-            return response.json().get("list")
-        else:
-            printUnexpectedResponse(
-                serverName, serverPlatformName, serverPlatformURL, response
-            )
-    else:
-        printUnexpectedResponse(
-            serverName, serverPlatformName, serverPlatformURL, response
-        )
+    return list(pager) or None
 
 
 def get_comments(
@@ -422,6 +465,7 @@ def get_comments(
     serviceURLMarker,
     userId,
     assetGUID,
+    max_elements: int = 0,
 ):
     connectedAssetURL = (
         serverPlatformURL
@@ -432,19 +476,20 @@ def get_comments(
         + "/connected-asset/users/"
         + userId
     )
-    commentQuery = (
-        connectedAssetURL
-        + "/assets/"
-        + assetGUID
-        + "/comments?elementStart=0&maxElements=50"
+    commentQuery = connectedAssetURL + "/assets/" + assetGUID + "/comments"
+    responseObjects = list(
+        connected_asset_pager(
+            serverName,
+            serverPlatformName,
+            serverPlatformURL,
+            commentQuery,
+            max_elements=max_elements,
+        )
     )
-    response = issueGet(commentQuery)
-    responseObjects = response.json().get("list")
     if responseObjects:
         return responseObjects
     else:
         print("No comments returned")
-        process_error_response(serverName, "fixme", serverPlatformURL, response)
 
 
 def get_comment_replies(
@@ -455,6 +500,7 @@ def get_comment_replies(
     userId,
     assetGUID,
     commentGUID,
+    max_elements: int = 0,
 ):
     connectedAssetURL = (
         serverPlatformURL
@@ -471,15 +517,21 @@ def get_comment_replies(
         + assetGUID
         + "/comments/"
         + commentGUID
-        + "/replies?elementStart=0&maxElements=50"
+        + "/replies"
+    )
+    responseObjects = list(
+        connected_asset_pager(
+            serverName,
+            serverPlatformName,
+            serverPlatformURL,
+            commentReplyQuery,
+            max_elements=max_elements,
+        )
     )
-    response = issueGet(commentReplyQuery)
-    responseObjects = response.json().get("list")
     if responseObjects:
         return responseObjects
     else:
         print("No comments returned")
-        process_error_response(serverName, "fixme", serverPlatformURL, response)
 
 
 def get_api_operations(
@@ -489,6 +541,7 @@ def get_api_operations(
     serviceURLMarker,
     userId,
     apiSchemaTypeGUID,
+    max_elements: int = 0,
 ):
     connectedAssetURL = (
         serverPlatformURL
@@ -503,22 +556,16 @@ def get_api_operations(
         connectedAssetURL
         + "/assets/schemas/apis/"
         + apiSchemaTypeGUID
-        + "/api-operations?elementStart=0&maxElements=50"
+        + "/api-operations"
     )
-    response = issueGet(requestURL)
-    responseObjects = response.json().get("list")
-    if response.status_code == 200:
-        relatedHTTPCode = response.json().get("relatedHTTPCode")
-        if relatedHTTPCode == 200:
-            return response.json().get("list")
-        else:
-            printUnexpectedResponse(
-                serverName, serverPlatformName, serverPlatformURL, response
-            )
-    else:
-        printUnexpectedResponse(
-            serverName, serverPlatformName, serverPlatformURL, response
-        )
+    pager = connected_asset_pager(
+        serverName,
+        serverPlatformName,
+        serverPlatformURL,
+        requestURL,
+        max_elements=max_elements,
+    )
+    return list(pager) or None
 
 
 def get_schema_attributes_from_schema_type(
@@ -528,6 +575,7 @@ def get_schema_attributes_from_schema_type(
     serviceURLMarker,
     userId,
     schemaTypeGUID,
+    max_elements: int = 0,
 ):
     ocfURL = (
         serverPlatformURL
@@ -539,18 +587,21 @@ def get_schema_attributes_from_schema_type(
         + userId
     )
     getSchemaAttributesURL = (
-        ocfURL
-        + "/assets/schemas/"
-        + schemaTypeGUID
-        + "/schema-attributes?elementStart=0&maxElements=100"
+        ocfURL + "/assets/schemas/" + schemaTypeGUID + "/schema-attributes"
+    )
+    schemaAttributes = list(
+        connected_asset_pager(
+            serverName,
+            serverPlatformName,
+            serverPlatformURL,
+            getSchemaAttributesURL,
+            max_elements=max_elements,
+        )
     )
-    response = issueGet(getSchemaAttributesURL)
-    schemaAttributes = response.json().get("list")
     if schemaAttributes:
         return schemaAttributes
     else:
         print("No Schema attributes retrieved")
-        process_error_response(serverName, "fixme", serverPlatformURL, response)
 
 
 def print_response(response):
@@ -610,19 +661,19 @@ def print_unexpected_response(
 # Rest calls, these functions issue rest calls and print debug if required.
 #
 
-def issue_get(url): object
-"""
-Wrap a get request, validating the url first and raising an exception if needed
-Args:
-    url: the URL to issue an HTTP GET to 
-Returns:
-    object: the response object returned from the requests package
+def issue_get(url) -> object:
+    """
+    Wrap a get request, validating the url first and raising an exception if needed
+    Args:
+        url: the URL to issue an HTTP GET to
+    Returns:
+        object: the response object returned from the requests package
 
-"""
+    """
     if isDebug:
         print_rest_request("GET " + url)
     jsonHeader = {"content-type": "application/json"}
-    validate_url(url)
+    validate_url(url, "utils", "issue_get")
     response = requests.get(url, headers=jsonHeader, verify=False)
     if isDebug:
         print_rest_response(response)
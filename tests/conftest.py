@@ -0,0 +1,29 @@
+#
+#  Fixtures shared by the tests
+#
+import pytest
+
+from src.egeria_client.mock_platform import MockPlatform, SyntheticCatalog
+from src.egeria_client.session_pool import session_pool
+from tests.stub_server import StubServers
+
+
+@pytest.fixture()
+def stub_server():
+    """
+    A function serving a StubHandler subclass on a free local port, as stub_server(handler, **attributes),
+    and returning the server and its URL - the servers are stopped after the test
+    """
+    servers = StubServers()
+    yield servers
+    servers.stop()
+
+
+@pytest.fixture()
+def platform_url():
+    """The URL of a MockPlatform serving a small synthetic catalog - the platform is stopped after the test"""
+    platform = MockPlatform(SyntheticCatalog(asset_count=10, term_count=10))
+    url = platform.start()
+    yield url
+    session_pool.close(url)
+    platform.stop()
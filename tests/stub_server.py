@@ -0,0 +1,58 @@
+#
+#  A local HTTP server standing in for an OMAG server platform in the tests
+#
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.egeria_client.session_pool import session_pool
+
+# a platform URL nothing listens on - requests to it fail to connect
+unreachable_url = "http://127.0.0.1:9"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    The base of the request handlers served by the stub_server fixture - subclasses add do_GET, do_POST,
+    and so on, and find the attributes the fixture was given on self.server
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def _read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def _reply(self, status: int = 200, body: dict = None):
+        data = json.dumps({"relatedHTTPCode": status, **(body or {})}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServers:
+    """The servers started by one test, stopped with their pooled sessions when it ends"""
+
+    def __init__(self):
+        self._servers = []
+
+    def __call__(self, handler, **attributes):
+        """Serve handler on a free local port, with attributes set on the server - returns it and its URL"""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        for name, value in attributes.items():
+            setattr(server, name, value)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        self._servers.append((server, url))
+        return server, url
+
+    def stop(self):
+        for server, url in self._servers:
+            session_pool.close(url)
+            server.shutdown()
+            server.server_close()
+        self._servers.clear()
@@ -0,0 +1,172 @@
+#
+#  Test streaming archive upload and the chunked archive validator
+#
+import json
+
+import pytest
+
+from egeria_client.archive import (
+    ArchiveValidationError,
+    ArchiveValidator,
+    archive_chunks,
+    validate_archive,
+)
+from egeria_client.platform_services import Platform
+from tests.stub_server import StubHandler
+
+archive = {
+    "class": "OpenMetadataArchive",
+    "archiveProperties": {"archiveGUID": "a-1", "archiveName": "Content Pack é"},
+    "archiveInstanceStore": {
+        "entities": [
+            {"guid": f"guid-{i}", "version": i, "deleted": False, "rating": -1.5e3}
+            for i in range(200)
+        ]
+    },
+}
+
+
+@pytest.fixture()
+def archive_file(tmp_path):
+    path = tmp_path / "archive.json"
+    path.write_text(json.dumps(archive, indent=2), encoding="utf-8")
+    return path
+
+
+def _validate_in_pieces(text: str, size: int) -> dict:
+    validator = ArchiveValidator()
+    for i in range(0, len(text), size):
+        validator.feed(text[i : i + size])
+    return validator.close(())
+
+
+class TestArchiveValidator:
+    @pytest.mark.parametrize("size", [1, 3, 7, 4096])
+    def test_valid_json_in_any_chunking(self, size):
+        text = json.dumps(archive) + "\n"
+        summary = _validate_in_pieces(text, size)
+        assert summary["characters"] == len(text)
+        assert summary["top_level_keys"] == list(archive)
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            '{"a": 1,}',
+            '{"a" 1}',
+            '{"a": [1, 2}',
+            '{"a": tru}',
+            '{"a": 01}',
+            '{"a": "unterminated}',
+            '{"a": "bad \\x escape"}',
+            '{"a": 1} {"b": 2}',
+            '{"a": 1}}',
+            "[1 2]",
+            '{"a": "\\u12g4"}',
+        ],
+    )
+    def test_invalid_json(self, text):
+        with pytest.raises(ArchiveValidationError):
+            _validate_in_pieces(text, 2)
+        with pytest.raises(ValueError):
+            json.loads(text)
+
+    @pytest.mark.parametrize(
+        "text", ['{"s": "a\\"b\\\\c\\u00e9"}', "[]", "{}", "[null, true, 0.5, -0]"]
+    )
+    def test_edge_cases(self, text):
+        _validate_in_pieces(text, 1)
+
+    def test_error_offset(self):
+        with pytest.raises(ArchiveValidationError) as e:
+            _validate_in_pieces('{"a": 1,, "b": 2}', 4)
+        assert e.value.offset == 8
+
+    def test_validate_file(self, archive_file):
+        summary = validate_archive(archive_file, chunk_size=100)
+        assert summary["bytes"] == archive_file.stat().st_size
+        assert "archiveProperties" in summary["top_level_keys"]
+
+    def test_missing_archive_properties(self, tmp_path):
+        path = tmp_path / "bad.json"
+        path.write_text(
+            '{"class": "OpenMetadataArchive", "x": {"archiveProperties": 1}}'
+        )
+        with pytest.raises(ArchiveValidationError):
+            validate_archive(path)
+
+    def test_multibyte_characters_split_across_chunks(self, tmp_path):
+        path = tmp_path / "utf8.json"
+        path.write_text('{"archiveProperties": "ééé€"}', encoding="utf-8")
+        for size in range(1, 8):
+            validate_archive(path, chunk_size=size)
+
+
+class _ArchiveHandler(StubHandler):
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding") != "chunked":
+            return super()._read_body()
+        body = b""
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            if size == 0:
+                self.rfile.readline()
+                return body
+            body += self.rfile.read(size)
+            self.rfile.readline()
+
+    def do_POST(self):
+        self.server.requests.append(
+            (self.path, self.headers.get("Transfer-Encoding"), self._read_body())
+        )
+        self._reply(200)
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    return stub_server(_ArchiveHandler, requests=[])
+
+
+class TestLoadArchiveContent:
+    def test_streams_archive(self, local_platform, archive_file):
+        server, url = local_platform
+        progress = []
+        platform = Platform("cocoMDS1", url, "garygeeke")
+        response = platform.load_archive_content(
+            archive_file, chunk_size=1000, on_progress=lambda *p: progress.append(p)
+        )
+        assert response.status_code == 200
+        path, encoding, body = server.requests[0]
+        assert path.endswith(
+            "/users/garygeeke/server-platform/servers/cocoMDS1"
+            "/instance/open-metadata-archives/archive-content"
+        )
+        assert encoding == "chunked"
+        assert body == archive_file.read_bytes()
+        size = archive_file.stat().st_size
+        assert progress[-1] == (size, size)
+        assert len(progress) == -(-size // 1000)
+
+    def test_invalid_archive_is_not_sent(self, local_platform, tmp_path):
+        server, url = local_platform
+        path = tmp_path / "broken.json"
+        path.write_text('{"archiveProperties": {"archiveGUID": "a-1"')
+        platform = Platform("cocoMDS1", url, "garygeeke")
+        with pytest.raises(ArchiveValidationError):
+            platform.load_archive_content(path, "cocoMDS2")
+        assert server.requests == []
+
+    def test_load_archive_file_sends_file_name(self, local_platform):
+        server, url = local_platform
+        Platform("cocoMDS1", url, "garygeeke").load_archive_file(
+            "content-packs/CocoComboArchive.json"
+        )
+        path, _, body = server.requests[0]
+        assert path.endswith("/instance/open-metadata-archives/file")
+        assert json.loads(body) == "content-packs/CocoComboArchive.json"
+
+
+def test_archive_chunks_bounded(archive_file):
+    sizes = [len(c) for c in archive_chunks(archive_file, chunk_size=512)]
+    assert max(sizes) <= 512
+    assert sum(sizes) == archive_file.stat().st_size
@@ -0,0 +1,223 @@
+#
+#  Test the AssetConsumer client against a small local stand-in for the asset consumer OMAS
+#
+import re
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.cache import AssetCache
+from src.egeria_client.disk_cache import DiskCache
+from src.egeria_client.mock_platform import MockPlatform, SyntheticCatalog
+from src.egeria_client.session_pool import session_pool
+from src.egeria_client.tagging import TagNameMap
+from tests.stub_server import StubHandler
+
+asset_guids = [f"asset-{i:05d}" for i in range(250)]
+comments = [
+    {"comment": {"guid": f"comment-{i:03d}", "commentType": "STANDARD_COMMENT"}}
+    for i in range(120)
+]
+
+
+class _AssetConsumerHandler(StubHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        self.requests_seen.append(self.path)
+        if parts.path.endswith("/comments"):
+            start = int(query["elementStart"][0])
+            size = int(query["maxElements"][0])
+            page = comments[start : start + size]
+            self._reply(200, {"list": page or None})
+        elif re.search(r"/connected-asset/users/[^/]+/assets/asset-\d+$", parts.path):
+            guid = parts.path.rsplit("/", 1)[1]
+            asset = {
+                "elementHeader": {"guid": guid, "type": {"typeName": "DataSet"}},
+                "qualifiedName": "qn-" + guid,
+            }
+            self._reply(200, {"asset": asset})
+        elif re.search(r"/(meanings|tags)/[^/]+$", parts.path):
+            kind, guid = parts.path.rsplit("/", 2)[1:]
+            element = {"elementHeader": {"guid": guid}}
+            key = "meaning" if kind == "meanings" else "tag"
+            self._reply(200, {key: element})
+        else:
+            self._reply(404)
+
+    def do_POST(self):
+        self._read_body()
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        self.requests_seen.append(self.path)
+        if parts.path.endswith("/assets/by-search-string"):
+            start = int(query["startFrom"][0])
+            size = int(query["pageSize"][0])
+            page = asset_guids[start : start + size]
+            self._reply(200, {"guids": page or None})
+        elif parts.path.endswith("/comments"):
+            self._reply(200, {"guid": "comment-new"})
+        elif re.search(r"/(meanings|tags)/by-name$", parts.path):
+            key = "meanings" if "/meanings/" in parts.path else "tags"
+            self._reply(200, {key: [{"name": "x"}]})
+        elif re.search(r"/(likes|ratings|tags/[^/]+)(/delete)?$", parts.path):
+            self._reply(200)
+        else:
+            self._reply(404)
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    _AssetConsumerHandler.requests_seen = []
+    return stub_server(_AssetConsumerHandler)[1]
+
+
+class TestAssetConsumer:
+    @pytest.mark.parametrize(
+        "page_size, read_ahead, calls",
+        [(100, False, 4), (100, True, 4), (50, True, 6), (250, False, 2)],
+    )
+    def test_iter_assets(self, local_platform, page_size, read_ahead, calls):
+        consumer = AssetConsumer("cocoMDS1", local_platform, "garygeeke")
+        guids = list(
+            consumer.iter_assets(".*", page_size=page_size, read_ahead=read_ahead)
+        )
+        assert guids == asset_guids
+        assert len(_AssetConsumerHandler.requests_seen) == calls
+
+    def test_iter_assets_is_lazy(self, local_platform):
+        consumer = AssetConsumer("cocoMDS1", local_platform, "garygeeke")
+        assets = consumer.iter_assets(".*", page_size=100)
+        assert [next(assets) for _ in range(10)] == asset_guids[:10]
+        assert len(_AssetConsumerHandler.requests_seen) == 1
+        assets.close()
+
+    def test_iter_assets_page_size(self, local_platform):
+        consumer = AssetConsumer("cocoMDS1", local_platform, "garygeeke")
+        with pytest.raises(ValueError):
+            next(consumer.iter_assets(".*", page_size=0))
+
+    @pytest.mark.parametrize(
+        "start_from, max_elements, expected",
+        [(0, 0, 120), (0, 75, 75), (100, 0, 20), (100, 5, 5)],
+    )
+    def test_get_comments_pages(
+        self, local_platform, start_from, max_elements, expected
+    ):
+        consumer = AssetConsumer("cocoMDS1", local_platform, "garygeeke")
+        comment_list = consumer.get_comments(
+            "asset-00001", start_from=start_from, max_elements=max_elements
+        )
+        assert len(comment_list) == expected
+        assert comment_list[0].comment_guid == f"comment-{start_from:03d}"
+
+    def test_asset_lookups_are_cached(self, local_platform):
+        cache = AssetCache(max_entries=10, ttl=60)
+        consumer = AssetConsumer("cocoMDS1", local_platform, "garygeeke", cache=cache)
+        asset = consumer.get_asset_properties("asset-00001")
+        universe = consumer.get_asset_universe("asset-00001")
+        assert asset["qualifiedName"] == "qn-asset-00001"
+        assert universe.guid == "asset-00001"
+        assert len(_AssetConsumerHandler.requests_seen) == 1
+        assert cache.stats()["hits"] == 1
+
+        consumer.get_asset_properties("asset-00001", end_user_id="erinoverview")
+        assert len(_AssetConsumerHandler.requests_seen) == 2
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda c: c.add_comment_to_asset(
+                "asset-00001", "nice", "STANDARD_COMMENT", True
+            ),
+            lambda c: c.add_like("asset-00001", True),
+            lambda c: c.remove_like("asset-00001"),
+            lambda c: c.add_rating("asset-00001", "FIVE_STARS", "great", True),
+            lambda c: c.remove_rating("asset-00001"),
+            lambda c: c.add_tag("asset-00001", "tag-1", True),
+            lambda c: c.remove_tag("asset-00001", "tag-1"),
+            lambda c: c.remove_tag_from_element("asset-00001", "element-1", "tag-1"),
+        ],
+    )
+    def test_mutation_invalidates_asset(self, local_platform, mutate):
+        cache = AssetCache()
+        consumer = AssetConsumer("cocoMDS1", local_platform, "garygeeke", cache=cache)
+        other_user = AssetConsumer(
+            "cocoMDS1", local_platform, "erinoverview", cache=cache
+        )
+        consumer.get_asset_universe("asset-00001")
+        other_user.get_asset_universe("asset-00001")
+        consumer.get_asset_universe("asset-00002")
+        mutate(consumer)
+        assert len(cache) == 1
+        consumer.get_asset_universe("asset-00002")
+        assert cache.stats()["hits"] == 1
+
+    def test_no_cache(self, local_platform):
+        consumer = AssetConsumer("cocoMDS1", local_platform, "garygeeke")
+        consumer.get_asset_properties("asset-00001")
+        consumer.get_asset_properties("asset-00001")
+        assert len(_AssetConsumerHandler.requests_seen) == 2
+
+    def test_lookups_use_disk_cache(self, local_platform, tmp_path):
+        path = str(tmp_path / "platform.sqlite")
+        consumer = AssetConsumer(
+            "cocoMDS1", local_platform, "garygeeke", disk_cache=DiskCache(path)
+        )
+        for _ in range(2):
+            assert consumer.get_meaning("term-1")["elementHeader"]["guid"] == "term-1"
+            assert consumer.get_tag("tag-1")["elementHeader"]["guid"] == "tag-1"
+            assert consumer.get_meaning_by_name("Customer") == [{"name": "x"}]
+            assert consumer.get_tags_by_name("pii") == [{"name": "x"}]
+        assert len(_AssetConsumerHandler.requests_seen) == 4
+
+        restarted = AssetConsumer(
+            "cocoMDS1", local_platform, "garygeeke", disk_cache=DiskCache(path)
+        )
+        restarted.get_meaning("term-1")
+        assert len(_AssetConsumerHandler.requests_seen) == 4
+
+    def test_tag_changes_invalidate_name_lookups(self, tmp_path):
+        path = str(tmp_path / "platform.sqlite")
+        with MockPlatform(SyntheticCatalog(asset_count=10, tag_count=0)) as platform:
+            consumer = AssetConsumer(
+                "cocoMDS1", platform.url, "garygeeke", disk_cache=DiskCache(path)
+            )
+            assert consumer.get_tags_by_name("x") is None
+            guid = consumer.create_public_tag("x", "first")
+            assert [
+                t["informalTagProperties"]["description"]
+                for t in consumer.get_tags_by_name("x")
+            ] == ["first"]
+            consumer.update_tag_description(guid, "second")
+            assert [
+                t["informalTagProperties"]["description"]
+                for t in consumer.get_tags_by_name("x")
+            ] == ["second"]
+            consumer.delete_tag(guid)
+            assert consumer.get_tags_by_name("x") is None
+
+            for _ in range(2):
+                restarted = AssetConsumer(
+                    "cocoMDS1", platform.url, "garygeeke", disk_cache=DiskCache(path)
+                )
+                TagNameMap(restarted).resolve("nightly")
+            assert len(consumer.find_tags("nightly")) == 1
+            session_pool.close(platform.url)
+
+    def test_warm_disk_cache(self, local_platform):
+        cache = DiskCache(":memory:")
+        consumer = AssetConsumer(
+            "cocoMDS1", local_platform, "garygeeke", disk_cache=cache
+        )
+        consumer.get_meaning("term-1")
+        fetched = consumer.warm_disk_cache(
+            term_guids=["term-1", "term-2", "term-3"], tag_guids=["tag-1"]
+        )
+        assert fetched == 3
+        assert consumer.warm_disk_cache(term_guids=["term-2"]) == 0
+        consumer.get_tag("tag-1")
+        assert len(_AssetConsumerHandler.requests_seen) == 4
@@ -0,0 +1,89 @@
+#
+#  Test the breadth-first asset universe crawler
+#
+import re
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+from src.egeria_client.asset_crawler import AssetUniverseCrawler
+from tests.stub_server import StubHandler
+
+# a0 -> a1, a2 ; a1 -> a3, a0 ; a2 -> a3 ; a3 -> a4 ; a4 -> (none)
+related = {
+    "a0": ["a1", "a2"],
+    "a1": ["a3", "a0"],
+    "a2": ["a3"],
+    "a3": ["a4"],
+    "a4": [],
+}
+
+
+class _ConnectedAssetHandler(StubHandler):
+    assets_retrieved = []
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        match = re.search(r"/assets/([^/]+)(/related-assets)?$", parts.path)
+        guid = match.group(1) if match else None
+        if guid not in related:
+            self._reply(404)
+        elif match.group(2):
+            query = parse_qs(parts.query)
+            start = int(query["elementStart"][0])
+            size = int(query["maxElements"][0])
+            page = [
+                {"relatedAsset": {"elementHeader": {"guid": g}}}
+                for g in related[guid][start : start + size]
+            ]
+            self._reply(200, {"list": page or None})
+        else:
+            self.assets_retrieved.append(guid)
+            asset = {
+                "elementHeader": {"guid": guid, "type": {"typeName": "DataSet"}},
+                "qualifiedName": "qn-" + guid,
+            }
+            self._reply(200, {"asset": asset})
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    _ConnectedAssetHandler.assets_retrieved = []
+    return stub_server(_ConnectedAssetHandler)[1]
+
+
+class TestAssetUniverseCrawler:
+    @pytest.mark.parametrize(
+        "max_depth, expected",
+        [
+            (0, {"a0": 0}),
+            (1, {"a0": 0, "a1": 1, "a2": 1}),
+            (3, {"a0": 0, "a1": 1, "a2": 1, "a3": 2, "a4": 3}),
+        ],
+    )
+    def test_crawl_depth(self, local_platform, max_depth, expected):
+        crawler = AssetUniverseCrawler(
+            "cocoMDS1", local_platform, "garygeeke", max_workers=3, max_depth=max_depth
+        )
+        universes = list(crawler.crawl(["a0"]))
+        assert {u.guid: u.depth for u in universes} == expected
+        assert sorted(_ConnectedAssetHandler.assets_retrieved) == sorted(expected)
+
+    def test_crawl_deduplicates(self, local_platform):
+        crawler = AssetUniverseCrawler(
+            "cocoMDS1", local_platform, "garygeeke", max_depth=5
+        )
+        universes = list(crawler.crawl(["a0", "a2", "a0"]))
+        guids = [u.guid for u in universes]
+        assert sorted(guids) == ["a0", "a1", "a2", "a3", "a4"]
+        assert universes[0].qualified_name in ("qn-a0", "qn-a2")
+
+    def test_crawl_max_assets(self, local_platform):
+        crawler = AssetUniverseCrawler(
+            "cocoMDS1", local_platform, "garygeeke", max_depth=5, max_assets=2
+        )
+        assert len(list(crawler.crawl(["a0"]))) == 2
+
+    def test_crawl_skips_missing_assets(self, local_platform):
+        crawler = AssetUniverseCrawler("cocoMDS1", local_platform, "garygeeke")
+        assert [u.guid for u in crawler.crawl(["nonesuch", "a4"])] == ["a4"]
@@ -0,0 +1,184 @@
+#
+#  Test the bulk registration of data files
+#
+import json
+import os
+import re
+import threading
+import time
+
+import pytest
+
+from src.egeria_client.asset_owner import AssetOwner
+from src.egeria_client.asset_registrar import (
+    AssetRegistrar,
+    read_manifest,
+    sniff_csv_header,
+    walk_files,
+)
+from src.egeria_client.mock_platform import MockPlatform, SyntheticCatalog
+from src.egeria_client.retry import RetryPolicy
+from src.egeria_client.session_pool import session_pool
+from tests.stub_server import StubHandler
+
+fast_retries = RetryPolicy(max_attempts=3, backoff_base=0, jitter=False)
+
+
+class _AssetOwnerHandler(StubHandler):
+    def do_POST(self):
+        state = self.server.state
+        body = json.loads(self._read_body())
+        with state["lock"]:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        time.sleep(0.02)
+        with state["lock"]:
+            state["active"] -= 1
+            if os.path.basename(body["fullPath"]) in state["broken"]:
+                self._reply(400)
+                return
+            state["created"].append((self.path.rsplit("/", 1)[1], body))
+            guid = f"guid-{len(state['created'])}"
+        self._reply(200, {"guids": [guid, guid + "-schema"]})
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    server, url = stub_server(
+        _AssetOwnerHandler,
+        state={
+            "lock": threading.Lock(),
+            "active": 0,
+            "max_active": 0,
+            "created": [],
+            "broken": set(),
+        },
+    )
+    return server.state, AssetOwner("cocoMDS1", url, "erinoverview")
+
+
+@pytest.fixture()
+def landing_zone(tmp_path):
+    for day in ("2023-01-01", "2023-01-02"):
+        (tmp_path / day).mkdir()
+        for n in range(5):
+            (tmp_path / day / f"week{n}.csv").write_text(
+                '"id",name , "unit price"\n' + "1,a,2.0\n" * 1000
+            )
+        (tmp_path / day / "events.avro").write_bytes(b"Obj\x01")
+        (tmp_path / day / "notes.txt").write_text("not a data file")
+    return tmp_path
+
+
+class TestAssetRegistrar:
+    @pytest.mark.parametrize(
+        "content, headers",
+        [
+            ('"id",name , "unit price"\n1,a,2.0\n', ["id", "name", "unit price"]),
+            ("\ufeffa;b,c\r\n", ["a;b", "c"]),
+            ("", []),
+        ],
+    )
+    def test_sniff_csv_header(self, tmp_path, content, headers):
+        path = tmp_path / "data.csv"
+        path.write_text(content, encoding="utf-8")
+        assert sniff_csv_header(str(path)) == headers
+
+    def test_walk_and_manifest(self, landing_zone):
+        files = list(walk_files(str(landing_zone)))
+        assert len(files) == 12
+        assert files[0].endswith(os.path.join("2023-01-01", "events.avro"))
+        manifest = landing_zone / "files.txt"
+        manifest.write_text("# today\n2023-01-02/week1.csv\n\n")
+        assert list(read_manifest(str(manifest))) == [
+            os.path.join(str(landing_zone), "2023-01-02/week1.csv")
+        ]
+
+    def test_register_tree(self, local_platform, landing_zone):
+        state, owner = local_platform
+        with AssetRegistrar(
+            owner, str(landing_zone / "registered.jsonl"), max_workers=4
+        ) as registrar:
+            report = registrar.register_tree(str(landing_zone))
+            assert report.summary()["succeeded"] == 12
+            assert 1 < state["max_active"] <= 4
+            csv_file = str(landing_zone / "2023-01-01" / "week3.csv")
+            assert registrar.registered(csv_file).startswith("guid-")
+        created = {body["fullPath"]: (kind, body) for kind, body in state["created"]}
+        kind, body = created[csv_file]
+        assert kind == "csv"
+        assert body["displayName"] == "week3.csv"
+        assert body["columnHeaders"] == ["id", "name", "unit price"]
+        kind, body = created[str(landing_zone / "2023-01-02" / "events.avro")]
+        assert kind == "avro" and "columnHeaders" not in body
+
+    def test_skips_registered_files(self, local_platform, landing_zone):
+        state, owner = local_platform
+        state["broken"].add("week2.csv")
+        manifest = str(landing_zone / "registered.jsonl")
+        with AssetRegistrar(
+            owner, manifest, retry_policy=RetryPolicy(max_attempts=1)
+        ) as registrar:
+            report = registrar.register_tree(str(landing_zone))
+        assert report.summary()["failed"] == 2
+        assert len(state["created"]) == 10
+
+        state["broken"].clear()
+        with AssetRegistrar(owner, manifest) as registrar:
+            report = registrar.register_tree(str(landing_zone))
+            assert len(registrar) == 12
+        summary = report.summary()
+        assert summary["resumed"] == 10 and summary["succeeded"] == 12
+        assert len(state["created"]) == 12
+
+
+class TestRegistrationRetries:
+    @pytest.fixture()
+    def mock_platform(self):
+        platform = MockPlatform(SyntheticCatalog(asset_count=10))
+        url = platform.start()
+        yield platform, AssetOwner("cocoMDS1", url, "erinoverview")
+        session_pool.close(url)
+        platform.stop()
+
+    def _assets(self, platform, path) -> list:
+        return platform.catalog.search_assets(re.escape(str(path)), 0, 100) or []
+
+    @pytest.mark.parametrize("status", [503, 502, 500])
+    def test_lost_response_is_found_before_retry(
+        self, mock_platform, landing_zone, monkeypatch, status
+    ):
+        platform, owner = mock_platform
+        create = owner.create_data_file_asset
+        lost = []
+
+        def create_once(*args, **kwargs):
+            guids = create(*args, **kwargs)
+            if not lost:
+                lost.append(guids[0])
+                raise ConnectionError(json.dumps({"relatedHTTPCode": status}))
+            return guids
+
+        monkeypatch.setattr(owner, "create_data_file_asset", create_once)
+        path = landing_zone / "2023-01-01" / "week1.csv"
+        with AssetRegistrar(
+            owner, str(landing_zone / "registered.jsonl"), retry_policy=fast_retries
+        ) as registrar:
+            report = registrar.register([str(path)], keep_results=True)
+            assert report.results[0].attempts == 2
+            assert registrar.registered(str(path)) == lost[0]
+        assert len(self._assets(platform, path)) == 1
+
+    def test_read_timeout_is_not_retried(self, mock_platform, landing_zone):
+        platform, owner = mock_platform
+        platform.route_latency = {"create_data_file_asset": 0.5}
+        owner.timeout = 0.2
+        path = landing_zone / "2023-01-01" / "week1.csv"
+        with AssetRegistrar(
+            owner, str(landing_zone / "registered.jsonl"), retry_policy=fast_retries
+        ) as registrar:
+            report = registrar.register([str(path)], keep_results=True)
+        assert report.results[0].attempts == 1
+        assert "ReadTimeout" in report.results[0].error
+        time.sleep(0.5)
+        assert len(self._assets(platform, path)) == 1
@@ -0,0 +1,85 @@
+#
+#  Test the asyncio clients
+#
+import asyncio
+import json
+
+import pytest
+
+from egeria_client.async_client import AsyncClient, AsyncPlatform, AsyncAssetConsumer
+from src.egeria_client.mock_platform import MockPlatform, SyntheticCatalog
+from src.egeria_client.session_pool import session_pool
+from src.egeria_client.util_exp import InvalidParameterException
+from tests.stub_server import StubHandler
+
+
+class _PlatformHandler(StubHandler):
+    def do_GET(self):
+        if self.path.endswith("/server-platform/servers"):
+            self._reply(200, {"result": ["cocoMDS1"]})
+        else:
+            self._reply(404)
+
+    def do_POST(self):
+        body = json.loads(self._read_body() or b"{}")
+        self._reply(200, {"guids": [body.get("searchString")]})
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    return stub_server(_PlatformHandler)[1]
+
+
+class TestAsyncClient:
+    def test_gather_list_servers(self, local_platform):
+        async def sweep():
+            platforms = [
+                AsyncPlatform(f"server{i}", local_platform, "garygeeke")
+                for i in range(20)
+            ]
+            return await asyncio.gather(*(p.list_servers() for p in platforms))
+
+        results = asyncio.run(sweep())
+        assert len(results) == 20
+        assert all(r["result"] == ["cocoMDS1"] for r in results)
+
+    def test_make_request_error_mapping(self, local_platform):
+        client = AsyncClient("meow", local_platform, "garygeeke")
+        with pytest.raises(InvalidParameterException):
+            asyncio.run(client.make_request("GET", local_platform + "/nonesuch"))
+
+    def test_find_assets(self, local_platform):
+        consumer = AsyncAssetConsumer("cocoMDS1", local_platform, "garygeeke")
+
+        async def search():
+            return await asyncio.gather(
+                *(consumer.find_assets(f"asset{i}") for i in range(10))
+            )
+
+        results = asyncio.run(search())
+        assert results == [[f"asset{i}"] for i in range(10)]
+
+    def test_tag_methods(self):
+        with MockPlatform(SyntheticCatalog(asset_count=10)) as platform:
+            consumer = AsyncAssetConsumer("cocoMDS1", platform.url, "garygeeke")
+            asset = platform.catalog.search_assets(".*", 0, 1)[0]["elementHeader"]
+            asset_guid = asset["guid"]
+
+            async def tag():
+                tag_guid = await consumer.create_private_tag("mine", "my tag")
+                await consumer.add_tag_to_element(asset_guid, tag_guid, False)
+                tagged = await consumer.get_assets_by_tag(tag_guid)
+                mine = await consumer.get_my_tags_by_name("mine")
+                await consumer.remove_tag_from_element(asset_guid, asset_guid, tag_guid)
+                return (
+                    tag_guid,
+                    tagged,
+                    mine,
+                    await consumer.get_assets_by_tag(tag_guid),
+                )
+
+            tag_guid, tagged, mine, untagged = asyncio.run(tag())
+            session_pool.close(platform.url)
+        assert tagged == [asset_guid]
+        assert [t["elementHeader"]["guid"] for t in mine] == [tag_guid]
+        assert untagged is None
@@ -0,0 +1,114 @@
+#
+#  Test the benchmark harness and the client benchmarks
+#
+import json
+
+import pytest
+
+from benchmarks import bench_client
+from benchmarks.harness import (
+    BenchmarkResult,
+    compare,
+    load_baseline,
+    percentile,
+    run_benchmark,
+    save_baseline,
+)
+from src.egeria_client.mock_platform import MockPlatform, SyntheticCatalog
+from src.egeria_client.session_pool import session_pool
+
+
+def _result(name="find", p50=1.0, p95=2.0, rps=100.0, alloc=10.0) -> BenchmarkResult:
+    return BenchmarkResult(name, 100, 0, p50, p50, p95, p95, rps, 4, alloc, 0.0)
+
+
+@pytest.fixture()
+def mock_platform_url():
+    platform = MockPlatform(SyntheticCatalog(asset_count=2000, term_count=10))
+    url = platform.start()
+    yield url
+    session_pool.close(url)
+    platform.stop()
+
+
+class TestHarness:
+    @pytest.mark.parametrize(
+        "fraction, expected", [(0.5, 50), (0.95, 95), (0.99, 99), (1.0, 100), (0, 1)]
+    )
+    def test_percentile(self, fraction, expected):
+        assert percentile(list(range(1, 101)), fraction) == expected
+        assert percentile([], fraction) == 0.0
+
+    def test_run_benchmark(self):
+        calls, kept = [0], []
+
+        def call():
+            calls[0] += 1
+            kept[:] = [bytearray(64 * 1024)]
+            if calls[0] % 10 == 0:
+                raise ConnectionError("every tenth call fails")
+
+        result = run_benchmark(
+            "list",
+            call,
+            iterations=50,
+            warmup=0,
+            concurrency=2,
+            duration=0.05,
+            alloc_calls=5,
+        )
+        assert result.p50_ms <= result.p95_ms <= result.p99_ms
+        assert result.errors >= 5 and result.rps > 0
+        assert result.alloc_kib_per_call >= 64
+        assert result.retained_kib < 5 * 64
+
+    def test_compare(self, tmp_path):
+        path = str(tmp_path / "baseline.json")
+        save_baseline(path, [_result(), _result("tags")], {"iterations": 100})
+        baseline = load_baseline(path)
+        assert baseline["find"] == _result()
+        assert compare([_result(p50=1.2, rps=80)], baseline, 0.25) == []
+
+        regressions = compare(
+            [_result(p95=3.0, rps=50), _result("tags", alloc=20), _result("new")],
+            baseline,
+            0.25,
+        )
+        assert [(r.name, r.metric) for r in regressions] == [
+            ("find", "p95_ms"),
+            ("find", "rps"),
+            ("tags", "alloc_kib_per_call"),
+        ]
+        assert str(regressions[0]) == "find: p95_ms 2.000 -> 3.000 (+50%)"
+
+
+class TestClientBenchmarks:
+    def test_hot_paths(self, mock_platform_url):
+        benchmarks = bench_client.hot_paths(mock_platform_url, assets=2000)
+        assert {
+            "client.make_request",
+            "util.issue_get",
+            "util.issue_post",
+            "consumer.find_assets",
+            "consumer.get_comments",
+            "consumer.add_tag",
+            "platform.get_server_status",
+        } <= set(benchmarks)
+        for call in benchmarks.values():
+            call()
+
+    def test_main_saves_and_compares(self, mock_platform_url, tmp_path, capsys):
+        path = str(tmp_path / "baseline.json")
+        args = ["--url", mock_platform_url, "--only", "consumer.find_assets"]
+        args += ["--iterations", "20", "--warmup", "2", "--concurrency", "2"]
+        args += ["--duration", "0.1", "--alloc-calls", "2"]
+        assert bench_client.main(args + ["--save", path]) == 0
+        assert "consumer.find_assets" in capsys.readouterr().out
+
+        with open(path) as f:
+            baseline = json.load(f)
+        baseline["results"]["consumer.find_assets"]["p50_ms"] /= 1000
+        with open(path, "w") as f:
+            json.dump(baseline, f)
+        assert bench_client.main(args + ["--baseline", path]) == 1
+        assert "REGRESSION consumer.find_assets: p50_ms" in capsys.readouterr().out
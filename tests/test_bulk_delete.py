@@ -0,0 +1,136 @@
+#
+#  Test the bulk deletion of assets
+#
+import json
+import re
+import threading
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+from src.egeria_client.asset_owner import AssetOwner
+from src.egeria_client.bulk_delete import BulkDeleter
+from src.egeria_client.retry import RetryPolicy
+from tests.stub_server import StubHandler
+
+
+class _AssetOwnerHandler(StubHandler):
+    def do_POST(self):
+        state = self.server.state
+        body = self._read_body().decode()
+        path = urlsplit(self.path).path
+        with state["lock"]:
+            if path.endswith("/assets/by-search-string"):
+                query = parse_qs(urlsplit(self.path).query)
+                start, size = int(query["startFrom"][0]), int(query["pageSize"][0])
+                state["searches"] += 1
+                matches = [
+                    {
+                        "elementHeader": {"guid": guid},
+                        "assetProperties": {"qualifiedName": name},
+                    }
+                    for guid, name in state["assets"].items()
+                    if re.search(body, name)
+                ]
+                self._reply(200, {"assets": matches[start : start + size] or None})
+                return
+            guid = path.split("/")[-2]
+            if guid in state["protected"]:
+                self._reply(403)
+                return
+            if state["assets"].pop(guid, None) is None:
+                self._reply(404)
+                return
+            state["deleted"] += 1
+            if guid in state["lost"]:
+                state["lost"].discard(guid)
+                self._reply(503)
+                return
+        self._reply(200)
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    assets = {f"guid-{n}": f"test-asset-{n}" for n in range(250)}
+    assets["guid-keep"] = "production-asset"
+    server, url = stub_server(
+        _AssetOwnerHandler,
+        state={
+            "lock": threading.Lock(),
+            "assets": assets,
+            "protected": set(),
+            "lost": set(),
+            "searches": 0,
+            "deleted": 0,
+        },
+    )
+    return server.state, AssetOwner("cocoMDS1", url, "erinoverview")
+
+
+def _audit(path) -> list:
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestBulkDeleter:
+    def test_dry_run(self, local_platform, tmp_path):
+        state, owner = local_platform
+        audit = tmp_path / "audit.jsonl"
+        deleter = BulkDeleter(owner, page_size=40)
+        report = deleter.delete("^test-", dry_run=True, audit_log_path=str(audit))
+        assert report.counts["matched"] == 250
+        assert deleter.count("^test-") == 250
+        assert state["deleted"] == 0
+        entries = _audit(audit)
+        assert {e["action"] for e in entries} == {"dry-run"}
+        assert entries[0]["qualifiedName"] == "test-asset-0"
+
+    def test_deletes_every_match(self, local_platform, tmp_path):
+        state, owner = local_platform
+        audit = tmp_path / "audit.jsonl"
+        report = BulkDeleter(owner, max_workers=8, page_size=40).delete(
+            "^test-", audit_log_path=str(audit)
+        )
+        summary = report.summary()
+        assert summary["succeeded"] == summary["matched"] == 250
+        assert summary["remaining"] == 0
+        # the search is read from the start after each page, and once more to find it empty
+        assert summary["searches"] == state["searches"] == 250 // 40 + 2
+        assert list(state["assets"]) == ["guid-keep"]
+        entries = _audit(audit)
+        assert len(entries) == 250
+        assert {e["guid"] for e in entries} == {f"guid-{n}" for n in range(250)}
+
+    def test_failed_deletes_are_audited(self, local_platform, tmp_path):
+        state, owner = local_platform
+        state["protected"].update({"guid-3", "guid-77"})
+        audit = tmp_path / "audit.jsonl"
+        report = BulkDeleter(
+            owner, page_size=40, retry_policy=RetryPolicy(max_attempts=1)
+        ).delete("^test-", audit_log_path=str(audit))
+        assert sorted(r.key for r in report.failed()) == ["guid-3", "guid-77"]
+        assert report.counts["remaining"] == 2
+        assert sorted(state["assets"]) == ["guid-3", "guid-77", "guid-keep"]
+        failed = [e for e in _audit(audit) if e["action"] == "failed"]
+        assert {e["qualifiedName"] for e in failed} == {
+            "test-asset-3",
+            "test-asset-77",
+        }
+
+    def test_lost_response(self, local_platform):
+        state, owner = local_platform
+        state["lost"].update({"guid-5", "guid-6"})
+        report = BulkDeleter(
+            owner, retry_policy=RetryPolicy(max_attempts=3, backoff_base=0)
+        ).delete("^test-")
+        summary = report.summary()
+        assert summary["succeeded"] == 250 and summary["retries"] == 2
+        assert state["deleted"] == 250
+
+    def test_rate_limit(self, local_platform):
+        state, owner = local_platform
+        state["assets"] = {f"guid-{n}": f"test-asset-{n}" for n in range(10)}
+        deleter = BulkDeleter(owner, max_workers=8, rate_limit=50)
+        report = deleter.delete("^test-")
+        assert report.summary()["succeeded"] == 10
+        assert report.elapsed >= 0.15
@@ -0,0 +1,281 @@
+#
+#  Test bulk execution and bulk comment ingestion
+#
+import json
+import re
+import threading
+import time
+
+import pytest
+import requests
+
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.bulk_ops import (
+    BulkCheckpoint,
+    RateLimiter,
+    resend_after_lookup,
+    run_bulk,
+    safe_to_resend,
+)
+from src.egeria_client.mock_platform import MockPlatform, SyntheticCatalog
+from src.egeria_client.retry import RetryPolicy
+from src.egeria_client.session_pool import session_pool
+from tests.stub_server import StubHandler
+
+fast_retries = RetryPolicy(max_attempts=3, backoff_base=0, jitter=False)
+
+
+class _CommentHandler(StubHandler):
+    def do_POST(self):
+        body = json.loads(self._read_body())
+        state = self.server.state
+        with state["lock"]:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+            state["posts"].append((self.path, body["commentText"]))
+            failures = state["failures"].get(body["commentText"], 0)
+            if failures:
+                state["failures"][body["commentText"]] = failures - 1
+            guid = f"comment-{len(state['posts'])}"
+        time.sleep(0.02)
+        with state["lock"]:
+            state["active"] -= 1
+        if failures:
+            self._reply(503)
+        elif re.search(r"/comments(/[^/]+/replies)?$", self.path):
+            self._reply(200, {"guid": guid})
+        else:
+            self._reply(200)
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    server, url = stub_server(
+        _CommentHandler,
+        state={
+            "lock": threading.Lock(),
+            "active": 0,
+            "max_active": 0,
+            "posts": [],
+            "failures": {},
+        },
+    )
+    return server.state, AssetConsumer("cocoMDS1", url, "garygeeke")
+
+
+class TestRunBulk:
+    def test_results_in_input_order(self):
+        def slow_square(n):
+            time.sleep(0.01 * (5 - n % 5))
+            return n * n
+
+        report = run_bulk(iter(range(20)), slow_square, max_workers=4)
+        assert report.values() == [n * n for n in range(20)]
+        assert [r.key for r in report.results] == [str(n) for n in range(20)]
+
+    def test_retries_only_transient_errors(self):
+        calls = {"flaky": 0, "bad": 0}
+
+        def operation(name):
+            calls[name] += 1
+            if name == "flaky" and calls[name] < 3:
+                raise ConnectionError("server restarting")
+            if name == "bad":
+                raise ValueError("not a valid comment type")
+            return name
+
+        report = run_bulk(["flaky", "bad"], operation, retry_policy=fast_retries)
+        assert calls == {"flaky": 3, "bad": 1}
+        assert report.results[0].ok and report.results[0].attempts == 3
+        assert report.results[1].error == "ValueError: not a valid comment type"
+        assert report.summary()["retries"] == 2
+
+    def test_retry_on_function(self):
+        calls = []
+
+        def operation(n):
+            calls.append(n)
+            raise ConnectionError(json.dumps({"relatedHTTPCode": 400 + 103 * n}))
+
+        report = run_bulk(
+            [0, 1], operation, retry_policy=fast_retries, retry_on=safe_to_resend
+        )
+        assert sorted(calls) == [0, 1, 1, 1]
+        assert [r.attempts for r in report.results] == [1, 3]
+
+    def test_safe_to_resend(self):
+        with pytest.raises(requests.ConnectionError) as refused:
+            requests.get("http://127.0.0.1:9", timeout=1)
+        assert safe_to_resend(refused.value)
+        assert safe_to_resend(requests.ConnectTimeout())
+        assert not safe_to_resend(requests.ReadTimeout())
+        assert not safe_to_resend(requests.ConnectionError("Connection aborted."))
+        assert not safe_to_resend(ConnectionError("not json"))
+        assert not safe_to_resend(ValueError("not a valid comment type"))
+
+    @pytest.mark.parametrize(
+        "status, resend, after_lookup",
+        [(503, True, True), (429, True, True), (502, False, True), (504, False, True)]
+        + [(500, False, True), (404, False, False)],
+    )
+    def test_resend_statuses(self, status, resend, after_lookup):
+        error = ConnectionError(json.dumps({"relatedHTTPCode": status}))
+        assert safe_to_resend(error) == resend
+        assert resend_after_lookup(error) == after_lookup
+        assert not resend_after_lookup(requests.ReadTimeout())
+
+    def test_checkpoint_resume(self, tmp_path):
+        path = tmp_path / "checkpoint.jsonl"
+        calls = []
+
+        def operation(n):
+            calls.append(n)
+            if n == 3:
+                raise ValueError("rejected")
+            return f"guid-{n}"
+
+        run_bulk(range(5), operation, checkpoint=str(path))
+        with open(path, "a") as f:
+            f.write('{"key": "3", "val')  # a line cut short by a crash
+        calls.clear()
+        report = run_bulk(range(5), lambda n: f"guid-{n}", checkpoint=str(path))
+        assert report.values() == [f"guid-{n}" for n in range(5)]
+        assert [r.resumed for r in report.results] == [True, True, True, False, True]
+        assert len(BulkCheckpoint(str(path))) == 5
+
+    def test_max_workers(self):
+        with pytest.raises(ValueError):
+            run_bulk([1], str, max_workers=0)
+
+    def test_rate_limiter(self):
+        clock = {"now": 0.0}
+        sleeps = []
+
+        def sleep(delay):
+            sleeps.append(delay)
+
+        limiter = RateLimiter(10, burst=2, sleep=sleep, clock=lambda: clock["now"])
+        for _ in range(4):
+            limiter.acquire()
+        assert sleeps == pytest.approx([0.1, 0.2])
+        clock["now"] = 1.0
+        limiter.acquire()
+        assert len(sleeps) == 2
+
+    def test_rate_limit(self):
+        start = time.perf_counter()
+        report = run_bulk(range(10), str, max_workers=8, rate_limit=50)
+        assert report.summary()["succeeded"] == 10
+        assert time.perf_counter() - start >= 0.15
+
+
+class TestBulkComments:
+    def test_bulk_comments(self, local_platform):
+        state, consumer = local_platform
+        specs = [
+            {
+                "asset_guid": f"asset-{i}",
+                "comment_text": f"text-{i}",
+                "key": f"wiki-{i}",
+            }
+            for i in range(30)
+        ]
+        report = consumer.bulk_comments(specs, max_workers=5)
+        assert len(state["posts"]) == 30
+        assert 1 < state["max_active"] <= 5
+        assert all(r.ok for r in report.results)
+        assert [r.key for r in report.results] == [s["key"] for s in specs]
+        assert len(set(report.values())) == 30
+
+    def test_replies_wait_for_their_comment(self, local_platform):
+        state, consumer = local_platform
+        specs = [
+            {
+                "key": "reply",
+                "reply_to": "parent",
+                "asset_guid": "a",
+                "comment_text": "r",
+            },
+            {"key": "parent", "asset_guid": "a", "comment_text": "p"},
+            {
+                "action": "update",
+                "asset_guid": "a",
+                "comment_guid": "comment-9",
+                "comment_text": "u",
+                "comment_type": "QUESTION",
+            },
+        ]
+        report = consumer.bulk_comments(specs)
+        parent_guid = report.results[1].value
+        assert report.results[2].value == "comment-9"
+        assert any(
+            path.endswith(f"/comments/{parent_guid}/replies")
+            for path, _ in state["posts"]
+        )
+        assert [r.index for r in report.results] == [0, 1, 2]
+
+    def test_failed_parent_fails_reply(self, local_platform):
+        state, consumer = local_platform
+        specs = [
+            {"key": "p", "asset_guid": "a", "comment_text": "p", "comment_type": "BAD"},
+            {"key": "r", "reply_to": "p", "asset_guid": "a", "comment_text": "r"},
+        ]
+        report = consumer.bulk_comments(specs, retry_policy=fast_retries)
+        assert not report.results[0].ok and "BAD" in report.results[0].error
+        assert "failed" in report.results[1].error
+        assert state["posts"] == []
+
+    def test_resume_after_failures(self, local_platform, tmp_path):
+        state, consumer = local_platform
+        path = str(tmp_path / "comments.jsonl")
+        specs = [{"asset_guid": "a", "comment_text": f"t{i}"} for i in range(6)]
+        state["failures"] = {"t2": 1, "t4": 5}
+        report = consumer.bulk_comments(
+            specs, checkpoint_path=path, retry_policy=fast_retries
+        )
+        assert report.results[2].ok and report.results[2].attempts == 2
+        assert not report.results[4].ok
+        first_run = report.values()
+
+        state["posts"].clear()
+        report = consumer.bulk_comments(specs, checkpoint_path=path)
+        assert [text for _, text in state["posts"]] == ["t4"]
+        assert report.values()[:4] == first_run[:4]
+        assert report.summary()["resumed"] == 5
+
+
+class TestBulkCommentRetries:
+    asset = "00000001-0000-4000-8000-000000000007"
+
+    @pytest.fixture()
+    def mock_platform(self):
+        platform = MockPlatform(SyntheticCatalog(asset_count=10, comments_per_asset=0))
+        url = platform.start()
+        yield platform, AssetConsumer("cocoMDS1", url, "garygeeke")
+        session_pool.close(url)
+        platform.stop()
+
+    def _comments(self, platform) -> list:
+        return platform.catalog.comments(self.asset, 0, 100)
+
+    def test_read_timeout_is_not_retried(self, mock_platform):
+        platform, consumer = mock_platform
+        platform.route_latency = {"add_comment": 0.5}
+        consumer.timeout = 0.2
+        specs = [{"asset_guid": self.asset, "comment_text": "t", "key": "wiki-1"}]
+        report = consumer.bulk_comments(specs, retry_policy=fast_retries)
+        assert report.results[0].attempts == 1
+        assert "ReadTimeout" in report.results[0].error
+        time.sleep(0.5)
+        assert len(self._comments(platform)) == 1
+
+    @pytest.mark.parametrize(
+        "status, attempts", [(503, 3), (429, 3), (502, 1), (500, 1), (409, 1)]
+    )
+    def test_status_retries(self, mock_platform, status, attempts):
+        platform, consumer = mock_platform
+        platform.error_rate, platform.error_status = 1.0, status
+        specs = [{"asset_guid": self.asset, "comment_text": "t"}]
+        report = consumer.bulk_comments(specs, retry_policy=fast_retries)
+        assert report.results[0].attempts == attempts
+        assert self._comments(platform) == []
@@ -0,0 +1,73 @@
+#
+#  Test the in-process LRU / TTL cache
+#
+import pytest
+
+from src.egeria_client.cache import LRUCache, AssetCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache:
+    def test_get_and_put(self):
+        cache = LRUCache(max_entries=2)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b", "default") == "default"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    def test_least_recently_used_is_evicted(self):
+        cache = LRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    @pytest.mark.parametrize(
+        "ttl, elapsed, expected", [(10, 5, 1), (10, 10, None), (None, 301, None)]
+    )
+    def test_entries_expire(self, ttl, elapsed, expected):
+        clock = _Clock()
+        cache = LRUCache(clock=clock)
+        cache.put("a", 1, ttl=ttl)
+        clock.now += elapsed
+        assert cache.get("a") == expected
+        assert cache.stats()["expirations"] == (0 if expected else 1)
+
+    def test_invalidate(self):
+        cache = LRUCache()
+        for key in range(5):
+            cache.put(key, key)
+        cache.invalidate(0)
+        assert cache.invalidate_where(lambda key: key % 2) == 2
+        assert len(cache) == 2
+        cache.clear()
+        assert cache.stats()["size"] == 0
+
+    def test_max_entries(self):
+        with pytest.raises(ValueError):
+            LRUCache(max_entries=0)
+
+
+class TestAssetCache:
+    def test_invalidate_asset_for_all_users(self):
+        cache = AssetCache()
+        cache.put_asset("cocoMDS1", "garygeeke", "g1", {"asset": 1})
+        cache.put_asset("cocoMDS1", "erinoverview", "g1", {"asset": 2})
+        cache.put_asset("cocoMDS1", "garygeeke", "g2", {"asset": 3})
+        cache.put_asset("cocoMDS2", "garygeeke", "g1", {"asset": 4})
+        assert cache.invalidate_asset("cocoMDS1", "g1") == 2
+        assert cache.get_asset("cocoMDS1", "garygeeke", "g2") == {"asset": 3}
+        assert cache.get_asset("cocoMDS2", "garygeeke", "g1") == {"asset": 4}
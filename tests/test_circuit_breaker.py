@@ -0,0 +1,204 @@
+#
+#  Test the per-server circuit breakers
+#
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from egeria_client.client import Client
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    circuit_breakers,
+)
+from src.egeria_client.retry import no_retries
+from src.egeria_client.session_pool import session_pool
+from src.egeria_client.util_exp import CircuitOpenException, PropertyServerException
+from tests.stub_server import StubHandler
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(clock: _Clock) -> CircuitBreaker:
+    return CircuitBreaker(
+        failure_threshold=0.5, minimum_calls=4, window=10, reset_timeout=5, clock=clock
+    )
+
+
+class TestCircuitBreaker:
+    @pytest.mark.parametrize(
+        "outcomes, state",
+        [
+            ("ffff", CircuitState.OPEN),
+            ("sfsf", CircuitState.OPEN),
+            ("sssf", CircuitState.CLOSED),
+            ("fff", CircuitState.CLOSED),
+        ],
+    )
+    def test_opens_on_failure_rate(self, outcomes, state):
+        breaker = _breaker(_Clock())
+        for outcome in outcomes:
+            assert breaker.allow()
+            if outcome == "f":
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        assert breaker.state is state
+
+    def test_old_calls_leave_the_window(self):
+        clock = _Clock()
+        breaker = _breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 11
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.stats()["calls"] == 1
+
+    @pytest.mark.parametrize(
+        "trial_succeeds, state",
+        [(True, CircuitState.CLOSED), (False, CircuitState.OPEN)],
+    )
+    def test_half_open_trial(self, trial_succeeds, state):
+        clock = _Clock()
+        breaker = _breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        assert not breaker.allow()
+        assert breaker.retry_in() == 5
+        clock.now = 5
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+        if trial_succeeds:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        assert breaker.state is state
+        assert breaker.stats()["rejected"] == 2
+
+    def test_registry(self):
+        registry = CircuitBreakerRegistry(minimum_calls=1)
+        breaker = registry.get("https://127.0.0.1:9443", "cocoMDS1")
+        assert registry.get("https://127.0.0.1:9443/", "cocoMDS1") is breaker
+        assert registry.get("https://127.0.0.1:9443", "cocoMDS2") is not breaker
+        breaker.record_failure()
+        states = registry.states()
+        assert states["https://127.0.0.1:9443/cocoMDS1"]["state"] == "open"
+        assert states["https://127.0.0.1:9443/cocoMDS2"]["state"] == "closed"
+
+
+class _DownHandler(StubHandler):
+    calls = 0
+
+    def _handle(self):
+        _DownHandler.calls += 1
+        self._read_body()
+        time.sleep(getattr(self.server, "delay", 0))
+        self._reply(503)
+
+    do_GET = _handle
+    do_POST = _handle
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    _DownHandler.calls = 0
+    return stub_server(_DownHandler)[1]
+
+
+class TestFastFail:
+    def test_client_fails_fast(self, local_platform):
+        client = Client("cocoMDS1", local_platform, "garygeeke")
+        client.retry_policy = no_retries
+        for _ in range(5):
+            with pytest.raises(PropertyServerException):
+                client.make_request("GET", local_platform + "/status")
+        assert _DownHandler.calls == 5
+        with pytest.raises(CircuitOpenException):
+            client.make_request("GET", local_platform + "/status")
+        assert _DownHandler.calls == 5
+        assert client.circuit_state()["state"] == "open"
+
+        other = Client("cocoMDS2", local_platform, "garygeeke")
+        other.retry_policy = no_retries
+        with pytest.raises(PropertyServerException) as e:
+            other.make_request("GET", local_platform + "/status")
+        assert not isinstance(e.value, CircuitOpenException)
+
+    def test_coalesced_failure_counted_once(self, stub_server):
+        _DownHandler.calls = 0
+        url = stub_server(_DownHandler, delay=0.3)[1]
+        client = Client("cocoMDS1", url, "garygeeke")
+        client.retry_policy = no_retries
+        barrier = threading.Barrier(6)
+
+        def call():
+            barrier.wait()
+            with pytest.raises(PropertyServerException):
+                client.make_request("GET", url + "/status")
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            for future in [executor.submit(call) for _ in range(6)]:
+                future.result()
+        assert _DownHandler.calls == 1
+        assert client.circuit_state()["failures"] == 1
+        assert client.circuit_state()["state"] == "closed"
+
+    def test_consumer_shares_breaker(self, local_platform):
+        client = Client("cocoMDS1", local_platform, "garygeeke")
+        consumer = AssetConsumer("cocoMDS1", local_platform, "garygeeke")
+        assert consumer.circuit_breaker is client.circuit_breaker
+        consumer.retry_policy = no_retries
+        for _ in range(5):
+            with pytest.raises(ConnectionError):
+                consumer.get_tag("tag-1")
+        with pytest.raises(CircuitOpenException):
+            consumer.get_tag("tag-1")
+        key = session_pool.platform_key(local_platform) + "/cocoMDS1"
+        assert circuit_breakers.states()[key]["rejected"] == 1
+
+    @pytest.mark.parametrize(
+        "make, error",
+        [
+            ("client", TypeError("Object of type set is not JSON serializable")),
+            ("consumer", requests.exceptions.ChunkedEncodingError("truncated body")),
+        ],
+    )
+    def test_any_error_ends_trial(self, local_platform, monkeypatch, make, error):
+        clock = _Clock()
+        if make == "client":
+            caller = Client("cocoMDS1", local_platform, "garygeeke")
+            call = lambda: caller.make_request("GET", local_platform + "/status")
+        else:
+            caller = AssetConsumer("cocoMDS1", local_platform, "garygeeke")
+            call = lambda: caller.get_tag("tag-1")
+        caller.retry_policy = no_retries
+        caller.circuit_breaker = _breaker(clock)
+        for _ in range(4):
+            caller.circuit_breaker.record_failure()
+        clock.now += 5
+
+        def broken(*args, **kwargs):
+            raise error
+
+        monkeypatch.setattr(caller.session, "get", broken)
+        with pytest.raises(type(error)):
+            call()
+        assert caller.circuit_breaker.state is CircuitState.OPEN
+        monkeypatch.undo()
+        clock.now += 5
+        with pytest.raises((PropertyServerException, ConnectionError)):
+            call()
+        assert _DownHandler.calls == 1
@@ -31,70 +31,76 @@ from src.egeria_client.util_exp import (
     PropertyServerException,
     RESTConnectionException,
 )
-
-
-@pytest.fixture()
-def basic_server():
-    platform = "https://127.0.0.1:9443"
+from tests.stub_server import unreachable_url
 
 
 class TestClient:
     # @pytest.mark.xfail
     @pytest.mark.parametrize(
-        "url, user_id, status_code, expectation",
+        "url, user_id, path, status_code, expectation",
         [
             (
-                "https://google.com",
+                "{platform}/elsewhere",
                 "garygeeke",
+                "/origin",
                 404,
                 pytest.raises(InvalidParameterException),
             ),
             (
-                "https://localhost:9443",
+                "{platform}",
                 "garygeeke",
+                "/servers/cocoMDS7/instance/configuration",
                 400,
                 pytest.raises(InvalidParameterException),
             ),
             (
-                "https://127.0.0.1:9443",
+                "{platform}",
                 "garygeeke",
+                "/origin",
                 200,
                 does_not_raise(),
             ),
             (
-                "https://127.0.0.1:9443",
+                "{platform}",
                 "",
+                "/origin",
                 404,
                 pytest.raises(InvalidParameterException),
             ),
             (
-                "https://127.0.0.1:9443/open-metadata/admin-services/users/garygeeke/servers/active-metadata-store",
+                "{platform}/open-metadata/admin-services/users/garygeeke/servers/active-metadata-store",
                 "meow",
+                "/origin",
                 404,
                 pytest.raises(InvalidParameterException),
             ),
             (
-                "https://wolfsonnet.me:9443/open-metadata/admin-services/users/garygeeke/servers/active-metadata-store",
+                unreachable_url,
                 "woof",
+                "/origin",
                 503,
                 pytest.raises(InvalidParameterException),
             ),
-            ("", "", 400, pytest.raises(InvalidParameterException)),
+            ("", "", "/origin", 400, pytest.raises(InvalidParameterException)),
         ],
     )
-    def test_make_get_request(self, url, user_id, status_code, expectation):
+    def test_make_get_request(
+        self, platform_url, url, user_id, path, status_code, expectation
+    ):
         server = "None"
         user_pwd = "nonesuch"
         response = ""
+        url = url.format(platform=platform_url)
         with expectation as excinfo:
             t_client = egeria_client.client.Client(
                 server, url, user_id, user_pwd, False
             )
             endpoint = (
                 url
-                + "/open-metadata/admin-services/users/"
+                + "/open-metadata/platform-services/users/"
                 + user_id
-                + "/stores/connection"
+                + "/server-platform"
+                + path
             )
             if t_client is not None:
                 response = t_client.make_request("GET", endpoint, None)
@@ -108,6 +114,7 @@ class TestClient:
             print(f"\t\t   System: {excinfo.value.system_action}")
             print(f"\t\t   Message: {excinfo.value.error_msg}")
             print(f"\t\t   User Action: {excinfo.value.user_action}")
+            assert excinfo.value.http_error_code == str(status_code), "Invalid URL"
         else:
             if (response is not None) & (response.status_code is None):
                 assert excinfo.value.http_error_code == str(status_code), "Invalid URL"
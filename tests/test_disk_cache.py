@@ -0,0 +1,90 @@
+#
+#  Test the SQLite response cache
+#
+import pytest
+
+from src.egeria_client import disk_cache
+from src.egeria_client.disk_cache import DiskCache, disk_cache_for
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDiskCache:
+    def test_get_and_put(self):
+        cache = DiskCache(":memory:")
+        assert cache.get("a") is None
+        cache.put("a", {"meaning": {"guid": "t1"}})
+        assert cache.get("a") == {"meaning": {"guid": "t1"}}
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_survives_reopen(self, tmp_path):
+        path = str(tmp_path / "platform.sqlite")
+        cache = DiskCache(path)
+        cache.put_many({"a": [1], "b": [2]})
+        cache.close()
+        assert DiskCache(path).get_many(["a", "b", "c"]) == {"a": [1], "b": [2]}
+
+    @pytest.mark.parametrize("elapsed, expected", [(59, "v"), (60, None)])
+    def test_entries_expire(self, elapsed, expected):
+        clock = _Clock()
+        cache = DiskCache(":memory:", ttl=60, clock=clock)
+        cache.put("a", "v")
+        clock.now += elapsed
+        assert cache.get("a") == expected
+
+    def test_least_recently_used_is_evicted(self):
+        clock = _Clock()
+        cache = DiskCache(":memory:", max_bytes=30, clock=clock, touch_interval=10)
+        for key in ("a", "b", "c"):
+            clock.now += 1
+            cache.put(key, "x" * 8)
+        clock.now += 1
+        cache.get("b")  # used too recently to be recorded
+        clock.now += 10
+        cache.get("a")
+        clock.now += 1
+        cache.put("d", "x" * 8)
+        assert sorted(cache.get_many(["a", "b", "c", "d"])) == ["a", "c", "d"]
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= 30
+
+    def test_size_is_kept_up_to_date(self, tmp_path):
+        path = str(tmp_path / "platform.sqlite")
+        clock = _Clock()
+        cache = DiskCache(path, ttl=60, clock=clock)
+        cache.put_many({"a": "x" * 8, "b": "x" * 18, "c": [1]})
+        cache.put("b", "x")
+        cache.invalidate("c")
+        clock.now += 60
+        cache.put("d", "x" * 98, ttl=120)
+        cache.get("a")
+        assert cache.stats()["bytes"] == len('"x"') + 100
+        cache.close()
+        reopened = DiskCache(path, clock=clock)
+        assert reopened.stats()["bytes"] == len('"x"') + 100
+        assert reopened.purge_expired() == 1
+        assert reopened.stats()["bytes"] == 100
+
+    def test_invalidate(self):
+        cache = DiskCache(":memory:")
+        cache.put_many({"s/u/tags/1": 1, "s/u/tags/2": 2, "s/u/meanings/1": 3})
+        cache.invalidate("s/u/meanings/1")
+        assert cache.invalidate_prefix("s/u/tags/") == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_one_file_per_platform(self, tmp_path):
+        first = disk_cache_for("https://localhost:9443", str(tmp_path))
+        assert disk_cache_for("https://localhost:9443/", str(tmp_path)) is first
+        assert disk_cache_for("https://localhost:9444", str(tmp_path)) is not first
+        disk_cache.close_disk_caches()
+        assert sorted(p.name for p in tmp_path.glob("*.sqlite")) == [
+            "https_localhost_9443.sqlite",
+            "https_localhost_9444.sqlite",
+        ]
@@ -0,0 +1,89 @@
+#
+#  Test concurrent status sweeps across many platforms
+#
+import socket
+import time
+
+import pytest
+
+from src.egeria_client.fleet import PlatformFleet
+from tests.stub_server import StubHandler
+
+
+class _PlatformHandler(StubHandler):
+    def do_GET(self):
+        time.sleep(self.server.delay)
+        if self.path.endswith("/server-platform/servers"):
+            self._reply(200, {"serverList": ["s1", "s2"]})
+        elif self.path.endswith("/servers/active"):
+            self._reply(200, {"serverList": ["s1"]})
+        else:
+            server = self.path.split("/servers/")[1].split("/")[0]
+            self._reply(200, {"serverName": server})
+
+
+def _closed_port_url() -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+
+@pytest.fixture()
+def platforms(stub_server):
+    return [
+        stub_server(_PlatformHandler, delay=delay)[1]
+        for delay in (0.2, 0.2, 0.2, 0.2, 2.0)
+    ]
+
+
+class TestPlatformFleet:
+    def test_sweep_is_concurrent(self, platforms):
+        fleet = PlatformFleet(platforms[:4], "garygeeke")
+        status = fleet.sweep()
+        assert status.complete
+        assert len(status.results) == 8
+        assert not status.failed()
+        assert status.elapsed < 8 * 0.2
+        assert status.servers(platforms[0]) == ["s1", "s2"]
+        assert status.servers(platforms[0], "get_active_server_list") == ["s1"]
+        assert all(r.latency >= 0.2 for r in status.results)
+
+    def test_partial_results(self, platforms):
+        down = _closed_port_url()
+        fleet = PlatformFleet(platforms + [down], "garygeeke", timeout=5)
+        status = fleet.list_servers(deadline=1.0)
+        assert not status.complete
+        by_platform = {r.platform_url: r for r in status.results}
+        assert all(by_platform[url].ok for url in platforms[:4])
+        assert by_platform[platforms[4]].error == "timed out"
+        assert not by_platform[down].ok
+        assert status.elapsed < 1.5
+
+    def test_status_of_listed_servers(self, platforms):
+        fleet = PlatformFleet(platforms[:2], "garygeeke")
+        status = fleet.get_server_status()
+        statuses = sorted(
+            (r.platform_url, r.server)
+            for r in status.results
+            if r.operation == "get_server_status"
+        )
+        assert statuses == sorted(
+            (url, s) for url in platforms[:2] for s in ("s1", "s2")
+        )
+
+    def test_named_servers_and_table(self, platforms):
+        fleet = PlatformFleet(platforms[:1], "garygeeke")
+        status = fleet.get_server_status({platforms[0]: ["s2"]})
+        assert [(r.server, r.result["serverName"]) for r in status.results] == [
+            ("s2", "s2")
+        ]
+        table = status.table().splitlines()
+        assert table[0].split() == [
+            "platform",
+            "operation",
+            "server",
+            "status",
+            "latency_ms",
+            "detail",
+        ]
+        assert table[1].split()[1:4] == ["get_server_status", "s2", "ok"]
@@ -0,0 +1,146 @@
+#
+#  Test the local glossary term resolver
+#
+import json
+import re
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.glossary import GlossaryResolver, MeaningEntry
+
+glossary = {f"term-{i:03d}": f"Customer Attribute {i:03d}" for i in range(120)}
+glossary.update(
+    {"term-email": "Email", "term-EMAIL": "EMAIL", "term-late": "Late Term"}
+)
+from tests.stub_server import StubHandler
+
+
+def _meaning(guid: str) -> dict:
+    return {
+        "elementHeader": {"guid": guid},
+        "meaningProperties": {
+            "name": glossary[guid],
+            "qualifiedName": "Glossary::" + glossary[guid],
+        },
+    }
+
+
+class _MeaningHandler(StubHandler):
+    def _visible(self) -> list:
+        return sorted(g for g in glossary if g not in self.server.hidden)
+
+    def do_GET(self):
+        self.server.calls.append(self.path)
+        guid = urlsplit(self.path).path.rsplit("/", 1)[1]
+        self._reply(200, {"meaning": _meaning(guid)})
+
+    def do_POST(self):
+        body = json.loads(self._read_body())
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        self.server.calls.append(self.path)
+        if parts.path.endswith("/meanings/by-search-string"):
+            pattern = re.compile(body["searchString"])
+            found = [g for g in self._visible() if pattern.fullmatch(glossary[g])]
+            start, size = int(query["startFrom"][0]), int(query["pageSize"][0])
+            if size:
+                found = found[start : start + size]
+            self._reply(200, {"meanings": [_meaning(g) for g in found] or None})
+        else:
+            found = [g for g in glossary if glossary[g] == body["name"]]
+            self._reply(200, {"meanings": [_meaning(g) for g in found] or None})
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    server, url = stub_server(
+        _MeaningHandler,
+        calls=[],
+        hidden={"term-late"},  # not returned by searches until it is looked up
+    )
+    return server, AssetConsumer("cocoMDS1", url, "garygeeke")
+
+
+class TestGlossaryResolver:
+    def test_load_and_exact_lookups(self, local_platform):
+        server, consumer = local_platform
+        resolver = GlossaryResolver(consumer)
+        assert len(resolver) == 122
+        calls = len(server.calls)
+        for _ in range(1000):
+            assert resolver.resolve("Customer Attribute 007") == "term-007"
+        assert resolver.lookup("Email") == [
+            MeaningEntry("term-email", "Email", "Glossary::Email")
+        ]
+        assert len(server.calls) == calls
+        stats = resolver.stats()
+        assert stats["exact"]["hit_rate"] == 1.0 and stats["lookups"] == 1001
+
+    def test_case_insensitive(self, local_platform):
+        _, consumer = local_platform
+        resolver = GlossaryResolver(consumer)
+        assert [e.guid for e in resolver.lookup("email", ignore_case=True)] == [
+            "term-EMAIL",
+            "term-email",
+        ]
+        assert (
+            resolver.resolve("customer attribute 001", ignore_case=True) == "term-001"
+        )
+
+    @pytest.mark.parametrize(
+        "prefix, limit, ignore_case, expected",
+        [
+            ("Customer Attribute 01", 0, False, [f"term-01{i}" for i in range(10)]),
+            ("Customer Attribute 11", 3, False, ["term-110", "term-111", "term-112"]),
+            ("customer attribute 11", 2, True, ["term-110", "term-111"]),
+            ("EM", 0, False, ["term-EMAIL"]),
+            ("em", 0, True, ["term-EMAIL", "term-email"]),
+        ],
+    )
+    def test_prefix(self, local_platform, prefix, limit, ignore_case, expected):
+        _, consumer = local_platform
+        resolver = GlossaryResolver(consumer)
+        found = resolver.prefix(prefix, limit, ignore_case)
+        assert [e.guid for e in found] == expected
+
+    def test_fallback_to_server(self, local_platform):
+        server, consumer = local_platform
+        resolver = GlossaryResolver(consumer)
+        server.calls.clear()
+        assert resolver.resolve("Late Term") == "term-late"
+        assert resolver.resolve("Late Term") == "term-late"
+        assert resolver.prefix("Late")[0].guid == "term-late"
+        assert len(server.calls) == 1
+        stats = resolver.stats()
+        assert stats["exact"] == {
+            "lookups": 2,
+            "hits": 1,
+            "server": 1,
+            "hit_rate": 0.5,
+        }
+
+    def test_misses_are_remembered(self, local_platform):
+        server, consumer = local_platform
+        resolver = GlossaryResolver(consumer)
+        server.calls.clear()
+        for _ in range(5):
+            assert resolver.resolve("No Such Term") is None
+            assert resolver.prefix("Zebra") == []
+        assert len(server.calls) == 2
+
+    def test_no_fallback(self, local_platform):
+        server, consumer = local_platform
+        resolver = GlossaryResolver(consumer, fallback=False)
+        server.calls.clear()
+        assert resolver.resolve("Late Term") is None
+        assert server.calls == []
+
+    def test_get_by_guid(self, local_platform):
+        server, consumer = local_platform
+        resolver = GlossaryResolver(consumer, load=False)
+        assert resolver.get("term-late").name == "Late Term"
+        assert resolver.get("term-late").qualified_name == "Glossary::Late Term"
+        assert len(server.calls) == 1
+        assert resolver.stats()["guid"]["hit_rate"] == 0.5
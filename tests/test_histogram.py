@@ -0,0 +1,53 @@
+#
+#  Test the latency histograms
+#
+import math
+import random
+
+import pytest
+
+from src.egeria_client.histogram import LatencyHistogram
+
+
+def _exact(values: list, percentile: float) -> float:
+    return values[max(math.ceil(len(values) * percentile / 100), 1) - 1]
+
+
+class TestLatencyHistogram:
+    @pytest.mark.parametrize("significant_figures", [2, 3, 4])
+    def test_relative_error(self, significant_figures):
+        rng = random.Random(1)
+        values = sorted(rng.lognormvariate(-5, 1.5) for _ in range(20000))
+        histogram = LatencyHistogram(significant_figures)
+        for value in values:
+            histogram.record(value)
+        assert histogram.count == 20000
+        for p in (50, 90, 99, 99.9, 100):
+            exact = _exact(values, p)
+            found = histogram.value_at_percentile(p)
+            assert abs(found - exact) <= exact * 10**-significant_figures * 2 + 1e-6
+
+    def test_buckets_are_bounded(self):
+        histogram = LatencyHistogram()
+        for n in range(200000):
+            histogram.record(n * 1e-5)
+        assert len(histogram._counts) < 10000
+        assert histogram.min == 0 and histogram.max == pytest.approx(1.99999)
+        assert histogram.count_at_or_below(1.0) == pytest.approx(100001, rel=1e-3)
+
+    def test_merge_and_summary(self):
+        fast, slow = LatencyHistogram(), LatencyHistogram()
+        for _ in range(90):
+            fast.record(0.001)
+        slow.record(0.5, count=10)
+        fast.merge(slow)
+        summary = fast.summary()
+        assert summary["count"] == 100
+        assert summary["p50_ms"] == pytest.approx(1, rel=1e-3)
+        assert summary["p95_ms"] == pytest.approx(500, rel=1e-3)
+        assert summary["max_ms"] == 500
+        assert summary["mean_ms"] == pytest.approx(50.9)
+        with pytest.raises(ValueError):
+            fast.merge(LatencyHistogram(2))
+        fast.reset()
+        assert fast.count == 0 and fast.value_at_percentile(99) == 0.0
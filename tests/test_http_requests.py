@@ -22,6 +22,7 @@ from src.egeria_client.util_exp import (
     InvalidParameterException,
     RESTConnectionException,
 )
+from tests.stub_server import unreachable_url
 
 
 class TestHttpRequests:
@@ -38,36 +39,41 @@ class TestHttpRequests:
 
     """
 
-    def __init__(
-        self, error_msg, class_name, method_name, action_description, error_code, params
-    ):
-        pass
-
     @pytest.mark.parametrize(
         "url, status_code, expectation",
         [
-            ("https://google.com", 200, does_not_raise()),
             (
-                "https://localhost:9443/open-metadata/admin-services/users/garygeeke/servers/active-metadata-store/configuration",
-                405,
-                pytest.raises(InvalidParameterException, RESTConnectionException),
+                "{platform}/open-metadata/platform-services/users/garygeeke/server-platform/origin",
+                200,
+                does_not_raise(),
             ),
             (
-                "https://127.0.0.1:9443/open-metadata/admin-services/users/garygeeke/servers/active-metadata-store/configuration",
+                "{platform}/open-metadata/admin-services/users/garygeeke/servers/active-metadata-store/configuration",
+                404,
+                pytest.raises((InvalidParameterException, RESTConnectionException)),
+            ),
+            (
+                "{platform}/open-metadata/platform-services/users/garygeeke/server-platform/servers/active-metadata-store/instance/configuration",
                 200,
                 does_not_raise(),
             ),
             (
-                "https://127.0.0.1:9443/open-metadata/admin-services/users/garygeeke/servers/active-metadata-store",
-                405,
-                pytest.raises(InvalidParameterException, RESTConnectionException),
+                "{platform}/open-metadata/admin-services/users/garygeeke/servers/active-metadata-store",
+                404,
+                pytest.raises((InvalidParameterException, RESTConnectionException)),
+            ),
+            (
+                unreachable_url
+                + "/open-metadata/platform-services/users/garygeeke/server-platform/origin",
+                503,
+                pytest.raises((InvalidParameterException, RESTConnectionException)),
             ),
-            ("", 200, does_not_raise()),
+            ("", 400, pytest.raises(InvalidParameterException)),
         ],
     )
-    def test_issue_get(self, url, status_code, expectation):
+    def test_issue_get(self, platform_url, url, status_code, expectation):
         with expectation as excinfo:
-            response = issue_get(url)
+            response = issue_get(url.format(platform=platform_url))
             assert response.status_code == status_code, "Invalid URL"
 
             if excinfo:
@@ -0,0 +1,139 @@
+#
+#  Test the open-loop load generator
+#
+import json
+import threading
+import time
+
+import pytest
+
+from egeria_client.__main__ import main
+from src.egeria_client.load_generator import LoadGenerator, parse_mix
+from src.egeria_client.mock_platform import MockPlatform, SyntheticCatalog
+from src.egeria_client.session_pool import session_pool
+
+
+@pytest.fixture()
+def mock_platform():
+    platform = MockPlatform(SyntheticCatalog(asset_count=500, term_count=10))
+    url = platform.start()
+    yield platform, url
+    session_pool.close(url)
+    platform.stop()
+
+
+def _operations(delays: dict, calls: list):
+    lock = threading.Lock()
+
+    def operation(name):
+        def call():
+            with lock:
+                calls.append((name, time.perf_counter()))
+            time.sleep(delays[name])
+            if name == "broken":
+                raise ConnectionError("rejected")
+
+        return call
+
+    return {name: operation(name) for name in delays}
+
+
+class TestLoadGenerator:
+    @pytest.mark.parametrize(
+        "text, mix",
+        [
+            ("find_assets=4,get_comments=1.5", {"find_assets": 4, "get_comments": 1.5}),
+            ("add_tag, find_assets=2,", {"add_tag": 1, "find_assets": 2}),
+        ],
+    )
+    def test_parse_mix(self, text, mix):
+        assert parse_mix(text) == mix
+
+    def test_invalid_settings(self):
+        operations = _operations({"find": 0}, [])
+        with pytest.raises(ValueError):
+            LoadGenerator(operations, {"lost": 1})
+        with pytest.raises(ValueError):
+            LoadGenerator(operations, {"find": 0})
+        with pytest.raises(ValueError):
+            LoadGenerator(operations, {"find": 1}, arrivals="bursty")
+        with pytest.raises(ValueError):
+            parse_mix("find=often")
+
+    def test_mix_and_errors(self):
+        calls = []
+        generator = LoadGenerator(
+            _operations({"find": 0.001, "broken": 0.001}, calls),
+            {"find": 3, "broken": 1},
+            rate=400,
+            duration=0.5,
+            seed=7,
+        )
+        report = generator.run()
+        summary = report.summary()
+        assert summary["total"]["calls"] == len(calls) == 200
+        find, broken = report.operations["find"], report.operations["broken"]
+        assert 120 <= find.calls <= 180 and find.errors == 0
+        assert broken.errors == broken.calls
+        assert summary["operations"]["broken"]["error_types"] == {
+            "ConnectionError": broken.calls
+        }
+        assert summary["operations"]["broken"]["error_rate"] == 1.0
+        assert "broken" in report.format()
+
+    def test_open_loop(self):
+        # a slow operation does not hold back the calls due after it, and its latency counts the queueing
+        calls = []
+        generator = LoadGenerator(
+            _operations({"slow": 0.2}, calls), rate=50, duration=0.4, max_workers=4
+        )
+        report = generator.run()
+        stats = report.operations["slow"]
+        assert stats.calls == 20 and stats.dropped == 0
+        assert report.elapsed < 1.5
+        assert stats.latency.value_at_percentile(100) > 0.5
+        assert stats.service_time.value_at_percentile(100) < 0.3
+
+    def test_dropped_calls(self):
+        generator = LoadGenerator(
+            _operations({"slow": 0.3}, []),
+            rate=100,
+            duration=0.2,
+            max_workers=2,
+            max_outstanding=5,
+        )
+        stats = generator.run().operations["slow"]
+        assert stats.calls == 5 and stats.dropped == 15
+        assert stats.error_rate == 0.75
+
+    def test_poisson_arrivals(self):
+        calls = []
+        LoadGenerator(
+            _operations({"find": 0}, calls),
+            rate=500,
+            duration=0.4,
+            arrivals="poisson",
+            seed=3,
+        ).run()
+        assert 120 <= len(calls) <= 280
+
+    def test_main(self, mock_platform, tmp_path, capsys):
+        platform, url = mock_platform
+        report = tmp_path / "load.json"
+        args = ["--url", url, "--server", "cocoMDS1", "--rate", "100"]
+        args += ["--duration", "0.5", "--seed", "1", "--report", str(report)]
+        assert main(args) == 0
+        assert "add_comment_to_asset" in capsys.readouterr().out
+        with open(report) as f:
+            summary = json.load(f)
+        assert summary["total"]["calls"] == 50
+        assert summary["total"]["errors"] == 0
+        assert set(summary["operations"]) == {
+            "find_assets",
+            "get_comments",
+            "add_comment_to_asset",
+            "add_tag",
+            "platform_status",
+        }
+        routes = platform.stats()["routes"]
+        assert routes["create_tag"]["requests"] == 1
@@ -0,0 +1,183 @@
+#
+#  Test the timing of REST calls and the metrics collectors
+#
+import pytest
+import requests
+
+from egeria_client.platform_services import Platform
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.metrics import (
+    CallRecord,
+    HistogramCollector,
+    PrometheusTextfile,
+    metrics,
+    url_template,
+)
+from src.egeria_client.mock_platform import MockPlatform, SyntheticCatalog
+from src.egeria_client.retry import RetryPolicy
+from src.egeria_client.session_pool import session_pool
+from src.egeria_client.util_exp import issue_data_post, issue_get, issue_post, issue_put
+
+guid = "00000001-0000-4000-8000-00000000002a"
+
+
+@pytest.fixture()
+def mock_platform():
+    platform = MockPlatform(SyntheticCatalog(asset_count=100, term_count=10))
+    url = platform.start()
+    yield platform, url
+    session_pool.close(url)
+    platform.stop()
+
+
+@pytest.fixture()
+def records():
+    found = []
+    hook = metrics.add_hook(found.append)
+    yield found
+    metrics.remove_hook(hook)
+
+
+class TestUrlTemplate:
+    @pytest.mark.parametrize(
+        "url, template",
+        [
+            (
+                "https://localhost:9443/servers/cocoMDS1/open-metadata/access-services/asset-consumer"
+                "/users/peterprofile/assets/by-search-string?startFrom=0&pageSize=50",
+                "/servers/{server}/open-metadata/access-services/asset-consumer/users/{user}"
+                "/assets/by-search-string",
+            ),
+            (
+                f"https://localhost:9443/servers/cocoMDS1/open-metadata/common-services/asset-consumer"
+                f"/connected-asset/users/erinoverview/assets/{guid}/comments",
+                "/servers/{server}/open-metadata/common-services/asset-consumer"
+                "/connected-asset/users/{user}/assets/{guid}/comments",
+            ),
+            (
+                "https://localhost:9443/open-metadata/platform-services/users/garygeeke/server-platform"
+                "/servers/active",
+                "/open-metadata/platform-services/users/{user}/server-platform/servers/active",
+            ),
+        ],
+    )
+    def test_url_template(self, url, template):
+        assert url_template(url) == template
+
+
+class TestMetricsRegistry:
+    def test_no_hooks(self, mock_platform):
+        platform, url = mock_platform
+        assert not metrics.enabled
+        consumer = AssetConsumer("cocoMDS1", url, "peterprofile")
+        assert len(consumer.find_assets(".*", page_size=10)) == 10
+
+    def test_client_calls(self, mock_platform, records):
+        platform, url = mock_platform
+        consumer = AssetConsumer("cocoMDS1", url, "peterprofile")
+        guids = consumer.find_assets(".*", page_size=10)
+        consumer.get_comments(guids[3])
+        Platform("cocoMDS1", url, "garygeeke").get_active_server_status()
+        operations = [(r.operation, r.method, r.status) for r in records]
+        assert operations == [
+            ("find_assets", "POST", 200),
+            ("get_comments", "GET", 200),  # the comments
+            ("get_comments", "GET", 200),  # the empty page ending them
+            ("get_active_server_status", "GET", 200),
+        ]
+        assert records[1].url_template.endswith("/assets/{guid}/comments")
+        assert all(r.bytes > 0 and r.duration > 0 and r.retries == 0 for r in records)
+
+    def test_retries_and_errors(self, mock_platform, records):
+        platform, url = mock_platform
+        platform.error_rate = 1.0
+        consumer = AssetConsumer("cocoMDS1", url, "peterprofile")
+        consumer.retry_policy = RetryPolicy(max_attempts=3, backoff_base=0)
+        with pytest.raises(ConnectionError):
+            consumer.find_assets(".*")
+        assert (records[0].status, records[0].retries) == (503, 2)
+
+        session_pool.close(url)
+        platform.stop()
+        with pytest.raises(requests.ConnectionError):
+            consumer.get_asset_properties(guid)
+        assert (records[1].status, records[1].retries) == (None, 2)
+        assert records[1].error == "ConnectionError"
+
+    def test_util_functions(self, mock_platform, records):
+        platform, url = mock_platform
+        consumer_url = f"{url}/servers/cocoMDS1/open-metadata/access-services/asset-consumer/users/peterprofile"
+        issue_get(
+            f"{url}/servers/cocoMDS1/open-metadata/common-services/asset-consumer"
+            f"/connected-asset/users/peterprofile/assets/{guid}"
+        )
+        issue_post(consumer_url + "/assets/by-search-string?startFrom=0&pageSize=5")
+        issue_data_post(
+            consumer_url + "/tags/by-search-string", '{"searchString": "x"}'
+        )
+        issue_put(consumer_url + "/tags", {})
+        assert [(r.operation, r.method, r.status) for r in records] == [
+            ("test_util_functions", "GET", 200),
+            ("test_util_functions", "POST", 200),
+            ("test_util_functions", "POST", 200),
+            ("test_util_functions", "PUT", 501),
+        ]
+
+    def test_broken_hook(self, mock_platform, records):
+        platform, url = mock_platform
+
+        def broken(record):
+            raise RuntimeError("broken hook")
+
+        metrics.add_hook(broken)
+        try:
+            consumer = AssetConsumer("cocoMDS1", url, "peterprofile")
+            assert len(consumer.find_assets(".*", page_size=5)) == 5
+        finally:
+            metrics.remove_hook(broken)
+        assert len(records) == 1
+
+
+class TestCollectors:
+    def _collect(self) -> HistogramCollector:
+        collector = HistogramCollector()
+        for n in range(10):
+            collector(CallRecord("find_assets", "/assets", "POST", 200, 100, 0.02))
+        collector(CallRecord("find_assets", "/assets", "POST", 503, 10, 1.5, 2))
+        collector(
+            CallRecord("get_tag", "/tags/{guid}", "GET", None, 0, 0.001, 0, "Timeout")
+        )
+        return collector
+
+    def test_histogram_collector(self):
+        collector = self._collect()
+        find, get_tag = collector.summary()
+        assert find["operation"] == "find_assets"
+        assert (find["calls"], find["errors"], find["retries"]) == (11, 1, 2)
+        assert find["bytes"] == 1010
+        assert find["statuses"] == {"200": 10, "503": 1}
+        assert find["total_seconds"] == pytest.approx(1.7)
+        assert find["p50_ms"] == pytest.approx(20, rel=1e-3)
+        assert get_tag["statuses"] == {"Timeout": 1} and get_tag["errors"] == 1
+        assert "find_assets" in collector.format()
+
+    def test_prometheus_textfile(self, tmp_path):
+        path = tmp_path / "egeria.prom"
+        exporter = PrometheusTextfile(self._collect(), str(path))
+        exporter.start(interval=0.01)
+        exporter.stop()
+        text = path.read_text()
+        labels = 'operation="find_assets",method="POST",endpoint="/assets"'
+        assert "# TYPE egeria_client_request_duration_seconds histogram" in text
+        assert (
+            f'egeria_client_request_duration_seconds_bucket{{{labels},le="0.025"}} 10'
+            in text
+        )
+        assert (
+            f'egeria_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 11'
+            in text
+        )
+        assert f'egeria_client_requests_total{{{labels},status="503"}} 1' in text
+        assert f"egeria_client_request_retries_total{{{labels}}} 2" in text
+        assert f"egeria_client_response_bytes_total{{{labels}}} 1010" in text
+        assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,143 @@
+#
+#  Test the local mock platform against the clients
+#
+import time
+
+import pytest
+import requests
+
+from egeria_client.platform_services import Platform
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.asset_owner import AssetOwner
+from src.egeria_client.mock_platform import (
+    MockPlatform,
+    SyntheticCatalog,
+    asset_kind,
+    parse_guid,
+    synthetic_guid,
+)
+from src.egeria_client.retry import RetryPolicy
+from src.egeria_client.session_pool import session_pool
+
+
+@pytest.fixture()
+def mock_platform():
+    platform = MockPlatform(SyntheticCatalog(asset_count=250, term_count=10))
+    url = platform.start()
+    yield platform, url
+    session_pool.close(url)
+    platform.stop()
+
+
+class TestSyntheticCatalog:
+    def test_deterministic_guids(self):
+        guid = synthetic_guid(asset_kind, 1234567, seed=7)
+        assert parse_guid(guid) == (asset_kind, 7, 1234567)
+        assert parse_guid("not-a-guid") is None
+        one, other = SyntheticCatalog(seed=3), SyntheticCatalog(seed=3)
+        assert one.search_assets(".*", 10, 5) == other.search_assets(".*", 10, 5)
+
+    def test_millions_of_assets(self):
+        catalog = SyntheticCatalog(asset_count=5_000_000)
+        start = time.perf_counter()
+        page = catalog.search_assets(".*", 4_999_990, 100)
+        assert len(page) == 10
+        assert (
+            page[-1]["assetProperties"]["qualifiedName"] == "synthetic-asset-004999999"
+        )
+        assert time.perf_counter() - start < 1
+
+    def test_deletes_shift_pages(self):
+        catalog = SyntheticCatalog(asset_count=20)
+        for index in (0, 3, 4):
+            catalog.delete_asset(synthetic_guid(asset_kind, index))
+        names = [
+            a["assetProperties"]["qualifiedName"][-2:]
+            for a in catalog.search_assets(".*", 2, 3)
+        ]
+        assert names == ["05", "06", "07"]
+        assert len(catalog.search_assets("asset-00000000", 0, 0)) == 10 - 3
+        assert catalog.stats()["assets"] == 17
+
+
+class TestMockPlatform:
+    def test_platform_calls(self, mock_platform):
+        platform, url = mock_platform
+        platform.activation_time = 0.2
+        client = Platform("cocoMDS1", url, "garygeeke")
+        assert "mock" in client.get_platform_origin().text
+        assert "cocoMDS2" in client.list_servers()["serverList"]
+        client.de_activate_server("cocoMDS2")
+        active = client.get_active_server_list().json()["serverList"]
+        assert "cocoMDS2" not in active
+        client.activate_server_stored_config("cocoMDS2")
+        status = client.get_active_server_status("cocoMDS2").json()
+        assert status["serverStatus"] == "STARTING"
+        time.sleep(0.25)
+        status = client.get_active_server_status("cocoMDS2").json()
+        assert status["serverStatus"] == "RUNNING"
+        assert client.is_server_known("nobody").json()["flag"] is False
+
+    def test_asset_consumer_calls(self, mock_platform):
+        platform, url = mock_platform
+        consumer = AssetConsumer("cocoMDS1", url, "peterprofile")
+        guids = list(consumer.iter_assets(".*", page_size=40))
+        assert len(guids) == 250
+        assert consumer.get_asset_properties(guids[7])["assetProperties"][
+            "qualifiedName"
+        ] == ("synthetic-asset-000000007")
+        assert len(consumer.get_comments(guids[7])) == 2
+
+        comment = consumer.add_comment_to_asset(guids[7], "Useful", "OTHER", True)
+        texts = [c.comment_text for c in consumer.get_comments(guids[7])]
+        assert texts[-1] == "Useful"
+        consumer.add_comment_reply(guids[7], comment, "Agreed", "ANSWER", True)
+        assert [
+            r.comment_text for r in consumer.get_comment_replies(guids[7], comment)
+        ] == ["Agreed"]
+
+        tag = consumer.create_private_tag("mine", "a private tag")
+        consumer.add_tag(guids[7], tag, False)
+        assert [t["elementHeader"]["guid"] for t in consumer.find_my_tags("min.*")] == [
+            tag
+        ]
+        assert consumer.find_tags("mine", "erinoverview") is None
+
+        term = consumer.find_meanings("Term 0000003")[0]["elementHeader"]["guid"]
+        assert len(list(consumer.iter_assets_by_meaning(term, page_size=10))) == 25
+        assert platform.stats()["catalog"]["tag_assignments"] == 1
+
+    def test_asset_owner_calls(self, mock_platform):
+        platform, url = mock_platform
+        owner = AssetOwner("cocoMDS1", url, "erinoverview")
+        guids = owner.create_csv_asset("week1.csv", "sales", "/landing/week1.csv")
+        assets = owner.find_assets("^/landing/")
+        assert [a["elementHeader"]["guid"] for a in assets] == guids
+        owner.delete_asset(guids[0])
+        assert owner.find_assets("^/landing/") is None
+
+    def test_injected_errors_and_latency(self, mock_platform):
+        platform, url = mock_platform
+        consumer = AssetConsumer("cocoMDS1", url, "peterprofile")
+        consumer.retry_policy = RetryPolicy(max_attempts=2, backoff_base=0)
+        platform.error_rate = 1.0
+        with pytest.raises(ConnectionError):
+            consumer.find_assets(".*", page_size=10)
+        assert platform.stats()["routes"]["find_assets"] == {
+            "requests": 2,
+            "errors": 2,
+        }
+
+        platform.error_rate = 0.0
+        platform.route_latency["find_assets"] = 0.1
+        start = time.perf_counter()
+        assert len(consumer.find_assets(".*", page_size=10)) == 10
+        assert time.perf_counter() - start >= 0.1
+
+    def test_unknown_routes_and_servers(self, mock_platform):
+        platform, url = mock_platform
+        response = requests.get(url + "/no/such/endpoint")
+        assert response.status_code == 404
+        consumer = AssetConsumer("nowhere", url, "peterprofile")
+        with pytest.raises(ConnectionError):
+            consumer.find_assets(".*")
@@ -0,0 +1,167 @@
+#
+#  Test the Pager used for all paged list endpoints
+#
+import json
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+from requests import Response
+
+from src.egeria_client import paging
+from src.egeria_client.paging import Pager, list_of
+from src.egeria_client.util_exp import max_paging_size
+from src.egeria_client.utils import connected_asset_pager
+from tests.stub_server import StubHandler
+
+
+def _list_endpoint(
+    elements: list, calls: list, padding: int = 0, cap: int = 0, short: dict = None
+):
+    """
+    Return a fetch_page function serving elements like an Egeria list endpoint, at most cap a page -
+    short maps a start_from to the number of elements the page starting there is cut to
+    """
+
+    def fetch(start_from: int, page_size: int) -> Response:
+        calls.append((start_from, page_size))
+        size = min(
+            page_size, cap or page_size, (short or {}).get(start_from, page_size)
+        )
+        page = elements[start_from : start_from + size]
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            {"relatedHTTPCode": 200, "list": page or None, "padding": "x" * padding}
+        ).encode()
+        return response
+
+    return fetch
+
+
+class TestPager:
+    @pytest.mark.parametrize("count", [0, 1, 49, 50, 51, 1000])
+    def test_returns_every_element(self, count):
+        elements = list(range(count))
+        calls = []
+        pager = Pager(_list_endpoint(elements, calls), adaptive=False)
+        assert list(pager) == elements
+        assert pager.exhausted
+        assert not pager.truncated
+        assert pager.start_from == count
+        assert len(calls) == -(-count // paging.default_page_size) + 1
+
+    @pytest.mark.parametrize("adaptive", [False, True])
+    def test_server_page_cap(self, adaptive):
+        elements = list(range(1000))
+        calls = []
+        pager = Pager(
+            _list_endpoint(elements, calls, cap=50), page_size=100, adaptive=adaptive
+        )
+        assert list(pager) == elements
+        assert pager.exhausted and pager.max_page_size == 50
+        assert len(calls) == 1000 // 50 + 1
+
+    def test_short_page_does_not_cap(self):
+        elements = list(range(300))
+        calls = []
+        pager = Pager(
+            _list_endpoint(elements, calls, short={0: 3}), page_size=100, adaptive=False
+        )
+        assert list(pager) == elements
+        assert pager.max_page_size == max_paging_size
+        assert [size for _, size in calls] == [100] * 5
+
+    @pytest.mark.parametrize(
+        "start_from, max_elements, expected, truncated",
+        [
+            (0, 10, range(0, 10), True),
+            (95, 10, range(95, 100), False),
+            (20, 0, range(20, 100), False),
+        ],
+    )
+    def test_start_and_cap(self, start_from, max_elements, expected, truncated):
+        calls = []
+        pager = Pager(
+            _list_endpoint(list(range(100)), calls),
+            start_from=start_from,
+            max_elements=max_elements,
+        )
+        assert list(pager) == list(expected)
+        assert pager.truncated == truncated
+        assert all(size <= max_elements for _, size in calls if max_elements)
+
+    def test_resume_after_truncation(self):
+        calls = []
+        elements = list(range(100))
+        first = Pager(_list_endpoint(elements, calls), max_elements=30)
+        head = list(first)
+        rest = list(Pager(_list_endpoint(elements, calls), start_from=first.start_from))
+        assert head + rest == elements
+
+    def test_page_size_grows_when_fast(self):
+        calls = []
+        pager = Pager(_list_endpoint(list(range(1000)), calls), page_size=10)
+        list(pager)
+        sizes = [size for _, size in calls]
+        assert sizes[:4] == [10, 20, 40, 80]
+        assert sizes[-1] == pager.max_page_size
+
+    def test_page_size_shrinks_when_large(self, monkeypatch):
+        monkeypatch.setattr(paging, "max_page_bytes", 1000)
+        calls = []
+        pager = Pager(
+            _list_endpoint(list(range(500)), calls, padding=2000), page_size=80
+        )
+        list(pager)
+        sizes = [size for _, size in calls]
+        assert sizes[:4] == [80, 40, 20, 10]
+        assert min(sizes) == paging.min_page_size
+
+    def test_read_ahead(self):
+        calls = []
+        elements = list(range(230))
+        pager = Pager(_list_endpoint(elements, calls), read_ahead=True)
+        assert list(pager) == elements
+
+    def test_list_of(self):
+        calls = []
+        response = _list_endpoint(["a"], calls)(0, 1)
+        assert list_of("list")(response) == ["a"]
+
+    def test_negative_arguments(self):
+        with pytest.raises(ValueError):
+            Pager(lambda s, p: None, start_from=-1)
+        with pytest.raises(ValueError):
+            Pager(lambda s, p: None, page_size=-1)
+
+
+class _ConnectedAssetHandler(StubHandler):
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        start = int(query["elementStart"][0])
+        size = int(query["maxElements"][0])
+        if start >= self.server.fail_from:
+            self._reply(500)
+        else:
+            self._reply(
+                200, {"list": list(range(start, min(start + size, 120))) or None}
+            )
+
+
+class TestConnectedAssetPager:
+    def test_returns_every_element(self, stub_server):
+        url = stub_server(_ConnectedAssetHandler, fail_from=1000)[1]
+        pager = connected_asset_pager("cocoMDS1", "platform", url, url + "/comments")
+        assert list(pager) == list(range(120))
+
+    def test_failed_page_raises(self, stub_server, capsys):
+        url = stub_server(_ConnectedAssetHandler, fail_from=50)[1]
+        pager = connected_asset_pager(
+            "cocoMDS1", "platform", url, url + "/comments", page_size=50
+        )
+        elements = []
+        with pytest.raises(ConnectionError):
+            for element in pager:
+                elements.append(element)
+        assert elements == list(range(50))
+        assert not pager.exhausted
@@ -7,7 +7,8 @@ from egeria_client.client import (
 )
 
 from egeria_client.platform_services import Platform
-import test_client
+from src.egeria_client.mock_platform import default_servers, platform_origin
+from tests.stub_server import unreachable_url
 from contextlib import nullcontext as does_not_raise
 import json
 import requests
@@ -18,18 +19,13 @@ import requests
 
 
 class TestPlatform:
-    def test_shutdown_platform(self):
-        response = None
-
-        with pytest.raises(
-            RESTConnectionException, InvalidParameterException, requests.ConnectionError
-        ) as excinfo:
-            p_client = Platform("moo", "https://127.0.0.1:9443", "garygeeke")
-            response = p_client.shutdown_platform()
-            response = p_client.get_platform_origin()
-        if response is not None:
-            assert excinfo.value.http_error_code == str(200), "Invalid URL"
-            print(excinfo)
+    def test_shutdown_platform(self, platform_url):
+        p_client = Platform("moo", platform_url, "garygeeke")
+        assert p_client.shutdown_platform() is None
+
+        with pytest.raises(InvalidParameterException) as excinfo:
+            p_client = Platform("moo", unreachable_url, "garygeeke")
+            p_client.shutdown_platform()
 
         if excinfo:
             print(
@@ -41,14 +37,13 @@ class TestPlatform:
             print(f"\t\t   Message: {excinfo.value.error_msg}")
             print(f"\t\t   User Action: {excinfo.value.user_action}")
 
-    def test_get_platform_origin(self):
+    def test_get_platform_origin(self, platform_url):
         try:
-            p_client = Platform(
-                "active-metadata-store", "https://127.0.0.1:9443", "garygeeke"
-            )
+            p_client = Platform("active-metadata-store", platform_url, "garygeeke")
             response = p_client.get_platform_origin()
             print(response.text)
             assert response.status_code == 200
+            assert response.text == platform_origin
 
         except (InvalidParameterException, PropertyServerException) as excinfo:
             assert excinfo.http_error_code == "503"
@@ -62,24 +57,28 @@ class TestPlatform:
             print(f"\t\t   Message: {excinfo.error_msg}")
             print(f"\t\t   User Action: {excinfo.user_action}")
 
-    def test_activate_server_stored_config(self):
-        p_client = Platform("meow", "https://127.0.0.1:9443", "garygeeke")
+    def test_activate_server_stored_config(self, platform_url):
+        p_client = Platform("cocoMDS1", platform_url, "garygeeke")
         response = p_client.activate_server_stored_config()
         assert response.get("relatedHTTPCode") == 200
 
-    def test_de_activate_server(self):
-        p_client = Platform("meow", "https://127.0.0.1:9443", "garygeeke")
+        with pytest.raises(InvalidParameterException) as excinfo:
+            Platform("meow", platform_url, "garygeeke").activate_server_stored_config()
+        assert excinfo.value.http_error_code == "404"
+
+    def test_de_activate_server(self, platform_url):
+        p_client = Platform("cocoMDS1", platform_url, "garygeeke")
         response = p_client.de_activate_server()
-        assert response.get("relatedHTTPCode") == 200
+        assert response.json().get("relatedHTTPCode") == 200
+        assert "cocoMDS1" not in p_client.get_active_server_list().json()["serverList"]
 
-    def test_list_servers(self):
+    def test_list_servers(self, platform_url):
         try:
-            p_client = Platform(
-                "active-metadata-store", "https://127.0.0.1:9443", "garygeeke"
-            )
+            p_client = Platform("active-metadata-store", platform_url, "garygeeke")
             response = p_client.list_servers()
             print(json.dumps(response, indent=4))
             assert response.get("relatedHTTPCode") == 200
+            assert response.get("serverList") == sorted(default_servers)
 
         except (InvalidParameterException, PropertyServerException) as excinfo:
             assert excinfo.http_error_code == "503"
@@ -94,8 +93,8 @@ class TestPlatform:
             print(f"\t\t   Message: {excinfo.error_msg}")
             print(f"\t\t   User Action: {excinfo.user_action}")
 
-    def test_delete_servers(self):
-        p_client = Platform("moo", "https://127.0.0.1:9443", "garygeeke")
+    def test_delete_servers(self, platform_url):
+        p_client = Platform("moo", platform_url, "garygeeke")
         response = p_client.delete_servers()
         assert response.status_code == 200
 
@@ -104,49 +103,42 @@ class TestPlatform:
         [
             (
                 "meow",
-                "https://google.com",
+                "{platform}/elsewhere",
                 "garygeeke",
                 404,
                 pytest.raises(InvalidParameterException),
             ),
             (
-                "cocoMDS2",
-                "https://localhost:9443",
+                "cocoMDS7",
+                "{platform}",
                 "garygeeke",
                 400,
                 pytest.raises(InvalidParameterException),
             ),
             (
                 "cocoMDS2",
-                "https://127.0.0.1:9443",
+                "{platform}",
                 "garygeeke",
                 200,
                 does_not_raise(),
             ),
-            # (
-            #     "cocoMDS7",
-            #     "https://127.0.0.1:9443",
-            #     "garygeeke",
-            #     404,
-            #     pytest.raises(InvalidParameterException),
-            # ),
             (
                 "cocoMDS2",
-                "https://127.0.0.1:9443",
+                "{platform}",
                 "",
                 404,
                 pytest.raises(InvalidParameterException),
             ),
             (
                 "cocoMDS2",
-                "https://127.0.0.1:9443/open-metadata/admin-services/users/garygeeke/servers/active-metadata-store",
+                "{platform}/open-metadata/admin-services/users/garygeeke/servers/active-metadata-store",
                 "meow",
                 404,
                 pytest.raises(InvalidParameterException),
             ),
             (
                 "cocoMDS2",
-                "https://wolfsonnet.me:9443/open-metadata/admin-services/users/garygeeke/servers/active-metadata-store",
+                unreachable_url,
                 "woof",
                 503,
                 pytest.raises(InvalidParameterException),
@@ -155,13 +147,13 @@ class TestPlatform:
         ],
     )
     def test_get_active_configuration(
-        self, server, url, user_id, status_code, expectation
+        self, platform_url, server, url, user_id, status_code, expectation
     ):
         user_pwd = "nonesuch"
         response = requests.Response()
 
         with expectation as excinfo:
-            p_client = Platform(server, url, user_id)
+            p_client = Platform(server, url.format(platform=platform_url), user_id)
             response = p_client.get_active_configuration()
             # print(json.dumps(response, indent=4))
 
@@ -0,0 +1,183 @@
+#
+#  Test retrying of transient request failures
+#
+
+import pytest
+import requests
+from requests import Response
+
+from egeria_client.client import Client
+from src.egeria_client import util_exp
+from src.egeria_client.retry import RetryPolicy
+from src.egeria_client.util_exp import (
+    PropertyServerException,
+    issue_data_post,
+    issue_post,
+    issue_put,
+)
+from tests.stub_server import StubHandler
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _responses(*outcomes):
+    """Return a send function producing the given status codes or raising the given exceptions"""
+    calls = []
+
+    def send(timeout):
+        calls.append(timeout)
+        outcome = outcomes[min(len(calls), len(outcomes)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = Response()
+        response.status_code = outcome
+        return response
+
+    return send, calls
+
+
+def _policy(clock: _Clock, **kwargs) -> RetryPolicy:
+    return RetryPolicy(jitter=False, sleep=clock.sleep, clock=clock, **kwargs)
+
+
+class TestRetryPolicy:
+    @pytest.mark.parametrize(
+        "outcomes, status, attempts",
+        [
+            ((200,), 200, 1),
+            ((503, 200), 200, 2),
+            ((500, 502, 504), 504, 3),
+            ((404, 200), 404, 1),
+            ((requests.ConnectionError("refused"), 200), 200, 2),
+        ],
+    )
+    def test_retries_transient_failures(self, outcomes, status, attempts):
+        clock = _Clock()
+        send, calls = _responses(*outcomes)
+        assert _policy(clock).call("GET", send).status_code == status
+        assert len(calls) == attempts
+
+    def test_exponential_backoff_is_capped(self):
+        clock = _Clock()
+        send, _ = _responses(503)
+        _policy(clock, max_attempts=6, backoff_base=1, backoff_cap=5).call("GET", send)
+        assert clock.sleeps == [1, 2, 4, 5, 5]
+
+    def test_jitter_stays_within_backoff(self):
+        policy = RetryPolicy(backoff_base=1, backoff_cap=8)
+        assert all(0 <= policy.backoff(4) <= 8 for _ in range(100))
+
+    def test_last_exception_is_raised(self):
+        clock = _Clock()
+        send, calls = _responses(requests.Timeout("slow"))
+        with pytest.raises(requests.Timeout):
+            _policy(clock).call("GET", send)
+        assert len(calls) == 3
+
+    @pytest.mark.parametrize("safe, attempts", [(False, 1), (True, 3)])
+    def test_posts_replayed_only_when_safe(self, safe, attempts):
+        clock = _Clock()
+        send, calls = _responses(503)
+        _policy(clock).call("POST", send, safe=safe)
+        assert len(calls) == attempts
+
+    def test_deadline_bounds_attempts_and_timeouts(self):
+        clock = _Clock()
+        send, calls = _responses(503)
+        policy = _policy(clock, max_attempts=10, backoff_base=1, deadline=5)
+        policy.call("GET", send, timeout=30)
+        assert calls == [5, 4, 2]
+        assert sum(clock.sleeps) < 5
+
+    def test_retry_after_header(self):
+        clock = _Clock()
+        send, _ = _responses(503, 200)
+
+        def send_with_header(timeout):
+            response = send(timeout)
+            response.headers["Retry-After"] = "3"
+            return response
+
+        _policy(clock, backoff_base=0.5).call("GET", send_with_header)
+        assert clock.sleeps == [3]
+
+
+class _FlakyHandler(StubHandler):
+    failures = 0
+    calls = 0
+
+    def _handle(self):
+        _FlakyHandler.calls += 1
+        self._read_body()
+        self._reply(503 if _FlakyHandler.calls <= _FlakyHandler.failures else 200)
+
+    do_GET = _handle
+    do_POST = _handle
+    do_PUT = _handle
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    _FlakyHandler.calls = 0
+    return stub_server(_FlakyHandler)[1]
+
+
+class TestMakeRequestRetries:
+    @pytest.mark.parametrize(
+        "request_type, retry_safe, failures, calls, succeeds",
+        [
+            ("GET", False, 2, 3, True),
+            ("GET", False, 3, 3, False),
+            ("POST", False, 1, 1, False),
+            ("POST", True, 1, 2, True),
+        ],
+    )
+    def test_make_request(
+        self, local_platform, request_type, retry_safe, failures, calls, succeeds
+    ):
+        _FlakyHandler.failures = failures
+        client = Client("meow", local_platform, "garygeeke")
+        client.retry_policy = RetryPolicy(backoff_base=0.01)
+        endpoint = local_platform + "/status"
+        if succeeds:
+            response = client.make_request(
+                request_type, endpoint, retry_safe=retry_safe
+            )
+            assert response.status_code == 200
+        else:
+            with pytest.raises(PropertyServerException):
+                client.make_request(request_type, endpoint, retry_safe=retry_safe)
+        assert _FlakyHandler.calls == calls
+
+
+class TestIssueRetries:
+    @pytest.mark.parametrize(
+        "issue, safe, calls",
+        [
+            (lambda url, safe: issue_post(url, safe=safe), False, 1),
+            (lambda url, safe: issue_post(url, safe=safe), True, 2),
+            (lambda url, safe: issue_data_post(url, "{}", safe=safe), False, 1),
+            (lambda url, safe: issue_data_post(url, "{}", safe=safe), True, 2),
+            (lambda url, safe: issue_put(url, {}, safe=safe), False, 1),
+            (lambda url, safe: issue_put(url, {}, safe=safe), True, 2),
+        ],
+    )
+    def test_issue(self, local_platform, monkeypatch, issue, safe, calls):
+        monkeypatch.setattr(
+            util_exp, "default_retry_policy", RetryPolicy(backoff_base=0.01)
+        )
+        _FlakyHandler.failures = 1
+        response = issue(local_platform + "/status", safe)
+        assert response.status_code == (200 if safe else 503)
+        assert _FlakyHandler.calls == calls
@@ -0,0 +1,166 @@
+#
+#  Test parallel server activation and deactivation
+#
+import re
+import threading
+import time
+
+import pytest
+
+from egeria_client.platform_services import Platform
+from src.egeria_client.retry import no_retries
+from src.egeria_client.server_orchestrator import ServerOrchestrator, dependency_order
+from tests.stub_server import StubHandler
+
+startup_time = 0.3
+
+
+class _PlatformHandler(StubHandler):
+    def _server(self) -> str:
+        match = re.search(r"/servers/([^/]+)/instance", self.path)
+        return match.group(1) if match else None
+
+    def do_POST(self):
+        self._read_body()
+        server = self._server()
+        state = self.server.state
+        with state["lock"]:
+            state["events"].append(("activate", server, time.monotonic()))
+            broken = server in state["broken"]
+            if not broken:
+                state["ready_at"][server] = time.monotonic() + startup_time
+        self._reply(200, {"relatedHTTPCode": 500 if broken else 200})
+
+    def do_DELETE(self):
+        server = self._server()
+        state = self.server.state
+        with state["lock"]:
+            state["events"].append(("deactivate", server, time.monotonic()))
+            state["ready_at"].pop(server, None)
+        self._reply(200)
+
+    def do_GET(self):
+        state = self.server.state
+        now = time.monotonic()
+        with state["lock"]:
+            running = [s for s, t in state["ready_at"].items() if t <= now]
+        if self.path.endswith("/servers/active"):
+            self._reply(200, {"serverList": running})
+        else:
+            server = self._server()
+            with state["lock"]:
+                failing = state["failing_polls"].get(server, 0)
+                state["failing_polls"][server] = failing - 1
+            if failing > 0:
+                self._reply(503)
+                return
+            status = "RUNNING" if server in running else "STARTING"
+            self._reply(200, {"serverStatus": status})
+
+
+@pytest.fixture()
+def platform_server(stub_server):
+    server, url = stub_server(
+        _PlatformHandler,
+        state={
+            "lock": threading.Lock(),
+            "events": [],
+            "ready_at": {},
+            "broken": set(),
+            "failing_polls": {},
+        },
+    )
+    return server, Platform("cocoMDS1", url, "garygeeke")
+
+
+dependencies = {"view1": ["mds1", "mds2"], "int1": ["mds1"], "view2": ["view1"]}
+servers = ["mds1", "mds2", "view1", "view2", "int1"]
+
+
+class TestDependencyOrder:
+    def test_waves(self):
+        assert dependency_order(servers, dependencies) == [
+            ["mds1", "mds2"],
+            ["view1", "int1"],
+            ["view2"],
+        ]
+
+    def test_cycle(self):
+        with pytest.raises(ValueError):
+            dependency_order(["a", "b"], {"a": ["b"], "b": ["a"]})
+
+
+class TestServerOrchestrator:
+    def test_activate_respects_dependencies(self, platform_server):
+        server, platform = platform_server
+        seen = []
+        orchestrator = ServerOrchestrator(platform, max_parallel=4, poll_interval=0.05)
+        report = orchestrator.activate(
+            servers,
+            dependencies,
+            on_progress=lambda p: seen.append((p.server, p.state)),
+        )
+        assert sorted(report.succeeded()) == sorted(servers)
+        started = {s: t for _, s, t in server.state["events"]}
+        for dependent, needs in dependencies.items():
+            for need in needs:
+                assert started[dependent] >= started[need] + startup_time
+        assert report.elapsed < 3 * startup_time + 0.5
+        assert ("view2", "ready") in seen
+        assert all(p.polls >= 1 for p in report.progress.values())
+
+    def test_failure_skips_dependents(self, platform_server):
+        server, platform = platform_server
+        server.state["broken"].add("mds1")
+        orchestrator = ServerOrchestrator(platform, poll_interval=0.05)
+        report = orchestrator.activate(servers, dependencies)
+        states = {s: p.state for s, p in report.progress.items()}
+        assert states == {
+            "mds1": "failed",
+            "mds2": "ready",
+            "view1": "skipped",
+            "view2": "skipped",
+            "int1": "skipped",
+        }
+        assert sorted(report.failed()) == ["int1", "mds1", "view1", "view2"]
+        assert "mds1" in report.table()
+
+    def test_ready_timeout(self, platform_server):
+        _, platform = platform_server
+        orchestrator = ServerOrchestrator(
+            platform, poll_interval=0.05, ready_timeout=0.1
+        )
+        report = orchestrator.activate(["mds1"])
+        assert report.progress["mds1"].state == "failed"
+        assert "TimeoutError" in report.progress["mds1"].error
+
+    @pytest.mark.parametrize(
+        "failing_polls, ready_timeout, state",
+        [(3, 5.0, "ready"), (1000, 0.3, "failed")],
+    )
+    def test_failed_polls_are_retried(
+        self, platform_server, failing_polls, ready_timeout, state
+    ):
+        server, platform = platform_server
+        platform.retry_policy = no_retries
+        server.state["failing_polls"]["mds1"] = failing_polls
+        orchestrator = ServerOrchestrator(
+            platform, poll_interval=0.05, ready_timeout=ready_timeout
+        )
+        progress = orchestrator.activate(["mds1"]).progress["mds1"]
+        assert progress.state == state
+        assert progress.polls > 3
+        if state == "failed":
+            assert "TimeoutError" in progress.error
+            assert "last poll failed" in progress.error
+
+    def test_restart_deactivates_dependents_first(self, platform_server):
+        server, platform = platform_server
+        orchestrator = ServerOrchestrator(platform, poll_interval=0.05)
+        orchestrator.activate(servers, dependencies)
+        server.state["events"].clear()
+        stopped, started = orchestrator.restart(servers, dependencies)
+        assert sorted(stopped.succeeded()) == sorted(servers)
+        assert sorted(started.succeeded()) == sorted(servers)
+        order = [s for action, s, _ in server.state["events"] if action == "deactivate"]
+        assert order.index("view2") < order.index("view1") < order.index("mds1")
@@ -0,0 +1,62 @@
+#
+#  Test the shared keep-alive session pool
+#
+
+import pytest
+
+from egeria_client.client import Client
+from egeria_client.platform_services import Platform
+from src.egeria_client.session_pool import SessionPool, session_pool
+from tests.stub_server import StubHandler
+
+
+class _OKHandler(StubHandler):
+    def do_GET(self):
+        self._reply(200, {"class": "VoidResponse"})
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    return stub_server(_OKHandler)[1]
+
+
+class TestSessionPool:
+    @pytest.mark.parametrize(
+        "url_a, url_b, shared",
+        [
+            ("https://127.0.0.1:9443", "https://127.0.0.1:9443/open-metadata", True),
+            ("https://127.0.0.1:9443", "https://127.0.0.1:9444", False),
+            ("https://127.0.0.1", "https://127.0.0.1:443", True),
+            ("http://127.0.0.1", "https://127.0.0.1", False),
+        ],
+    )
+    def test_sessions_shared_per_platform(self, url_a, url_b, shared):
+        pool = SessionPool()
+        assert (pool.get_session(url_a) is pool.get_session(url_b)) == shared
+        pool.close()
+
+    def test_adapter_settings(self):
+        pool = SessionPool(pool_size=2, max_connections=4, pool_block=True)
+        pool.get_session("https://127.0.0.1:9443")
+        stats = pool.pool_stats("https://127.0.0.1:9443")
+        assert stats["pool_size"] == 2
+        assert stats["max_connections"] == 4
+        assert stats["pool_block"] is True
+        assert pool.pool_stats("https://127.0.0.1:9999") == {}
+        pool.close()
+
+    def test_platforms_share_session(self, local_platform):
+        p1 = Platform("meow", local_platform, "garygeeke")
+        p2 = Platform("woof", local_platform, "garygeeke")
+        assert p1.session is p2.session
+
+    def test_connection_reused(self, local_platform):
+        client = Client("meow", local_platform, "garygeeke")
+        for _ in range(5):
+            response = client.make_request("GET", local_platform + "/status")
+            assert response.status_code == 200
+
+        stats = client.pool_stats()
+        assert stats["requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["idle_connections"] == 1
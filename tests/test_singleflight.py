@@ -0,0 +1,103 @@
+#
+#  Test coalescing of identical concurrent requests
+#
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from egeria_client.platform_services import Platform
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.singleflight import SingleFlight
+from src.egeria_client.util_exp import issue_get
+from tests.stub_server import StubHandler
+
+
+class _SlowHandler(StubHandler):
+    paths_seen = []
+
+    def do_GET(self):
+        self.paths_seen.append(self.path)
+        time.sleep(0.3)
+        self._reply(200, {"serverName": "meow"})
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    _SlowHandler.paths_seen = []
+    return stub_server(_SlowHandler)[1]
+
+
+def _run_together(count: int, fn):
+    barrier = threading.Barrier(count)
+
+    def call():
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(call) for _ in range(count)]
+        return [f.result() for f in futures]
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_result(self):
+        flight = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return object()
+
+        results = _run_together(8, lambda: flight.do("key", slow))
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert flight.stats() == {"calls": 1, "shared": 7, "in_flight": 0}
+
+    def test_sequential_calls_are_not_shared(self):
+        flight = SingleFlight()
+        assert [flight.do("key", lambda: n) for n in range(3)] == [0, 1, 2]
+        assert flight.shared == 0
+
+    def test_different_keys_are_not_shared(self):
+        flight = SingleFlight()
+        results = _run_together(2, lambda: flight.do(threading.get_ident(), list))
+        assert results[0] is not results[1]
+
+    def test_exception_shared(self):
+        flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.2)
+            raise ValueError("down")
+
+        def call():
+            try:
+                flight.do("key", fail)
+            except ValueError as e:
+                return e
+
+        errors = _run_together(4, call)
+        assert all(isinstance(e, ValueError) for e in errors)
+        assert flight.calls == 1
+        assert flight.in_flight() == 0
+
+
+class TestCoalescedRequests:
+    @pytest.mark.parametrize("coalesce, expected_calls", [(True, 1), (False, 6)])
+    def test_get_server_status(self, local_platform, coalesce, expected_calls):
+        platform = Platform("meow", local_platform, "garygeeke")
+        platform.coalesce_gets = coalesce
+        results = _run_together(6, lambda: platform.get_server_status().json())
+        assert len(_SlowHandler.paths_seen) == expected_calls
+        assert all(r["serverName"] == "meow" for r in results)
+
+    def test_code_paths_not_shared(self, local_platform):
+        consumer = AssetConsumer("meow", local_platform, "garygeeke")
+        url = local_platform + "/open-metadata/platform-services/users/garygeeke"
+        calls = [lambda: consumer._get(url), lambda: issue_get(url)]
+        responses = _run_together(2, lambda: calls.pop()())
+        assert len(_SlowHandler.paths_seen) == 2
+        assert responses[0] is not responses[1]
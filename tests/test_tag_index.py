@@ -0,0 +1,148 @@
+#
+#  Test the client-side tag index
+#
+import json
+import re
+import threading
+import time
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.tag_index import TagEntry, TagIndex
+from tests.stub_server import StubHandler
+
+
+def _tag(guid: str, name: str, description: str, private: bool) -> dict:
+    return {
+        "elementHeader": {"guid": guid},
+        "informalTagProperties": {
+            "name": name,
+            "description": description,
+            "isPrivateTag": private,
+        },
+    }
+
+
+class _TagHandler(StubHandler):
+    def do_POST(self):
+        body = json.loads(self._read_body())
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        state = self.server.state
+        path = re.split(r"/users/[^/]+", parts.path)[1]
+        with state["lock"]:
+            state["calls"].append(path)
+            if path.endswith("by-search-string"):
+                private = "/private/" in path
+                tags = sorted(
+                    (t for t in state["tags"].values() if t[3] == private),
+                    key=lambda t: t[0],
+                )
+                start, size = int(query["startFrom"][0]), int(query["pageSize"][0])
+                size = min(size, state.get("page_cap") or size)
+                page = [_tag(*t) for t in tags[start : start + size]]
+                self._reply(200, {"tags": page or None})
+            elif path == "/tags":
+                guid = f"tag-{len(state['tags']) + 100}"
+                private = body["isPrivateTag"] == "true"
+                state["tags"][guid] = (guid, body["name"], body["description"], private)
+                self._reply(200, {"guid": guid})
+            elif re.fullmatch(r"/tags/[^/]+/delete", path):
+                state["tags"].pop(path.split("/")[2], None)
+                self._reply(200)
+            elif re.fullmatch(r"/tags/[^/]+/update", path):
+                guid, name, _, private = state["tags"][path.split("/")[2]]
+                state["tags"][guid] = (guid, name, body["description"], private)
+                self._reply(200)
+            else:
+                self.send_error(404)
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    tags = [(f"tag-{i:02d}", f"pii-{i:02d}", "", False) for i in range(30)]
+    tags += [("tag-fin", "finance", "", False), ("tag-mine", "finance", "", True)]
+    server, url = stub_server(
+        _TagHandler,
+        state={
+            "lock": threading.Lock(),
+            "calls": [],
+            "tags": {t[0]: t for t in tags},
+        },
+    )
+    return server.state, AssetConsumer("cocoMDS1", url, "garygeeke")
+
+
+class TestTagIndex:
+    def test_load_and_lookup(self, local_platform):
+        state, consumer = local_platform
+        index = TagIndex(consumer, page_size=10)
+        assert len(index) == 32
+        # 4 pages of public tags and 1 of private tags, each list ended by an empty page
+        assert len(state["calls"]) == 7
+        assert index.guid_for("pii-07") == "tag-07"
+        assert [e.guid for e in index.lookup("finance")] == ["tag-fin", "tag-mine"]
+        assert index.lookup("finance")[1].is_private
+        assert index.lookup("unknown") == []
+        assert index.stats()["hits"] == 3
+
+    @pytest.mark.parametrize(
+        "prefix, limit, expected",
+        [
+            ("pii-1", 0, [f"pii-1{i}" for i in range(10)]),
+            ("pii-2", 3, ["pii-20", "pii-21", "pii-22"]),
+            ("fin", 0, ["finance", "finance"]),
+            ("zzz", 0, []),
+        ],
+    )
+    def test_prefix(self, local_platform, prefix, limit, expected):
+        _, consumer = local_platform
+        index = TagIndex(consumer)
+        assert [e.name for e in index.prefix(prefix, limit)] == expected
+
+    def test_client_changes_update_the_index(self, local_platform):
+        state, consumer = local_platform
+        index = TagIndex(consumer)
+        state["calls"].clear()
+        guid = consumer.create_public_tag("gdpr", "personal data")
+        assert index.get(guid) == TagEntry(guid, "gdpr", "personal data", False)
+        consumer.create_private_tag("someone-elses", "x", end_user_id="erinoverview")
+        assert index.lookup("someone-elses") == []
+        consumer.update_tag_description("tag-03", "renamed")
+        assert index.get("tag-03").description == "renamed"
+        consumer.delete_tag("tag-04")
+        assert index.lookup("pii-04") == []
+        assert [e.name for e in index.prefix("gd")] == ["gdpr"]
+        assert not any("by-search-string" in c for c in state["calls"])
+
+    def test_refresh_applies_differences(self, local_platform):
+        state, consumer = local_platform
+        index = TagIndex(consumer)
+        with state["lock"]:
+            del state["tags"]["tag-01"]
+            state["tags"]["tag-02"] = ("tag-02", "pii-two", "", False)
+            state["tags"]["tag-new"] = ("tag-new", "aardvark", "", False)
+        assert index.refresh() == {"added": 1, "removed": 1, "updated": 1}
+        assert index.prefix("a")[0].guid == "tag-new"
+        assert index.lookup("pii-02") == [] and index.guid_for("pii-two") == "tag-02"
+        assert index.refresh() == {"added": 0, "removed": 0, "updated": 0}
+
+    def test_server_page_cap(self, local_platform):
+        state, consumer = local_platform
+        state["page_cap"] = 4
+        index = TagIndex(consumer, page_size=10)
+        assert len(index) == 32
+        assert index.refresh() == {"added": 0, "removed": 0, "updated": 0}
+
+    def test_background_refresh(self, local_platform):
+        state, consumer = local_platform
+        with TagIndex(consumer, refresh_interval=0.05) as index:
+            with state["lock"]:
+                state["tags"]["tag-bg"] = ("tag-bg", "background", "", False)
+            deadline = time.monotonic() + 2
+            while index.guid_for("background") is None and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert index.guid_for("background") == "tag-bg"
+        assert index.stats()["refreshes"] >= 2
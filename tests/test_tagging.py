@@ -0,0 +1,139 @@
+#
+#  Test the bulk tagging pipeline
+#
+import json
+import re
+import threading
+import time
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.tagging import BulkTagger, TagNameMap
+from tests.stub_server import StubHandler
+
+existing_tags = {f"existing-{i}": f"tag-guid-{i}" for i in range(25)}
+
+
+def _tag(name: str, guid: str) -> dict:
+    return {
+        "elementHeader": {"guid": guid},
+        "informalTagProperties": {"name": name, "isPrivateTag": False},
+    }
+
+
+class _TagHandler(StubHandler):
+    def do_POST(self):
+        body = json.loads(self._read_body())
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        state = self.server.state
+        with state["lock"]:
+            state["calls"].append(parts.path.split("/users/garygeeke")[1])
+            tags = dict(state["tags"])
+        if parts.path.endswith("/tags/by-search-string"):
+            start, size = int(query["startFrom"][0]), int(query["pageSize"][0])
+            page = [_tag(n, g) for n, g in sorted(tags.items())][start : start + size]
+            self._reply(200, {"tags": page or None})
+        elif parts.path.endswith("/tags/by-name"):
+            name = body["name"]
+            found = [_tag(name, tags[name])] if name in tags else None
+            self._reply(200, {"tags": found})
+        elif parts.path.endswith("/tags"):
+            time.sleep(0.05)
+            with state["lock"]:
+                guid = f"new-guid-{len(state['tags'])}"
+                state["tags"][body["name"]] = guid
+                state["created"].append((body["name"], body["isPublic"]))
+            self._reply(200, {"guid": guid})
+        elif re.search(r"/(assets|elements)/[^/]+/tags/[^/]+$", parts.path):
+            time.sleep(0.01)
+            self._reply(200)
+        else:
+            self.send_error(404)
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    server, url = stub_server(
+        _TagHandler,
+        state={
+            "lock": threading.Lock(),
+            "calls": [],
+            "tags": dict(existing_tags),
+            "created": [],
+        },
+    )
+    return server.state, AssetConsumer("cocoMDS1", url, "garygeeke")
+
+
+def _calls(state, pattern: str) -> list:
+    return [c for c in state["calls"] if re.search(pattern, c)]
+
+
+class TestTagNameMap:
+    def test_load(self, local_platform):
+        state, consumer = local_platform
+        tags = TagNameMap(consumer)
+        assert tags.load(page_size=10) == 25
+        assert tags.resolve("existing-3") == "tag-guid-3"
+        assert (
+            len(_calls(state, "by-search-string")) == 4
+        )  # 10, 20, then 15 and the empty page
+        assert tags.stats()["looked_up"] == 0
+
+    def test_missing_tag_is_created_once(self, local_platform):
+        state, consumer = local_platform
+        tags = TagNameMap(consumer, is_public=False)
+        threads = [
+            threading.Thread(target=tags.resolve, args=("pii",)) for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert state["created"] == [("pii", "false")]
+        assert tags.resolve("pii") == state["tags"]["pii"]
+        assert tags.stats() == {"names": 1, "loaded": 0, "looked_up": 1, "created": 1}
+
+    def test_lookup_by_name(self, local_platform):
+        state, consumer = local_platform
+        tags = TagNameMap(consumer, create_missing=False)
+        assert tags.resolve("existing-7") == "tag-guid-7"
+        with pytest.raises(KeyError):
+            tags.resolve("unknown")
+        assert state["created"] == []
+
+
+class TestBulkTagger:
+    def test_tag_assets(self, local_platform):
+        state, consumer = local_platform
+        pairs = (
+            (f"asset-{i}", f"existing-{i % 3}" if i % 2 else f"new-{i % 4}")
+            for i in range(200)
+        )
+        tagger = BulkTagger(consumer, max_workers=8)
+        report = tagger.tag_assets(pairs)
+        summary = report.summary()
+        assert summary["items"] == summary["succeeded"] == 200
+        assert report.results == []
+        assert summary["items_per_second"] > 0
+        assert summary["tag_created"] == 2
+        assert len(_calls(state, "/tags/by-name$")) == 2
+        assert len(_calls(state, r"^/assets/asset-\d+/tags/")) == 200
+        assert f"/assets/asset-2/tags/{state['tags']['new-2']}" in state["calls"]
+
+    def test_tag_elements_with_checkpoint(self, local_platform, tmp_path):
+        state, consumer = local_platform
+        path = str(tmp_path / "tags.jsonl")
+        pairs = [(f"element-{i}", "existing-1") for i in range(10)]
+        tagger = BulkTagger(consumer, preload=False)
+        tagger.tag_elements(pairs[:6], checkpoint_path=path)
+        state["calls"].clear()
+        report = tagger.tag_elements(pairs, checkpoint_path=path, keep_results=True)
+        assert report.values() == ["tag-guid-1"] * 10
+        assert report.summary()["resumed"] == 6
+        assert sorted(_calls(state, "^/elements/")) == [
+            f"/elements/element-{i}/tags/tag-guid-1" for i in range(6, 10)
+        ]
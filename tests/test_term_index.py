@@ -0,0 +1,114 @@
+#
+#  Test the term to asset inverted index
+#
+import threading
+import time
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.retry import RetryPolicy
+from src.egeria_client.term_index import TermAssetIndex
+from tests.stub_server import StubHandler
+
+# term-k is carried by every asset whose number is a multiple of k
+terms = {f"term-{k}": [f"asset-{n}" for n in range(0, 60, k)] for k in range(1, 9)}
+
+
+class _MeaningHandler(StubHandler):
+    def _page(self, items: list) -> list:
+        query = parse_qs(urlsplit(self.path).query)
+        start, size = int(query["startFrom"][0]), int(query["pageSize"][0])
+        return items[start : start + size] or None
+
+    def do_GET(self):
+        state = self.server.state
+        term = urlsplit(self.path).path.rsplit("/", 1)[1]
+        with state["lock"]:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        time.sleep(0.05)
+        with state["lock"]:
+            state["active"] -= 1
+        if term in state["broken"]:
+            self._reply(404)
+        else:
+            self._reply(200, {"guids": self._page(terms[term])})
+
+    def do_POST(self):
+        self._read_body()
+        meanings = [{"elementHeader": {"guid": t}} for t in sorted(terms)]
+        self._reply(200, {"meanings": self._page(meanings)})
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    server, url = stub_server(
+        _MeaningHandler,
+        state={
+            "lock": threading.Lock(),
+            "active": 0,
+            "max_active": 0,
+            "broken": set(),
+        },
+    )
+    return server.state, AssetConsumer("cocoMDS1", url, "garygeeke")
+
+
+def _index() -> TermAssetIndex:
+    index = TermAssetIndex()
+    for term, assets in terms.items():
+        index.add_term(term, assets)
+    return index
+
+
+class TestTermAssetIndex:
+    @pytest.mark.parametrize(
+        "query, any_of, all_of",
+        [
+            (
+                ["term-2", "term-3"],
+                {n for n in range(60) if n % 2 == 0 or n % 3 == 0},
+                {n for n in range(0, 60, 6)},
+            ),
+            (["term-4", "term-8"], set(range(0, 60, 4)), set(range(0, 60, 8))),
+            (["term-7", "unknown"], set(range(0, 60, 7)), set()),
+            ([], set(), set()),
+        ],
+    )
+    def test_queries(self, query, any_of, all_of):
+        index = _index()
+        assert index.assets_with_any(query) == {f"asset-{n}" for n in any_of}
+        assert index.assets_with_all(query) == {f"asset-{n}" for n in all_of}
+        assert index.count_with_any(query) == len(any_of)
+
+    def test_interned_postings(self):
+        index = _index()
+        index.add_term("term-1", terms["term-1"] + ["asset-0"])
+        stats = index.stats()
+        assert stats["assets"] == 60
+        assert stats["postings"] == sum(len(a) for a in terms.values())
+        assert stats["posting_bytes"] == stats["postings"] * 4
+        assert index.assets_of("term-5") == terms["term-5"]
+
+    def test_build_for_whole_glossary(self, local_platform):
+        state, consumer = local_platform
+        index = TermAssetIndex.build(consumer, max_workers=4, page_size=7)
+        assert sorted(index.terms()) == sorted(terms)
+        assert 1 < state["max_active"] <= 4
+        assert index.assets_with_all(["term-2", "term-5"]) == {
+            f"asset-{n}" for n in range(0, 60, 10)
+        }
+        assert index.report.summary()["succeeded"] == 8
+
+    def test_build_reports_failed_terms(self, local_platform):
+        state, consumer = local_platform
+        state["broken"].add("term-3")
+        index = TermAssetIndex.build(
+            consumer,
+            ["term-1", "term-3"],
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+        assert index.terms() == ["term-1"]
+        assert [r.key for r in index.report.failed()] == ["term-3"]
@@ -0,0 +1,213 @@
+#
+#  Test the tracing of client calls
+#
+import asyncio
+from urllib.parse import urlsplit
+
+import pytest
+
+from egeria_client.platform_services import Platform
+from src.egeria_client.asset_consumer import AssetConsumer
+from src.egeria_client.async_client import AsyncAssetConsumer
+from src.egeria_client.bulk_ops import run_bulk
+from src.egeria_client.tracing import (
+    SimpleTracer,
+    format_traceparent,
+    parse_traceparent,
+    tracing,
+)
+from src.egeria_client.util_exp import issue_post, issue_put
+from tests.stub_server import StubHandler
+
+asset = "00000001-0000-4000-8000-00000000002a"
+remote_trace, remote_span = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+
+
+class _TraceparentHandler(StubHandler):
+    def _handle(self):
+        self._read_body()
+        parts = urlsplit(self.path)
+        path = parts.path
+        self.server.state["traceparents"].append(
+            (path.rsplit("/", 1)[1], self.headers.get("traceparent"))
+        )
+        if "missing" in path:
+            self._reply(404)
+        else:
+            first = "startFrom=0" in parts.query or "startFrom" not in parts.query
+            self._reply(
+                200, {"guids": [asset] if first else None, "serverStatus": "RUNNING"}
+            )
+
+    do_GET = _handle
+    do_POST = _handle
+    do_PUT = _handle
+
+
+@pytest.fixture()
+def local_platform(stub_server):
+    server, url = stub_server(_TraceparentHandler, state={"traceparents": []})
+    yield server.state, url
+    tracing.set_tracer(None)
+
+
+class TestTraceparent:
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            (f"00-{remote_trace}-{remote_span}-01", (remote_trace, remote_span, True)),
+            (
+                f"00-{remote_trace.upper()}-{remote_span}-00",
+                (remote_trace, remote_span, False),
+            ),
+            (f"00-{'0' * 32}-{remote_span}-01", None),
+            (f"ff-{remote_trace}-{remote_span}-01", None),
+            ("not a traceparent", None),
+            (None, None),
+        ],
+    )
+    def test_parse(self, header, expected):
+        context = parse_traceparent(header)
+        if expected is None:
+            assert context is None
+        else:
+            assert (context.trace_id, context.span_id, context.sampled) == expected
+            assert context.traceparent == format_traceparent(*expected)
+
+
+class TestTracing:
+    def test_disabled(self, local_platform):
+        state, url = local_platform
+        find_assets = AssetConsumer.__dict__["find_assets"]
+        AssetConsumer("cocoMDS1", url, "peterprofile").find_assets(".*")
+        assert state["traceparents"] == [("by-search-string", None)]
+        assert AssetConsumer.__dict__["find_assets"] is find_assets
+
+    def test_spans_and_headers(self, local_platform):
+        state, url = local_platform
+        tracer = SimpleTracer()
+        tracing.set_tracer(tracer)
+        consumer = AssetConsumer("cocoMDS1", url, "peterprofile")
+        consumer.find_assets(".*")
+        consumer.add_tag(asset, "tag-guid", True)
+        Platform("cocoMDS1", url, "garygeeke").get_active_server_status("cocoMDS2")
+
+        find, tag, status = tracer.spans
+        assert find.name == "AssetConsumer.find_assets"
+        assert find.attributes == {
+            "egeria.operation": "find_assets",
+            "egeria.server": "cocoMDS1",
+            "egeria.platform_url": url,
+        }
+        assert tag.attributes["egeria.asset_guid"] == asset
+        assert tag.attributes["egeria.tag_guid"] == "tag-guid"
+        assert status.name == "Platform.get_active_server_status"
+        assert status.attributes["egeria.server"] == "cocoMDS2"
+        assert [tp for _, tp in state["traceparents"]] == [
+            s.traceparent for s in (find, tag, status)
+        ]
+        assert len({s.trace_id for s in tracer.spans}) == 3
+        assert all(s.duration > 0 and s.parent_id is None for s in tracer.spans)
+
+    def test_remote_parent_and_errors(self, local_platform):
+        state, url = local_platform
+        tracer = SimpleTracer()
+        tracing.set_tracer(tracer)
+        consumer = AssetConsumer("cocoMDS1", url, "peterprofile")
+        with tracing.remote_parent(f"00-{remote_trace}-{remote_span}-01"):
+            with pytest.raises(ConnectionError):
+                consumer.add_tag("missing", "tag-guid", True)
+        (span,) = tracer.spans
+        assert (span.trace_id, span.parent_id) == (remote_trace, remote_span)
+        assert span.error.startswith("ConnectionError")
+        assert state["traceparents"][0][1] == span.traceparent
+
+        tracer.clear()
+        with tracing.remote_parent(f"00-{remote_trace}-{remote_span}-00"):
+            consumer.find_assets(".*")
+        assert not tracer.spans
+        assert state["traceparents"][1][1].endswith("-00")
+
+    def test_util_exp_requests(self, local_platform):
+        state, url = local_platform
+        tracer = SimpleTracer()
+        tracing.set_tracer(tracer)
+        consumer = AssetConsumer("cocoMDS1", url, "peterprofile")
+        consumer.get_comment_replies(asset, "comment-guid")
+        (span,) = tracer.spans
+        assert state["traceparents"][0] == ("replies", span.traceparent)
+
+        with tracing.remote_parent(f"00-{remote_trace}-{remote_span}-01"):
+            issue_post(url + "/posted")
+            issue_put(url + "/put", {})
+        assert [tp for _, tp in state["traceparents"][-2:]] == [
+            f"00-{remote_trace}-{remote_span}-01"
+        ] * 2
+
+    def test_nested_spans(self, local_platform):
+        state, url = local_platform
+        tracer = SimpleTracer()
+        tracing.set_tracer(tracer)
+        consumer = AssetConsumer("cocoMDS1", url, "peterprofile")
+        assert list(consumer.iter_assets(".*", page_size=5)) == [asset]
+        assert [s.name for s in tracer.spans] == ["AssetConsumer.find_assets"] * 2
+
+        tracer.clear()
+        consumer.print_asset_guids(".*")
+        inner, outer = tracer.spans
+        assert outer.name == "AssetConsumer.print_asset_guids"
+        assert inner.parent_id == outer.span_id and inner.trace_id == outer.trace_id
+
+    def test_parent_crosses_threads(self, local_platform):
+        state, url = local_platform
+        tracer = SimpleTracer()
+        tracing.set_tracer(tracer)
+        consumer = AssetConsumer("cocoMDS1", url, "peterprofile")
+        async_consumer = AsyncAssetConsumer("cocoMDS1", url, "peterprofile")
+        with tracing.remote_parent(f"00-{remote_trace}-{remote_span}-01"):
+            asyncio.run(async_consumer.find_assets(".*"))
+            report = run_bulk(["a", "b"], consumer.find_assets, max_workers=2)
+        assert report.summary()["succeeded"] == 2
+        assert len(tracer.spans) == 3
+        assert all(
+            (s.trace_id, s.parent_id) == (remote_trace, remote_span)
+            for s in tracer.spans
+        )
+
+    def test_set_tracer_restores_classes(self):
+        get_comments = AssetConsumer.get_comments
+        tracing.set_tracer(SimpleTracer())
+        try:
+            assert AssetConsumer.get_comments is not get_comments
+            assert AssetConsumer.get_comments.__wrapped__ is get_comments
+            assert Platform.make_request is Platform.__mro__[1].make_request
+        finally:
+            tracing.set_tracer(None)
+        assert AssetConsumer.get_comments is get_comments
+        assert "get_comments" not in AssetConsumer.__dict__
+
+    def test_open_telemetry(self, local_platform):
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+        from src.egeria_client.tracing import OpenTelemetryTracer
+
+        state, url = local_platform
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        otel = provider.get_tracer("test")
+        tracing.set_tracer(OpenTelemetryTracer(otel))
+        consumer = AssetConsumer("cocoMDS1", url, "peterprofile")
+        with otel.start_as_current_span("handler") as handler:
+            consumer.find_assets(".*")
+        find = exporter.get_finished_spans()[0]
+        assert find.name == "AssetConsumer.find_assets"
+        assert find.parent.span_id == handler.get_span_context().span_id
+        assert find.attributes["egeria.server"] == "cocoMDS1"
+        assert state["traceparents"][0][1] == (
+            f"00-{find.context.trace_id:032x}-{find.context.span_id:016x}-01"
+        )